@@ -0,0 +1,4 @@
+"""Benchmark suite for System Monitor.
+
+Run with ``python -m benchmarks``; see ``python -m benchmarks --help``.
+"""
@@ -0,0 +1,58 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from . import bench_monitor  # noqa: F401  (registers benchmarks)
+from . import bench_threads  # noqa: F401
+from .runner import BenchConfig, compare, load, run, save
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run System Monitor benchmarks.",
+    )
+    parser.add_argument(
+        "-k", dest="selected", help="only run benchmarks containing TEXT"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="short smoke-test settings"
+    )
+    parser.add_argument("--output", "-o", help="save results as JSON")
+    parser.add_argument(
+        "--compare", help="baseline JSON to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative slowdown reported as regression (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    config = BenchConfig.quick() if args.quick else BenchConfig()
+    report = run(config, args.selected)
+
+    for name, result in sorted(report["results"].items()):
+        print(f"{name:45s} {result['median']:14.2f} {result['unit']}")
+
+    if args.output:
+        save(report, args.output)
+        print(f"\nSaved: {args.output}")
+
+    if args.compare:
+        rows = compare(report, load(args.compare), args.threshold)
+        regressions = [row for row in rows if row["regressed"]]
+        print(f"\nCompared with {args.compare}:")
+        for row in rows:
+            mark = "REGRESSION" if row["regressed"] else ""
+            print(f"{row['name']:45s} x{row['ratio']:6.2f} {mark}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""Benchmarks of monitor read paths, sampling and serialization."""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+from system_monitor.analysis import (
+    LeakDetector,
+    MemoryForecaster,
+    SpikeStackSampler,
+)
+from system_monitor.core import (
+    MemoryHistory,
+    MemoryInfo,
+    MemoryRollup,
+    decode_history,
+    encode_history,
+)
+from system_monitor.monitor import SystemMonitor
+from system_monitor.monitors import (
+    CPUMonitor,
+    GPUMonitor,
+    GPUProcessCollector,
+    GPUStatsCollector,
+    ProcessMonitor,
+    host_collectors,
+)
+from system_monitor.replay import TraceReplay
+from system_monitor.scheduling import AdaptiveInterval
+
+from .fakes import FakeCupy, FakeNVML
+from .runner import BenchConfig, BenchResult, benchmark, time_call
+
+SAMPLER_RATES = (10, 100, 1000)
+
+
+@contextmanager
+def _silenced(name: str) -> Iterator[None]:
+    """Send a logger's output to devnull while keeping formatting cost."""
+    target = logging.getLogger(name)
+    handlers = list(target.handlers)
+    with open(os.devnull, "w") as devnull:
+        target.handlers = [logging.StreamHandler(devnull)]
+        try:
+            yield
+        finally:
+            target.handlers = handlers
+
+
+def _fake_nvml() -> FakeNVML:
+    nvml = FakeNVML()
+    nvml.devices[0].processes = [
+        (os.getpid(), 256 * 1024 * 1024),
+        (1, 128 * 1024 * 1024),
+    ]
+    return nvml
+
+
+@benchmark("backend")
+def bench_backends(config: BenchConfig) -> List[BenchResult]:
+    cpu = CPUMonitor()
+    process = ProcessMonitor()
+    gpu = GPUMonitor(cupy_instance=FakeCupy())
+    gpu_fallback = GPUMonitor(cupy_instance=FakeCupy(used=0, total=0))
+    return [
+        time_call("backend.cpu.read", cpu.get_memory_info, config),
+        time_call("backend.process.read", process.get_memory_info, config),
+        time_call("backend.gpu.read", gpu.get_memory_info, config),
+        time_call(
+            "backend.gpu.read_device_fallback",
+            gpu_fallback.get_memory_info,
+            config,
+        ),
+    ] + [
+        time_call(
+            f"backend.{collector.name}.collect",
+            lambda collector=collector: collector.collect(time.time()),
+            config,
+        )
+        for collector in host_collectors()
+        + [
+            GPUStatsCollector(nvml_instance=_fake_nvml()),
+            # interval=0: 매 호출마다 프로세스 목록을 조회
+            GPUProcessCollector(nvml_instance=_fake_nvml(), interval=0.0),
+        ]
+    ]
+
+
+def _span(monitor: SystemMonitor) -> None:
+    with monitor.span("event"):
+        pass
+
+
+@benchmark("monitor")
+def bench_monitor(config: BenchConfig) -> List[BenchResult]:
+    monitor = SystemMonitor(cupy_instance=FakeCupy())
+    results = [
+        time_call(
+            "monitor.is_available.cached", lambda: monitor.has_gpu, config
+        ),
+        time_call("monitor.get_cpu_memory", monitor.get_cpu_memory, config),
+        time_call("monitor.get_gpu_memory", monitor.get_gpu_memory, config),
+        time_call("monitor.sample", monitor.sample, config),
+        time_call("monitor.step", lambda: monitor.step(0), config),
+        time_call("monitor.mark", lambda: monitor.mark("event"), config),
+        time_call("monitor.span", lambda: _span(monitor), config),
+    ]
+    with _silenced("system_monitor.monitor"):
+        results.append(
+            time_call(
+                "monitor.print_memory_usage",
+                lambda: monitor.print_memory_usage(include_cpu=True),
+                config,
+            )
+        )
+    return results
+
+
+def _sampler_overhead(
+    name: str,
+    config: BenchConfig,
+    interval: float,
+    scheduler_factory: Optional[Callable[[], AdaptiveInterval]] = None,
+) -> BenchResult:
+    values = []
+    ticks = late = dropped = 0
+    jitter = []
+    for _ in range(config.rounds):
+        monitor = SystemMonitor(cupy_instance=FakeCupy())
+        scheduler = scheduler_factory() if scheduler_factory else None
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        monitor.start_sampling(interval=interval, scheduler=scheduler)
+        time.sleep(config.duration)
+        monitor.stop_sampling()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        values.append(cpu / wall * 100)
+        sampler = monitor.get_overhead_stats()["sampler"]
+        ticks += sampler["ticks"]
+        late += sampler["late_ticks"]
+        dropped += sampler["dropped_ticks"]
+        jitter.append(sampler["jitter"]["p99_us"])
+    return BenchResult(
+        name,
+        "% cpu",
+        values,
+        {
+            "achieved_hz": ticks / (config.duration * config.rounds),
+            "late_ticks": late,
+            "dropped_ticks": dropped,
+            "jitter_p99_us": max(jitter),
+        },
+    )
+
+
+@benchmark("sampler")
+def bench_sampler(config: BenchConfig) -> List[BenchResult]:
+    results = [
+        _sampler_overhead(f"sampler.overhead@{rate}Hz", config, 1.0 / rate)
+        for rate in SAMPLER_RATES
+    ]
+    # 메모리가 일정할 때 적응형 스케줄러가 얼마나 물러나는지 측정
+    results.append(
+        _sampler_overhead(
+            "sampler.overhead@adaptive",
+            config,
+            0.001,
+            lambda: AdaptiveInterval(min_interval=0.001, max_interval=0.1),
+        )
+    )
+    return results
+
+
+@benchmark("serialize")
+def bench_serialize(config: BenchConfig) -> List[BenchResult]:
+    history = MemoryHistory(maxlen=3600)
+    for i in range(3600):
+        for source in ("cpu", "gpu", "process"):
+            history.append(source, float(i), MemoryInfo(used=i, total=4096.0))
+    info = MemoryInfo(used=512.0, total=1024.0)
+    encoded = encode_history(history)
+    return [
+        time_call("serialize.memory_info.str", lambda: str(info), config),
+        time_call(
+            "serialize.history.samples",
+            lambda: history.samples("gpu"),
+            config,
+        ),
+        time_call(
+            "serialize.history.json",
+            lambda: json.dumps(history.to_records()),
+            config,
+        ),
+        time_call(
+            "serialize.history.encode",
+            lambda: encode_history(history),
+            config,
+        ),
+        time_call(
+            "serialize.history.decode",
+            lambda: decode_history(encoded),
+            config,
+        ),
+        BenchResult(
+            "serialize.history.compression_ratio",
+            "x",
+            [len(json.dumps(history.to_records())) / len(encoded)],
+        ),
+    ]
+
+
+@benchmark("analysis")
+def bench_analysis(config: BenchConfig) -> List[BenchResult]:
+    detector = LeakDetector(window=120, min_samples=30)
+    counter = iter(range(10 ** 12))
+
+    def update() -> None:
+        i = next(counter)
+        detector.update("process", float(i), 100.0 + (i % 17))
+
+    # replay 예제와 같은 10분 창
+    wide = LeakDetector(window=600, min_samples=30)
+    wide_counter = iter(range(10 ** 12))
+    for _ in range(600):
+        i = next(wide_counter)
+        wide.update("process", float(i), 100.0 + (i % 17))
+
+    def wide_update() -> None:
+        i = next(wide_counter)
+        wide.update("process", float(i), 100.0 + (i % 17))
+
+    forecaster = MemoryForecaster(period=60.0)
+    forecast_counter = iter(range(10 ** 12))
+
+    def forecast_update() -> None:
+        i = next(forecast_counter)
+        forecaster.update("gpu", float(i), 100.0 + (i % 17), 1000.0)
+
+    for _ in range(100):
+        forecast_update()
+
+    stacks = SpikeStackSampler(max_captures=16)
+    steady = MemoryInfo(100.0, 1000.0)
+    return [
+        time_call("analysis.leak.update", update, config),
+        time_call("analysis.leak.update@600", wide_update, config),
+        time_call("analysis.forecast.update", forecast_update, config),
+        time_call(
+            "analysis.forecast.project",
+            lambda: forecaster.forecast(horizon=600.0),
+            config,
+        ),
+        time_call(
+            "analysis.stacks.update_no_spike",
+            lambda: stacks.update("gpu", 0.0, steady),
+            config,
+        ),
+        time_call(
+            "analysis.stacks.capture",
+            lambda: stacks.capture(0.0, "gpu", 512.0),
+            config,
+        ),
+    ]
+
+
+@benchmark("replay")
+def bench_replay(config: BenchConfig) -> List[BenchResult]:
+    history = MemoryHistory(maxlen=3600)
+    for i in range(3600):
+        for source in ("gpu", "process"):
+            history.append(
+                source, float(i), MemoryInfo(used=100.0 + i, total=4096.0)
+            )
+
+    def replay_hour() -> None:
+        TraceReplay(history).run()
+
+    result = time_call("replay.run.3600_frames", replay_hour, config)
+    result.extra["frames_per_s"] = 3600 / (result.median / 1e9)
+    return [result]
+
+
+@benchmark("rollup")
+def bench_rollup(config: BenchConfig) -> List[BenchResult]:
+    rollup = MemoryRollup()
+    # 1주일 분량을 10초 간격으로 채움
+    week = 7 * 24 * 3600
+    for i in range(0, week, 10):
+        rollup.update("gpu", float(i), 100.0 + (i % 17))
+    counter = iter(range(week, 10 ** 12))
+
+    def update() -> None:
+        rollup.update("process", float(next(counter)), 100.0)
+
+    return [
+        time_call("rollup.update", update, config),
+        time_call(
+            "rollup.query.10min",
+            lambda: rollup.query("gpu", week - 600.0, float(week)),
+            config,
+        ),
+        time_call(
+            "rollup.query.7d",
+            lambda: rollup.query("gpu", 0.0, float(week)),
+            config,
+        ),
+    ]
+
+
+@benchmark("import")
+def bench_import(config: BenchConfig) -> List[BenchResult]:
+    code = (
+        "import time; start = time.perf_counter(); import system_monitor; "
+        "print(time.perf_counter() - start)"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    values = []
+    for _ in range(config.rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        values.append(float(output.strip().splitlines()[-1]) * 1000)
+    return [BenchResult("import.system_monitor", "ms", values)]
@@ -0,0 +1,109 @@
+"""Multi-threaded read throughput of a sampling monitor.
+
+Readers run while the background sampler writes, so the numbers show
+how the lock-free read paths scale with threads. On a GIL build the
+total throughput stays roughly flat; on a free-threaded build it should
+grow with the number of cores.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, List
+
+from system_monitor.env_utils import probe_free_threading
+from system_monitor.monitor import SystemMonitor
+
+from .fakes import FakeCupy
+from .runner import BenchConfig, BenchResult, benchmark
+
+MAX_THREADS = 16
+BATCH = 100  # 시간 확인 없이 연속으로 실행하는 읽기 횟수
+
+
+def thread_counts(cpus: int) -> List[int]:
+    """Powers of two up to the number of CPUs (at most ``MAX_THREADS``)."""
+    limit = max(1, min(cpus, MAX_THREADS))
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+
+def measure_throughput(
+    operation: Callable[[], object], threads: int, duration: float
+) -> float:
+    """
+    Run ``operation`` in ``threads`` threads for ``duration`` seconds.
+
+    Returns:
+        Total operations per second across all threads
+    """
+    counts = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+    deadline = [0.0]
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        end = deadline[0]
+        done = 0
+        while time.perf_counter() < end:
+            for _ in range(BATCH):
+                operation()
+            done += BATCH
+        counts[index] = done
+
+    workers = [
+        threading.Thread(target=worker, args=(i,), daemon=True)
+        for i in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    start = time.perf_counter()
+    deadline[0] = start + duration
+    barrier.wait()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(counts) / elapsed
+
+
+@benchmark("threads")
+def bench_threads(config: BenchConfig) -> List[BenchResult]:
+    monitor = SystemMonitor(cupy_instance=FakeCupy())
+    for _ in range(100):
+        monitor.sample()
+    history = monitor.history
+    operations = {
+        "state": lambda: monitor.state.get("gpu"),
+        "history.latest": lambda: history.latest("gpu"),
+        "get_gpu_memory": monitor.get_gpu_memory,
+    }
+    gil = probe_free_threading()
+    results = []
+    monitor.start_sampling(interval=0.01)
+    try:
+        for name, operation in operations.items():
+            single = None
+            for threads in thread_counts(os.cpu_count() or 1):
+                values = [
+                    measure_throughput(operation, threads, config.duration)
+                    for _ in range(config.rounds)
+                ]
+                result = BenchResult(
+                    f"threads.{name}@{threads}",
+                    "ops/s",
+                    values,
+                    {"threads": threads, **gil},
+                )
+                if single is None:
+                    single = result.median
+                result.extra["speedup"] = (
+                    result.median / single if single else 0.0
+                )
+                results.append(result)
+    finally:
+        monitor.stop_sampling()
+    return results
@@ -0,0 +1,162 @@
+"""Lightweight fake backends for benchmarks.
+
+``unittest.mock.Mock`` is far slower than the real backends, so the
+benchmarks use these plain classes shaped like the CuPy objects that
+``tests/conftest.py`` mocks, and a fake NVML binding shaped like
+``pynvml`` that the tests use as well.
+"""
+
+from typing import Any, List, Optional, Set, Tuple
+
+MB = 1024 * 1024
+
+
+class FakeMemoryPool:
+    """Stand-in for ``cupy.cuda.MemoryPool``."""
+
+    def __init__(self, used: int = 512 * MB, total: int = 1024 * MB):
+        self._used = used
+        self._total = total
+
+    def used_bytes(self) -> int:
+        return self._used
+
+    def total_bytes(self) -> int:
+        return self._total
+
+    def free_all_blocks(self) -> None:
+        self._total = self._used
+
+
+class FakeDevice:
+    """Stand-in for ``cupy.cuda.Device``."""
+
+    def __init__(self, device_id: int = 0):
+        self.id = device_id
+        self.mem_info: Tuple[int, int] = (512 * MB, 1024 * MB)
+
+
+class _FakeCuda:
+    def __init__(self):
+        self._device = FakeDevice()
+
+    def Device(self, device_id: int = 0) -> FakeDevice:  # noqa: N802
+        return self._device
+
+
+class FakeCupy:
+    """Stand-in for the ``cupy`` module."""
+
+    __version__ = "0.0.0-fake"
+
+    def __init__(self, used: int = 512 * MB, total: int = 1024 * MB):
+        self._pool = FakeMemoryPool(used, total)
+        self.cuda = _FakeCuda()
+
+    def get_default_memory_pool(self) -> FakeMemoryPool:
+        return self._pool
+
+
+class NVMLError_NotSupported(Exception):  # noqa: N801 - pynvml name
+    """Stand-in for ``pynvml.NVMLError_NotSupported``."""
+
+
+class _Record:
+    def __init__(self, **fields: Any):
+        self.__dict__.update(fields)
+
+
+class FakeNVMLDevice:
+    """Readings of one fake NVML device (units as NVML reports them)."""
+
+    def __init__(self, index: int = 0):
+        self.index = index
+        self.name = f"Fake GPU {index}"
+        self.uuid = f"GPU-fake-{index}"
+        self.sm_util = 50
+        self.mem_util = 25
+        self.temperature = 60  # C
+        self.power = 150_000  # mW
+        self.power_limit = 300_000  # mW
+        self.sm_clock = 1410  # MHz
+        self.mem_clock = 1215  # MHz
+        self.used = 512 * MB
+        self.total = 1024 * MB
+        # (pid, 사용 바이트 또는 None) 목록
+        self.processes: List[Tuple[int, Optional[int]]] = []
+        self.unsupported: Set[str] = set()
+
+
+class FakeNVML:
+    """Stand-in for the ``pynvml`` module."""
+
+    NVML_TEMPERATURE_GPU = 0
+    NVML_CLOCK_SM = 1
+    NVML_CLOCK_MEM = 2
+    NVMLError_NotSupported = NVMLError_NotSupported
+
+    def __init__(self, devices: int = 1):
+        self.devices = [FakeNVMLDevice(index) for index in range(devices)]
+        self.initialized = 0
+        self.calls = 0
+
+    def _query(self, device: FakeNVMLDevice, field: str) -> Any:
+        self.calls += 1
+        if field in device.unsupported:
+            raise NVMLError_NotSupported(field)
+        return getattr(device, field)
+
+    def nvmlInit(self) -> None:  # noqa: N802
+        self.initialized += 1
+
+    def nvmlDeviceGetCount(self) -> int:  # noqa: N802
+        return len(self.devices)
+
+    def nvmlDeviceGetHandleByIndex(  # noqa: N802
+        self, index: int
+    ) -> FakeNVMLDevice:
+        return self.devices[index]
+
+    def nvmlDeviceGetUtilizationRates(  # noqa: N802
+        self, device: FakeNVMLDevice
+    ) -> _Record:
+        return _Record(
+            gpu=self._query(device, "sm_util"),
+            memory=self._query(device, "mem_util"),
+        )
+
+    def nvmlDeviceGetTemperature(  # noqa: N802
+        self, device: FakeNVMLDevice, sensor: int
+    ) -> int:
+        return self._query(device, "temperature")
+
+    def nvmlDeviceGetPowerUsage(  # noqa: N802
+        self, device: FakeNVMLDevice
+    ) -> int:
+        return self._query(device, "power")
+
+    def nvmlDeviceGetEnforcedPowerLimit(  # noqa: N802
+        self, device: FakeNVMLDevice
+    ) -> int:
+        return self._query(device, "power_limit")
+
+    def nvmlDeviceGetClockInfo(  # noqa: N802
+        self, device: FakeNVMLDevice, clock: int
+    ) -> int:
+        field = "sm_clock" if clock == self.NVML_CLOCK_SM else "mem_clock"
+        return self._query(device, field)
+
+    def nvmlDeviceGetMemoryInfo(  # noqa: N802
+        self, device: FakeNVMLDevice
+    ) -> _Record:
+        used = self._query(device, "used")
+        total = self._query(device, "total")
+        return _Record(used=used, total=total, free=total - used)
+
+    def nvmlDeviceGetComputeRunningProcesses(  # noqa: N802
+        self, device: FakeNVMLDevice
+    ) -> List[_Record]:
+        return [
+            _Record(pid=pid, usedGpuMemory=used)
+            for pid, used in self._query(device, "processes")
+        ]
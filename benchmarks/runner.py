@@ -0,0 +1,185 @@
+"""Benchmark registry, timing and result comparison."""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchConfig:
+    """Settings shared by all benchmarks."""
+
+    rounds: int = 7
+    min_time: float = 0.05  # seconds per round for micro benchmarks
+    duration: float = 1.0  # seconds per case for macro benchmarks
+
+    @classmethod
+    def quick(cls) -> "BenchConfig":
+        """Short settings for smoke runs."""
+        return cls(rounds=2, min_time=0.001, duration=0.05)
+
+
+@dataclass
+class BenchResult:
+    """Measurements of one benchmark."""
+
+    name: str
+    unit: str
+    values: List[float]
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "unit": self.unit,
+            "median": self.median,
+            "min": min(self.values),
+            "max": max(self.values),
+            "stdev": (
+                statistics.stdev(self.values) if len(self.values) > 1 else 0.0
+            ),
+            "rounds": len(self.values),
+            **self.extra,
+        }
+
+
+BenchFunction = Callable[[BenchConfig], List[BenchResult]]
+_REGISTRY: Dict[str, BenchFunction] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchFunction], BenchFunction]:
+    """Register a benchmark function returning one or more results."""
+
+    def decorator(func: BenchFunction) -> BenchFunction:
+        if name in _REGISTRY:
+            raise ValueError(f"duplicate benchmark: {name}")
+        _REGISTRY[name] = func
+        return func
+
+    return decorator
+
+
+def registered() -> List[str]:
+    """Get the names of all registered benchmarks."""
+    return sorted(_REGISTRY)
+
+
+def time_call(
+    name: str, func: Callable[[], Any], config: BenchConfig
+) -> BenchResult:
+    """
+    Time a zero-argument callable.
+
+    The number of calls per round is calibrated so that each round
+    takes at least ``config.min_time``.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= config.min_time:
+            break
+        number *= 10
+    values = [
+        elapsed / number * 1e9
+        for elapsed in timer.repeat(repeat=config.rounds, number=number)
+    ]
+    return BenchResult(name, "ns/call", values, {"calls": number})
+
+
+def run(
+    config: BenchConfig, selected: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run registered benchmarks.
+
+    Args:
+        config: Timing settings
+        selected: Only run benchmarks whose name contains this text
+
+    Returns:
+        JSON-serializable report
+    """
+    results: Dict[str, Any] = {}
+    for name in registered():
+        if selected and selected not in name:
+            continue
+        for result in _REGISTRY[name](config):
+            results[result.name] = result.to_dict()
+
+    from system_monitor import __version__
+    from system_monitor.env_utils import probe_free_threading
+
+    return {
+        "meta": {
+            "version": __version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": sys.platform,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            **probe_free_threading(),
+            "created": time.time(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare medians of two reports.
+
+    Args:
+        current: Report of this run
+        baseline: Previously saved report
+        threshold: Relative slowdown treated as a regression (0.25 = 25%)
+
+    Returns:
+        One row per benchmark present in both reports; ``ratio`` above 1
+        means slower (or lower throughput for ``*/s`` units)
+    """
+    rows = []
+    for name, result in sorted(current["results"].items()):
+        previous = baseline.get("results", {}).get(name)
+        if previous is None or previous["unit"] != result["unit"]:
+            continue
+        if previous["median"] == 0:
+            continue
+        ratio = result["median"] / previous["median"]
+        if result["unit"].endswith("/s"):
+            # 처리량 단위는 클수록 좋으므로 비율을 뒤집는다
+            ratio = 1 / ratio if ratio else float("inf")
+        rows.append(
+            {
+                "name": name,
+                "baseline": previous["median"],
+                "current": result["median"],
+                "unit": result["unit"],
+                "ratio": ratio,
+                "regressed": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def load(path: str) -> Dict[str, Any]:
+    """Load a saved report."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    """Save a report as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
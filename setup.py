@@ -21,6 +21,8 @@ setup(
         "cuda11": ["cupy-cuda11x>=12.0.0"],
         "cuda12": ["cupy-cuda12x>=12.0.0"],
         "colab": ["cupy-cuda12x>=12.0.0"],  # Colab용 (보통 CUDA 12.x)
+        "arrow": ["pyarrow>=8.0.0"],  # Arrow/Parquet 내보내기
+        "nvml": ["nvidia-ml-py>=11.0.0"],  # GPU 사용률/온도/전력
         "dev": [
             "black>=23.9.1",
             "isort>=5.12.0",
@@ -30,6 +32,10 @@ setup(
             "flake8>=6.1.0",
         ],
     },
+    entry_points={
+        # 테스트별 메모리 회귀 검사 (--memory-baseline)
+        "pytest11": ["system_monitor = system_monitor.pytest_plugin"],
+    },
     python_requires=">=3.8",  # 더 넓은 호환성 지원
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -1,12 +1,47 @@
 """System Monitor - A comprehensive system resource monitoring library."""
 
 from .monitor import SystemMonitor, GPUMemoryMonitor, MemoryMonitorManager
-from .core import MemoryInfo, MemoryConverter
+from .core import (
+    MemoryInfo,
+    MemoryConverter,
+    MemoryHistory,
+    MemorySample,
+    MetricHistory,
+    MonitorState,
+    MemorySnapshot,
+    MemoryDiff,
+    MemoryRollup,
+    Annotation,
+    AnnotationLog,
+)
+from .analysis import (
+    LeakDetector,
+    LeakReport,
+    MemoryForecaster,
+    Forecast,
+    SpikeStackSampler,
+)
+from .scheduling import AdaptiveInterval
+from .streaming import DeadbandFilter
+from .forking import WorkerRelay
+from .profiles import MonitorProfile, select_profile
+from .jupyter import LiveMemoryPanel
+from .budget import GPUBudget, GPUBudgetExceeded, GPUBudgetManager
+from .steps import StepRecorder
+from .replay import TraceReplay, ReplayMonitor
+from .integrations import (
+    track_steps,
+    KerasStepCallback,
+    LightningStepCallback,
+    TransformersStepCallback,
+)
 from .logging_config import setup_logger, get_logger, reset_logger_config
 from .env_utils import (
     detect_environment,
     print_environment_info,
-    setup_environment_optimized_monitor
+    setup_environment_optimized_monitor,
+    warm_up_probes,
+    clear_probe_cache,
 )
 
 __version__ = "0.3.1"
@@ -16,10 +51,42 @@ __all__ = [
     'MemoryMonitorManager',  # 하위 호환성
     'MemoryInfo',
     'MemoryConverter',
+    'MemoryHistory',        # 메모리 기록
+    'MemorySample',
+    'MetricHistory',        # 메모리 외 지표 기록
+    'MonitorState',         # 마지막 샘플 스냅샷
+    'MemorySnapshot',       # snapshot()/diff() 비교
+    'MemoryDiff',
+    'MemoryRollup',         # 다중 해상도 min/max/avg 집계
+    'Annotation',           # 이벤트 주석 (mark/span)
+    'AnnotationLog',
+    'LeakDetector',         # 메모리 누수 감지
+    'LeakReport',
+    'MemoryForecaster',     # 사용량 예측
+    'Forecast',
+    'SpikeStackSampler',    # 메모리 급증 시 Python 스택 캡처
+    'AdaptiveInterval',     # 적응형 샘플링 주기
+    'DeadbandFilter',       # 변경분만 전달
+    'WorkerRelay',          # 워커 프로세스 샘플을 부모로 전달
+    'MonitorProfile',       # 환경별 모니터 프로필
+    'select_profile',
+    'LiveMemoryPanel',      # Jupyter 라이브 패널
+    'GPUBudgetManager',     # GPU 메모리 예산
+    'GPUBudget',
+    'GPUBudgetExceeded',
+    'TraceReplay',          # 기록된 트레이스 재생
+    'ReplayMonitor',
+    'StepRecorder',         # 학습 스텝별 메모리 기록
+    'track_steps',
+    'KerasStepCallback',
+    'LightningStepCallback',
+    'TransformersStepCallback',
     'setup_logger',         # 로깅 설정
     'get_logger',          # 로거 가져오기
     'reset_logger_config',  # 로거 리셋
     'detect_environment',   # 환경 감지
     'print_environment_info',  # 환경 정보 출력
-    'setup_environment_optimized_monitor'  # 환경 최적화 모니터
+    'setup_environment_optimized_monitor',  # 환경 최적화 모니터
+    'warm_up_probes',       # 환경 프로브 미리 실행
+    'clear_probe_cache',    # 환경 프로브 캐시 초기화
 ]
@@ -0,0 +1,16 @@
+"""Analysis of recorded memory history."""
+
+from .forecast import Forecast, MemoryForecaster
+from .leak import LeakDetector, LeakReport
+from .stacks import SpikeStackSampler, StackCapture, StackTable, ThreadStack
+
+__all__ = [
+    'LeakDetector',
+    'LeakReport',
+    'MemoryForecaster',
+    'Forecast',
+    'SpikeStackSampler',
+    'StackCapture',
+    'StackTable',
+    'ThreadStack',
+]
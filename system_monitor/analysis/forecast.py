@@ -0,0 +1,351 @@
+"""Out-of-memory forecasting over recorded traces."""
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from ..core import MemoryHistory, MemoryInfo
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..monitor import SystemMonitor
+
+
+@dataclass(frozen=True)
+class Forecast:
+    """Projected memory usage of one source over a horizon."""
+
+    source: str
+    timestamp: float  # time of the latest sample
+    horizon: float  # seconds ahead
+    current: float  # latest used MB
+    expected: float  # expected used MB at the end of the horizon
+    peak: float  # highest expected used MB within the horizon
+    peak_time: float  # time at which the expected peak is reached
+    lower: float  # peak of the lower confidence bound
+    upper: float  # peak of the upper confidence bound
+    limit: float  # total MB of the latest sample
+    probability: float  # probability of reaching the limit in the horizon
+    time_to_limit: Optional[float]  # seconds until expected usage hits it
+    samples: int
+
+    @property
+    def will_exceed(self) -> bool:
+        """Check if the expected usage reaches the limit in the horizon."""
+        return self.time_to_limit is not None
+
+
+class _SourceModel:
+    """
+    Incremental trend plus periodic component of one source.
+
+    The trend is an exponentially weighted least squares line. Its sums
+    are kept relative to the latest sample, so every update shifts and
+    decays them in O(1) and the fit stays well conditioned however long
+    the monitor runs. The periodic component is a profile of residuals
+    over ``bins`` phases of ``period`` seconds, centered so it only
+    describes the shape within a period.
+    """
+
+    def __init__(
+        self,
+        halflife: float,
+        period: Optional[float],
+        bins: int,
+        seasonal_rate: float,
+    ):
+        self._decay_rate = math.log(2) / halflife
+        self._period = period
+        self._bins = bins
+        self._seasonal_rate = seasonal_rate
+        self._start: Optional[float] = None
+        self.last: Optional[float] = None
+        self.current = 0.0
+        self.limit = 0.0
+        self.samples = 0
+        # 최신 샘플 기준 상대 시간 x에 대한 가중 합
+        self._s0 = self._sx = self._sxx = self._sy = self._sxy = 0.0
+        self._e0 = self._e2 = 0.0
+        self._profile = [0.0] * bins if period else []
+        self._seen = [False] * bins if period else []
+        self._profile_sum = 0.0
+        self._profile_count = 0
+
+    def _bin(self, timestamp: float) -> int:
+        phase = ((timestamp - self._start) % self._period) / self._period
+        return min(int(phase * self._bins), self._bins - 1)
+
+    def seasonal(self, timestamp: float) -> float:
+        if not self._profile_count:
+            return 0.0
+        index = self._bin(timestamp)
+        if not self._seen[index]:
+            return 0.0
+        return self._profile[index] - self._profile_sum / self._profile_count
+
+    def line(self) -> Tuple[float, float]:
+        """Level at the latest sample and slope per second."""
+        if self._s0 <= 0:
+            return 0.0, 0.0
+        sxx = self._sxx - self._sx * self._sx / self._s0
+        if sxx <= 1e-12 * max(self._sxx, 1.0):
+            return self._sy / self._s0, 0.0
+        slope = (self._sxy - self._sx * self._sy / self._s0) / sxx
+        return (self._sy - slope * self._sx) / self._s0, slope
+
+    def spread(self, x: float) -> float:
+        """Standard deviation of a prediction ``x`` seconds ahead."""
+        if self._e0 <= 0 or self._s0 <= 0:
+            return 0.0
+        variance = self._e2 / self._e0
+        factor = 1 + 1 / self._s0
+        sxx = self._sxx - self._sx * self._sx / self._s0
+        if sxx > 1e-12 * max(self._sxx, 1.0):
+            factor += (x - self._sx / self._s0) ** 2 / sxx
+        return math.sqrt(variance * factor)
+
+    def update(self, timestamp: float, used: float, total: float) -> None:
+        if self.last is not None:
+            if timestamp < self.last:
+                return
+            shift = timestamp - self.last
+            decay = math.exp(-self._decay_rate * shift)
+            # 기준 시점을 새 샘플로 옮긴 뒤 감쇠
+            self._sxx = decay * (
+                self._sxx - 2 * shift * self._sx + shift * shift * self._s0
+            )
+            self._sxy = decay * (self._sxy - shift * self._sy)
+            self._sx = decay * (self._sx - shift * self._s0)
+            self._s0 *= decay
+            self._sy *= decay
+            self._e0 *= decay
+            self._e2 *= decay
+        else:
+            self._start = timestamp
+
+        seasonal = self.seasonal(timestamp) if self._period else 0.0
+        if self.samples >= 2:
+            level, _ = self.line()
+            error = used - level - seasonal
+            self._e0 += 1.0
+            self._e2 += error * error
+
+        self._s0 += 1.0
+        self._sy += used - seasonal
+        self.last = timestamp
+        self.current = used
+        self.limit = total
+        self.samples += 1
+
+        if self._period:
+            residual = used - self.line()[0]
+            index = self._bin(timestamp)
+            if self._seen[index]:
+                change = self._seasonal_rate * (
+                    residual - self._profile[index]
+                )
+            else:
+                self._seen[index] = True
+                self._profile_count += 1
+                change = residual
+            self._profile[index] += change
+            self._profile_sum += change
+
+
+class MemoryForecaster:
+    """
+    Incremental memory usage forecaster.
+
+    Each source is modeled as an exponentially weighted linear trend,
+    optionally plus a periodic component for workloads with phases of a
+    known length (e.g. a training epoch), and forecasts carry normal
+    confidence bounds from the recent one-step prediction errors.
+
+    Like ``LeakDetector`` it can be registered as a ``SystemMonitor``
+    listener or fed from a recorded ``MemoryHistory``.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[str] = ("process", "gpu", "cpu"),
+        halflife: float = 600.0,
+        period: Optional[float] = None,
+        bins: int = 32,
+        seasonal_rate: float = 0.2,
+        confidence: float = 0.95,
+        min_samples: int = 10,
+    ):
+        """
+        Initialize forecaster.
+
+        Args:
+            sources: Sources to model
+            halflife: Seconds after which a sample's weight is halved
+            period: Length in seconds of a repeating usage pattern
+                (no periodic component if omitted)
+            bins: Number of phases the period is divided into
+            seasonal_rate: Smoothing rate of the periodic profile
+            confidence: Coverage of the confidence bounds
+            min_samples: Samples required before a source is forecast
+        """
+        if halflife <= 0:
+            raise ValueError("halflife must be positive")
+        if period is not None and period <= 0:
+            raise ValueError("period must be positive")
+        if bins < 1:
+            raise ValueError("bins must be positive")
+        if not 0 < seasonal_rate <= 1:
+            raise ValueError("seasonal_rate must be in (0, 1]")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be in (0, 1)")
+        if min_samples < 3:
+            raise ValueError("min_samples must be at least 3")
+        self._sources = tuple(sources)
+        self._halflife = halflife
+        self._period = period
+        self._bins = bins
+        self._seasonal_rate = seasonal_rate
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self._min_samples = min_samples
+        self._models: Dict[str, _SourceModel] = {}
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        """Get the modeled sources."""
+        return self._sources
+
+    def update(
+        self, source: str, timestamp: float, used: float, total: float
+    ) -> None:
+        """
+        Add a sample to the model of its source.
+
+        Args:
+            source: Source name
+            timestamp: Sample time in seconds
+            used: Used memory in MB
+            total: Total memory in MB
+        """
+        model = self._models.get(source)
+        if model is None:
+            model = self._models[source] = _SourceModel(
+                self._halflife, self._period, self._bins, self._seasonal_rate
+            )
+        model.update(timestamp, used, total)
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Process one ``SystemMonitor.sample()`` result."""
+        for source in self._sources:
+            info = readings.get(source)
+            if info is not None:
+                self.update(source, timestamp, info.used, info.total)
+
+    def feed(self, history: MemoryHistory) -> None:
+        """Add the samples recorded in a history."""
+        for source in self._sources:
+            for sample in history.samples(source):
+                self.update(
+                    source, sample.timestamp, sample.used, sample.total
+                )
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Update the forecaster on every sample taken by a monitor."""
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Stop receiving samples from a monitor."""
+        monitor.remove_listener(self)
+
+    def forecast_source(
+        self, source: str, horizon: float, points: int = 64
+    ) -> Optional[Forecast]:
+        """
+        Project usage of one source.
+
+        Args:
+            source: Source name
+            horizon: Seconds ahead to project
+            points: Number of evaluation points within the horizon
+
+        Returns:
+            Forecast, or None if the source has too few samples
+        """
+        if horizon <= 0:
+            raise ValueError("horizon must be positive")
+        model = self._models.get(source)
+        if model is None or model.samples < self._min_samples:
+            return None
+
+        level, slope = model.line()
+        limit = model.limit
+        normal = NormalDist()
+        peak = lower = upper = -math.inf
+        peak_x = 0.0
+        probability = 0.0
+        time_to_limit: Optional[float] = None
+        expected = model.current
+        for index in range(points + 1):
+            x = horizon * index / points
+            expected = (
+                level + slope * x + model.seasonal(model.last + x)
+            )
+            spread = model.spread(x)
+            if expected > peak:
+                peak, peak_x = expected, x
+            lower = max(lower, expected - self._z * spread)
+            upper = max(upper, expected + self._z * spread)
+            if time_to_limit is None and expected >= limit:
+                time_to_limit = x
+            if spread > 0:
+                exceed = 1 - normal.cdf((limit - expected) / spread)
+            else:
+                exceed = float(expected >= limit)
+            probability = max(probability, exceed)
+
+        return Forecast(
+            source=source,
+            timestamp=model.last,
+            horizon=horizon,
+            current=model.current,
+            expected=expected,
+            peak=peak,
+            peak_time=model.last + peak_x,
+            lower=lower,
+            upper=upper,
+            limit=limit,
+            probability=probability,
+            time_to_limit=time_to_limit,
+            samples=model.samples,
+        )
+
+    def forecast(
+        self, horizon: float, sources: Optional[Iterable[str]] = None
+    ) -> Dict[str, Forecast]:
+        """
+        Project usage of every source with enough samples.
+
+        Args:
+            horizon: Seconds ahead to project
+            sources: Sources to project (all modeled sources if omitted)
+
+        Returns:
+            Forecast per source
+        """
+        forecasts = {}
+        names: List[str] = (
+            list(self._models) if sources is None else list(sources)
+        )
+        for source in names:
+            result = self.forecast_source(source, horizon)
+            if result is not None:
+                forecasts[source] = result
+        return forecasts
+
+    def reset(self, source: Optional[str] = None) -> None:
+        """Forget the model of one or all sources."""
+        if source is None:
+            self._models.clear()
+        else:
+            self._models.pop(source, None)
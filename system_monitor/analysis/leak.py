@@ -0,0 +1,353 @@
+"""Memory leak detection over recorded traces."""
+
+from bisect import bisect_left, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ..core import MemoryHistory, MemoryInfo
+from ..logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..monitor import SystemMonitor
+
+logger = get_logger('system_monitor.analysis.leak')
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
+
+@dataclass(frozen=True)
+class LeakReport:
+    """Result of trend analysis for one source."""
+
+    source: str
+    timestamp: float  # time of the latest sample
+    slope: float  # Theil-Sen slope in MB per hour
+    tau: float  # Kendall's tau in [-1, 1]
+    samples: int  # samples currently in the window
+    change_point: Optional[float]  # start of the current growth regime
+    is_leak: bool
+
+
+class _SortedSlopes:
+    """
+    Sorted multiset of floats stored as a list of bounded sorted chunks.
+
+    Inserting into or deleting from one flat sorted list of n values
+    moves O(n) elements; here only a chunk of at most ``2 * _LOAD``
+    values is changed, found by bisecting the chunk maxima.
+    """
+
+    _LOAD = 256
+
+    def __init__(self) -> None:
+        self._chunks: List[List[float]] = []
+        self._maxes: List[float] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, value: float) -> None:
+        if not self._chunks:
+            self._chunks.append([value])
+            self._maxes.append(value)
+            self._len = 1
+            return
+        index = bisect_left(self._maxes, value)
+        if index == len(self._maxes):
+            index -= 1
+        chunk = self._chunks[index]
+        insort(chunk, value)
+        self._maxes[index] = chunk[-1]
+        self._len += 1
+        if len(chunk) > 2 * self._LOAD:
+            half = len(chunk) // 2
+            self._chunks[index:index + 1] = [chunk[:half], chunk[half:]]
+            self._maxes[index:index + 1] = [chunk[half - 1], chunk[-1]]
+
+    def remove(self, value: float) -> None:
+        index = bisect_left(self._maxes, value)
+        chunk = self._chunks[index]
+        del chunk[bisect_left(chunk, value)]
+        self._len -= 1
+        if not chunk:
+            del self._chunks[index]
+            del self._maxes[index]
+            return
+        self._maxes[index] = chunk[-1]
+        if len(chunk) < self._LOAD // 2 and len(self._chunks) > 1:
+            # 작은 청크는 이웃과 합쳐 청크 수를 제한
+            lo = index - 1 if index else index
+            merged = self._chunks[lo] + self._chunks[lo + 1]
+            self._chunks[lo:lo + 2] = [merged]
+            self._maxes[lo:lo + 2] = [merged[-1]]
+            if len(merged) > 2 * self._LOAD:
+                half = len(merged) // 2
+                self._chunks[lo:lo + 1] = [merged[:half], merged[half:]]
+                self._maxes[lo:lo + 1] = [merged[half - 1], merged[-1]]
+
+    def __getitem__(self, index: int) -> float:
+        if not 0 <= index < self._len:
+            raise IndexError("slope index out of range")
+        for chunk in self._chunks:
+            if index < len(chunk):
+                return chunk[index]
+            index -= len(chunk)
+        raise IndexError("slope index out of range")  # pragma: no cover
+
+
+class _TrendWindow:
+    """
+    Sliding window with incrementally maintained trend statistics.
+
+    All pairwise slopes are kept in a ``_SortedSlopes`` multiset so
+    the Theil-Sen estimate is an index lookup, and the Mann-Kendall
+    ``S`` statistic is updated with the signs added and removed by each
+    sample. A sample adds and removes O(window) slopes, each moving at
+    most one chunk, and the median lookup walks the O(window^2 / chunk
+    size) chunks, so an update costs O(window * chunk size) instead of
+    the O(window^3) element moves of a single sorted list.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._points: Deque[Tuple[float, float]] = deque()
+        self._slopes = _SortedSlopes()
+        self._kendall_s = 0
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def add(self, timestamp: float, value: float) -> None:
+        if len(self._points) == self._size:
+            self._evict()
+        for t, v in self._points:
+            if timestamp != t:
+                self._slopes.add((value - v) / (timestamp - t))
+            self._kendall_s += _sign(value - v)
+        self._points.append((timestamp, value))
+
+    def _evict(self) -> None:
+        t0, v0 = self._points.popleft()
+        for t, v in self._points:
+            if t != t0:
+                self._slopes.remove((v - v0) / (t - t0))
+            self._kendall_s -= _sign(v - v0)
+
+    @property
+    def slope(self) -> float:
+        """Median of pairwise slopes per second."""
+        count = len(self._slopes)
+        if count == 0:
+            return 0.0
+        middle = count // 2
+        if count % 2:
+            return self._slopes[middle]
+        return (self._slopes[middle - 1] + self._slopes[middle]) / 2
+
+    @property
+    def tau(self) -> float:
+        """Kendall's tau of value against time."""
+        n = len(self._points)
+        if n < 2:
+            return 0.0
+        return self._kendall_s / (n * (n - 1) / 2)
+
+
+class _GrowthCusum:
+    """One-sided CUSUM over sample-to-sample increments."""
+
+    def __init__(self, slack: float, threshold: float):
+        self._slack = slack
+        self._threshold = threshold
+        self._score = 0.0
+        self._last: Optional[Tuple[float, float]] = None
+        self._candidate: Optional[float] = None
+        self.change_point: Optional[float] = None
+
+    def add(self, timestamp: float, value: float) -> None:
+        if self._last is not None:
+            last_timestamp, last_value = self._last
+            self._score = max(
+                0.0, self._score + (value - last_value) - self._slack
+            )
+            if self._score == 0.0:
+                self._candidate = None
+                self.change_point = None
+            elif self._candidate is None:
+                self._candidate = last_timestamp
+            if self._score >= self._threshold:
+                self.change_point = self._candidate
+        self._last = (timestamp, value)
+
+
+class LeakDetector:
+    """
+    Incremental memory leak detector.
+
+    Flags a source as leaking when, over a sliding window of samples,
+    the robust Theil-Sen slope exceeds ``min_slope`` and the growth is
+    consistently monotonic (Kendall's tau at least ``min_tau``). A
+    CUSUM over increments marks when the current growth regime began.
+
+    The detector can be registered as a ``SystemMonitor`` listener to
+    run on every sample, or fed from a recorded ``MemoryHistory``.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[str] = ("process", "gpu"),
+        window: int = 120,
+        min_samples: int = 30,
+        min_slope: float = 10.0,
+        min_tau: float = 0.6,
+        cusum_slack: float = 0.5,
+        cusum_threshold: float = 16.0,
+        on_leak: Optional[Callable[[LeakReport], None]] = None,
+    ):
+        """
+        Initialize leak detector.
+
+        Args:
+            sources: Sources to analyze
+            window: Number of recent samples used for trend estimation
+            min_samples: Samples required before a leak can be flagged
+            min_slope: Minimum growth in MB per hour to flag a leak
+            min_tau: Minimum Kendall's tau to flag a leak
+            cusum_slack: Per-sample growth in MB tolerated by the CUSUM
+            cusum_threshold: Accumulated growth in MB marking a change point
+            on_leak: Callback invoked when a source starts leaking
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        if not 2 <= min_samples <= window:
+            raise ValueError("min_samples must be between 2 and window")
+        self._sources = tuple(sources)
+        self._window = window
+        self._min_samples = min_samples
+        self._min_slope = min_slope
+        self._min_tau = min_tau
+        self._cusum_slack = cusum_slack
+        self._cusum_threshold = cusum_threshold
+        self._on_leak = on_leak
+        self._windows: Dict[str, _TrendWindow] = {}
+        self._cusums: Dict[str, _GrowthCusum] = {}
+        self._reports: Dict[str, LeakReport] = {}
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        """Get the analyzed sources."""
+        return self._sources
+
+    def update(self, source: str, timestamp: float, used: float) -> LeakReport:
+        """
+        Add a sample and re-evaluate the trend of its source.
+
+        Args:
+            source: Source name
+            timestamp: Sample time in seconds
+            used: Used memory in MB
+
+        Returns:
+            Updated report for the source
+        """
+        window = self._windows.get(source)
+        if window is None:
+            window = self._windows[source] = _TrendWindow(self._window)
+            self._cusums[source] = _GrowthCusum(
+                self._cusum_slack, self._cusum_threshold
+            )
+        cusum = self._cusums[source]
+        window.add(timestamp, used)
+        cusum.add(timestamp, used)
+
+        slope = window.slope * 3600
+        tau = window.tau
+        is_leak = (
+            len(window) >= self._min_samples
+            and slope >= self._min_slope
+            and tau >= self._min_tau
+        )
+        report = LeakReport(
+            source=source,
+            timestamp=timestamp,
+            slope=slope,
+            tau=tau,
+            samples=len(window),
+            change_point=cusum.change_point,
+            is_leak=is_leak,
+        )
+
+        previous = self._reports.get(source)
+        self._reports[source] = report
+        if is_leak and (previous is None or not previous.is_leak):
+            logger.warning(
+                f"Possible memory leak in {source}: "
+                f"{slope:.2f} MB/h (tau={tau:.2f})"
+            )
+            if self._on_leak is not None:
+                self._on_leak(report)
+        return report
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Process one ``SystemMonitor.sample()`` result."""
+        for source in self._sources:
+            info = readings.get(source)
+            if info is not None:
+                self.update(source, timestamp, info.used)
+
+    def feed(self, history: MemoryHistory) -> Dict[str, LeakReport]:
+        """
+        Analyze samples recorded in a history.
+
+        Args:
+            history: History to replay through the detector
+
+        Returns:
+            Latest report per analyzed source
+        """
+        for source in self._sources:
+            for sample in history.samples(source):
+                self.update(source, sample.timestamp, sample.used)
+        return self.reports()
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Run the detector on every sample taken by a monitor."""
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Stop receiving samples from a monitor."""
+        monitor.remove_listener(self)
+
+    def report(self, source: str) -> Optional[LeakReport]:
+        """Get the latest report of a source."""
+        return self._reports.get(source)
+
+    def reports(self) -> Dict[str, LeakReport]:
+        """Get the latest report of every source seen so far."""
+        return dict(self._reports)
+
+    def reset(self, source: Optional[str] = None) -> None:
+        """Forget accumulated samples of one or all sources."""
+        if source is None:
+            self._windows.clear()
+            self._cusums.clear()
+            self._reports.clear()
+            return
+        self._windows.pop(source, None)
+        self._cusums.pop(source, None)
+        self._reports.pop(source, None)
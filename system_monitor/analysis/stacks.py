@@ -0,0 +1,339 @@
+"""Python stack capture on memory spikes."""
+
+import os
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import FrameType
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ..core import Annotation, AnnotationLog, MemoryInfo
+from ..core.trace import PathLike
+from ..logging_config import get_logger
+from ..sampler import THREAD_NAME
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..monitor import SystemMonitor
+
+logger = get_logger('system_monitor.analysis.stacks')
+
+# 이 패키지의 프레임은 스택 끝(잎)에서 잘라냄
+_PACKAGE_DIR = (
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+)
+
+TRUNCATED = "[truncated]"
+
+# 프레임 라벨 캐시 상한 (넘으면 비우고 다시 채움)
+_MAX_LABELS = 4096
+
+
+@dataclass(frozen=True)
+class ThreadStack:
+    """Stack of one thread at a capture."""
+
+    thread: int  # threading.get_ident()
+    name: str
+    stack: int  # id in the StackTable
+
+
+@dataclass(frozen=True)
+class StackCapture:
+    """Stacks of all threads captured at a memory spike."""
+
+    timestamp: float  # time of the sample that showed the spike
+    source: str
+    increase: float  # MB since the previous sample
+    threads: Tuple[ThreadStack, ...]
+
+
+class StackTable:
+    """
+    Deduplicated stacks.
+
+    Each distinct stack, a tuple of frame labels from the outermost
+    call to the innermost, is stored once and referred to by its id.
+    Every ``intern`` adds a reference that ``release`` drops; a stack
+    without references is removed and its id is not reused.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[Tuple[str, ...], int] = {}
+        self._stacks: Dict[int, Tuple[str, ...]] = {}
+        self._refs: Dict[int, int] = {}
+        self._next_id = 0
+
+    def intern(self, stack: Tuple[str, ...]) -> int:
+        """Get the id of a stack and add a reference, adding it if new."""
+        stack_id = self._ids.get(stack)
+        if stack_id is None:
+            stack_id = self._ids[stack] = self._next_id
+            self._next_id += 1
+            self._stacks[stack_id] = stack
+            self._refs[stack_id] = 0
+        self._refs[stack_id] += 1
+        return stack_id
+
+    def release(self, stack_id: int) -> None:
+        """Drop a reference, removing the stack with its last one."""
+        refs = self._refs[stack_id] - 1
+        if refs:
+            self._refs[stack_id] = refs
+            return
+        del self._refs[stack_id]
+        del self._ids[self._stacks.pop(stack_id)]
+
+    def __getitem__(self, stack_id: int) -> Tuple[str, ...]:
+        return self._stacks[stack_id]
+
+    def __len__(self) -> int:
+        return len(self._stacks)
+
+
+class SpikeStackSampler:
+    """
+    Captures the Python stacks of all threads when memory jumps.
+
+    Registered as a ``SystemMonitor`` listener, it compares each reading
+    of ``sources`` with the previous one. When used memory grew by at
+    least ``threshold`` MB (or ``relative`` of the total), it walks
+    ``sys._current_frames()`` and records which code every thread was
+    running, so the allocation site is usually on one of the stacks.
+    Stacks are deduplicated in a :class:`StackTable` and captures are
+    rate limited to one per ``min_interval`` seconds, keeping at most
+    ``max_captures``; stacks only referred to by dropped captures are
+    removed from the table. The background sampler's own thread and the
+    innermost frames of this package are left out.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[str] = ("gpu",),
+        threshold: float = 256.0,
+        relative: Optional[float] = None,
+        min_interval: float = 5.0,
+        max_captures: int = 100,
+        max_depth: int = 64,
+        on_capture: Optional[Callable[[StackCapture], None]] = None,
+    ):
+        """
+        Initialize stack sampler.
+
+        Args:
+            sources: Sources whose increases trigger a capture
+            threshold: Minimum increase in MB between two samples
+            relative: Minimum increase as a fraction of the total (a
+                capture is triggered if either limit is reached)
+            min_interval: Minimum seconds between two captures
+            max_captures: Number of most recent captures kept
+            max_depth: Maximum frames kept per stack (innermost first)
+            on_capture: Callback invoked with every capture
+        """
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        if max_captures <= 0 or max_depth <= 0:
+            raise ValueError("max_captures and max_depth must be positive")
+        self._sources = tuple(sources)
+        self._threshold = threshold
+        self._relative = relative
+        self._min_interval = min_interval
+        self._max_depth = max_depth
+        self._on_capture = on_capture
+        self._previous: Dict[str, float] = {}
+        self._last_capture: Optional[float] = None
+        self._labels: Dict[Tuple[object, int], str] = {}
+        self._logs: Dict[int, AnnotationLog] = {}
+        self.table = StackTable()
+        self.captures: Deque[StackCapture] = deque(maxlen=max_captures)
+        self.skipped = 0  # spikes not captured due to rate limiting
+        self.capture_seconds = 0.0  # total time spent capturing
+
+    @property
+    def sources(self) -> Tuple[str, ...]:
+        """Get the watched sources."""
+        return self._sources
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        key = (code, frame.f_lineno)
+        label = self._labels.get(key)
+        if label is None:
+            label = self._labels[key] = (
+                f"{code.co_name} ({code.co_filename}:{frame.f_lineno})"
+            )
+        return label
+
+    def _stack(self, frame: Optional[FrameType]) -> Tuple[str, ...]:
+        # 잎 쪽의 이 패키지 프레임(리스너/sample 호출)은 제외
+        while frame is not None and frame.f_code.co_filename.startswith(
+            _PACKAGE_DIR
+        ):
+            frame = frame.f_back
+        labels = []
+        while frame is not None and len(labels) < self._max_depth:
+            labels.append(self._label(frame))
+            frame = frame.f_back
+        if frame is not None:
+            labels.append(TRUNCATED)
+        labels.reverse()
+        return tuple(labels)
+
+    def capture(
+        self, timestamp: float, source: str, increase: float
+    ) -> StackCapture:
+        """
+        Capture the stacks of all threads now.
+
+        Args:
+            timestamp: Time the capture is recorded at
+            source: Source that triggered the capture
+            increase: Increase in MB that triggered the capture
+
+        Returns:
+            The recorded capture
+        """
+        start = time.perf_counter()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        threads = []
+        for ident, frame in sys._current_frames().items():
+            name = names.get(ident, f"thread {ident}")
+            if name == THREAD_NAME:
+                continue
+            stack = self._stack(frame)
+            if stack:
+                threads.append(
+                    ThreadStack(ident, name, self.table.intern(stack))
+                )
+        capture = StackCapture(timestamp, source, increase, tuple(threads))
+        captures = self.captures
+        if len(captures) == captures.maxlen:
+            for thread in captures[0].threads:
+                self.table.release(thread.stack)
+        captures.append(capture)
+        if len(self._labels) > _MAX_LABELS:
+            # 코드 객체를 계속 붙잡지 않도록 캐시를 비움
+            self._labels.clear()
+        self._last_capture = timestamp
+        self.capture_seconds += time.perf_counter() - start
+        for log in list(self._logs.values()):
+            log.append(
+                Annotation(
+                    timestamp,
+                    f"stack_capture {source}",
+                    0.0,
+                    threading.get_ident(),
+                )
+            )
+        if self._on_capture is not None:
+            self._on_capture(capture)
+        return capture
+
+    def update(
+        self, source: str, timestamp: float, info: MemoryInfo
+    ) -> Optional[StackCapture]:
+        """
+        Check one reading for a spike and capture stacks if it is one.
+
+        Returns:
+            The capture, or None if there was no (captured) spike
+        """
+        previous = self._previous.get(source)
+        self._previous[source] = info.used
+        if previous is None:
+            return None
+        increase = info.used - previous
+        spike = increase >= self._threshold or (
+            self._relative is not None
+            and info.total > 0
+            and increase >= self._relative * info.total
+        )
+        if not spike:
+            return None
+        if (
+            self._last_capture is not None
+            and timestamp - self._last_capture < self._min_interval
+        ):
+            self.skipped += 1
+            return None
+        logger.info(
+            f"Memory spike in {source}: +{increase:.1f} MB, "
+            "capturing Python stacks"
+        )
+        return self.capture(timestamp, source, increase)
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Process one ``SystemMonitor.sample()`` result."""
+        for source in self._sources:
+            info = readings.get(source)
+            if info is not None:
+                self.update(source, timestamp, info)
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Watch every sample taken by a monitor and mark captures."""
+        self._logs[id(monitor)] = monitor.annotations
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Stop receiving samples from a monitor."""
+        monitor.remove_listener(self)
+        self._logs.pop(id(monitor), None)
+
+    def folded(self, source: Optional[str] = None) -> Dict[str, int]:
+        """
+        Aggregate captured stacks in the folded flamegraph format.
+
+        Args:
+            source: Only count captures triggered by this source
+
+        Returns:
+            Number of captures per ``"thread;outer;...;inner"`` line
+        """
+        counts: Dict[str, int] = {}
+        for capture in list(self.captures):
+            if source is not None and capture.source != source:
+                continue
+            for thread in capture.threads:
+                try:
+                    frames = self.table[thread.stack]
+                except KeyError:  # 읽는 동안 밀려난 캡처
+                    continue
+                line = ";".join((thread.name,) + frames)
+                counts[line] = counts.get(line, 0) + 1
+        return counts
+
+    def write_folded(
+        self, path: PathLike, source: Optional[str] = None
+    ) -> int:
+        """
+        Write captured stacks for ``flamegraph.pl``, speedscope, etc.
+
+        Returns:
+            Number of lines written
+        """
+        counts = self.folded(source)
+        with open(path, "w", encoding="utf-8") as f:
+            for line, count in sorted(counts.items()):
+                f.write(f"{line} {count}\n")
+        return len(counts)
+
+    def reset(self) -> None:
+        """Forget captures, stacks and previous readings."""
+        self._previous.clear()
+        self._last_capture = None
+        self.table = StackTable()
+        self._labels.clear()
+        self.captures.clear()
+        self.skipped = 0
+        self.capture_seconds = 0.0
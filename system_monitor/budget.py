@@ -0,0 +1,328 @@
+"""GPU memory budgets for tenants sharing a device."""
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+from .core import MemoryConverter, MemoryInfo
+from .logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .monitor import SystemMonitor
+
+logger = get_logger('system_monitor.budget')
+
+_MB = 1024 * 1024
+
+
+class GPUBudgetExceeded(MemoryError):
+    """Raised when an allocation would exceed a tenant's hard limit."""
+
+    def __init__(
+        self, tenant: str, requested: Optional[int], used: int, limit: int
+    ):
+        self.tenant = tenant
+        self.requested = requested
+        self.used = used
+        self.limit = limit
+        request = (
+            "allocation"
+            if requested is None
+            else MemoryConverter.format_memory(requested)
+        )
+        super().__init__(
+            f"GPU budget of '{tenant}' exceeded: requested {request} with "
+            f"{MemoryConverter.format_memory(used)} in use "
+            f"(hard limit {MemoryConverter.format_memory(limit)})"
+        )
+
+
+@dataclass(frozen=True)
+class GPUBudget:
+    """Memory limits of one tenant on one device (MB)."""
+
+    tenant: str
+    device: int
+    hard_limit: float
+    soft_limit: float
+
+
+class _Tenant:
+    def __init__(self, budget: GPUBudget, pool: Any):
+        self.budget = budget
+        self.pool = pool
+        self.frees = 0
+
+
+class GPUBudgetManager:
+    """
+    Per-tenant CuPy memory pools with soft and hard limits.
+
+    Every tenant gets its own memory pool capped at its hard limit with
+    ``set_limit``. Allocations made inside :meth:`activate` go to that
+    pool; exceeding the cap raises :class:`GPUBudgetExceeded` instead of
+    CuPy's generic out-of-memory error, and :meth:`check` raises it
+    before a known-size allocation is attempted. When the memory held by
+    a pool (used plus cached blocks) reaches its soft limit,
+    :meth:`enforce` returns the cached blocks to the device with
+    ``free_all_blocks()``. Attach the manager to a sampling monitor to
+    enforce soft limits on every sample. CuPy pools act on the current
+    device, so every pool call is made inside ``cuda.Device`` of the
+    tenant's budget (the sampler thread's current device is 0)::
+
+        budgets = GPUBudgetManager()
+        budgets.assign("model-a", hard_limit=4096)
+        budgets.attach(monitor)
+        with budgets.activate("model-a"):
+            run_model_a()
+    """
+
+    def __init__(self, cupy_instance=None, soft_ratio: float = 0.9):
+        """
+        Initialize budget manager.
+
+        Args:
+            cupy_instance: Custom CuPy instance to use
+            soft_ratio: Default soft limit as a fraction of the hard limit
+        """
+        if not 0 < soft_ratio <= 1:
+            raise ValueError("soft_ratio must be in (0, 1]")
+        self._cupy = cupy_instance
+        self._soft_ratio = soft_ratio
+        self._tenants: Dict[str, _Tenant] = {}
+        self._lock = threading.Lock()
+
+    def _cupy_module(self):
+        if self._cupy is None:
+            try:
+                import cupy as cp
+            except ImportError:
+                raise RuntimeError(
+                    "CuPy is required for GPU memory budgets"
+                ) from None
+            self._cupy = cp
+        return self._cupy
+
+    def _device_total(self, device: int) -> Optional[int]:
+        try:
+            return self._cupy_module().cuda.Device(device).mem_info[1]
+        except Exception as e:
+            logger.error(f"Failed to get GPU {device} memory info: {e}")
+            return None
+
+    def _device(self, device: int) -> Any:
+        # CuPy 풀의 set_limit/used_bytes/free_all_blocks는 현재 디바이스에
+        # 적용되므로 모든 풀 호출을 예산의 디바이스 안에서 실행
+        return self._cupy_module().cuda.Device(device)
+
+    def _tenant(self, tenant: str) -> _Tenant:
+        try:
+            return self._tenants[tenant]
+        except KeyError:
+            raise KeyError(f"No GPU budget assigned to '{tenant}'") from None
+
+    def assign(
+        self,
+        tenant: str,
+        hard_limit: float,
+        device: int = 0,
+        soft_limit: Optional[float] = None,
+        pool: Any = None,
+    ) -> GPUBudget:
+        """
+        Assign a budget and a dedicated memory pool to a tenant.
+
+        Args:
+            tenant: Tenant name
+            hard_limit: Maximum memory the tenant may use in MB
+            device: CUDA device id
+            soft_limit: Held memory in MB at which cached blocks are
+                freed (``soft_ratio * hard_limit`` if omitted)
+            pool: Memory pool to use (a new ``cupy.cuda.MemoryPool``
+                if omitted)
+
+        Returns:
+            The assigned budget
+
+        Raises:
+            ValueError: If the limits are invalid or the hard limits of
+                all tenants on the device exceed its memory
+        """
+        if soft_limit is None:
+            soft_limit = hard_limit * self._soft_ratio
+        if hard_limit <= 0:
+            raise ValueError("hard_limit must be positive")
+        if not 0 < soft_limit <= hard_limit:
+            raise ValueError("require 0 < soft_limit <= hard_limit")
+        budget = GPUBudget(tenant, device, hard_limit, soft_limit)
+
+        with self._lock:
+            committed = sum(
+                t.budget.hard_limit
+                for name, t in self._tenants.items()
+                if t.budget.device == device and name != tenant
+            )
+            total = self._device_total(device)
+            if total is not None and committed + hard_limit > total / _MB:
+                raise ValueError(
+                    f"GPU {device} budgets would total "
+                    f"{committed + hard_limit:.2f} MB, more than the "
+                    f"device's {total / _MB:.2f} MB"
+                )
+            if pool is None:
+                existing = self._tenants.get(tenant)
+                if existing is not None and existing.budget.device == device:
+                    pool = existing.pool
+                else:
+                    pool = self._cupy_module().cuda.MemoryPool()
+            with self._device(device):
+                pool.set_limit(size=int(hard_limit * _MB))
+            self._tenants[tenant] = _Tenant(budget, pool)
+        return budget
+
+    def release(self, tenant: str) -> None:
+        """Remove a tenant's budget and free its cached blocks."""
+        with self._lock:
+            entry = self._tenants.pop(tenant, None)
+        if entry is not None:
+            with self._device(entry.budget.device):
+                entry.pool.free_all_blocks()
+
+    def budget(self, tenant: str) -> GPUBudget:
+        """Get the budget of a tenant."""
+        return self._tenant(tenant).budget
+
+    def pool(self, tenant: str) -> Any:
+        """Get the memory pool of a tenant."""
+        return self._tenant(tenant).pool
+
+    def tenants(self) -> List[str]:
+        """Get the names of tenants with a budget."""
+        return list(self._tenants)
+
+    def check(self, tenant: str, nbytes: int) -> None:
+        """
+        Check that an allocation fits in a tenant's hard limit.
+
+        Args:
+            tenant: Tenant name
+            nbytes: Size of the planned allocation in bytes
+
+        Raises:
+            GPUBudgetExceeded: If the allocation would exceed the limit
+        """
+        entry = self._tenant(tenant)
+        with self._device(entry.budget.device):
+            used = entry.pool.used_bytes()
+        limit = int(entry.budget.hard_limit * _MB)
+        if used + nbytes > limit:
+            raise GPUBudgetExceeded(tenant, nbytes, used, limit)
+
+    @contextmanager
+    def activate(self, tenant: str) -> Iterator[Any]:
+        """
+        Route CuPy allocations of the block to a tenant's pool.
+
+        Yields:
+            The tenant's memory pool
+
+        Raises:
+            GPUBudgetExceeded: If an allocation exceeds the hard limit
+        """
+        entry = self._tenant(tenant)
+        cuda = self._cupy_module().cuda
+        out_of_memory = getattr(
+            getattr(cuda, "memory", None), "OutOfMemoryError", None
+        )
+        try:
+            with cuda.Device(entry.budget.device):
+                with cuda.using_allocator(entry.pool.malloc):
+                    yield entry.pool
+        except Exception as e:
+            if out_of_memory is None or not isinstance(e, out_of_memory):
+                raise
+            limit = int(entry.budget.hard_limit * _MB)
+            with cuda.Device(entry.budget.device):
+                used = entry.pool.used_bytes()
+            raise GPUBudgetExceeded(tenant, None, used, limit) from e
+
+    def usage(self, tenant: str) -> MemoryInfo:
+        """Get a tenant's used memory against its hard limit."""
+        entry = self._tenant(tenant)
+        with self._device(entry.budget.device):
+            used = entry.pool.used_bytes()
+        return MemoryInfo(
+            used=MemoryConverter.to_mb(used),
+            total=entry.budget.hard_limit,
+        )
+
+    def enforce(self) -> List[str]:
+        """
+        Free cached blocks of pools holding memory above the soft limit.
+
+        Returns:
+            Tenants whose pools were trimmed
+        """
+        trimmed = []
+        with self._lock:
+            entries = list(self._tenants.items())
+        for tenant, entry in entries:
+            try:
+                with self._device(entry.budget.device):
+                    held = entry.pool.total_bytes()
+                    if held < entry.budget.soft_limit * _MB:
+                        continue
+                    entry.pool.free_all_blocks()
+            except Exception as e:
+                logger.error(
+                    f"Failed to enforce GPU budget of {tenant}: {e}"
+                )
+                continue
+            entry.frees += 1
+            trimmed.append(tenant)
+            logger.info(
+                f"GPU budget of {tenant}: freed cached blocks "
+                f"({MemoryConverter.format_memory(held)} held, soft limit "
+                f"{entry.budget.soft_limit:.2f} MB)"
+            )
+        return trimmed
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Enforce soft limits after a sample."""
+        self.enforce()
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Enforce soft limits on every sample taken by a monitor."""
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Stop receiving samples from a monitor."""
+        monitor.remove_listener(self)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get usage of every tenant.
+
+        Returns:
+            Tenant name to device, used and held MB, limits and the
+            number of soft-limit frees
+        """
+        with self._lock:
+            entries = list(self._tenants.items())
+        status = {}
+        for tenant, entry in entries:
+            with self._device(entry.budget.device):
+                used = entry.pool.used_bytes()
+                held = entry.pool.total_bytes()
+            status[tenant] = {
+                "device": entry.budget.device,
+                "used_mb": MemoryConverter.to_mb(used),
+                "held_mb": MemoryConverter.to_mb(held),
+                "soft_limit_mb": entry.budget.soft_limit,
+                "hard_limit_mb": entry.budget.hard_limit,
+                "frees": entry.frees,
+            }
+        return status
@@ -2,5 +2,44 @@
 
 from .info import MemoryInfo
 from .converter import MemoryConverter
+from .history import MemoryHistory, MemorySample
+from .metrics import MetricHistory
+from .state import MonitorState
+from .rollup import MemoryRollup, RollupPoint, RollupSeries
+from .snapshot import MemoryDiff, MemorySnapshot, SourceDiff, diff_snapshots
+from .annotations import Annotation, AnnotationLog
+from .codec import encode_history, decode_history
+from .trace import (
+    TraceChunk,
+    TraceWriter,
+    iter_annotations,
+    iter_trace,
+    read_trace,
+    trace_sources,
+)
 
-__all__ = ['MemoryInfo', 'MemoryConverter']
+__all__ = [
+    'MemoryInfo',
+    'MemoryConverter',
+    'MemoryHistory',
+    'MemorySample',
+    'MetricHistory',
+    'MonitorState',
+    'MemoryRollup',
+    'RollupSeries',
+    'RollupPoint',
+    'MemorySnapshot',
+    'MemoryDiff',
+    'SourceDiff',
+    'diff_snapshots',
+    'Annotation',
+    'AnnotationLog',
+    'encode_history',
+    'decode_history',
+    'TraceChunk',
+    'TraceWriter',
+    'iter_trace',
+    'iter_annotations',
+    'read_trace',
+    'trace_sources',
+]
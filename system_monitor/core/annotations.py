@@ -0,0 +1,158 @@
+"""Application event annotations on the sample timeline."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Annotation(NamedTuple):
+    """An application event: an instant mark or a span."""
+
+    timestamp: float  # start, seconds since the epoch
+    name: str
+    duration: float = 0.0  # seconds, 0 for instant marks
+    thread: int = 0  # threading.get_ident() of the marking thread
+
+    @property
+    def end(self) -> float:
+        """End time of the event (the start time for marks)."""
+        return self.timestamp + self.duration
+
+
+class AnnotationLog:
+    """
+    Bounded log of annotations next to the memory history.
+
+    Annotations are added from application threads, often on hot code
+    paths, so appending takes no lock: it is one ``deque.append`` for the
+    log and one per subscriber, each atomic. Exporters that need every
+    annotation exactly once (e.g. trace writers) ``subscribe()`` to get
+    their own queue and drain it, while readers copy the log. Once
+    ``maxlen`` annotations are kept the oldest ones are discarded.
+    """
+
+    def __init__(self, maxlen: int = 3600):
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self._maxlen = maxlen
+        self._items: Deque[Annotation] = deque(maxlen=maxlen)
+        self._subscribers: Tuple[Deque[Annotation], ...] = ()
+        self._subscribers_lock = threading.Lock()
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of annotations kept."""
+        return self._maxlen
+
+    def append(self, annotation: Annotation) -> None:
+        """Record an annotation."""
+        self._items.append(annotation)
+        for queue in self._subscribers:
+            queue.append(annotation)
+
+    def subscribe(self) -> Deque[Annotation]:
+        """
+        Get a queue that receives every annotation recorded from now on.
+
+        The consumer pops from the left; the queue holds at most
+        ``maxlen`` annotations and drops the oldest if not drained.
+        """
+        queue: Deque[Annotation] = deque(maxlen=self._maxlen)
+        with self._subscribers_lock:
+            self._subscribers = self._subscribers + (queue,)
+        return queue
+
+    def unsubscribe(self, queue: Deque[Annotation]) -> None:
+        """Stop delivering annotations to a subscribed queue."""
+        with self._subscribers_lock:
+            self._subscribers = tuple(
+                subscribed
+                for subscribed in self._subscribers
+                if subscribed is not queue
+            )
+
+    def _snapshot(self) -> List[Annotation]:
+        while True:
+            try:
+                return list(self._items)
+            except RuntimeError:
+                # 복사 중 deque가 변경됨
+                time.sleep(0)
+
+    def annotations(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> List[Annotation]:
+        """
+        Get recorded annotations overlapping a time range.
+
+        Args:
+            start: Earliest time (from the first annotation if omitted)
+            end: Latest time (up to the last annotation if omitted)
+
+        Returns:
+            Annotations ordered by start time
+        """
+        selected = [
+            annotation
+            for annotation in self._snapshot()
+            if (start is None or annotation.end >= start)
+            and (end is None or annotation.timestamp <= end)
+        ]
+        selected.sort(key=lambda annotation: annotation.timestamp)
+        return selected
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get all annotations as JSON-serializable dictionaries."""
+        return [annotation._asdict() for annotation in self.annotations()]
+
+    def clear(self) -> None:
+        """Discard all recorded annotations."""
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class AnnotationFeed:
+    """
+    Annotation queues of the logs an exporter is attached to.
+
+    Exporters subscribe to the log of every monitor they are attached
+    to and ``drain()`` the queued annotations when they write, so each
+    annotation is exported exactly once.
+    """
+
+    def __init__(self) -> None:
+        self._queues: Tuple[
+            Tuple[AnnotationLog, Deque[Annotation]], ...
+        ] = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, log: Any) -> None:
+        """Start receiving the annotations of a log (others are ignored)."""
+        if isinstance(log, AnnotationLog):
+            with self._lock:
+                self._queues = self._queues + ((log, log.subscribe()),)
+
+    def unsubscribe(self, log: Optional[Any] = None) -> None:
+        """Stop receiving the annotations of a log (all logs if omitted)."""
+        with self._lock:
+            remaining = []
+            for subscribed, queue in self._queues:
+                if log is None or subscribed is log:
+                    subscribed.unsubscribe(queue)
+                else:
+                    remaining.append((subscribed, queue))
+            self._queues = tuple(remaining)
+
+    def drain(self) -> List[Annotation]:
+        """Take the annotations recorded since the previous call."""
+        drained = []
+        for _, queue in self._queues:
+            while True:
+                try:
+                    drained.append(queue.popleft())
+                except IndexError:
+                    break
+        return drained
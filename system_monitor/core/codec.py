@@ -0,0 +1,327 @@
+"""Compact binary encoding of memory sample streams.
+
+Timestamps are stored at millisecond resolution as zigzag varints of
+delta-of-deltas, and values with Gorilla-style XOR float compression,
+so regularly sampled, slowly changing series shrink to a few bits per
+sample.
+"""
+
+import struct
+from typing import Iterable, List, Sequence, Tuple
+
+from .annotations import Annotation
+from .history import MemoryHistory
+from .info import MemoryInfo
+
+MAGIC = b"SMZ1"
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint, returning ``(value, new_offset)``."""
+    result = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+class _BitWriter:
+    def __init__(self):
+        self._buffer = bytearray()
+        self._acc = 0
+        self._bits = 0
+
+    def write(self, value: int, width: int) -> None:
+        self._acc = (self._acc << width) | (value & ((1 << width) - 1))
+        self._bits += width
+        while self._bits >= 8:
+            self._bits -= 8
+            self._buffer.append((self._acc >> self._bits) & 0xFF)
+        self._acc &= (1 << self._bits) - 1
+
+    def getvalue(self) -> bytes:
+        if self._bits:
+            return bytes(self._buffer) + bytes(
+                [(self._acc << (8 - self._bits)) & 0xFF]
+            )
+        return bytes(self._buffer)
+
+
+class _BitReader:
+    def __init__(self, data: bytes):
+        self._data = data
+        self._index = 0
+        self._acc = 0
+        self._bits = 0
+
+    def read(self, width: int) -> int:
+        while self._bits < width:
+            if self._index >= len(self._data):
+                raise ValueError("truncated bit stream")
+            self._acc = (self._acc << 8) | self._data[self._index]
+            self._index += 1
+            self._bits += 8
+        self._bits -= width
+        value = (self._acc >> self._bits) & ((1 << width) - 1)
+        self._acc &= (1 << self._bits) - 1
+        return value
+
+
+def _float_bits(value: float) -> int:
+    return struct.unpack(">Q", struct.pack(">d", value))[0]
+
+
+def _bits_float(bits: int) -> float:
+    return struct.unpack(">d", struct.pack(">Q", bits))[0]
+
+
+def encode_floats(values: Iterable[float]) -> bytes:
+    """Encode floats with Gorilla XOR compression."""
+    writer = _BitWriter()
+    previous = None
+    leading = trailing = -1
+    for value in values:
+        bits = _float_bits(value)
+        if previous is None:
+            writer.write(bits, 64)
+            previous = bits
+            continue
+        xor = bits ^ previous
+        previous = bits
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+        new_leading = min(64 - xor.bit_length(), 31)
+        new_trailing = (xor & -xor).bit_length() - 1
+        reuse = leading >= 0 and new_leading >= leading
+        if reuse and new_trailing >= trailing:
+            # 이전 유효 비트 구간 재사용
+            writer.write(0b10, 2)
+            writer.write(xor >> trailing, 64 - leading - trailing)
+        else:
+            leading, trailing = new_leading, new_trailing
+            length = 64 - leading - trailing
+            writer.write(0b11, 2)
+            writer.write(leading, 5)
+            writer.write(length - 1, 6)
+            writer.write(xor >> trailing, length)
+    return writer.getvalue()
+
+
+def decode_floats(data: bytes, count: int) -> List[float]:
+    """Decode ``count`` floats written by :func:`encode_floats`."""
+    if count == 0:
+        return []
+    reader = _BitReader(data)
+    previous = reader.read(64)
+    values = [_bits_float(previous)]
+    leading = trailing = 0
+    for _ in range(count - 1):
+        if reader.read(1):
+            if reader.read(1):
+                leading = reader.read(5)
+                trailing = 64 - leading - (reader.read(6) + 1)
+            length = 64 - leading - trailing
+            previous ^= reader.read(length) << trailing
+        values.append(_bits_float(previous))
+    return values
+
+
+def encode_timestamps(timestamps: Iterable[float]) -> bytes:
+    """Encode timestamps in milliseconds as delta-of-delta varints."""
+    buffer = bytearray()
+    previous = previous_delta = None
+    for timestamp in timestamps:
+        millis = round(timestamp * 1000)
+        if previous is None:
+            write_varint(buffer, _zigzag(millis))
+        else:
+            delta = millis - previous
+            if previous_delta is None:
+                write_varint(buffer, _zigzag(delta))
+            else:
+                write_varint(buffer, _zigzag(delta - previous_delta))
+            previous_delta = delta
+        previous = millis
+    return bytes(buffer)
+
+
+def decode_timestamps(data: bytes, count: int) -> List[float]:
+    """Decode ``count`` timestamps written by :func:`encode_timestamps`."""
+    timestamps: List[float] = []
+    offset = 0
+    millis = delta = 0
+    for index in range(count):
+        value, offset = read_varint(data, offset)
+        value = _unzigzag(value)
+        if index == 0:
+            millis = value
+        elif index == 1:
+            delta = value
+            millis += delta
+        else:
+            delta += value
+            millis += delta
+        timestamps.append(millis / 1000)
+    return timestamps
+
+
+def _write_block(buffer: bytearray, block: bytes) -> None:
+    write_varint(buffer, len(block))
+    buffer.extend(block)
+
+
+def _read_block(data: bytes, offset: int) -> Tuple[bytes, int]:
+    length, offset = read_varint(data, offset)
+    if offset + length > len(data):
+        raise ValueError("truncated block")
+    return data[offset:offset + length], offset + length
+
+
+def encode_series(
+    timestamps: Sequence[float], columns: Sequence[Sequence[float]]
+) -> bytes:
+    """
+    Encode a timestamp column and any number of float columns.
+
+    Args:
+        timestamps: Sample times in seconds
+        columns: Float columns of the same length as ``timestamps``
+
+    Returns:
+        Encoded bytes
+    """
+    count = len(timestamps)
+    if any(len(column) != count for column in columns):
+        raise ValueError("all columns must have the same length")
+    buffer = bytearray()
+    write_varint(buffer, count)
+    write_varint(buffer, len(columns))
+    _write_block(buffer, encode_timestamps(timestamps))
+    for column in columns:
+        _write_block(buffer, encode_floats(column))
+    return bytes(buffer)
+
+
+def decode_series(
+    data: bytes, offset: int = 0
+) -> Tuple[List[float], List[List[float]], int]:
+    """
+    Decode a series written by :func:`encode_series`.
+
+    Returns:
+        ``(timestamps, columns, new_offset)``
+    """
+    count, offset = read_varint(data, offset)
+    column_count, offset = read_varint(data, offset)
+    block, offset = _read_block(data, offset)
+    timestamps = decode_timestamps(block, count)
+    columns = []
+    for _ in range(column_count):
+        block, offset = _read_block(data, offset)
+        columns.append(decode_floats(block, count))
+    return timestamps, columns, offset
+
+
+def encode_annotations(annotations: Sequence[Annotation]) -> bytes:
+    """
+    Encode annotations.
+
+    Start times are stored like sample timestamps (milliseconds), while
+    durations keep full precision for short spans.
+    """
+    ordered = sorted(annotations, key=lambda annotation: annotation.timestamp)
+    buffer = bytearray()
+    write_varint(buffer, len(ordered))
+    _write_block(buffer, encode_timestamps(a.timestamp for a in ordered))
+    _write_block(buffer, encode_floats(a.duration for a in ordered))
+    names = bytearray()
+    for annotation in ordered:
+        name = annotation.name.encode("utf-8")
+        write_varint(names, len(name))
+        names.extend(name)
+        write_varint(names, annotation.thread)
+    _write_block(buffer, bytes(names))
+    return bytes(buffer)
+
+
+def decode_annotations(data: bytes) -> List[Annotation]:
+    """Decode annotations written by :func:`encode_annotations`."""
+    count, offset = read_varint(data, 0)
+    block, offset = _read_block(data, offset)
+    timestamps = decode_timestamps(block, count)
+    block, offset = _read_block(data, offset)
+    durations = decode_floats(block, count)
+    names, offset = _read_block(data, offset)
+    annotations = []
+    position = 0
+    for timestamp, duration in zip(timestamps, durations):
+        length, position = read_varint(names, position)
+        name = names[position:position + length].decode("utf-8")
+        thread, position = read_varint(names, position + length)
+        annotations.append(Annotation(timestamp, name, duration, thread))
+    return annotations
+
+
+def encode_history(history: MemoryHistory) -> bytes:
+    """Encode every source of a history."""
+    buffer = bytearray(MAGIC)
+    sources = history.sources()
+    write_varint(buffer, len(sources))
+    for source in sources:
+        samples = history.samples(source)
+        name = source.encode("utf-8")
+        write_varint(buffer, len(name))
+        buffer.extend(name)
+        buffer.extend(
+            encode_series(
+                [s.timestamp for s in samples],
+                [[s.used for s in samples], [s.total for s in samples]],
+            )
+        )
+    return bytes(buffer)
+
+
+def decode_history(data: bytes, maxlen: int = 3600) -> MemoryHistory:
+    """
+    Decode a history written by :func:`encode_history`.
+
+    Args:
+        data: Encoded bytes
+        maxlen: Capacity of the returned history per source
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("not an encoded memory history")
+    history = MemoryHistory(maxlen)
+    offset = len(MAGIC)
+    source_count, offset = read_varint(data, offset)
+    for _ in range(source_count):
+        length, offset = read_varint(data, offset)
+        source = data[offset:offset + length].decode("utf-8")
+        offset += length
+        timestamps, (used, total), offset = decode_series(data, offset)
+        for t, u, tot in zip(timestamps, used, total):
+            history.append(source, t, MemoryInfo(used=u, total=tot))
+    return history
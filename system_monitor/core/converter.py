@@ -1,9 +1,28 @@
 """Memory unit conversion utilities."""
 
+from typing import Dict
+
+# 단위별 바이트 수 (2의 거듭제곱이므로 곱셈/나눗셈이 정확함)
+UNITS: Dict[str, int] = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024 * 1024,
+    "GB": 1024 * 1024 * 1024,
+    "TB": 1024 * 1024 * 1024 * 1024,
+}
+
 
 class MemoryConverter:
     """Memory unit conversion utilities."""
 
+    @staticmethod
+    def unit_size(unit: str) -> int:
+        """Get the number of bytes in a unit (B, KB, MB, GB or TB)."""
+        try:
+            return UNITS[unit.upper()]
+        except KeyError:
+            raise ValueError(f"unknown memory unit: {unit}") from None
+
     @staticmethod
     def to_mb(bytes_value: float) -> float:
         """Convert bytes to megabytes."""
@@ -15,11 +34,30 @@ class MemoryConverter:
         return bytes_value / (1024 * 1024 * 1024)
 
     @staticmethod
-    def format_memory(bytes_value: float, unit: str = "MB") -> str:
-        """Format memory value with unit."""
-        if unit.upper() == "GB":
-            value = MemoryConverter.to_gb(bytes_value)
-            return f"{value:.2f} GB"
-        else:
-            value = MemoryConverter.to_mb(bytes_value)
-            return f"{value:.2f} MB"
+    def convert(bytes_value: float, unit: str = "MB") -> float:
+        """Convert bytes to a unit."""
+        return bytes_value / MemoryConverter.unit_size(unit)
+
+    @staticmethod
+    def to_bytes(value: float, unit: str = "MB") -> float:
+        """
+        Convert a value in a unit to bytes.
+
+        Whole numbers of bytes are returned as ``int``; fractions of a
+        byte are kept so that converting back gives the same value.
+        """
+        bytes_value = value * MemoryConverter.unit_size(unit)
+        if isinstance(bytes_value, float) and bytes_value.is_integer():
+            return int(bytes_value)
+        return bytes_value
+
+    @staticmethod
+    def format_memory(
+        bytes_value: float, unit: str = "MB", precision: int = 2
+    ) -> str:
+        """Format memory value with unit (MB if the unit is unknown)."""
+        unit = unit.upper()
+        if unit not in UNITS:
+            unit = "MB"
+        value = MemoryConverter.convert(bytes_value, unit)
+        return f"{value:.{precision}f} {unit}"
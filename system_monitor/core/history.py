@@ -0,0 +1,187 @@
+"""Time-indexed memory history storage."""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar
+
+from .info import Bytes, MemoryInfo
+
+T = TypeVar("T")
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    """A single recorded memory reading."""
+
+    timestamp: float  # seconds since the epoch
+    source: str
+    used: float  # in MB
+    total: float  # in MB
+
+    @property
+    def info(self) -> MemoryInfo:
+        """Get the reading as a MemoryInfo."""
+        return MemoryInfo(used=self.used, total=self.total)
+
+
+class _Series:
+    """Columnar ring buffer for one source (values in bytes)."""
+
+    def __init__(self, maxlen: int):
+        self.timestamps: Deque[float] = deque(maxlen=maxlen)
+        self.used: Deque[Bytes] = deque(maxlen=maxlen)
+        self.total: Deque[Bytes] = deque(maxlen=maxlen)
+
+    def append(self, timestamp: float, info: MemoryInfo) -> None:
+        self.timestamps.append(timestamp)
+        self.used.append(info.used_bytes)
+        self.total.append(info.total_bytes)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class _Versioned:
+    """
+    Single-writer store whose readers retry around concurrent writes.
+
+    Writes bump a sequence counter to an odd value while the columns are
+    being changed; readers copy the columns and retry if the counter
+    changed meanwhile, so they never see a half-applied write.
+    """
+
+    def __init__(self) -> None:
+        self._version = 0
+
+    def _consistent(self, read: Callable[[], T]) -> T:
+        """Run a read until it completes without a concurrent write."""
+        while True:
+            version = self._version
+            if not version & 1:
+                try:
+                    result = read()
+                except RuntimeError:
+                    # 읽는 중 deque가 변경됨
+                    result = None
+                else:
+                    if self._version == version:
+                        return result
+            time.sleep(0)
+
+
+class MemoryHistory(_Versioned):
+    """
+    Bounded, per-source history of memory readings.
+
+    Each source (``"cpu"``, ``"gpu"``, ``"process"``, ...) is stored as
+    columns of timestamps, used and total bytes; samples are converted
+    to MB when read. When a source reaches ``maxlen`` samples the oldest
+    ones are discarded.
+
+    Concurrency: there must be a single writer at a time (``SystemMonitor``
+    serializes its samples), while any number of threads may read without
+    locking; reads retry around a concurrent append (see ``_Versioned``),
+    so they never see a half-applied append.
+    """
+
+    def __init__(self, maxlen: int = 3600):
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        super().__init__()
+        self._maxlen = maxlen
+        self._series: Dict[str, _Series] = {}
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of samples kept per source."""
+        return self._maxlen
+
+    def append(self, source: str, timestamp: float, info: MemoryInfo) -> None:
+        """Record a reading for a source."""
+        self._version += 1
+        try:
+            series = self._series.get(source)
+            if series is None:
+                series = self._series[source] = _Series(self._maxlen)
+            series.append(timestamp, info)
+        finally:
+            self._version += 1
+
+    def remove(self, source: str) -> bool:
+        """
+        Discard all samples of a source.
+
+        Returns:
+            Whether the source was recorded
+        """
+        self._version += 1
+        try:
+            return self._series.pop(source, None) is not None
+        finally:
+            self._version += 1
+
+    def sources(self) -> List[str]:
+        """Get the names of all recorded sources."""
+        return list(self._series)
+
+    def samples(self, source: str) -> List[MemorySample]:
+        """Get all recorded samples of a source, oldest first."""
+        series = self._series.get(source)
+        if series is None:
+            return []
+        columns = self._consistent(
+            lambda: (
+                list(series.timestamps),
+                list(series.used),
+                list(series.total),
+            )
+        )
+        return [
+            MemorySample(
+                timestamp=t, source=source, used=u / _MB, total=tot / _MB
+            )
+            for t, u, tot in zip(*columns)
+        ]
+
+    def latest(self, source: str) -> Optional[MemorySample]:
+        """Get the most recent sample of a source."""
+        series = self._series.get(source)
+        if not series:
+            return None
+        return self._consistent(
+            lambda: MemorySample(
+                timestamp=series.timestamps[-1],
+                source=source,
+                used=series.used[-1] / _MB,
+                total=series.total[-1] / _MB,
+            )
+        )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get all samples as JSON-serializable dictionaries."""
+        records = []
+        for source in self.sources():
+            for sample in self.samples(source):
+                records.append(
+                    {
+                        "timestamp": sample.timestamp,
+                        "source": sample.source,
+                        "used": sample.used,
+                        "total": sample.total,
+                    }
+                )
+        return records
+
+    def clear(self) -> None:
+        """Discard all recorded samples."""
+        self._version += 1
+        try:
+            self._series.clear()
+        finally:
+            self._version += 1
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in list(self._series.values()))
@@ -1,26 +1,120 @@
 """Memory information data structures."""
 
 from dataclasses import dataclass
+from typing import Optional, Union
 
+from .converter import MemoryConverter
 
-@dataclass
+_MB = 1024 * 1024
+
+Bytes = Union[int, float]
+
+
+@dataclass(init=False, repr=False)
 class MemoryInfo:
-    """Memory usage information."""
+    """
+    Memory usage information.
+
+    Readings are stored as bytes (``used_bytes``, ``total_bytes``), as
+    ``int`` when taken from a monitor, so differences between readings
+    are exact and sampling involves no float conversion. ``used``,
+    ``total`` and ``free`` give the values in MB for compatibility, and
+    ``MemoryInfo(used, total)`` still takes MB. Since a MB is a power of
+    two bytes, converting MB to bytes and back gives the same value.
+
+    It is a dataclass whose fields are the byte values, so
+    ``dataclasses.asdict()`` gives ``used_bytes``/``total_bytes`` and
+    ``dataclasses.replace(info, used_bytes=...)`` works.
+    """
+
+    __slots__ = ("used_bytes", "total_bytes")
 
-    used: float  # in MB
-    total: float  # in MB
+    used_bytes: Bytes
+    total_bytes: Bytes
+
+    def __init__(
+        self,
+        used: Optional[float] = None,
+        total: Optional[float] = None,
+        *,
+        used_bytes: Optional[Bytes] = None,
+        total_bytes: Optional[Bytes] = None,
+    ):
+        """
+        Initialize from values in MB, or in bytes by keyword.
+
+        Args:
+            used: Used memory in MB
+            total: Total memory in MB
+            used_bytes: Used memory in bytes (instead of ``used``)
+            total_bytes: Total memory in bytes (instead of ``total``)
+        """
+        self.used_bytes = _bytes("used", used, used_bytes)
+        self.total_bytes = _bytes("total", total, total_bytes)
+
+    @classmethod
+    def from_bytes(cls, used: Bytes, total: Bytes) -> "MemoryInfo":
+        """Create from values in bytes without any conversion."""
+        info = cls.__new__(cls)
+        info.used_bytes = used
+        info.total_bytes = total
+        return info
+
+    @property
+    def used(self) -> float:
+        """Get used memory in MB."""
+        return self.used_bytes / _MB
+
+    @used.setter
+    def used(self, value: float) -> None:
+        self.used_bytes = MemoryConverter.to_bytes(value)
+
+    @property
+    def total(self) -> float:
+        """Get total memory in MB."""
+        return self.total_bytes / _MB
+
+    @total.setter
+    def total(self, value: float) -> None:
+        self.total_bytes = MemoryConverter.to_bytes(value)
+
+    @property
+    def free_bytes(self) -> Bytes:
+        """Get free memory in bytes."""
+        return self.total_bytes - self.used_bytes
 
     @property
     def free(self) -> float:
         """Get free memory in MB."""
-        return self.total - self.used
+        return self.free_bytes / _MB
 
     @property
     def usage_percent(self) -> float:
         """Get memory usage percentage."""
-        if self.total == 0:
+        if self.total_bytes == 0:
             return 0.0
-        return (self.used / self.total) * 100
+        return (self.used_bytes / self.total_bytes) * 100
+
+    def format(self, unit: str = "MB", precision: int = 2) -> str:
+        """Format as ``"used / total"`` in a unit."""
+        used = MemoryConverter.format_memory(self.used_bytes, unit, precision)
+        total = MemoryConverter.format_memory(
+            self.total_bytes, unit, precision
+        )
+        return f"{used} / {total}"
+
+    def __repr__(self) -> str:
+        return f"MemoryInfo(used={self.used!r}, total={self.total!r})"
 
     def __str__(self) -> str:
-        return f"{self.used:.2f} MB / {self.total:.2f} MB"
+        return self.format()
+
+
+def _bytes(name: str, mb: Optional[float], value: Optional[Bytes]) -> Bytes:
+    if value is None:
+        if mb is None:
+            raise TypeError(f"MemoryInfo() missing {name} or {name}_bytes")
+        return MemoryConverter.to_bytes(mb)
+    if mb is not None:
+        raise TypeError(f"MemoryInfo() got both {name} and {name}_bytes")
+    return value
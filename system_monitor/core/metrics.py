@@ -0,0 +1,142 @@
+"""Time-indexed history of non-memory metrics."""
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional
+
+from .history import _Versioned
+
+
+class _MetricSeries:
+    """Columnar ring buffer of named float fields for one source."""
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.timestamps: Deque[float] = deque(maxlen=maxlen)
+        self.fields: Dict[str, Deque[float]] = {}
+
+    def append(self, timestamp: float, values: Mapping[str, float]) -> None:
+        for name in values:
+            if name not in self.fields:
+                # 새 필드는 이전 샘플을 nan으로 채워 열 길이를 맞춤
+                self.fields[name] = deque(
+                    [math.nan] * len(self.timestamps), maxlen=self.maxlen
+                )
+        self.timestamps.append(timestamp)
+        for name, column in self.fields.items():
+            column.append(float(values.get(name, math.nan)))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+class MetricHistory(_Versioned):
+    """
+    Bounded, per-source history of named metric values.
+
+    Where ``MemoryHistory`` keeps used/total memory, this keeps any
+    float fields of a source (``"host_cpu"``: per-core utilization,
+    ``"pressure"``: PSI stall shares, ...) on the same timestamps as the
+    memory samples. Fields may appear over time; values missing from a
+    sample are stored as ``nan``.
+
+    Like ``MemoryHistory`` it has a single writer and lock-free readers.
+    """
+
+    def __init__(self, maxlen: int = 3600):
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        super().__init__()
+        self._maxlen = maxlen
+        self._series: Dict[str, _MetricSeries] = {}
+
+    @property
+    def maxlen(self) -> int:
+        """Maximum number of samples kept per source."""
+        return self._maxlen
+
+    def append(
+        self, source: str, timestamp: float, values: Mapping[str, float]
+    ) -> None:
+        """Record the metric values of a source."""
+        self._version += 1
+        try:
+            series = self._series.get(source)
+            if series is None:
+                series = self._series[source] = _MetricSeries(self._maxlen)
+            series.append(timestamp, values)
+        finally:
+            self._version += 1
+
+    def sources(self) -> List[str]:
+        """Get the names of all recorded sources."""
+        return list(self._series)
+
+    def fields(self, source: str) -> List[str]:
+        """Get the field names recorded for a source."""
+        series = self._series.get(source)
+        if series is None:
+            return []
+        return self._consistent(lambda: list(series.fields))
+
+    def columns(self, source: str) -> Dict[str, List[float]]:
+        """
+        Get all recorded values of a source as columns.
+
+        Returns:
+            ``timestamp`` column and one column per field, oldest first
+            (empty if the source was never recorded)
+        """
+        series = self._series.get(source)
+        if series is None:
+            return {}
+
+        def read() -> Dict[str, List[float]]:
+            columns = {"timestamp": list(series.timestamps)}
+            for name, column in list(series.fields.items()):
+                columns[name] = list(column)
+            return columns
+
+        return self._consistent(read)
+
+    def latest(self, source: str) -> Optional[Dict[str, float]]:
+        """Get the most recent values of a source, with its timestamp."""
+        series = self._series.get(source)
+        if not series:
+            return None
+
+        def read() -> Dict[str, float]:
+            values = {"timestamp": series.timestamps[-1]}
+            for name, column in list(series.fields.items()):
+                values[name] = column[-1]
+            return values
+
+        return self._consistent(read)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get all samples as JSON-serializable dictionaries."""
+        records = []
+        for source in self.sources():
+            columns = self.columns(source)
+            timestamps = columns.pop("timestamp", [])
+            for index, timestamp in enumerate(timestamps):
+                values = {
+                    name: column[index]
+                    for name, column in columns.items()
+                    if not math.isnan(column[index])
+                }
+                records.append(
+                    {"timestamp": timestamp, "source": source, **values}
+                )
+        return records
+
+    def clear(self) -> None:
+        """Discard all recorded samples."""
+        self._version += 1
+        try:
+            self._series.clear()
+        finally:
+            self._version += 1
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in list(self._series.values()))
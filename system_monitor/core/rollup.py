@@ -0,0 +1,395 @@
+"""Multi-resolution min/max/avg rollups of recorded series."""
+
+import math
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Tuple,
+)
+
+from .history import MemoryHistory, _Versioned
+from .info import MemoryInfo
+from .metrics import MetricHistory
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..monitor import SystemMonitor
+
+# (버킷 폭 초, 보관할 버킷 수): 10분, 3시간, 1일, 1주, 90일
+DEFAULT_LEVELS: Tuple[Tuple[float, int], ...] = (
+    (1.0, 600),
+    (10.0, 1080),
+    (60.0, 1440),
+    (600.0, 1008),
+    (3600.0, 2160),
+)
+
+
+class RollupPoint(NamedTuple):
+    """Aggregate of the values in one time bucket."""
+
+    start: float  # bucket start, seconds since the epoch
+    min: float
+    max: float
+    avg: float
+    count: int
+
+
+@dataclass(frozen=True)
+class RollupSeries:
+    """Bucketed values of one series over a time window."""
+
+    series: str
+    resolution: float  # width of the stored buckets that were merged
+    bucket: float  # width of the returned buckets
+    points: Tuple[RollupPoint, ...]
+
+    @property
+    def min(self) -> Optional[float]:
+        """Get the lowest value in the window."""
+        return min((p.min for p in self.points), default=None)
+
+    @property
+    def max(self) -> Optional[float]:
+        """Get the highest value in the window."""
+        return max((p.max for p in self.points), default=None)
+
+    @property
+    def count(self) -> int:
+        """Get the number of values in the window."""
+        return sum(p.count for p in self.points)
+
+    @property
+    def avg(self) -> Optional[float]:
+        """Get the mean value in the window."""
+        count = self.count
+        if not count:
+            return None
+        return sum(p.avg * p.count for p in self.points) / count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the series as a JSON-serializable dictionary."""
+        return {
+            "series": self.series,
+            "resolution": self.resolution,
+            "bucket": self.bucket,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.avg,
+            "count": self.count,
+            "points": [list(point) for point in self.points],
+        }
+
+
+class _Level:
+    """Columnar ring buffer of fixed-width buckets of one series."""
+
+    def __init__(self, width: float, maxlen: int):
+        self.width = width
+        self.starts: Deque[float] = deque(maxlen=maxlen)
+        self.mins: Deque[float] = deque(maxlen=maxlen)
+        self.maxs: Deque[float] = deque(maxlen=maxlen)
+        self.sums: Deque[float] = deque(maxlen=maxlen)
+        self.counts: Deque[int] = deque(maxlen=maxlen)
+
+    def add(self, timestamp: float, value: float) -> None:
+        start = math.floor(timestamp / self.width) * self.width
+        starts = self.starts
+        if not starts or start > starts[-1]:
+            starts.append(start)
+            self.mins.append(value)
+            self.maxs.append(value)
+            self.sums.append(value)
+            self.counts.append(1)
+            return
+        # 늦게 도착한 값 (대부분 마지막 버킷)
+        index = len(starts) - 1
+        if start != starts[index]:
+            index = bisect_left(starts, start)
+            if index == len(starts) or starts[index] != start:
+                return  # 이미 지워졌거나 빈 구간의 버킷은 만들지 않음
+        if value < self.mins[index]:
+            self.mins[index] = value
+        if value > self.maxs[index]:
+            self.maxs[index] = value
+        self.sums[index] += value
+        self.counts[index] += 1
+
+    def rows(
+        self, start: float, end: float
+    ) -> List[Tuple[float, float, float, float, int]]:
+        starts = self.starts
+        lo = math.floor(start / self.width) * self.width
+        index = bisect_left(starts, lo)
+        rows = []
+        for i in range(index, len(starts)):
+            if starts[i] > end:
+                break
+            rows.append(
+                (
+                    starts[i],
+                    self.mins[i],
+                    self.maxs[i],
+                    self.sums[i],
+                    self.counts[i],
+                )
+            )
+        return rows
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+class MemoryRollup(_Versioned):
+    """
+    Precomputed min/max/avg buckets of series at several resolutions.
+
+    Every value is added to one bucket per resolution (by default 1 s,
+    10 s, 1 min, 10 min and 1 h buckets, kept for 10 minutes up to 90
+    days), so updates cost a few operations and memory is bounded no
+    matter how long the monitor runs. A query reads the coarsest
+    resolution that still resolves the requested bucket width and
+    merges at most ``max_points`` times the ratio between resolutions
+    stored buckets: querying days of data takes about as long as
+    querying minutes.
+
+    Memory sources are stored as used MB under their source name
+    (``"gpu"``, ``"process"``, ...); metric fields of collectors as
+    ``"{collector}.{field}"`` (e.g. ``"gpu0_stats.used"``).
+
+    Like ``MemoryHistory`` it has a single writer and lock-free readers.
+    """
+
+    def __init__(
+        self,
+        levels: Sequence[Tuple[float, int]] = DEFAULT_LEVELS,
+        metrics: bool = True,
+    ):
+        """
+        Initialize rollup.
+
+        Args:
+            levels: ``(bucket width in seconds, number of buckets)`` per
+                resolution, finest first
+            metrics: Whether ``__call__`` also adds the metric values of
+                attached monitors
+        """
+        levels = tuple((float(width), int(size)) for width, size in levels)
+        if not levels:
+            raise ValueError("at least one level is required")
+        for width, size in levels:
+            if width <= 0 or size <= 0:
+                raise ValueError("level widths and sizes must be positive")
+        if any(a[0] >= b[0] for a, b in zip(levels, levels[1:])):
+            raise ValueError("levels must be ordered finest first")
+        super().__init__()
+        self._levels = levels
+        self._metrics = metrics
+        self._series: Dict[str, List[_Level]] = {}
+        self._latest: Optional[float] = None
+        self._monitors: Dict[int, "SystemMonitor"] = {}
+
+    @property
+    def levels(self) -> Tuple[Tuple[float, int], ...]:
+        """Get the ``(width, size)`` of every resolution."""
+        return self._levels
+
+    @property
+    def latest_timestamp(self) -> Optional[float]:
+        """Get the newest timestamp added."""
+        return self._latest
+
+    def update(self, series: str, timestamp: float, value: float) -> None:
+        """Add one value of a series."""
+        if value != value:  # nan (필드가 없던 샘플)
+            return
+        levels = self._series.get(series)
+        self._version += 1
+        try:
+            if levels is None:
+                levels = [_Level(w, size) for w, size in self._levels]
+                self._series[series] = levels
+            for level in levels:
+                level.add(timestamp, value)
+            if self._latest is None or timestamp > self._latest:
+                self._latest = timestamp
+        finally:
+            self._version += 1
+
+    def update_readings(
+        self, timestamp: float, readings: Mapping[str, MemoryInfo]
+    ) -> None:
+        """Add the used MB of memory readings."""
+        for source, info in readings.items():
+            self.update(source, timestamp, info.used)
+
+    def update_metrics(
+        self,
+        timestamp: float,
+        metrics: Mapping[str, Mapping[str, float]],
+    ) -> None:
+        """Add metric values as ``"{collector}.{field}"`` series."""
+        for source, values in metrics.items():
+            for name, value in values.items():
+                self.update(f"{source}.{name}", timestamp, value)
+
+    def feed(
+        self,
+        history: MemoryHistory,
+        metrics: Optional[MetricHistory] = None,
+    ) -> None:
+        """Add the samples recorded in histories (e.g. when starting)."""
+        for source in history.sources():
+            for sample in history.samples(source):
+                self.update(source, sample.timestamp, sample.used)
+        if metrics is None:
+            return
+        for source in metrics.sources():
+            columns = metrics.columns(source)
+            timestamps = columns.pop("timestamp", [])
+            for name, column in columns.items():
+                for timestamp, value in zip(timestamps, column):
+                    self.update(f"{source}.{name}", timestamp, value)
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Add one ``SystemMonitor.sample()`` result."""
+        self.update_readings(timestamp, readings)
+        if self._metrics:
+            for monitor in list(self._monitors.values()):
+                state = monitor.state
+                # 이 샘플을 만든 모니터의 지표만 추가
+                if state.timestamp == timestamp:
+                    self.update_metrics(timestamp, state.metrics)
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Update the rollup on every sample taken by a monitor."""
+        self._monitors[id(monitor)] = monitor
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Stop receiving samples from a monitor."""
+        monitor.remove_listener(self)
+        self._monitors.pop(id(monitor), None)
+
+    def series(self) -> List[str]:
+        """Get the names of all series."""
+        return self._consistent(lambda: sorted(self._series))
+
+    def _level(
+        self, levels: List[_Level], start: float, bucket: float
+    ) -> _Level:
+        # 요청한 버킷 폭 이하인 가장 거친 해상도
+        index = 0
+        for i, level in enumerate(levels):
+            if level.width <= bucket * (1 + 1e-9):
+                index = i
+        # 구간 시작이 이미 지워졌으면 더 오래 보관하는 해상도로 대체
+        # (가득 차지 않은 해상도는 지운 버킷이 없으므로 그대로 사용)
+        while index + 1 < len(levels):
+            starts = levels[index].starts
+            if not starts or starts[0] <= start:
+                break
+            if len(starts) < (starts.maxlen or 0):
+                break
+            if not levels[index + 1].starts:
+                break
+            index += 1
+        return levels[index]
+
+    def query(
+        self,
+        series: str,
+        start: float,
+        end: float,
+        bucket: Optional[float] = None,
+        max_points: int = 500,
+    ) -> Optional[RollupSeries]:
+        """
+        Get min/max/avg buckets of a series over a time window.
+
+        Args:
+            series: Series name
+            start: Window start, seconds since the epoch
+            end: Window end
+            bucket: Width of the returned buckets in seconds (the window
+                split into ``max_points`` buckets if omitted); rounded
+                up to a multiple of the resolution used
+            max_points: Maximum number of returned buckets; wider
+                buckets are used if ``bucket`` would exceed it
+
+        Returns:
+            Buckets that contain values, oldest first (None if the
+            series was never recorded)
+        """
+        if not math.isfinite(end - start) or (
+            bucket is not None and not math.isfinite(bucket)
+        ):
+            raise ValueError("start, end and bucket must be finite")
+        if end < start:
+            raise ValueError("end must not be before start")
+        if max_points <= 0:
+            raise ValueError("max_points must be positive")
+        if bucket is not None and bucket <= 0:
+            raise ValueError("bucket must be positive")
+        levels = self._series.get(series)
+        if levels is None:
+            return None
+        span = max(end - start, 0.0)
+        bucket = max(bucket or 0.0, span / max_points)
+        level = self._level(levels, start, bucket)
+        width = level.width
+        steps = max(math.ceil(bucket / width - 1e-9), 1)
+        bucket = steps * width
+
+        rows = self._consistent(lambda: level.rows(start, end))
+        points: List[RollupPoint] = []
+        current: Optional[List[Any]] = None
+        for row_start, low, high, total, count in rows:
+            key = math.floor(row_start / bucket) * bucket
+            if current is None or key != current[0]:
+                if current is not None:
+                    points.append(_point(current))
+                current = [key, low, high, total, count]
+                continue
+            if low < current[1]:
+                current[1] = low
+            if high > current[2]:
+                current[2] = high
+            current[3] += total
+            current[4] += count
+        if current is not None:
+            points.append(_point(current))
+        return RollupSeries(series, width, bucket, tuple(points))
+
+    def clear(self) -> None:
+        """Discard all buckets."""
+        self._version += 1
+        try:
+            self._series.clear()
+            self._latest = None
+        finally:
+            self._version += 1
+
+    def __len__(self) -> int:
+        """Get the number of stored buckets of all series."""
+        return sum(
+            len(level)
+            for levels in list(self._series.values())
+            for level in levels
+        )
+
+
+def _point(row: List[Any]) -> RollupPoint:
+    start, low, high, total, count = row
+    return RollupPoint(start, low, high, total / count, count)
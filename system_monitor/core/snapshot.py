@@ -0,0 +1,124 @@
+"""Memory snapshots and differences between them."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from .history import MemoryHistory
+from .info import Bytes, MemoryInfo
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class MemorySnapshot:
+    """Readings of every source at one point in time."""
+
+    timestamp: float  # seconds since the epoch
+    readings: Mapping[str, MemoryInfo] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+
+@dataclass(frozen=True)
+class SourceDiff:
+    """Change of one source's used memory between two snapshots."""
+
+    source: str
+    before: Bytes  # used bytes at the first snapshot
+    after: Bytes  # used bytes at the second snapshot
+    peak: Bytes  # highest used bytes seen from the first to the second
+
+    @property
+    def delta(self) -> Bytes:
+        """Get the change in used bytes."""
+        return self.after - self.before
+
+    @property
+    def peak_increase(self) -> Bytes:
+        """Get how far usage rose above the first snapshot, in bytes."""
+        return max(self.peak - self.before, 0)
+
+    @property
+    def delta_mb(self) -> float:
+        """Get the change in used MB."""
+        return self.delta / _MB
+
+    @property
+    def peak_increase_mb(self) -> float:
+        """Get how far usage rose above the first snapshot, in MB."""
+        return self.peak_increase / _MB
+
+
+@dataclass(frozen=True)
+class MemoryDiff:
+    """Changes of every source present in both snapshots."""
+
+    start: float
+    end: float
+    sources: Mapping[str, SourceDiff] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def __getitem__(self, source: str) -> SourceDiff:
+        return self.sources[source]
+
+    def __contains__(self, source: object) -> bool:
+        return source in self.sources
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the changes in MB as a JSON-serializable dictionary."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "sources": {
+                source: {
+                    "before": diff.before / _MB,
+                    "after": diff.after / _MB,
+                    "peak": diff.peak / _MB,
+                    "delta": diff.delta_mb,
+                    "peak_increase": diff.peak_increase_mb,
+                }
+                for source, diff in self.sources.items()
+            },
+        }
+
+
+def diff_snapshots(
+    before: MemorySnapshot,
+    after: MemorySnapshot,
+    history: Optional[MemoryHistory] = None,
+    peaks: Optional[Mapping[str, Bytes]] = None,
+) -> MemoryDiff:
+    """
+    Compare two snapshots.
+
+    Args:
+        before: Earlier snapshot
+        after: Later snapshot
+        history: History whose samples between the snapshots are
+            included in the peaks (only the snapshots if omitted)
+        peaks: Highest used bytes per source observed otherwise between
+            the snapshots (e.g. by a sample listener)
+
+    Returns:
+        Changes of the sources read in both snapshots
+    """
+    sources: Dict[str, SourceDiff] = {}
+    for source, start in before.readings.items():
+        end = after.readings.get(source)
+        if end is None:
+            continue
+        peak = max(start.used_bytes, end.used_bytes)
+        if history is not None:
+            for sample in history.samples(source):
+                if before.timestamp <= sample.timestamp <= after.timestamp:
+                    peak = max(peak, sample.info.used_bytes)
+        if peaks is not None and source in peaks:
+            peak = max(peak, peaks[source])
+        sources[source] = SourceDiff(
+            source, start.used_bytes, end.used_bytes, peak
+        )
+    return MemoryDiff(
+        before.timestamp, after.timestamp, MappingProxyType(sources)
+    )
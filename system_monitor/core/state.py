@@ -0,0 +1,32 @@
+"""Immutable view of the latest monitor sample."""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from .info import MemoryInfo
+
+
+@dataclass(frozen=True)
+class MonitorState:
+    """
+    Readings of one ``SystemMonitor.sample()`` call.
+
+    A new state is built for every sample and published by replacing a
+    single reference, so a reader always sees the readings of one
+    complete sample without taking a lock.
+    """
+
+    sequence: int  # number of samples taken before and including this one
+    timestamp: Optional[float]  # None before the first sample
+    readings: Mapping[str, MemoryInfo] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    # 수집기 이름별 지표 값 (SystemMonitor collectors)
+    metrics: Mapping[str, Mapping[str, float]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def get(self, source: str) -> Optional[MemoryInfo]:
+        """Get the reading of a source, if it was available."""
+        return self.readings.get(source)
@@ -0,0 +1,370 @@
+"""Append-only on-disk traces of memory samples.
+
+A trace file starts with a magic header followed by independent frames.
+Each frame holds up to ``chunk_size`` samples of one source, encoded
+with :func:`~system_monitor.core.codec.encode_series`, so a trace can
+be written while sampling and read back one frame at a time without
+loading the whole file. Frames with an empty source name hold
+annotations instead, encoded with
+:func:`~system_monitor.core.codec.encode_annotations`.
+"""
+
+import os
+import threading
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from .annotations import Annotation, AnnotationFeed
+from .codec import (
+    decode_annotations,
+    decode_series,
+    encode_annotations,
+    encode_series,
+    write_varint,
+)
+from .history import MemoryHistory
+from .info import MemoryInfo
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..monitor import SystemMonitor
+
+TRACE_MAGIC = b"SMT1"
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class TraceChunk(NamedTuple):
+    """Consecutive samples of one source as columns."""
+
+    source: str
+    timestamps: List[float]  # seconds since the epoch
+    used: List[float]  # in MB
+    total: List[float]  # in MB
+
+
+def history_chunks(
+    history: MemoryHistory, chunk_size: int = 65536
+) -> Iterator[TraceChunk]:
+    """
+    Split the samples of a history into chunks.
+
+    Args:
+        history: History to read
+        chunk_size: Maximum number of samples per chunk
+
+    Returns:
+        Iterator over chunks, grouped by source and oldest first
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    for source in history.sources():
+        samples = history.samples(source)
+        for start in range(0, len(samples), chunk_size):
+            part = samples[start:start + chunk_size]
+            yield TraceChunk(
+                source,
+                [s.timestamp for s in part],
+                [s.used for s in part],
+                [s.total for s in part],
+            )
+
+
+def chunks_to_history(
+    chunks: Iterable[TraceChunk], maxlen: int = 3600
+) -> MemoryHistory:
+    """
+    Collect chunks into a history.
+
+    Args:
+        chunks: Chunks to append in order
+        maxlen: Capacity of the returned history per source (only the
+            newest samples of longer traces are kept)
+    """
+    history = MemoryHistory(maxlen)
+    for chunk in chunks:
+        for t, u, tot in zip(chunk.timestamps, chunk.used, chunk.total):
+            history.append(chunk.source, t, MemoryInfo(used=u, total=tot))
+    return history
+
+
+class TraceWriter:
+    """
+    Sample listener that appends readings to a trace file.
+
+    Samples are buffered per source and written as one frame once
+    ``chunk_size`` samples have accumulated, so memory use stays bounded
+    no matter how long the trace runs. Frames of one source are in time
+    order; frames of different sources may interleave. When attached to
+    a monitor, its annotations are written too, drained on every sample
+    and on ``flush()``::
+
+        with TraceWriter("run.smt") as writer:
+            writer.attach(monitor)
+            monitor.start_sampling(interval=0.1)
+            ...
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        chunk_size: int = 4096,
+        sources: Optional[Iterable[str]] = None,
+    ):
+        """
+        Open a trace file for writing.
+
+        Args:
+            path: File to create (an existing file is replaced)
+            chunk_size: Samples per source buffered before a frame is
+                written
+            sources: Sources to record (all sources if omitted)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._chunk_size = chunk_size
+        self._sources = None if sources is None else frozenset(sources)
+        self._buffers: Dict[str, TraceChunk] = {}
+        self._annotations: List[Annotation] = []
+        self._feed = AnnotationFeed()
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = open(path, "wb")
+        self._file.write(TRACE_MAGIC)
+        self.samples = 0
+        self.annotations = 0
+        self.frames = 0
+
+    @property
+    def closed(self) -> bool:
+        """Whether the trace file has been closed."""
+        return self._file is None
+
+    def write(self, source: str, timestamp: float, info: MemoryInfo) -> None:
+        """Append one reading of a source."""
+        with self._lock:
+            if self._file is None:
+                raise ValueError("trace writer is closed")
+            buffer = self._buffers.get(source)
+            if buffer is None:
+                buffer = TraceChunk(source, [], [], [])
+                self._buffers[source] = buffer
+            buffer.timestamps.append(timestamp)
+            buffer.used.append(info.used)
+            buffer.total.append(info.total)
+            self.samples += 1
+            if len(buffer.timestamps) >= self._chunk_size:
+                self._write_frame(buffer)
+                del self._buffers[source]
+
+    def write_annotation(self, annotation: Annotation) -> None:
+        """Append one annotation."""
+        with self._lock:
+            if self._file is None:
+                raise ValueError("trace writer is closed")
+            self._annotations.append(annotation)
+            self.annotations += 1
+            if len(self._annotations) >= self._chunk_size:
+                self._write_annotation_frame()
+
+    def _drain(self) -> None:
+        for annotation in self._feed.drain():
+            self.write_annotation(annotation)
+
+    def write_chunk(self, chunk: TraceChunk) -> None:
+        """Append consecutive samples of one source."""
+        for t, u, tot in zip(chunk.timestamps, chunk.used, chunk.total):
+            self.write(chunk.source, t, MemoryInfo(used=u, total=tot))
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Append one ``SystemMonitor.sample()`` result."""
+        for source, info in readings.items():
+            if self._sources is None or source in self._sources:
+                self.write(source, timestamp, info)
+        self._drain()
+
+    def _write_frame(self, chunk: TraceChunk) -> None:
+        assert self._file is not None
+        frame = bytearray()
+        name = chunk.source.encode("utf-8")
+        write_varint(frame, len(name))
+        frame.extend(name)
+        block = encode_series(chunk.timestamps, [chunk.used, chunk.total])
+        write_varint(frame, len(block))
+        frame.extend(block)
+        self._file.write(frame)
+        self.frames += 1
+
+    def _write_annotation_frame(self) -> None:
+        assert self._file is not None
+        frame = bytearray()
+        write_varint(frame, 0)  # 빈 소스 이름 = 주석 프레임
+        block = encode_annotations(self._annotations)
+        write_varint(frame, len(block))
+        frame.extend(block)
+        self._file.write(frame)
+        self._annotations = []
+        self.frames += 1
+
+    def _flush(self) -> None:
+        assert self._file is not None
+        for buffer in self._buffers.values():
+            self._write_frame(buffer)
+        self._buffers.clear()
+        if self._annotations:
+            self._write_annotation_frame()
+        self._file.flush()
+
+    def flush(self) -> None:
+        """Write all buffered samples and annotations to the file."""
+        if not self.closed:
+            self._drain()
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+
+    def close(self) -> None:
+        """Flush buffered samples and close the file."""
+        if not self.closed:
+            self._drain()
+        self._feed.unsubscribe()
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._flush()
+            finally:
+                self._file.close()
+                self._file = None
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Register as a sample listener and annotation subscriber."""
+        self._feed.subscribe(getattr(monitor, "annotations", None))
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Unregister from a monitor, keeping its pending annotations."""
+        monitor.remove_listener(self)
+        if not self.closed:
+            self._drain()
+        log = getattr(monitor, "annotations", None)
+        if log is not None:
+            self._feed.unsubscribe(log)
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _read_stream_varint(stream: BinaryIO) -> Optional[int]:
+    """Read a varint from a stream, or None at the end of the stream."""
+    result = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise ValueError("truncated varint")
+            return None
+        result |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return result
+        shift += 7
+
+
+def _read_exact(stream: BinaryIO, length: int) -> bytes:
+    data = stream.read(length)
+    if len(data) != length:
+        raise ValueError("truncated trace frame")
+    return data
+
+
+def _iter_frames(path: PathLike) -> Iterator[Tuple[str, bytes]]:
+    """Read the (source name, encoded block) frames of a trace file."""
+    with open(path, "rb") as stream:
+        if stream.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError("not a memory trace file")
+        while True:
+            length = _read_stream_varint(stream)
+            if length is None:
+                return
+            source = _read_exact(stream, length).decode("utf-8")
+            length = _read_stream_varint(stream)
+            if length is None:
+                raise ValueError("truncated trace frame")
+            yield source, _read_exact(stream, length)
+
+
+def iter_trace(
+    path: PathLike, sources: Optional[Iterable[str]] = None
+) -> Iterator[TraceChunk]:
+    """
+    Read the samples of a trace file frame by frame.
+
+    Args:
+        path: File written by :class:`TraceWriter`
+        sources: Only decode the frames of these sources (all if
+            omitted); other frames are skipped without decoding
+
+    Returns:
+        Iterator over the chunks in the order they were written
+    """
+    wanted = None if sources is None else set(sources)
+    for source, block in _iter_frames(path):
+        if not source or (wanted is not None and source not in wanted):
+            continue
+        timestamps, (used, total), _ = decode_series(block)
+        yield TraceChunk(source, timestamps, used, total)
+
+
+def trace_sources(path: PathLike) -> List[str]:
+    """
+    List the sources of a trace file without decoding its samples.
+
+    Returns:
+        Source names in the order of their first frame
+    """
+    sources: Dict[str, None] = {}
+    for source, _ in _iter_frames(path):
+        if source:
+            sources.setdefault(source)
+    return list(sources)
+
+
+def iter_annotations(path: PathLike) -> Iterator[Annotation]:
+    """
+    Read the annotations of a trace file frame by frame.
+
+    Args:
+        path: File written by :class:`TraceWriter`
+
+    Returns:
+        Iterator over the annotations, ordered by start time within each
+        frame
+    """
+    for source, block in _iter_frames(path):
+        if not source:
+            yield from decode_annotations(block)
+
+
+def read_trace(path: PathLike, maxlen: int = 3600) -> MemoryHistory:
+    """
+    Load a trace file into a history.
+
+    Args:
+        path: File written by :class:`TraceWriter`
+        maxlen: Capacity of the returned history per source
+    """
+    return chunks_to_history(iter_trace(path), maxlen)
@@ -1,46 +1,244 @@
 """Environment detection and setup utilities."""
 
+import importlib.util
 import os
 import sys
-from typing import Dict, Any
+import sysconfig
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# 프로세스당 한 번만 실행되는 환경 프로브 결과 캐시
+# (프로브가 다른 프로브를 호출하므로 재진입 가능한 잠금 사용)
+_probe_cache: Dict[str, Any] = {}
+_probe_lock = threading.RLock()
+
+# CuPy는 CUDA 버전별로 배포 이름이 다르다
+_CUPY_DISTRIBUTIONS = (
+    "cupy",
+    "cupy-cuda12x",
+    "cupy-cuda11x",
+    "cupy-cuda110",
+    "cupy-rocm-5-0",
+)
+
+
+def _cached(key: str, probe: Callable[[], T]) -> T:
+    """프로브를 한 번만 실행하고 결과를 캐시합니다."""
+    try:
+        return _probe_cache[key]
+    except KeyError:
+        pass
+    with _probe_lock:
+        if key not in _probe_cache:
+            _probe_cache[key] = probe()
+        return _probe_cache[key]
+
+
+def _find_module(name: str) -> bool:
+    """모듈을 import하지 않고 설치 여부만 확인합니다."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _distribution_version(*names: str) -> Optional[str]:
+    """설치된 배포판의 버전을 import 없이 조회합니다."""
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: no cover - Python 3.8 미만
+        return None
+
+    for name in names:
+        try:
+            return metadata.version(name)
+        except metadata.PackageNotFoundError:
+            continue
+    return None
+
+
+def probe_module(name: str) -> bool:
+    """
+    모듈 설치 여부를 확인합니다 (프로세스당 한 번, import 없이).
+
+    Args:
+        name: 모듈 이름 (예: "cupy", "google.colab")
+
+    Returns:
+        설치 여부
+    """
+    return _cached(f"module:{name}", lambda: _find_module(name))
+
+
+def probe_ipython() -> Tuple[Optional[str], bool]:
+    """
+    실행 중인 IPython 셸을 확인합니다.
+
+    IPython 셸 안에서는 IPython이 이미 import되어 있으므로
+    ``sys.modules``만 확인하고 새로 import하지 않습니다.
+
+    Returns:
+        (셸 클래스 이름 또는 None, 커널 보유 여부)
+    """
+
+    def probe() -> Tuple[Optional[str], bool]:
+        ipython_module = sys.modules.get("IPython")
+        if ipython_module is None:
+            return None, False
+        get_ipython = getattr(ipython_module, "get_ipython", None)
+        shell = get_ipython() if get_ipython else None
+        if shell is None:
+            return None, False
+        return type(shell).__name__, hasattr(shell, "kernel")
+
+    return _cached("ipython", probe)
+
+
+def get_backend_versions() -> Dict[str, Optional[str]]:
+    """
+    모니터링 백엔드 버전을 반환합니다 (import 없이 패키지 메타데이터 조회).
+
+    Returns:
+        {"cupy": 버전 또는 None, "psutil": 버전 또는 None}
+    """
+
+    def probe() -> Dict[str, Optional[str]]:
+        versions: Dict[str, Optional[str]] = {}
+        for module, distributions in (
+            ("cupy", _CUPY_DISTRIBUTIONS),
+            ("psutil", ("psutil",)),
+        ):
+            loaded = sys.modules.get(module)
+            if loaded is not None and hasattr(loaded, "__version__"):
+                versions[module] = loaded.__version__
+            elif probe_module(module):
+                versions[module] = (
+                    _distribution_version(*distributions) or "unknown"
+                )
+            else:
+                versions[module] = None
+        return versions
+
+    return dict(_cached("backends", probe))
+
+
+def probe_container() -> bool:
+    """
+    컨테이너(Docker, Podman, Kubernetes) 안에서 실행 중인지 확인합니다.
+
+    Returns:
+        컨테이너 여부
+    """
+
+    def probe() -> bool:
+        if os.path.exists("/.dockerenv") or os.path.exists(
+            "/run/.containerenv"
+        ):
+            return True
+        if "KUBERNETES_SERVICE_HOST" in os.environ:
+            return True
+        try:
+            with open("/proc/1/cgroup", "r", encoding="utf-8") as f:
+                content = f.read()
+        except OSError:
+            return False
+        markers = ("docker", "kubepods", "containerd", "libpod", "lxc")
+        return any(marker in content for marker in markers)
+
+    return _cached("container", probe)
+
+
+def probe_free_threading() -> Dict[str, bool]:
+    """
+    자유 스레드(free-threaded, no-GIL) 빌드 여부와 현재 GIL 상태를 확인합니다.
+
+    GIL을 지원하지 않는 확장 모듈을 import하면 실행 중에 GIL이 다시 켜질 수
+    있으므로 이 결과는 캐시하지 않습니다.
+
+    Returns:
+        ``free_threaded_build``와 ``gil_enabled``를 담은 딕셔너리
+    """
+    build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return {
+        "free_threaded_build": build,
+        "gil_enabled": True if is_gil_enabled is None else is_gil_enabled(),
+    }
+
+
+def warm_up_probes(background: bool = True) -> Optional[threading.Thread]:
+    """
+    환경 프로브를 미리 실행해 캐시를 채웁니다.
+
+    Args:
+        background: True이면 데몬 스레드에서 실행
+
+    Returns:
+        background가 True이면 시작된 스레드, 아니면 None
+    """
+
+    def run() -> None:
+        detect_environment()
+        get_backend_versions()
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(
+        target=run, name="system-monitor-env-probe", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def clear_probe_cache() -> None:
+    """캐시된 환경 프로브 결과를 지웁니다."""
+    with _probe_lock:
+        _probe_cache.clear()
 
 
 def detect_environment() -> Dict[str, Any]:
     """
     현재 실행 환경을 감지합니다.
 
+    프로브 결과는 프로세스당 한 번만 계산되어 캐시됩니다.
+
     Returns:
         환경 정보를 담은 딕셔너리
     """
+    env_info = dict(_cached("environment", _detect_environment))
+    env_info.update(probe_free_threading())
+    return env_info
+
+
+def _detect_environment() -> Dict[str, Any]:
     env_info = {
         "is_colab": False,
         "is_jupyter": False,
         "is_vscode": False,
         "is_terminal": False,
+        "is_container": False,
         "python_version": sys.version,
         "platform": sys.platform,
     }
 
     # Google Colab 감지
-    try:
-        import google.colab  # noqa: F401
-
-        env_info["is_colab"] = True
-    except ImportError:
-        pass
+    env_info["is_colab"] = probe_module("google.colab")
 
     # Jupyter 환경 감지
-    try:
-        from IPython import get_ipython  # noqa: F401
-
-        ipython = get_ipython()
-        if ipython is not None:
-            env_info["is_jupyter"] = True
-            # Colab이 아닌 일반 Jupyter인지 확인
-            if not env_info["is_colab"]:
-                env_info["jupyter_type"] = type(ipython).__name__
-    except ImportError:
-        pass
+    shell_type, _ = probe_ipython()
+    if shell_type is not None:
+        env_info["is_jupyter"] = True
+        # Colab이 아닌 일반 Jupyter인지 확인
+        if not env_info["is_colab"]:
+            env_info["jupyter_type"] = shell_type
+
+    # 컨테이너 환경 감지 (다른 환경과 함께 참일 수 있음)
+    env_info["is_container"] = probe_container()
 
     # VSCode 환경 감지
     if "VSCODE_PID" in os.environ or "TERM_PROGRAM" in os.environ:
@@ -131,47 +329,68 @@ def print_environment_info():
         print("알 수 없는 환경")
 
     print(f"Python: {env_info['python_version'].split()[0]}")
+    if env_info["free_threaded_build"]:
+        gil = "켜짐" if env_info["gil_enabled"] else "꺼짐"
+        print(f"자유 스레드 빌드 (GIL {gil})")
     print(f"플랫폼: {env_info['platform']}")
 
-    # GPU 환경 체크
-    try:
-        import cupy
-
-        print(f"CuPy: {cupy.__version__} (GPU 사용 가능)")
-    except ImportError:
+    # GPU 환경 체크 (CuPy를 import하지 않고 메타데이터만 조회)
+    versions = get_backend_versions()
+    if versions["cupy"]:
+        print(f"CuPy: {versions['cupy']} (GPU 사용 가능)")
+    else:
         print("CuPy: 미설치 (GPU 모니터링 불가)")
 
-    try:
-        import psutil
-
-        print(f"psutil: {psutil.__version__} (CPU 모니터링 가능)")
-    except ImportError:
+    if versions["psutil"]:
+        print(f"psutil: {versions['psutil']} (CPU 모니터링 가능)")
+    else:
         print("psutil: 미설치 (CPU 모니터링 불가)")
 
 
-def setup_environment_optimized_monitor():
+def setup_environment_optimized_monitor(profile=None):
     """
     환경에 최적화된 SystemMonitor를 설정하고 반환합니다.
 
+    환경에 맞는 모니터 프로필(소스, 샘플링 주기, 기록 크기)을 선택하고
+    검증한 뒤, 프로필에 샘플링 주기가 있으면 백그라운드 샘플링을 시작합니다.
+
+    Args:
+        profile: 사용할 프로필 이름 또는 MonitorProfile
+            (없으면 환경과 SYSTEM_MONITOR_* 환경 변수로 선택)
+
     Returns:
         설정된 SystemMonitor 인스턴스
+
+    Raises:
+        ValueError: 프로필 설정이 잘못된 경우
     """
     from .monitor import SystemMonitor
     from .logging_config import setup_logger
+    from .profiles import select_profile
 
     env_info = detect_environment()
     config = get_optimal_logging_config(env_info)
 
+    # 시작 시점에 프로필 검증 (잘못된 설정이면 즉시 실패)
+    if profile is None:
+        profile = select_profile(env_info)
+    elif isinstance(profile, str):
+        profile = select_profile(
+            env_info, {**os.environ, "SYSTEM_MONITOR_PROFILE": profile}
+        )
+    else:
+        profile.validate()
+
     # 환경 최적화 로깅 설정
     import logging
 
     level = getattr(logging, config["level"].upper())
     setup_logger("system_monitor", level=level, force_setup=True)
 
-    # GPU 사용 여부 결정 (Colab에서는 더 적극적으로 GPU 시도)
-    use_gpu = True
-    if env_info["is_colab"]:
-        # Colab에서는 GPU 런타임 체크를 더 관대하게
+    # GPU 사용 여부 결정 (CuPy가 없으면 import 시도 자체를 생략)
+    use_gpu = "gpu" in profile.sources and probe_module("cupy")
+    if use_gpu and env_info["is_colab"]:
+        # Colab에서는 GPU 런타임이 실제로 연결되어 있는지 확인
         try:
             import cupy
 
@@ -181,7 +400,17 @@ def setup_environment_optimized_monitor():
         except Exception:
             use_gpu = False
 
-    monitor = SystemMonitor(use_gpu=use_gpu)
+    monitor = SystemMonitor(
+        use_gpu=use_gpu,
+        track_process="process" in profile.sources,
+        history_size=profile.history_size,
+        track_cgroup="cgroup" in profile.sources,
+        track_host="host" in profile.sources,
+        track_gpu_stats="gpu_stats" in profile.sources,
+        track_gpu_processes="gpu_processes" in profile.sources,
+    )
+    if profile.interval is not None:
+        monitor.start_sampling(profile.interval, profile.scheduler())
 
     # 환경 정보와 함께 초기화 메시지 출력
     if env_info["is_colab"]:
@@ -195,5 +424,9 @@ def setup_environment_optimized_monitor():
 
     print(f"   CPU 모니터링: {'예' if monitor.has_cpu else '아니오'}")
     print(f"   GPU 모니터링: {'예' if monitor.has_gpu else '아니오'}")
+    if profile.interval is None:
+        print(f"   프로필: {profile.name} (수동 샘플링)")
+    else:
+        print(f"   프로필: {profile.name} (샘플링 주기 {profile.interval}s)")
 
     return monitor
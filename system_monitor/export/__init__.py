@@ -0,0 +1,5 @@
+"""Exporters of recorded memory traces to other formats.
+
+Submodules import their optional dependencies themselves, so importing
+this package never requires them.
+"""
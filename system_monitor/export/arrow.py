@@ -0,0 +1,426 @@
+"""Arrow record batches and Parquet files of memory traces.
+
+Samples are written in the long format of ``MemoryHistory.to_records()``
+with typed columns:
+
+- ``timestamp``: ``timestamp[us, tz=UTC]``
+- ``source``: ``dictionary<int16, string>``, so each device name is
+  stored once per batch
+- ``used`` / ``total``: ``float64`` in MB
+
+Conversion works on :class:`~system_monitor.core.trace.TraceChunk`
+streams in both directions and never holds more than one batch, so
+traces far larger than memory can be exported and imported.
+
+Annotations are exported to their own tables and files with
+:func:`annotation_schema` (``timestamp``, dictionary encoded ``name``,
+``duration`` in seconds and ``thread``).
+"""
+
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union
+
+from ..core import Annotation, AnnotationLog, MemoryHistory
+from ..core.trace import (
+    PathLike,
+    TraceChunk,
+    chunks_to_history,
+    history_chunks,
+    iter_annotations,
+    iter_trace,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    pq = None
+
+COLUMNS = ("timestamp", "source", "used", "total")
+ANNOTATION_COLUMNS = ("timestamp", "name", "duration", "thread")
+
+TraceSource = Union[MemoryHistory, PathLike, Iterable[TraceChunk]]
+AnnotationSource = Union[AnnotationLog, PathLike, Iterable[Annotation]]
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet export "
+            "(pip install system-monitor[arrow])"
+        )
+
+
+def arrow_schema() -> "pa.Schema":
+    """Get the Arrow schema of exported traces."""
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field("timestamp", pa.timestamp("us", tz="UTC"), False),
+            pa.field("source", pa.dictionary(pa.int16(), pa.string()), False),
+            pa.field("used", pa.float64(), False),
+            pa.field("total", pa.float64(), False),
+        ],
+        metadata={"system_monitor.units": "MB"},
+    )
+
+
+def _chunks(trace: TraceSource, chunk_size: int) -> Iterable[TraceChunk]:
+    if isinstance(trace, MemoryHistory):
+        return history_chunks(trace, chunk_size)
+    if isinstance(trace, (str, os.PathLike)):
+        return iter_trace(trace)
+    return trace
+
+
+class _BatchBuilder:
+    """Accumulates chunk rows into columns of at most one batch."""
+
+    def __init__(self, schema: "pa.Schema"):
+        self._schema = schema
+        self._sources: Dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.timestamps: List[int] = []
+        self.indices: List[int] = []
+        self.used: List[float] = []
+        self.total: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, chunk: TraceChunk, start: int, stop: int) -> None:
+        index = self._sources.setdefault(chunk.source, len(self._sources))
+        self.timestamps.extend(
+            round(t * 1_000_000) for t in chunk.timestamps[start:stop]
+        )
+        self.indices.extend([index] * (stop - start))
+        self.used.extend(chunk.used[start:stop])
+        self.total.extend(chunk.total[start:stop])
+
+    def build(self) -> "pa.RecordBatch":
+        # 지금까지 나온 소스 이름만 사전으로 사용 (소스 수는 작음)
+        dictionary = pa.array(list(self._sources), pa.string())
+        columns = [
+            pa.array(self.timestamps, pa.int64()).cast(
+                self._schema.field("timestamp").type
+            ),
+            pa.DictionaryArray.from_arrays(
+                pa.array(self.indices, pa.int16()), dictionary
+            ),
+            pa.array(self.used, pa.float64()),
+            pa.array(self.total, pa.float64()),
+        ]
+        batch = pa.RecordBatch.from_arrays(columns, schema=self._schema)
+        self.reset()
+        return batch
+
+
+def to_record_batches(
+    trace: TraceSource, batch_size: int = 65536
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Convert a trace into Arrow record batches.
+
+    Args:
+        trace: ``MemoryHistory``, path of a trace file written by
+            ``TraceWriter``, or an iterable of ``TraceChunk``
+        batch_size: Maximum number of rows per batch
+
+    Returns:
+        Iterator over record batches with :func:`arrow_schema`
+    """
+    _require_pyarrow()
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    return _iter_batches(_chunks(trace, batch_size), batch_size)
+
+
+def _iter_batches(
+    chunks: Iterable[TraceChunk], batch_size: int
+) -> Iterator["pa.RecordBatch"]:
+    builder = _BatchBuilder(arrow_schema())
+    for chunk in chunks:
+        start = 0
+        count = len(chunk.timestamps)
+        while start < count:
+            stop = min(count, start + batch_size - len(builder))
+            builder.add(chunk, start, stop)
+            start = stop
+            if len(builder) >= batch_size:
+                yield builder.build()
+    if len(builder):
+        yield builder.build()
+
+
+def write_parquet(
+    trace: TraceSource,
+    path: PathLike,
+    batch_size: int = 65536,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write a trace to a Parquet file, one row group per batch.
+
+    Args:
+        trace: Trace to export (see :func:`to_record_batches`)
+        path: Output file
+        batch_size: Rows per row group
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    rows = 0
+    with pq.ParquetWriter(
+        path, arrow_schema(), compression=compression
+    ) as writer:
+        for batch in to_record_batches(trace, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def _timestamps(column: Any) -> Sequence[float]:
+    if pa.types.is_timestamp(column.type):
+        micros = column.cast(pa.timestamp("us")).cast(pa.int64())
+        return [value / 1_000_000 for value in micros.to_pylist()]
+    return column.cast(pa.float64()).to_pylist()
+
+
+def from_record_batches(
+    batches: Iterable["pa.RecordBatch"],
+) -> Iterator[TraceChunk]:
+    """
+    Convert record batches back into trace chunks.
+
+    The ``source`` column may be dictionary encoded or plain strings and
+    ``timestamp`` may be an Arrow timestamp or float seconds.
+
+    Args:
+        batches: Batches with at least the columns of :data:`COLUMNS`
+
+    Returns:
+        Iterator over one chunk per source and batch, in row order
+    """
+    _require_pyarrow()
+    return _iter_chunks(batches)
+
+
+def _iter_chunks(
+    batches: Iterable["pa.RecordBatch"],
+) -> Iterator[TraceChunk]:
+    for batch in batches:
+        timestamps = _timestamps(batch.column("timestamp"))
+        sources = batch.column("source").to_pylist()
+        used = batch.column("used").to_pylist()
+        total = batch.column("total").to_pylist()
+        chunks: Dict[str, TraceChunk] = {}
+        for t, source, u, tot in zip(timestamps, sources, used, total):
+            chunk = chunks.get(source)
+            if chunk is None:
+                chunk = chunks[source] = TraceChunk(source, [], [], [])
+            chunk.timestamps.append(t)
+            chunk.used.append(u)
+            chunk.total.append(tot)
+        yield from chunks.values()
+
+
+def iter_parquet(
+    path: PathLike, batch_size: int = 65536
+) -> Iterator[TraceChunk]:
+    """
+    Read a Parquet trace incrementally.
+
+    Args:
+        path: Parquet file with the columns of :data:`COLUMNS`
+        batch_size: Rows read at a time
+
+    Returns:
+        Iterator over trace chunks
+    """
+    _require_pyarrow()
+    parquet = pq.ParquetFile(path)
+    return from_record_batches(
+        parquet.iter_batches(batch_size=batch_size, columns=list(COLUMNS))
+    )
+
+
+def read_parquet(
+    path: PathLike, maxlen: int = 3600, batch_size: int = 65536
+) -> MemoryHistory:
+    """
+    Load a Parquet trace into a history.
+
+    Args:
+        path: Parquet file with the columns of :data:`COLUMNS`
+        maxlen: Capacity of the returned history per source (only the
+            newest samples of longer traces are kept)
+        batch_size: Rows read at a time
+    """
+    return chunks_to_history(iter_parquet(path, batch_size), maxlen)
+
+
+def to_table(trace: TraceSource, batch_size: int = 65536) -> "pa.Table":
+    """Collect a whole trace into one Arrow table."""
+    _require_pyarrow()
+    return pa.Table.from_batches(
+        list(to_record_batches(trace, batch_size)), schema=arrow_schema()
+    )
+
+
+def annotation_schema() -> "pa.Schema":
+    """Get the Arrow schema of exported annotations."""
+    _require_pyarrow()
+    return pa.schema(
+        [
+            pa.field("timestamp", pa.timestamp("us", tz="UTC"), False),
+            pa.field("name", pa.dictionary(pa.int32(), pa.string()), False),
+            pa.field("duration", pa.float64(), False),
+            pa.field("thread", pa.uint64(), False),
+        ],
+        metadata={"system_monitor.duration_units": "s"},
+    )
+
+
+def _annotations(source: AnnotationSource) -> Iterable[Annotation]:
+    if isinstance(source, AnnotationLog):
+        return source.annotations()
+    if isinstance(source, (str, os.PathLike)):
+        return iter_annotations(source)
+    return source
+
+
+def annotations_to_record_batches(
+    annotations: AnnotationSource, batch_size: int = 65536
+) -> Iterator["pa.RecordBatch"]:
+    """
+    Convert annotations into Arrow record batches.
+
+    Args:
+        annotations: ``AnnotationLog`` (e.g. ``monitor.annotations``),
+            path of a trace file written by ``TraceWriter``, or an
+            iterable of ``Annotation``
+        batch_size: Maximum number of rows per batch
+
+    Returns:
+        Iterator over record batches with :func:`annotation_schema`
+    """
+    _require_pyarrow()
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    return _iter_annotation_batches(_annotations(annotations), batch_size)
+
+
+def _annotation_batch(
+    schema: "pa.Schema", rows: List[Annotation]
+) -> "pa.RecordBatch":
+    timestamps, names, durations, threads = zip(*rows)
+    columns = [
+        pa.array(
+            [round(t * 1_000_000) for t in timestamps], pa.int64()
+        ).cast(schema.field("timestamp").type),
+        pa.array(names, pa.string()).dictionary_encode(),
+        pa.array(durations, pa.float64()),
+        pa.array(threads, pa.uint64()),
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _iter_annotation_batches(
+    annotations: Iterable[Annotation], batch_size: int
+) -> Iterator["pa.RecordBatch"]:
+    schema = annotation_schema()
+    rows: List[Annotation] = []
+    for annotation in annotations:
+        rows.append(annotation)
+        if len(rows) >= batch_size:
+            yield _annotation_batch(schema, rows)
+            rows = []
+    if rows:
+        yield _annotation_batch(schema, rows)
+
+
+def write_annotations_parquet(
+    annotations: AnnotationSource,
+    path: PathLike,
+    batch_size: int = 65536,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write annotations to a Parquet file, one row group per batch.
+
+    Args:
+        annotations: Annotations to export (see
+            :func:`annotations_to_record_batches`)
+        path: Output file
+        batch_size: Rows per row group
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    rows = 0
+    with pq.ParquetWriter(
+        path, annotation_schema(), compression=compression
+    ) as writer:
+        for batch in annotations_to_record_batches(annotations, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def from_annotation_batches(
+    batches: Iterable["pa.RecordBatch"],
+) -> Iterator[Annotation]:
+    """
+    Convert record batches back into annotations.
+
+    Args:
+        batches: Batches with the columns of :data:`ANNOTATION_COLUMNS`
+
+    Returns:
+        Iterator over annotations in row order
+    """
+    _require_pyarrow()
+    return _iter_annotations(batches)
+
+
+def _iter_annotations(
+    batches: Iterable["pa.RecordBatch"],
+) -> Iterator[Annotation]:
+    for batch in batches:
+        yield from (
+            Annotation(t, name, duration, thread)
+            for t, name, duration, thread in zip(
+                _timestamps(batch.column("timestamp")),
+                batch.column("name").to_pylist(),
+                batch.column("duration").to_pylist(),
+                batch.column("thread").to_pylist(),
+            )
+        )
+
+
+def read_annotations_parquet(
+    path: PathLike, batch_size: int = 65536
+) -> List[Annotation]:
+    """
+    Load annotations from a Parquet file.
+
+    Args:
+        path: Parquet file with the columns of :data:`ANNOTATION_COLUMNS`
+        batch_size: Rows read at a time
+    """
+    _require_pyarrow()
+    parquet = pq.ParquetFile(path)
+    return list(
+        from_annotation_batches(
+            parquet.iter_batches(
+                batch_size=batch_size, columns=list(ANNOTATION_COLUMNS)
+            )
+        )
+    )
@@ -0,0 +1,341 @@
+"""Chrome Trace Event JSON export of memory counters and annotations.
+
+The files open in Perfetto (https://ui.perfetto.dev) and
+``chrome://tracing`` next to CPU profiles in the same format:
+
+- every memory source is a counter track named ``"{source} memory
+  (MB)"`` with the stacked series ``used`` and ``free`` (so the stack
+  height is the total)
+- every metric field (``MetricHistory``) is a counter track named
+  ``"{source}.{field}"``
+- spans are complete (``"X"``) slices and marks are instant (``"i"``)
+  events on the thread that recorded them
+
+Events are written one per line as they arrive, so traces of any length
+are exported without building them in memory. Paths ending in ``.gz``
+are gzip compressed, which Perfetto opens directly.
+"""
+
+import gzip
+import itertools
+import json
+import os
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    TextIO,
+    TYPE_CHECKING,
+    Union,
+)
+
+from ..core import Annotation, AnnotationLog, MemoryHistory, MemoryInfo
+from ..core.annotations import AnnotationFeed
+from ..core.metrics import MetricHistory
+from ..core.trace import (
+    PathLike,
+    TraceChunk,
+    history_chunks,
+    iter_annotations,
+    iter_trace,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..monitor import SystemMonitor
+
+TraceSource = Union[MemoryHistory, PathLike, Iterable[TraceChunk]]
+
+
+class ChromeTraceWriter:
+    """
+    Sample listener that streams a Chrome Trace Event JSON file.
+
+    Use it like ``TraceWriter``; when attached to a monitor, annotations
+    are written on every sample and on ``flush()``::
+
+        with ChromeTraceWriter("run.json.gz") as writer:
+            writer.attach(monitor)
+            monitor.start_sampling(interval=0.1)
+            ...
+
+    Timestamps are microseconds since ``time_origin`` (the epoch by
+    default). To overlay another trace, use the same origin and pass its
+    process id as ``pid`` so the counters appear in that process.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        pid: Optional[int] = None,
+        process_name: str = "system_monitor",
+        time_origin: float = 0.0,
+        metrics: bool = True,
+    ):
+        """
+        Open a trace file for writing.
+
+        Args:
+            path: File to create (gzip compressed if it ends in ``.gz``)
+            pid: Process id of the events (this process if omitted)
+            process_name: Name shown for the process
+            time_origin: Time in seconds since the epoch mapped to 0
+            metrics: Whether ``__call__`` also writes the monitor's
+                latest metric values
+        """
+        self._pid = os.getpid() if pid is None else pid
+        self._origin = time_origin
+        self._metrics = metrics
+        self._monitors: Dict[int, "SystemMonitor"] = {}
+        self._feed = AnnotationFeed()
+        self._threads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO]
+        if os.fspath(path).endswith(".gz"):
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+        self._file.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+        self._first = True
+        self.events = 0
+        self._emit(
+            {
+                "ph": "M",
+                "name": "process_name",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": process_name},
+            }
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Whether the trace file has been closed."""
+        return self._file is None
+
+    def _ts(self, timestamp: float) -> float:
+        return round((timestamp - self._origin) * 1_000_000, 3)
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        if self._file is None:
+            raise ValueError("trace writer is closed")
+        line = json.dumps(event, separators=(",", ":"))
+        self._file.write(line if self._first else ",\n" + line)
+        self._first = False
+        self.events += 1
+
+    def _tid(self, thread: int) -> int:
+        # 큰 스레드 식별자 대신 작은 번호를 쓰고 이름을 메타데이터로 기록
+        tid = self._threads.get(thread)
+        if tid is None:
+            tid = self._threads[thread] = len(self._threads) + 1
+            name = next(
+                (
+                    t.name
+                    for t in threading.enumerate()
+                    if t.ident == thread
+                ),
+                f"thread {thread}",
+            )
+            self._emit(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": self._pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        return tid
+
+    def write_sample(
+        self, source: str, timestamp: float, info: MemoryInfo
+    ) -> None:
+        """Append one reading of a source to its counter track."""
+        with self._lock:
+            self._emit(
+                {
+                    "ph": "C",
+                    "name": f"{source} memory (MB)",
+                    "pid": self._pid,
+                    "tid": 0,
+                    "ts": self._ts(timestamp),
+                    "args": {
+                        "used": info.used,
+                        "free": max(info.total - info.used, 0.0),
+                    },
+                }
+            )
+
+    def write_chunk(self, chunk: TraceChunk) -> None:
+        """Append consecutive samples of one source."""
+        for t, u, tot in zip(chunk.timestamps, chunk.used, chunk.total):
+            self.write_sample(chunk.source, t, MemoryInfo(used=u, total=tot))
+
+    def write_metrics(
+        self, source: str, timestamp: float, values: Mapping[str, float]
+    ) -> None:
+        """Append metric values, one counter track per field."""
+        with self._lock:
+            for field, value in values.items():
+                if value != value:  # nan은 기록하지 않음
+                    continue
+                self._emit(
+                    {
+                        "ph": "C",
+                        "name": f"{source}.{field}",
+                        "pid": self._pid,
+                        "tid": 0,
+                        "ts": self._ts(timestamp),
+                        "args": {"value": value},
+                    }
+                )
+
+    def write_annotation(self, annotation: Annotation) -> None:
+        """Append a span as a slice or a mark as an instant event."""
+        with self._lock:
+            event: Dict[str, Any] = {
+                "name": annotation.name,
+                "cat": "annotation",
+                "pid": self._pid,
+                "tid": self._tid(annotation.thread),
+                "ts": self._ts(annotation.timestamp),
+            }
+            if annotation.duration > 0:
+                event["ph"] = "X"
+                event["dur"] = round(annotation.duration * 1_000_000, 3)
+            else:
+                event["ph"] = "i"
+                event["s"] = "t"
+            self._emit(event)
+
+    def _drain(self) -> None:
+        for annotation in self._feed.drain():
+            self.write_annotation(annotation)
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Append one ``SystemMonitor.sample()`` result."""
+        for source, info in readings.items():
+            self.write_sample(source, timestamp, info)
+        if self._metrics:
+            for monitor in list(self._monitors.values()):
+                state = monitor.state
+                # 이 샘플을 만든 모니터의 지표만 기록
+                if state.timestamp == timestamp:
+                    for source, values in state.metrics.items():
+                        self.write_metrics(source, timestamp, values)
+        self._drain()
+
+    def flush(self) -> None:
+        """Write pending annotations and flush the file."""
+        if self.closed:
+            return
+        self._drain()
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Write pending annotations, terminate the JSON and close."""
+        if not self.closed:
+            self._drain()
+        self._feed.unsubscribe()
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write("\n]}\n")
+            finally:
+                self._file.close()
+                self._file = None
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Register as a sample listener and annotation subscriber."""
+        self._monitors[id(monitor)] = monitor
+        self._feed.subscribe(getattr(monitor, "annotations", None))
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Unregister from a monitor, keeping its pending annotations."""
+        monitor.remove_listener(self)
+        if not self.closed:
+            self._drain()
+        self._monitors.pop(id(monitor), None)
+        log = getattr(monitor, "annotations", None)
+        if log is not None:
+            self._feed.unsubscribe(log)
+
+    def __enter__(self) -> "ChromeTraceWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _chunks(trace: TraceSource) -> Iterable[TraceChunk]:
+    if isinstance(trace, MemoryHistory):
+        return history_chunks(trace)
+    if isinstance(trace, (str, os.PathLike)):
+        return iter_trace(trace)
+    return trace
+
+
+def write_chrome_trace(
+    trace: Union["SystemMonitor", TraceSource],
+    path: PathLike,
+    annotations: Optional[Union[AnnotationLog, Iterable[Annotation]]] = None,
+    metrics: Optional[MetricHistory] = None,
+    **options: Any,
+) -> int:
+    """
+    Export a recorded trace as a Chrome Trace Event JSON file.
+
+    Args:
+        trace: ``SystemMonitor`` (its history, metrics and annotations),
+            ``MemoryHistory``, path of a trace file written by
+            ``TraceWriter`` (with its annotations), or an iterable of
+            ``TraceChunk``
+        path: Output file (gzip compressed if it ends in ``.gz``)
+        annotations: Annotations to export in addition
+        metrics: Metric history to export in addition
+        **options: ``ChromeTraceWriter`` arguments (``pid``,
+            ``process_name``, ``time_origin``)
+
+    Returns:
+        Number of events written
+    """
+    from ..monitor import SystemMonitor
+
+    recorded: Iterable[Annotation] = ()
+    if isinstance(trace, SystemMonitor):
+        chunks = _chunks(trace.history)
+        recorded = trace.annotations.annotations()
+        if metrics is None:
+            metrics = trace.metrics
+    else:
+        chunks = _chunks(trace)
+        if isinstance(trace, (str, os.PathLike)):
+            recorded = iter_annotations(trace)
+    if isinstance(annotations, AnnotationLog):
+        annotations = annotations.annotations()
+
+    with ChromeTraceWriter(path, **options) as writer:
+        for chunk in chunks:
+            writer.write_chunk(chunk)
+        if metrics is not None:
+            for source in metrics.sources():
+                columns = metrics.columns(source)
+                timestamps = columns.pop("timestamp", [])
+                for index, timestamp in enumerate(timestamps):
+                    values = {
+                        name: column[index]
+                        for name, column in columns.items()
+                    }
+                    writer.write_metrics(source, timestamp, values)
+        for annotation in itertools.chain(recorded, annotations or ()):
+            writer.write_annotation(annotation)
+        return writer.events
@@ -0,0 +1,318 @@
+"""Fork safety and relaying of worker process samples."""
+
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+    Tuple,
+    Union,
+)
+
+from .core import MemoryHistory, MemoryInfo
+from .logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from multiprocessing.context import BaseContext
+    from .monitor import SystemMonitor
+
+logger = get_logger('system_monitor.forking')
+
+# (pid, timestamp, ((source, used_bytes, total_bytes), ...))
+_Message = Tuple[int, float, Tuple[Tuple[str, int, int], ...]]
+
+_monitors: "weakref.WeakSet[SystemMonitor]" = weakref.WeakSet()
+_relays: "weakref.WeakSet[WorkerRelay]" = weakref.WeakSet()
+# fork 동안 처리 중인 객체 (before에서 잡은 잠금을 같은 순서로 풀기 위해)
+_forking: List[Any] = []
+_registered = False
+_register_lock = threading.Lock()
+
+
+def _before_fork() -> None:
+    # 릴레이가 샘플링 주기를 먼저 기록한 뒤 모니터가 잠금을 잡음
+    _forking[:] = list(_relays) + list(_monitors)
+    for obj in _forking:
+        try:
+            obj._before_fork()
+        except Exception as e:
+            logger.error(f"Fork preparation failed: {e}")
+
+
+def _after_fork_parent() -> None:
+    for obj in reversed(_forking):
+        try:
+            obj._after_fork_parent()
+        except Exception as e:
+            logger.error(f"Fork cleanup failed in parent: {e}")
+    _forking.clear()
+
+
+def _after_fork_child() -> None:
+    global _register_lock
+    _register_lock = threading.Lock()
+    # 릴레이는 multiprocessing이 큐를 초기화한 뒤 다시 연결함
+    for obj in _forking:
+        if isinstance(obj, WorkerRelay):
+            continue
+        try:
+            obj._after_fork_child()
+        except Exception as e:
+            logger.error(f"Fork cleanup failed in child: {e}")
+    _forking.clear()
+
+
+def _register_handlers() -> None:
+    global _registered
+    if _registered:
+        return
+    with _register_lock:
+        if not _registered and hasattr(os, "register_at_fork"):
+            os.register_at_fork(
+                before=_before_fork,
+                after_in_parent=_after_fork_parent,
+                after_in_child=_after_fork_child,
+            )
+        _registered = True
+
+
+def track(monitor: "SystemMonitor") -> None:
+    """
+    Make a monitor fork-safe.
+
+    Before a fork the monitor's locks are taken, so the fork waits for
+    an in-progress sample and the background sampler pauses until the
+    parent continues. In the child the locks are recreated, the sampler
+    (whose thread does not exist there) is stopped, listeners of the
+    parent are dropped, CUDA handles are released and the process
+    monitor follows the child.
+    """
+    _register_handlers()
+    _monitors.add(monitor)
+
+
+def _context(
+    context: Optional[Union[str, "BaseContext"]]
+) -> "BaseContext":
+    if context is None or isinstance(context, str):
+        return multiprocessing.get_context(context)
+    return context
+
+
+class WorkerRelay:
+    """
+    Forwards the samples of worker processes to a monitor in the parent.
+
+    Create it in the parent and ``attach()`` the parent's monitor; the
+    readings of every worker are recorded in that monitor's history as
+    ``worker{pid}_{source}`` on each parent sample (or ``drain()``).
+
+    - Workers forked by ``multiprocessing`` (``fork`` start method,
+      e.g. ``DataLoader`` workers) reconnect automatically: their copy
+      of the attached monitor publishes its samples, sampling at the
+      parent's interval if the parent was sampling.
+    - Spawned workers get the relay as an argument and call
+      ``connect(monitor, interval)`` with a monitor of their own. The
+      relay must be created with the same ``context`` as the workers.
+
+    Readings are sent in bytes through a ``multiprocessing`` queue;
+    when the queue is full, workers drop readings instead of blocking.
+    Workers come and go (e.g. a new set per epoch), so the series of a
+    worker silent for ``expire_after`` seconds are removed.
+    """
+
+    def __init__(
+        self,
+        context: Optional[Union[str, "BaseContext"]] = None,
+        maxsize: int = 10000,
+        expire_after: Optional[float] = 600.0,
+    ):
+        """
+        Initialize relay.
+
+        Args:
+            context: ``multiprocessing`` context or start method name of
+                the workers (the default context if omitted)
+            maxsize: Maximum number of samples waiting in the queue
+            expire_after: Seconds without samples after which a worker
+                and its ``worker{pid}_*`` series are removed from
+                ``workers`` and the history (None keeps them)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if expire_after is not None and not expire_after > 0:
+            raise ValueError("expire_after must be positive")
+        self._queue = _context(context).Queue(maxsize)
+        self._expire_after = expire_after
+        self._init_local()
+        # 큐 자체의 fork 후 초기화 다음에 호출되도록 큐 생성 뒤에 등록
+        multiprocessing.util.register_after_fork(
+            self, WorkerRelay._after_fork_child
+        )
+
+    def _init_local(self) -> None:
+        self._monitor: Optional["SystemMonitor"] = None
+        self._connected: Optional["SystemMonitor"] = None
+        self._fork_interval: Optional[float] = None
+        self.workers: Dict[int, float] = {}  # 마지막 샘플 시각
+        self._series: Dict[int, Set[str]] = {}  # 워커별 기록한 소스
+        self._seen: Dict[int, float] = {}  # 부모 시계로 마지막 수신 시각
+        self.received = 0
+        self.dropped = 0  # 큐가 가득 차 보내지 못한 샘플 (워커 쪽)
+        _register_handlers()
+        _relays.add(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # spawn 워커에는 큐와 설정만 전달
+        return {"queue": self._queue, "expire_after": self._expire_after}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._queue = state["queue"]
+        self._expire_after = state["expire_after"]
+        self._init_local()
+
+    def attach(self, monitor: "SystemMonitor") -> None:
+        """Record worker samples in a monitor's history on its samples."""
+        if self._monitor is not None:
+            self._monitor.remove_listener(self)
+        self._monitor = monitor
+        monitor.add_listener(self)
+
+    def detach(self, monitor: "SystemMonitor") -> None:
+        """Stop recording worker samples in a monitor."""
+        monitor.remove_listener(self)
+        if self._monitor is monitor:
+            self._monitor = None
+
+    def connect(
+        self, monitor: "SystemMonitor", interval: Optional[float] = None
+    ) -> None:
+        """
+        Publish a worker's samples to the parent.
+
+        Args:
+            monitor: Monitor of the worker process
+            interval: Start background sampling at this interval
+        """
+        self._connected = monitor
+        monitor.add_listener(self._publish)
+        if interval is not None:
+            monitor.start_sampling(interval)
+
+    def _publish(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        message: _Message = (
+            os.getpid(),
+            timestamp,
+            tuple(
+                (source, info.used_bytes, info.total_bytes)
+                for source, info in readings.items()
+            ),
+        )
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+
+    def drain(self, now: Optional[float] = None) -> int:
+        """
+        Record the samples received from workers.
+
+        Called on every sample of the attached monitor; call it directly
+        only while that monitor is not sampling.
+
+        Args:
+            now: Current time for expiring silent workers, on the
+                parent's clock (``time.time()`` if omitted)
+
+        Returns:
+            Number of samples recorded
+        """
+        monitor = self._monitor
+        if monitor is None:
+            return 0
+        history = monitor.history
+        if now is None:
+            now = time.time()
+        count = 0
+        while True:
+            try:
+                pid, timestamp, readings = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            except Exception as e:
+                logger.error(f"Failed to receive worker sample: {e}")
+                break
+            series = self._series.setdefault(pid, set())
+            for source, used, total in readings:
+                name = f"worker{pid}_{source}"
+                series.add(name)
+                history.append(
+                    name, timestamp, MemoryInfo.from_bytes(used, total)
+                )
+            self.workers[pid] = timestamp
+            self._seen[pid] = now
+            count += 1
+        self.received += count
+        if self._expire_after is not None:
+            self._expire(history, now - self._expire_after)
+        return count
+
+    def _expire(self, history: MemoryHistory, deadline: float) -> None:
+        # 워커 시계가 아닌 수신 시각으로 판단
+        expired = [pid for pid, seen in self._seen.items() if seen < deadline]
+        for pid in expired:
+            del self._seen[pid]
+            self.workers.pop(pid, None)
+            for name in self._series.pop(pid, ()):
+                history.remove(name)
+            logger.debug(f"Worker {pid} expired")
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Drain worker samples after a sample of the attached monitor."""
+        self.drain(timestamp)
+
+    def close(self) -> None:
+        """Detach and close the queue."""
+        if self._monitor is not None:
+            self.detach(self._monitor)
+        if self._connected is not None:
+            self._connected.remove_listener(self._publish)
+            self._connected = None
+        self._queue.close()
+
+    def _before_fork(self) -> None:
+        monitor = self._connected or self._monitor
+        self._fork_interval = (
+            None if monitor is None else monitor.sampling_interval
+        )
+
+    def _after_fork_parent(self) -> None:
+        self._fork_interval = None
+
+    def _after_fork_child(self) -> None:
+        # 모니터의 리스너는 이미 비워졌으므로 자식에서는 발행만 함
+        monitor = self._connected or self._monitor
+        interval = self._fork_interval
+        self._monitor = None
+        self._connected = None
+        self._fork_interval = None
+        self.workers = {}
+        self._series = {}
+        self._seen = {}
+        self.received = 0
+        self.dropped = 0
+        if monitor is not None:
+            self.connect(monitor, interval)
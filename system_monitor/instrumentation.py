@@ -0,0 +1,174 @@
+"""Self-instrumentation of the monitor's own overhead."""
+
+from typing import Any, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Log2-bucketed latency histogram.
+
+    Bucket ``i`` counts durations in ``[2**i, 2**(i+1))`` microseconds
+    (bucket 0 also holds everything below 1 us), so recording is a
+    ``bit_length`` and a list increment.
+    """
+
+    BUCKETS = 32
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded durations."""
+        self._buckets: List[int] = [0] * self.BUCKETS
+        self._count = 0
+        self._total = 0.0
+        self._min: Optional[float] = None
+        self._max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        micros = round(seconds * 1_000_000)
+        index = min(max(micros, 1).bit_length() - 1, self.BUCKETS - 1)
+        self._buckets[index] += 1
+        self._count += 1
+        self._total += seconds
+        if self._min is None or seconds < self._min:
+            self._min = seconds
+        if seconds > self._max:
+            self._max = seconds
+
+    @property
+    def count(self) -> int:
+        """Number of recorded durations."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds."""
+        return self._total / self._count if self._count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile in seconds.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket containing the percentile
+        """
+        if not self._count:
+            return 0.0
+        rank = q / 100 * self._count
+        seen = 0
+        for index, count in enumerate(self._buckets):
+            seen += count
+            if count and seen >= rank:
+                return min((2 ** (index + 1)) / 1_000_000, self._max)
+        return self._max  # pragma: no cover
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON-serializable summary (durations in microseconds)."""
+        return {
+            "count": self._count,
+            "mean_us": self.mean * 1_000_000,
+            "min_us": (self._min or 0.0) * 1_000_000,
+            "max_us": self._max * 1_000_000,
+            "p50_us": self.percentile(50) * 1_000_000,
+            "p99_us": self.percentile(99) * 1_000_000,
+            "buckets": {
+                f"<{2 ** (index + 1)}us": count
+                for index, count in enumerate(self._buckets)
+                if count
+            },
+        }
+
+
+class SamplerStats:
+    """Timing statistics of a background sampler loop."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        self.ticks = 0
+        self.late_ticks = 0
+        self.dropped_ticks = 0
+        self.cpu_time = 0.0  # seconds of sampler thread CPU time
+        self.wall_time = 0.0  # seconds the sampler has been running
+        self.interval = 0.0  # current sampling interval in seconds
+        self.jitter = LatencyHistogram()
+
+    def record_tick(self, jitter: float) -> None:
+        """Record a tick that woke up ``jitter`` seconds after schedule."""
+        self.ticks += 1
+        self.jitter.record(max(jitter, 0.0))
+
+    def record_overrun(self, overrun: float, interval: float) -> None:
+        """Record a tick that finished ``overrun`` seconds past the next."""
+        self.late_ticks += 1
+        self.dropped_ticks += int(overrun // interval)
+
+    @property
+    def cpu_percent(self) -> float:
+        """CPU time of the sampler thread relative to its wall time."""
+        if not self.wall_time:
+            return 0.0
+        return self.cpu_time / self.wall_time * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON-serializable summary."""
+        return {
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "dropped_ticks": self.dropped_ticks,
+            "cpu_time_s": self.cpu_time,
+            "wall_time_s": self.wall_time,
+            "cpu_percent": self.cpu_percent,
+            "interval_s": self.interval,
+            "jitter": self.jitter.to_dict(),
+        }
+
+
+class OverheadTracker:
+    """
+    Collects read latencies and sampler statistics of a monitor.
+
+    Counters are updated without locks to keep recording cheap. Reads
+    recorded from several threads at once may occasionally lose a
+    count, which only affects the statistics.
+    """
+
+    def __init__(self):
+        self.reads: Dict[str, LatencyHistogram] = {}
+        self.sample = LatencyHistogram()
+        self.listeners = LatencyHistogram()
+        self.sampler = SamplerStats()
+
+    def record_read(self, source: str, seconds: float) -> None:
+        """Record the latency of one backend read."""
+        histogram = self.reads.get(source)
+        if histogram is None:
+            # 동시에 처음 기록해도 히스토그램이 하나만 남도록 setdefault 사용
+            histogram = self.reads.setdefault(source, LatencyHistogram())
+        histogram.record(seconds)
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        self.reads.clear()
+        self.sample.reset()
+        self.listeners.reset()
+        self.sampler.reset()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON-serializable summary."""
+        return {
+            "reads": {
+                source: histogram.to_dict()
+                for source, histogram in list(self.reads.items())
+            },
+            "sample": self.sample.to_dict(),
+            "listeners": self.listeners.to_dict(),
+            "sampler": self.sampler.to_dict(),
+        }
@@ -0,0 +1,121 @@
+"""Training-loop adapters feeding ``SystemMonitor`` step recording.
+
+The callbacks are duck-typed: they implement the hook methods of the
+framework without importing it. Frameworks that require a base class
+can mix them in, e.g. ``class MemoryCallback(LightningStepCallback,
+pl.Callback): pass``.
+"""
+
+from typing import Any, Iterable, Iterator, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .monitor import SystemMonitor
+
+T = TypeVar("T")
+
+
+def track_steps(
+    monitor: "SystemMonitor", iterable: Iterable[T], start: int = 0
+) -> Iterator[T]:
+    """
+    Record each item of a plain loop as one step.
+
+    A step starts once its item has been produced (so host RSS after
+    data loading is the start reading) and ends when the next item is
+    requested or the loop exits.
+
+    Example::
+
+        for batch in track_steps(monitor, loader):
+            train_step(batch)
+
+    Args:
+        monitor: Monitor recording the steps
+        iterable: Items of the loop (e.g. a data loader)
+        start: Index of the first step
+    """
+    try:
+        for index, item in enumerate(iterable, start):
+            monitor.step(index)
+            yield item
+    finally:
+        monitor.end_step()
+
+
+class KerasStepCallback:
+    """
+    Keras-style callback recording every training batch as a step.
+
+    Steps are numbered globally across epochs. Hooks other than the
+    training batch hooks are accepted and ignored.
+    """
+
+    def __init__(self, monitor: "SystemMonitor"):
+        self.monitor = monitor
+        self.model: Any = None
+        self.params: Any = None
+        self._step = 0
+
+    def set_model(self, model: Any) -> None:
+        self.model = model
+
+    def set_params(self, params: Any) -> None:
+        self.params = params
+
+    def on_train_batch_begin(self, batch: int, logs: Any = None) -> None:
+        self.monitor.step(self._step)
+        self._step += 1
+
+    def on_train_batch_end(self, batch: int, logs: Any = None) -> None:
+        self.monitor.end_step()
+
+    def __getattr__(self, name: str) -> Any:
+        # 그 밖의 on_* 훅은 아무 동작도 하지 않음
+        if name.startswith("on_"):
+            return _ignore
+        raise AttributeError(name)
+
+
+class LightningStepCallback:
+    """Lightning-style callback recording training batches by global step."""
+
+    def __init__(self, monitor: "SystemMonitor"):
+        self.monitor = monitor
+
+    def on_train_batch_start(
+        self, trainer: Any, pl_module: Any, batch: Any, batch_idx: int,
+        *args: Any
+    ) -> None:
+        self.monitor.step(getattr(trainer, "global_step", batch_idx))
+
+    def on_train_batch_end(
+        self, trainer: Any, pl_module: Any, outputs: Any, batch: Any,
+        batch_idx: int, *args: Any
+    ) -> None:
+        self.monitor.end_step()
+
+
+class TransformersStepCallback:
+    """Hugging Face ``TrainerCallback``-style callback keyed by global step."""
+
+    def __init__(self, monitor: "SystemMonitor"):
+        self.monitor = monitor
+
+    def on_step_begin(
+        self, args: Any, state: Any, control: Any, **kwargs: Any
+    ) -> None:
+        self.monitor.step(state.global_step)
+
+    def on_step_end(
+        self, args: Any, state: Any, control: Any, **kwargs: Any
+    ) -> None:
+        self.monitor.end_step()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("on_"):
+            return _ignore
+        raise AttributeError(name)
+
+
+def _ignore(*args: Any, **kwargs: Any) -> None:
+    return None
@@ -0,0 +1,188 @@
+"""Live-updating memory panel for Jupyter notebooks."""
+
+import html
+import time
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from .core import MemoryInfo, MemorySample
+from .logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .monitor import SystemMonitor
+
+logger = get_logger('system_monitor.jupyter')
+
+
+def sparkline_svg(
+    samples: List[MemorySample], width: int = 120, height: int = 24
+) -> str:
+    """
+    Render usage percent of samples as a small SVG polyline.
+
+    Args:
+        samples: Samples of one source, oldest first
+        width: Width in pixels
+        height: Height in pixels
+
+    Returns:
+        SVG markup (empty SVG when there are fewer than two samples)
+    """
+    points = []
+    if len(samples) >= 2:
+        step = width / (len(samples) - 1)
+        for index, sample in enumerate(samples):
+            percent = sample.used / sample.total if sample.total else 0.0
+            y = height - min(max(percent, 0.0), 1.0) * height
+            points.append(f"{index * step:.1f},{y:.1f}")
+    return (
+        f'<svg width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+        f'<polyline fill="none" stroke="#1f77b4" stroke-width="1.5" '
+        f'points="{" ".join(points)}"/></svg>'
+    )
+
+
+class LiveMemoryPanel:
+    """
+    Memory panel updated in place through an IPython ``display_id``.
+
+    The panel registers itself as a sample listener and re-renders at
+    most once per ``refresh_interval`` seconds, so a fast background
+    sampler does not flood the kernel's output channel.
+
+    Example::
+
+        monitor.start_sampling(interval=0.5)
+        panel = LiveMemoryPanel(monitor, refresh_interval=2.0)
+        panel.show()
+        ...
+        panel.close()
+    """
+
+    def __init__(
+        self,
+        monitor: "SystemMonitor",
+        sources: Optional[Iterable[str]] = None,
+        refresh_interval: float = 1.0,
+        window: int = 120,
+        display_module: Any = None,
+    ):
+        """
+        Initialize live panel.
+
+        Args:
+            monitor: Monitor whose samples are shown
+            sources: Sources to show (all recorded sources if omitted)
+            refresh_interval: Minimum seconds between display updates
+            window: Number of recent samples drawn in each sparkline
+            display_module: Custom ``IPython.display`` module to use
+        """
+        if refresh_interval < 0:
+            raise ValueError("refresh_interval must not be negative")
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self._monitor = monitor
+        self._sources = None if sources is None else tuple(sources)
+        self._refresh_interval = refresh_interval
+        self._window = window
+        self._display = display_module
+        self._handle: Any = None
+        self._last_update: Optional[float] = None
+        self.updates = 0
+        self.skipped = 0
+
+    def _display_module(self) -> Any:
+        if self._display is None:
+            from IPython import display
+
+            self._display = display
+        return self._display
+
+    def _selected_sources(self) -> List[str]:
+        if self._sources is not None:
+            return list(self._sources)
+        return self._monitor.history.sources()
+
+    def render(self) -> str:
+        """Render the panel as HTML."""
+        rows = []
+        history = self._monitor.history
+        for source in self._selected_sources():
+            samples = history.samples(source)[-self._window:]
+            if samples:
+                info: Optional[MemoryInfo] = samples[-1].info
+                text = f"{info} ({info.usage_percent:.1f}%)"
+            else:
+                text = "Not available"
+            rows.append(
+                "<tr>"
+                f"<td><b>{html.escape(source.upper())}</b></td>"
+                f"<td style='font-family:monospace'>{html.escape(text)}</td>"
+                f"<td>{sparkline_svg(samples)}</td>"
+                "</tr>"
+            )
+        return (
+            "<table class='system-monitor-panel'>" + "".join(rows) + "</table>"
+        )
+
+    def _repr_html_(self) -> str:
+        return self.render()
+
+    @property
+    def is_shown(self) -> bool:
+        """Check if the panel is displayed and receiving samples."""
+        return self._handle is not None
+
+    def show(self) -> None:
+        """Display the panel and start updating it on every sample."""
+        if self._handle is not None:
+            return
+        display = self._display_module()
+        self._handle = display.display(
+            display.HTML(self.render()), display_id=True
+        )
+        self._last_update = time.monotonic()
+        self._monitor.add_listener(self)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Update the displayed panel if the refresh interval has passed.
+
+        Args:
+            force: Update regardless of the refresh interval
+
+        Returns:
+            Whether the display was updated
+        """
+        if self._handle is None:
+            return False
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_update is not None
+            and now - self._last_update < self._refresh_interval
+        ):
+            self.skipped += 1
+            return False
+        self._last_update = now
+        try:
+            self._handle.update(self._display_module().HTML(self.render()))
+        except Exception as e:
+            logger.error(f"Failed to update memory panel: {e}")
+            return False
+        self.updates += 1
+        return True
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Refresh the panel after a sample (throttled)."""
+        self.refresh()
+
+    def close(self) -> None:
+        """Stop updating the panel, leaving the final state displayed."""
+        if self._handle is None:
+            return
+        self._monitor.remove_listener(self)
+        self.refresh(force=True)
+        self._handle = None
@@ -2,10 +2,12 @@
 
 import logging
 import sys
+import threading
 from typing import Optional
 
-# 전역 로거 설정 상태 추적
+# 전역 로거 설정 상태 추적 (_setup_lock으로 보호)
 _logger_configured = False
+_setup_lock = threading.RLock()
 
 
 def setup_logger(
@@ -26,14 +28,19 @@ def setup_logger(
     Returns:
         설정된 로거 인스턴스
     """
-    global _logger_configured
-
     logger_name = name or "system_monitor"
     logger = logging.getLogger(logger_name)
 
-    # 이미 설정되어 있고 강제 설정이 아니라면 기존 로거 반환
-    if _logger_configured and not force_setup:
-        return logger
+    # 여러 스레드가 동시에 설정해도 핸들러가 한 번만 추가되도록 잠금
+    with _setup_lock:
+        # 이미 설정되어 있고 강제 설정이 아니라면 기존 로거 반환
+        if _logger_configured and not force_setup:
+            return logger
+        return _configure(logger, level)
+
+
+def _configure(logger: logging.Logger, level: int) -> logging.Logger:
+    global _logger_configured
 
     # 기존 핸들러 제거 (중복 방지)
     if logger.handlers:
@@ -78,7 +85,9 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
 
     # 로거가 설정되지 않았다면 자동으로 설정
     if not logger.handlers:
-        return setup_logger(logger_name)
+        with _setup_lock:
+            if not logger.handlers:
+                return setup_logger(logger_name)
 
     return logger
 
@@ -86,7 +95,6 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
 def reset_logger_config():
     """로거 설정 초기화."""
     global _logger_configured
-    _logger_configured = False
 
     # 시스템 모니터 관련 모든 로거 리셋
     logger_names = [
@@ -94,29 +102,24 @@ def reset_logger_config():
         "system_monitor.monitor",
         "system_monitor.monitors",
     ]
-    for logger_name in logger_names:
-        logger = logging.getLogger(logger_name)
-        logger.handlers.clear()
-        logger.setLevel(logging.NOTSET)
-        logger.propagate = True
+    with _setup_lock:
+        _logger_configured = False
+        for logger_name in logger_names:
+            logger = logging.getLogger(logger_name)
+            logger.handlers.clear()
+            logger.setLevel(logging.NOTSET)
+            logger.propagate = True
 
 
 def is_colab() -> bool:
-    """Google Colab 환경인지 확인."""
-    try:
-        import google.colab  # noqa: F401
+    """Google Colab 환경인지 확인 (결과는 캐시됨)."""
+    from .env_utils import probe_module
 
-        return True
-    except ImportError:
-        return False
+    return probe_module("google.colab")
 
 
 def is_jupyter() -> bool:
-    """Jupyter 환경인지 확인."""
-    try:
-        from IPython import get_ipython  # noqa: F401
-
-        ipython = get_ipython()
-        return ipython is not None and hasattr(ipython, "kernel")
-    except ImportError:
-        return False
+    """Jupyter 환경인지 확인 (결과는 캐시됨)."""
+    from .env_utils import probe_ipython
+
+    return probe_ipython()[1]
@@ -1,31 +1,147 @@
 """System Monitor implementation."""
 
-from typing import Optional
-from .monitors import CPUMonitor, GPUMonitor
-from .core import MemoryInfo
+import threading
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from .monitors import (
+    BaseCollector,
+    BaseMonitor,
+    CgroupMonitor,
+    CPUMonitor,
+    GPUMonitor,
+    ProcessMonitor,
+    gpu_process_collectors,
+    gpu_stats_collectors,
+    host_collectors,
+)
+from .analysis.forecast import Forecast, MemoryForecaster
+from .core import (
+    Annotation,
+    AnnotationLog,
+    MemoryDiff,
+    MemoryInfo,
+    MemoryHistory,
+    MemorySnapshot,
+    MetricHistory,
+    MonitorState,
+    diff_snapshots,
+)
+from . import forking
+from .instrumentation import OverheadTracker
 from .logging_config import get_logger
+from .sampler import BackgroundSampler
+from .scheduling import AdaptiveInterval
+from .steps import StepRecorder
 
 logger = get_logger('system_monitor.monitor')
 
+# sample() 호출마다 (timestamp, {source: MemoryInfo})로 호출되는 콜백
+SampleListener = Callable[[float, Dict[str, MemoryInfo]], None]
+
 
 class SystemMonitor:
-    """Main system resource monitor for CPU and GPU memory."""
+    """
+    Main system resource monitor for CPU and GPU memory.
+
+    Thread safety: ``sample()`` may be called from any thread, but
+    samples are serialized so there is a single writer of the history,
+    step recorder and forecaster, and listeners are called by that
+    writer one sample at a time. Readers do not lock: ``state`` returns
+    an immutable ``MonitorState`` that each sample replaces atomically,
+    ``history`` reads retry around concurrent appends, and the listener
+    list is copied on write. ``mark()`` and ``span()`` may be called
+    from any thread without locking.
 
-    def __init__(self, use_gpu: bool = True, cupy_instance=None):
+    Fork safety: a fork waits for an in-progress sample and pauses the
+    background sampler until the parent continues. The child keeps a
+    copy of the history but no sampler, no listeners and no GPU (CUDA)
+    access; the process source follows the child. Use ``WorkerRelay``
+    to publish samples of workers to the parent.
+    """
+
+    def __init__(
+        self,
+        use_gpu: bool = True,
+        cupy_instance=None,
+        track_process: bool = True,
+        history_size: int = 3600,
+        track_cgroup: bool = False,
+        backends: Optional[Dict[str, BaseMonitor]] = None,
+        clock: Callable[[], float] = time.time,
+        track_host: bool = False,
+        collectors: Optional[Iterable[BaseCollector]] = None,
+        track_gpu_stats: bool = False,
+        track_gpu_processes: bool = False,
+    ):
         """
         Initialize memory monitor.
 
         Args:
             use_gpu: Whether to enable GPU monitoring
             cupy_instance: Custom CuPy instance to use
+            track_process: Whether to record this process's RSS
+            history_size: Number of samples kept per source
+            track_cgroup: Whether to record container (cgroup) memory
+            backends: Monitors to read keyed by source name, replacing
+                the built-in ones (e.g. replayed traces); the options
+                above that select built-in monitors are then ignored
+            clock: Function returning the timestamp of a sample in
+                seconds since the epoch
+            track_host: Whether to record host CPU utilization per core,
+                swap activity and PSI pressure
+            collectors: Additional collectors of non-memory metrics
+            track_gpu_stats: Whether to record GPU utilization,
+                temperature, power and clocks of every NVML device
+            track_gpu_processes: Whether to record per-process GPU memory
+                of every NVML device (listed every 10 seconds)
         """
-        self._cpu_monitor = CPUMonitor()
-        self._gpu_monitor = GPUMonitor(cupy_instance) if use_gpu else None
+        self._extra_monitors: Dict[str, BaseMonitor] = {}
+        if backends is None:
+            self._cpu_monitor: Optional[BaseMonitor] = CPUMonitor()
+            self._gpu_monitor: Optional[BaseMonitor] = (
+                GPUMonitor(cupy_instance) if use_gpu else None
+            )
+            self._process_monitor: Optional[BaseMonitor] = (
+                ProcessMonitor() if track_process else None
+            )
+            self._cgroup_monitor: Optional[BaseMonitor] = (
+                CgroupMonitor() if track_cgroup else None
+            )
+        else:
+            backends = dict(backends)
+            self._cpu_monitor = backends.pop("cpu", None)
+            self._gpu_monitor = backends.pop("gpu", None)
+            self._process_monitor = backends.pop("process", None)
+            self._cgroup_monitor = backends.pop("cgroup", None)
+            self._extra_monitors = backends
+        self._clock = clock
+        self._history = MemoryHistory(history_size)
+        self._metrics = MetricHistory(history_size)
+        self._annotations = AnnotationLog(history_size)
+        self._collectors: Tuple[BaseCollector, ...] = tuple(
+            (host_collectors() if track_host else [])
+            + (gpu_stats_collectors() if track_gpu_stats else [])
+            + (gpu_process_collectors() if track_gpu_processes else [])
+            + list(collectors or ())
+        )
+        self._listeners: Tuple[SampleListener, ...] = ()
+        self._listeners_lock = threading.Lock()
+        self._sampler: Optional[BackgroundSampler] = None
+        self._sampler_lock = threading.Lock()
+        # 단일 writer: sample()과 그에 딸린 기록/리스너 호출을 직렬화
+        self._write_lock = threading.RLock()
+        self._state = MonitorState(sequence=0, timestamp=None)
+        self._overhead = OverheadTracker()
+        self._steps = StepRecorder(self.read)
+        self._forecaster = MemoryForecaster()
+        forking.track(self)
 
     @property
     def has_cpu(self) -> bool:
         """Check if CPU monitoring is available."""
-        return self._cpu_monitor.is_available
+        return self._cpu_monitor is not None and self._cpu_monitor.is_available
 
     @property
     def has_gpu(self) -> bool:
@@ -34,6 +150,8 @@ class SystemMonitor:
 
     def get_cpu_memory(self) -> Optional[MemoryInfo]:
         """Get CPU memory information."""
+        if not self._cpu_monitor:
+            return None
         return self._cpu_monitor.get_memory_info()
 
     def get_gpu_memory(self) -> Optional[MemoryInfo]:
@@ -42,6 +160,449 @@ class SystemMonitor:
             return None
         return self._gpu_monitor.get_memory_info()
 
+    def get_process_memory(self) -> Optional[MemoryInfo]:
+        """Get memory information of the current process."""
+        if not self._process_monitor:
+            return None
+        return self._process_monitor.get_memory_info()
+
+    def get_cgroup_memory(self) -> Optional[MemoryInfo]:
+        """Get memory information of the current container (cgroup)."""
+        if not self._cgroup_monitor:
+            return None
+        return self._cgroup_monitor.get_memory_info()
+
+    @property
+    def history(self) -> MemoryHistory:
+        """Get the recorded memory history."""
+        return self._history
+
+    @property
+    def metrics(self) -> MetricHistory:
+        """Get the recorded non-memory metrics, keyed by collector name."""
+        return self._metrics
+
+    @property
+    def annotations(self) -> AnnotationLog:
+        """Get the recorded application annotations."""
+        return self._annotations
+
+    def mark(self, name: str) -> Annotation:
+        """
+        Record an instant event, e.g. ``mark("checkpoint_save")``.
+
+        Takes no lock, so it can be called from hot code paths.
+
+        Args:
+            name: Event name
+
+        Returns:
+            The recorded annotation
+        """
+        annotation = Annotation(
+            self._clock(), name, 0.0, threading.get_ident()
+        )
+        self._annotations.append(annotation)
+        return annotation
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Record the enclosed block as an event with a start and end.
+
+        The span is recorded when the block exits, also on exceptions.
+
+        Args:
+            name: Event name
+        """
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._annotations.append(
+                Annotation(
+                    start,
+                    name,
+                    self._clock() - start,
+                    threading.get_ident(),
+                )
+            )
+
+    @property
+    def collectors(self) -> Tuple[BaseCollector, ...]:
+        """Get the registered metric collectors."""
+        return self._collectors
+
+    def add_collector(self, collector: BaseCollector) -> None:
+        """Collect a collector's metrics on every sample."""
+        with self._listeners_lock:
+            if collector not in self._collectors:
+                self._collectors = self._collectors + (collector,)
+
+    def remove_collector(self, collector: BaseCollector) -> None:
+        """Stop collecting a collector's metrics."""
+        with self._listeners_lock:
+            self._collectors = tuple(
+                registered
+                for registered in self._collectors
+                if registered is not collector
+            )
+
+    def snapshot(self) -> MemorySnapshot:
+        """
+        Read every source without recording it, for a later ``diff()``.
+
+        Returns:
+            Readings of the available sources with the current time
+        """
+        timestamp = self._clock()
+        return MemorySnapshot(timestamp, MappingProxyType(self.read()))
+
+    def diff(
+        self,
+        before: MemorySnapshot,
+        after: Optional[MemorySnapshot] = None,
+    ) -> MemoryDiff:
+        """
+        Compare a snapshot with a later one.
+
+        Samples recorded in between (e.g. by the background sampler)
+        are included in the peaks, so short spikes are not missed.
+
+        Args:
+            before: Earlier snapshot
+            after: Later snapshot (taken now if omitted)
+
+        Returns:
+            Change and peak increase of every source in both snapshots
+        """
+        if after is None:
+            after = self.snapshot()
+        return diff_snapshots(before, after, self._history)
+
+    @property
+    def state(self) -> MonitorState:
+        """Get the readings of the latest sample (lock-free)."""
+        return self._state
+
+    def _iter_monitors(self) -> Dict[str, BaseMonitor]:
+        monitors: Dict[str, BaseMonitor] = {}
+        if self._cpu_monitor:
+            monitors["cpu"] = self._cpu_monitor
+        if self._gpu_monitor:
+            monitors["gpu"] = self._gpu_monitor
+        if self._process_monitor:
+            monitors["process"] = self._process_monitor
+        if self._cgroup_monitor:
+            monitors["cgroup"] = self._cgroup_monitor
+        monitors.update(self._extra_monitors)
+        return monitors
+
+    def read(
+        self, sources: Optional[Iterable[str]] = None
+    ) -> Dict[str, MemoryInfo]:
+        """
+        Read sources without recording history or notifying listeners.
+
+        Args:
+            sources: Sources to read (all sources if omitted)
+
+        Returns:
+            Readings of the available sources keyed by source name
+        """
+        monitors = self._iter_monitors()
+        if sources is not None:
+            monitors = {s: monitors[s] for s in sources if s in monitors}
+        readings: Dict[str, MemoryInfo] = {}
+        for source, source_monitor in monitors.items():
+            read_start = time.perf_counter()
+            info = source_monitor.get_memory_info()
+            self._overhead.record_read(
+                source, time.perf_counter() - read_start
+            )
+            if info is not None:
+                readings[source] = info
+        return readings
+
+    def collect(self, timestamp: float) -> Dict[str, Dict[str, float]]:
+        """
+        Run the collectors without recording their values.
+
+        Args:
+            timestamp: Time of the sample, used for rates between calls
+
+        Returns:
+            Non-empty values keyed by collector name
+        """
+        metrics: Dict[str, Dict[str, float]] = {}
+        for collector in self._collectors:
+            collect_start = time.perf_counter()
+            try:
+                values = collector.collect(timestamp)
+            except Exception as e:
+                logger.error(f"Collector {collector.name} failed: {e}")
+                values = None
+            self._overhead.record_read(
+                collector.name, time.perf_counter() - collect_start
+            )
+            if values:
+                metrics[collector.name] = values
+        return metrics
+
+    def sample(self) -> Dict[str, MemoryInfo]:
+        """
+        Read every source once, record it in history and notify listeners.
+
+        Returns:
+            Readings of the available sources keyed by source name
+        """
+        overhead = self._overhead
+        with self._write_lock:
+            sample_start = time.perf_counter()
+            timestamp = self._clock()
+            readings = self.read()
+            metrics = self.collect(timestamp)
+            for source, info in readings.items():
+                self._history.append(source, timestamp, info)
+            for name, values in metrics.items():
+                self._metrics.append(name, timestamp, values)
+            self._state = MonitorState(
+                sequence=self._state.sequence + 1,
+                timestamp=timestamp,
+                readings=MappingProxyType(dict(readings)),
+                metrics=MappingProxyType(
+                    {
+                        name: MappingProxyType(values)
+                        for name, values in metrics.items()
+                    }
+                ),
+            )
+            self._steps(timestamp, readings)
+            self._forecaster(timestamp, readings)
+
+            listeners_start = time.perf_counter()
+            for listener in self._listeners:
+                try:
+                    listener(timestamp, readings)
+                except Exception as e:
+                    logger.error(f"Sample listener failed: {e}")
+            end = time.perf_counter()
+            overhead.listeners.record(end - listeners_start)
+            overhead.sample.record(end - sample_start)
+        return readings
+
+    def add_listener(self, listener: SampleListener) -> None:
+        """Register a callback invoked after every sample."""
+        with self._listeners_lock:
+            if listener not in self._listeners:
+                self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener: SampleListener) -> None:
+        """Unregister a sample callback."""
+        with self._listeners_lock:
+            self._listeners = tuple(
+                registered
+                for registered in self._listeners
+                if registered != listener
+            )
+
+    @property
+    def steps(self) -> StepRecorder:
+        """Get the per-step memory recorder."""
+        return self._steps
+
+    def step(self, step: int) -> None:
+        """
+        Start training step ``step``, closing the previous one.
+
+        Call it at a fixed point of the loop, e.g. right after the next
+        batch is fetched, so the start reading captures host RSS after
+        data loading and the peak covers the whole step.
+
+        Args:
+            step: Step index
+        """
+        self._steps.begin(step)
+
+    def end_step(self) -> None:
+        """Close the current training step."""
+        self._steps.end()
+
+    @contextmanager
+    def step_scope(self, step: int) -> Iterator[None]:
+        """
+        Record memory of the enclosed block as training step ``step``.
+
+        Args:
+            step: Step index
+        """
+        self._steps.begin(step)
+        try:
+            yield
+        finally:
+            self._steps.end()
+
+    @property
+    def forecaster(self) -> MemoryForecaster:
+        """Get the usage forecaster updated on every sample."""
+        return self._forecaster
+
+    def configure_forecast(self, **options: Any) -> MemoryForecaster:
+        """
+        Replace the forecaster and rebuild it from the recorded history.
+
+        Args:
+            **options: ``MemoryForecaster`` arguments, e.g. ``period``
+                for workloads repeating every ``period`` seconds
+
+        Returns:
+            The new forecaster
+        """
+        forecaster = MemoryForecaster(**options)
+        with self._write_lock:
+            forecaster.feed(self._history)
+            self._forecaster = forecaster
+        return forecaster
+
+    def forecast(
+        self, horizon: float, sources: Optional[Iterable[str]] = None
+    ) -> Dict[str, Forecast]:
+        """
+        Project memory usage ``horizon`` seconds ahead.
+
+        Args:
+            horizon: Seconds ahead to project
+            sources: Sources to project (all forecast sources if omitted)
+
+        Returns:
+            Forecast per source with enough samples, including the
+            expected peak, its confidence bounds and the probability of
+            reaching the source's total
+        """
+        # 예측 모델은 writer가 갱신하므로 같은 잠금 아래에서 읽음
+        with self._write_lock:
+            return self._forecaster.forecast(horizon, sources)
+
+    @property
+    def is_sampling(self) -> bool:
+        """Check if the background sampler is running."""
+        sampler = self._sampler
+        return sampler is not None and sampler.is_running
+
+    @property
+    def sampling_interval(self) -> Optional[float]:
+        """Get the current background sampling interval in seconds."""
+        sampler = self._sampler
+        if sampler is None or not sampler.is_running:
+            return None
+        return sampler.interval
+
+    def start_sampling(
+        self,
+        interval: float = 1.0,
+        scheduler: Optional[AdaptiveInterval] = None,
+    ) -> None:
+        """
+        Start sampling in a background thread.
+
+        Args:
+            interval: Seconds between samples (initial value when a
+                scheduler is given)
+            scheduler: Policy adapting the interval after each sample
+        """
+        with self._sampler_lock:
+            if self.is_sampling:
+                return
+            self._sampler = BackgroundSampler(
+                self,
+                interval,
+                stats=self._overhead.sampler,
+                scheduler=scheduler,
+            )
+            self._sampler.start()
+
+    def stop_sampling(self, timeout: Optional[float] = None) -> None:
+        """Stop the background sampler."""
+        with self._sampler_lock:
+            sampler, self._sampler = self._sampler, None
+        if sampler is not None:
+            sampler.stop(timeout)
+
+    def _before_fork(self) -> None:
+        # 진행 중인 샘플이 끝날 때까지 기다리고 fork 동안 샘플러를 멈춤
+        self._write_lock.acquire()
+        self._listeners_lock.acquire()
+        self._sampler_lock.acquire()
+
+    def _after_fork_parent(self) -> None:
+        self._sampler_lock.release()
+        self._listeners_lock.release()
+        self._write_lock.release()
+
+    def _after_fork_child(self) -> None:
+        # 부모의 스레드, 잠금 소유자, 리스너(파일 등)는 자식에서 무효
+        self._write_lock = threading.RLock()
+        self._listeners_lock = threading.Lock()
+        self._sampler_lock = threading.Lock()
+        self._sampler = None
+        self._listeners = ()
+        for backend in list(self._iter_monitors().values()) + list(
+            self._collectors
+        ):
+            hook = getattr(backend, "after_fork_child", None)
+            if hook is not None:
+                hook()
+
+    def get_overhead_stats(self) -> Dict[str, Any]:
+        """
+        Get the monitor's own overhead.
+
+        Returns:
+            Per-source read latency histograms, sample() and listener
+            latencies, and sampler loop statistics (ticks, late and
+            dropped ticks, jitter, thread CPU time)
+        """
+        return self._overhead.to_dict()
+
+    def reset_overhead_stats(self) -> None:
+        """Discard recorded overhead statistics."""
+        self._overhead.reset()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export recorded samples together with overhead statistics.
+
+        Returns:
+            JSON-serializable dictionary with ``samples``, ``metrics``,
+            ``annotations``, ``steps`` and ``overhead``
+        """
+        return {
+            "samples": self._history.to_records(),
+            "metrics": self._metrics.to_records(),
+            "annotations": self._annotations.to_records(),
+            "steps": self._steps.to_records(),
+            "overhead": self.get_overhead_stats(),
+        }
+
+    def print_overhead_stats(self, label: str = "Monitor Overhead") -> None:
+        """Print the monitor's own overhead."""
+        stats = self.get_overhead_stats()
+        logger.info(f"{label}")
+        for source, read in sorted(stats["reads"].items()):
+            logger.info(
+                f"  {source} read: p50 {read['p50_us']:.0f}us, "
+                f"p99 {read['p99_us']:.0f}us ({read['count']} reads)"
+            )
+        sampler = stats["sampler"]
+        if sampler["ticks"]:
+            logger.info(
+                f"  sampler: {sampler['ticks']} ticks, "
+                f"{sampler['late_ticks']} late, "
+                f"{sampler['dropped_ticks']} dropped, "
+                f"jitter p99 {sampler['jitter']['p99_us']:.0f}us, "
+                f"CPU {sampler['cpu_percent']:.2f}%"
+            )
+
     def print_cpu_memory(self, label: str = "CPU Memory") -> None:
         """Print CPU memory usage."""
         info = self.get_cpu_memory()
@@ -2,6 +2,39 @@
 
 from .cpu import CPUMonitor
 from .gpu import GPUMonitor
-from .base import BaseMonitor
+from .process import ProcessMonitor
+from .cgroup import CgroupMonitor
+from .host import (
+    HostCPUCollector,
+    SwapCollector,
+    PressureCollector,
+    host_collectors,
+)
+from .nvml import (
+    GPUProcess,
+    GPUProcessCollector,
+    GPUStatsCollector,
+    gpu_process_collectors,
+    gpu_stats_collectors,
+    load_nvml,
+)
+from .base import BaseMonitor, BaseCollector
 
-__all__ = ['CPUMonitor', 'GPUMonitor', 'BaseMonitor']
+__all__ = [
+    'CPUMonitor',
+    'GPUMonitor',
+    'ProcessMonitor',
+    'CgroupMonitor',
+    'BaseMonitor',
+    'BaseCollector',
+    'HostCPUCollector',
+    'SwapCollector',
+    'PressureCollector',
+    'host_collectors',
+    'GPUStatsCollector',
+    'gpu_stats_collectors',
+    'GPUProcess',
+    'GPUProcessCollector',
+    'gpu_process_collectors',
+    'load_nvml',
+]
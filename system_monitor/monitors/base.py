@@ -1,7 +1,8 @@
 """Base monitor implementation."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 from ..core import MemoryInfo
 from ..logging_config import get_logger
 
@@ -13,6 +14,7 @@ class BaseMonitor(ABC):
 
     def __init__(self):
         self._available = None
+        self._available_lock = threading.Lock()
 
     @abstractmethod
     def get_memory_info(self) -> Optional[MemoryInfo]:
@@ -21,11 +23,49 @@ class BaseMonitor(ABC):
 
     @property
     def is_available(self) -> bool:
-        """Check if monitoring is available."""
-        if self._available is None:
-            try:
-                info = self.get_memory_info()
-                self._available = info is not None
-            except Exception:
-                self._available = False
-        return self._available
+        """Check if monitoring is available (probed once, thread-safe)."""
+        available = self._available
+        if available is not None:
+            return available
+        with self._available_lock:
+            if self._available is None:
+                try:
+                    info = self.get_memory_info()
+                    self._available = info is not None
+                except Exception:
+                    self._available = False
+            return self._available
+
+    def after_fork_child(self) -> None:
+        """Reset process-specific state in a forked child process."""
+        self._available_lock = threading.Lock()
+
+
+class BaseCollector(ABC):
+    """
+    Base class for collectors of non-memory metrics.
+
+    A collector is read in the same ``SystemMonitor.sample()`` pass as
+    the memory monitors and returns named float values, which are
+    recorded under ``name`` in the monitor's ``MetricHistory``.
+    """
+
+    name = "metrics"
+
+    @abstractmethod
+    def collect(self, timestamp: float) -> Optional[Dict[str, float]]:
+        """
+        Collect the current values.
+
+        Args:
+            timestamp: Time of the sample in seconds, used for rates
+                between consecutive calls
+
+        Returns:
+            Values keyed by field name, or None if unavailable
+        """
+        pass
+
+    def after_fork_child(self) -> None:
+        """Reset process-specific state in a forked child process."""
+        pass
@@ -0,0 +1,77 @@
+"""Container (cgroup) memory monitoring."""
+
+import os
+from typing import Optional, Tuple
+from .base import BaseMonitor
+from ..core import MemoryInfo
+from ..logging_config import get_logger
+
+logger = get_logger('system_monitor.monitors.cgroup')
+
+# cgroup v1은 제한이 없을 때 매우 큰 값을 기록한다
+_UNLIMITED = 2 ** 60
+
+
+class CgroupMonitor(BaseMonitor):
+    """Memory monitor for the current cgroup (v2 or v1)."""
+
+    V2_FILES = ("memory.current", "memory.max")
+    V1_FILES = (
+        os.path.join("memory", "memory.usage_in_bytes"),
+        os.path.join("memory", "memory.limit_in_bytes"),
+    )
+
+    def __init__(self, root: str = "/sys/fs/cgroup"):
+        super().__init__()
+        self._root = root
+        self._files = self._find_files()
+
+    def _find_files(self) -> Optional[Tuple[str, str]]:
+        """Find the usage and limit files of the cgroup hierarchy."""
+        for usage, limit in (self.V2_FILES, self.V1_FILES):
+            usage_path = os.path.join(self._root, usage)
+            if os.path.exists(usage_path):
+                return usage_path, os.path.join(self._root, limit)
+        logger.info(f"No cgroup memory controller found under {self._root}")
+        return None
+
+    @property
+    def version(self) -> Optional[int]:
+        """Get the detected cgroup version."""
+        if self._files is None:
+            return None
+        return 2 if self._files[0].endswith("memory.current") else 1
+
+    @staticmethod
+    def _read(path: str) -> str:
+        with open(path, "r", encoding="ascii") as f:
+            return f.read().strip()
+
+    @staticmethod
+    def _host_total() -> Optional[int]:
+        try:
+            import psutil
+
+            return psutil.virtual_memory().total
+        except ImportError:
+            return None
+
+    def get_memory_info(self) -> Optional[MemoryInfo]:
+        """Get cgroup memory usage against its limit."""
+        if self._files is None:
+            return None
+
+        try:
+            usage_path, limit_path = self._files
+            used = int(self._read(usage_path))
+            limit_text = self._read(limit_path)
+            limit = None
+            if limit_text != "max" and int(limit_text) < _UNLIMITED:
+                limit = int(limit_text)
+            if limit is None:
+                # 제한이 없으면 호스트 전체 메모리를 기준으로 한다
+                limit = self._host_total() or used
+            return MemoryInfo.from_bytes(used, limit)
+        except Exception as e:
+            logger.error(f"Failed to get cgroup memory info: {e}")
+            return None
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from .base import BaseMonitor
-from ..core import MemoryInfo, MemoryConverter
+from ..core import MemoryInfo
 from ..logging_config import get_logger
 
 logger = get_logger('system_monitor.monitors.cpu')
@@ -33,9 +33,7 @@ class CPUMonitor(BaseMonitor):
 
         try:
             memory = self._psutil.virtual_memory()
-            used_mb = MemoryConverter.to_mb(memory.used)
-            total_mb = MemoryConverter.to_mb(memory.total)
-            return MemoryInfo(used=used_mb, total=total_mb)
+            return MemoryInfo.from_bytes(memory.used, memory.total)
         except Exception as e:
             logger.error(f"Failed to get CPU memory info: {e}")
             return None
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from .base import BaseMonitor
-from ..core import MemoryInfo, MemoryConverter
+from ..core import MemoryInfo
 from ..logging_config import get_logger
 
 logger = get_logger('system_monitor.monitors.gpu')
@@ -43,10 +43,15 @@ class GPUMonitor(BaseMonitor):
                 total_bytes = device.mem_info[1]  # total memory
                 used_bytes = total_bytes - device.mem_info[0]  # total - free
 
-            used_mb = MemoryConverter.to_mb(used_bytes)
-            total_mb = MemoryConverter.to_mb(total_bytes)
-
-            return MemoryInfo(used=used_mb, total=total_mb)
+            return MemoryInfo.from_bytes(used_bytes, total_bytes)
         except Exception as e:
             logger.error(f"Failed to get GPU memory info: {e}")
             return None
+
+    def after_fork_child(self) -> None:
+        """Drop CuPy in a forked child (CUDA does not survive fork)."""
+        super().after_fork_child()
+        if self._cupy is not None:
+            logger.info("GPU monitoring disabled in forked child process")
+        self._cupy = None
+        self._available = False
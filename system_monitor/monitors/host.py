@@ -0,0 +1,208 @@
+"""Host CPU utilization, swap activity and PSI pressure collectors."""
+
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .base import BaseCollector
+from ..core import MemoryConverter
+from ..logging_config import get_logger
+
+logger = get_logger('system_monitor.monitors.host')
+
+
+def _import_psutil(purpose: str) -> Any:
+    try:
+        import psutil
+
+        return psutil
+    except ImportError:
+        logger.warning(f"psutil not available for {purpose}")
+        return None
+
+
+class HostCPUCollector(BaseCollector):
+    """
+    Host CPU utilization per core from ``psutil.cpu_times(percpu=True)``.
+
+    Utilization is the busy share of each core's CPU time between two
+    samples, so the first sample only records a baseline. Fields are
+    ``percent`` (mean over cores) and ``core0``, ``core1``, ...
+    """
+
+    name = "host_cpu"
+
+    def __init__(self):
+        self._psutil = _import_psutil("CPU utilization")
+        self._previous: Optional[List[Tuple[float, float]]] = None
+
+    @staticmethod
+    def _busy_total(times: Any) -> Tuple[float, float]:
+        total = sum(times)
+        # Linux에서 guest 시간은 user에 이미 포함되어 있음
+        total -= getattr(times, "guest", 0.0) + getattr(
+            times, "guest_nice", 0.0
+        )
+        idle = times.idle + getattr(times, "iowait", 0.0)
+        return total - idle, total
+
+    def collect(self, timestamp: float) -> Optional[Dict[str, float]]:
+        """Get per-core utilization since the previous call."""
+        if not self._psutil:
+            return None
+
+        try:
+            current = [
+                self._busy_total(times)
+                for times in self._psutil.cpu_times(percpu=True)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get CPU times: {e}")
+            return None
+        previous, self._previous = self._previous, current
+        if previous is None or len(previous) != len(current):
+            return {}
+
+        values: Dict[str, float] = {}
+        for index, ((busy, total), (last_busy, last_total)) in enumerate(
+            zip(current, previous)
+        ):
+            elapsed = total - last_total
+            percent = (busy - last_busy) / elapsed * 100 if elapsed else 0.0
+            values[f"core{index}"] = min(max(percent, 0.0), 100.0)
+        values["percent"] = sum(values.values()) / len(values)
+        return values
+
+
+class SwapCollector(BaseCollector):
+    """
+    Swap usage and swap-in/out rates from ``psutil.swap_memory()``.
+
+    Fields are ``used`` and ``total`` (MB), ``percent``, and ``in_rate``
+    and ``out_rate`` (MB/s swapped since the previous sample; not
+    reported on the first sample).
+    """
+
+    name = "swap"
+
+    def __init__(self):
+        self._psutil = _import_psutil("swap monitoring")
+        self._previous: Optional[Tuple[float, int, int]] = None
+
+    def collect(self, timestamp: float) -> Optional[Dict[str, float]]:
+        """Get swap usage and rates since the previous call."""
+        if not self._psutil:
+            return None
+
+        try:
+            swap = self._psutil.swap_memory()
+        except Exception as e:
+            logger.error(f"Failed to get swap info: {e}")
+            return None
+        values = {
+            "used": MemoryConverter.to_mb(swap.used),
+            "total": MemoryConverter.to_mb(swap.total),
+            "percent": float(swap.percent),
+        }
+        previous, self._previous = (
+            self._previous,
+            (timestamp, swap.sin, swap.sout),
+        )
+        if previous is not None and timestamp > previous[0]:
+            elapsed = timestamp - previous[0]
+            values["in_rate"] = (
+                MemoryConverter.to_mb(max(swap.sin - previous[1], 0))
+                / elapsed
+            )
+            values["out_rate"] = (
+                MemoryConverter.to_mb(max(swap.sout - previous[2], 0))
+                / elapsed
+            )
+        return values
+
+
+class PressureCollector(BaseCollector):
+    """
+    Linux pressure stall information (PSI) from ``/proc/pressure``.
+
+    For each resource and line kind (``some``: at least one task
+    stalled, ``full``: all non-idle tasks stalled) it reports the
+    kernel's 10 second average as ``{resource}_{kind}_avg10`` and the
+    stalled share of the time since the previous sample, computed from
+    the cumulative ``total`` counter, as ``{resource}_{kind}`` (percent).
+    Memory stalls show up here well before usage percent looks high.
+    """
+
+    name = "pressure"
+
+    def __init__(
+        self,
+        root: str = "/proc/pressure",
+        resources: Iterable[str] = ("cpu", "memory", "io"),
+    ):
+        self._root = root
+        self._resources = [
+            resource
+            for resource in resources
+            if os.path.exists(os.path.join(root, resource))
+        ]
+        if not self._resources:
+            logger.info(f"No pressure stall information under {root}")
+        self._previous: Optional[Tuple[float, Dict[str, int]]] = None
+
+    @property
+    def resources(self) -> List[str]:
+        """Resources with pressure information on this host."""
+        return list(self._resources)
+
+    @staticmethod
+    def parse(text: str) -> Dict[str, Dict[str, float]]:
+        """
+        Parse the contents of a pressure file.
+
+        Returns:
+            Fields (``avg10``, ``avg60``, ``avg300``, ``total``) per line
+            kind
+        """
+        lines: Dict[str, Dict[str, float]] = {}
+        for line in text.splitlines():
+            kind, _, rest = line.partition(" ")
+            fields = {}
+            for item in rest.split():
+                key, _, value = item.partition("=")
+                fields[key] = float(value)
+            if kind:
+                lines[kind] = fields
+        return lines
+
+    def collect(self, timestamp: float) -> Optional[Dict[str, float]]:
+        """Get stall averages and shares since the previous call."""
+        if not self._resources:
+            return None
+
+        values: Dict[str, float] = {}
+        totals: Dict[str, int] = {}
+        try:
+            for resource in self._resources:
+                path = os.path.join(self._root, resource)
+                with open(path, "r", encoding="ascii") as f:
+                    lines = self.parse(f.read())
+                for kind, fields in lines.items():
+                    key = f"{resource}_{kind}"
+                    values[f"{key}_avg10"] = fields.get("avg10", 0.0)
+                    totals[key] = int(fields.get("total", 0))
+        except Exception as e:
+            logger.error(f"Failed to read pressure information: {e}")
+            return None
+
+        previous, self._previous = self._previous, (timestamp, totals)
+        if previous is not None and timestamp > previous[0]:
+            elapsed_us = (timestamp - previous[0]) * 1_000_000
+            for key, total in totals.items():
+                if key in previous[1]:
+                    stalled = max(total - previous[1][key], 0)
+                    values[key] = min(stalled / elapsed_us * 100, 100.0)
+        return values
+
+
+def host_collectors() -> List[BaseCollector]:
+    """Create the CPU utilization, swap and pressure collectors."""
+    return [HostCPUCollector(), SwapCollector(), PressureCollector()]
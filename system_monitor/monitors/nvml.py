@@ -0,0 +1,389 @@
+"""GPU utilization, temperature, power, clocks and processes via NVML."""
+
+import math
+import os
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from .base import BaseCollector
+from ..core import MemoryConverter
+from ..logging_config import get_logger
+
+logger = get_logger('system_monitor.monitors.nvml')
+
+_nvml: Any = None
+_nvml_lock = threading.Lock()
+
+# 초기 PID 네임스페이스의 고정 inode (PROC_PID_INIT_INO)
+_INIT_PID_NAMESPACE_INODE = 0xEFFFFFFC
+
+
+def load_nvml(nvml_instance: Any = None) -> Any:
+    """
+    Get an initialized NVML binding.
+
+    Args:
+        nvml_instance: Custom binding shaped like ``pynvml`` (e.g. a fake
+            for tests); ``pynvml`` is imported and initialized once per
+            process if omitted
+
+    Returns:
+        The binding, or None if NVML is not available
+    """
+    global _nvml
+    if nvml_instance is not None:
+        try:
+            nvml_instance.nvmlInit()
+        except Exception as e:
+            logger.error(f"Failed to initialize NVML: {e}")
+            return None
+        return nvml_instance
+    if _nvml is not None:
+        return _nvml or None
+    with _nvml_lock:
+        if _nvml is None:
+            try:
+                import pynvml
+
+                pynvml.nvmlInit()
+                _nvml = pynvml
+            except ImportError:
+                logger.info("pynvml not available for GPU statistics")
+                _nvml = False
+            except Exception as e:
+                logger.info(f"NVML not available: {e}")
+                _nvml = False
+    return _nvml or None
+
+
+def device_count(nvml_instance: Any = None) -> int:
+    """Get the number of NVML devices (0 if NVML is not available)."""
+    nvml = load_nvml(nvml_instance)
+    if nvml is None:
+        return 0
+    try:
+        return int(nvml.nvmlDeviceGetCount())
+    except Exception as e:
+        logger.error(f"Failed to count NVML devices: {e}")
+        return 0
+
+
+class GPUStatsCollector(BaseCollector):
+    """
+    Utilization, temperature, power and clocks of one GPU.
+
+    Recorded as ``gpu{device}_stats`` with the fields ``sm_util`` and
+    ``mem_util`` (percent of time the SMs / the memory controller were
+    busy), ``temperature`` (C), ``power`` and ``power_limit`` (W),
+    ``sm_clock`` and ``mem_clock`` (MHz), and the device-wide ``used``
+    and ``total`` memory (MB, including other processes). Fields the
+    device does not support are left out.
+    """
+
+    def __init__(self, device: int = 0, nvml_instance: Any = None):
+        """
+        Initialize GPU statistics collector.
+
+        Args:
+            device: NVML device index
+            nvml_instance: Custom NVML binding (``pynvml`` if omitted)
+        """
+        self.name = f"gpu{device}_stats"
+        self._device = device
+        self._nvml = load_nvml(nvml_instance)
+        self._handle: Any = None
+        self._unsupported: Set[str] = set()
+        if self._nvml is not None:
+            try:
+                self._handle = self._nvml.nvmlDeviceGetHandleByIndex(device)
+            except Exception as e:
+                logger.error(f"Failed to open NVML device {device}: {e}")
+        self._query_table = self._queries()
+
+    @property
+    def device(self) -> int:
+        """NVML device index."""
+        return self._device
+
+    def _queries(self) -> Dict[str, Callable[[], float]]:
+        nvml = self._nvml
+        handle = self._handle
+        return {
+            "utilization": lambda: nvml.nvmlDeviceGetUtilizationRates(
+                handle
+            ),
+            "temperature": lambda: nvml.nvmlDeviceGetTemperature(
+                handle, nvml.NVML_TEMPERATURE_GPU
+            ),
+            # NVML은 전력을 mW로 반환
+            "power": lambda: nvml.nvmlDeviceGetPowerUsage(handle) / 1000,
+            "power_limit": lambda: (
+                nvml.nvmlDeviceGetEnforcedPowerLimit(handle) / 1000
+            ),
+            "sm_clock": lambda: nvml.nvmlDeviceGetClockInfo(
+                handle, nvml.NVML_CLOCK_SM
+            ),
+            "mem_clock": lambda: nvml.nvmlDeviceGetClockInfo(
+                handle, nvml.NVML_CLOCK_MEM
+            ),
+            "memory": lambda: nvml.nvmlDeviceGetMemoryInfo(handle),
+        }
+
+    def collect(self, timestamp: float) -> Optional[Dict[str, float]]:
+        """Query the device statistics."""
+        if self._handle is None:
+            return None
+
+        values: Dict[str, float] = {}
+        for field, query in self._query_table.items():
+            if field in self._unsupported:
+                continue
+            try:
+                result = query()
+            except Exception as e:
+                # 지원하지 않는 항목은 이후 샘플에서 다시 묻지 않음
+                if "NotSupported" in type(e).__name__:
+                    self._unsupported.add(field)
+                else:
+                    logger.error(f"NVML query {field} failed: {e}")
+                continue
+            if field == "utilization":
+                values["sm_util"] = float(result.gpu)
+                values["mem_util"] = float(result.memory)
+            elif field == "memory":
+                values["used"] = MemoryConverter.to_mb(result.used)
+                values["total"] = MemoryConverter.to_mb(result.total)
+            else:
+                values[field] = float(result)
+        return values or None
+
+
+def gpu_stats_collectors(nvml_instance: Any = None) -> List[BaseCollector]:
+    """Create a statistics collector for every NVML device."""
+    return [
+        GPUStatsCollector(device, nvml_instance)
+        for device in range(device_count(nvml_instance))
+    ]
+
+
+def _in_child_pid_namespace(proc_root: str = "/proc") -> bool:
+    # NSpid에 여러 pid가 있거나 네임스페이스가 초기(호스트) 것이 아니면 True
+    try:
+        with open(os.path.join(proc_root, "self", "status")) as f:
+            for line in f:
+                if line.startswith("NSpid:"):
+                    if len(line.split()) > 2:
+                        return True
+                    break
+    except OSError:
+        pass
+    try:
+        namespace = os.stat(os.path.join(proc_root, "self", "ns", "pid"))
+    except OSError:
+        return False
+    return namespace.st_ino != _INIT_PID_NAMESPACE_INODE
+
+
+class GPUProcess(NamedTuple):
+    """GPU memory used by one process."""
+
+    pid: int
+    used: float  # MB, nan if the driver does not report it
+    name: str  # "" if the process is not visible (e.g. another container)
+    cgroup: str
+
+
+class GPUProcessCollector(BaseCollector):
+    """
+    Per-process GPU memory of one device, for finding noisy neighbours.
+
+    Queries the device's running compute processes and joins them with
+    their names and cgroups from ``/proc``. Recorded as
+    ``gpu{device}_processes`` with the fields ``count``, ``used`` (MB,
+    all listed processes), ``own`` (this process), ``others`` and
+    ``top`` (largest single process). The listing is slower than the
+    aggregate memory read, so it runs at most once per ``interval``
+    seconds and the samples in between record nothing; the full table of
+    the last query is available as ``processes``.
+
+    NVML reports host pids. In a child PID namespace (a container) they
+    cannot be matched with this process or ``/proc``, so names and
+    cgroups stay empty and ``own``/``others`` are recorded as nan.
+    """
+
+    def __init__(
+        self,
+        device: int = 0,
+        nvml_instance: Any = None,
+        interval: float = 10.0,
+        proc_root: str = "/proc",
+    ):
+        """
+        Initialize GPU process collector.
+
+        Args:
+            device: NVML device index
+            nvml_instance: Custom NVML binding (``pynvml`` if omitted)
+            interval: Minimum seconds between two process listings
+            proc_root: Mount point of procfs, read for names and cgroups
+        """
+        if interval < 0:
+            raise ValueError("interval must not be negative")
+        self.name = f"gpu{device}_processes"
+        self._device = device
+        self._interval = interval
+        self._proc_root = proc_root
+        self._isolated = _in_child_pid_namespace(proc_root)
+        if self._isolated:
+            logger.info(
+                "GPU process pids are not visible from this PID namespace"
+            )
+        self._nvml = load_nvml(nvml_instance)
+        self._handle: Any = None
+        if self._nvml is not None:
+            try:
+                self._handle = self._nvml.nvmlDeviceGetHandleByIndex(device)
+            except Exception as e:
+                logger.error(f"Failed to open NVML device {device}: {e}")
+        self._last: Optional[float] = None
+        self._processes: Tuple[GPUProcess, ...] = ()
+        # pid별 (이름, cgroup) 캐시, 목록에서 사라진 pid는 제거
+        self._identities: Dict[int, Tuple[str, str]] = {}
+
+    @property
+    def device(self) -> int:
+        """NVML device index."""
+        return self._device
+
+    @property
+    def isolated(self) -> bool:
+        """Whether NVML's host pids are not visible (child PID namespace)."""
+        return self._isolated
+
+    @property
+    def processes(self) -> Tuple[GPUProcess, ...]:
+        """Processes of the last listing, largest first."""
+        return self._processes
+
+    def by_cgroup(self) -> Dict[str, float]:
+        """
+        Sum the GPU memory of the last listing per cgroup.
+
+        Returns:
+            Used MB keyed by cgroup path, largest first
+        """
+        totals: Dict[str, float] = {}
+        for process in self._processes:
+            if not math.isnan(process.used):
+                totals[process.cgroup] = (
+                    totals.get(process.cgroup, 0.0) + process.used
+                )
+        return dict(
+            sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        )
+
+    @staticmethod
+    def parse_cgroup(text: str) -> str:
+        """
+        Get the cgroup path from the contents of ``/proc/<pid>/cgroup``.
+
+        The unified (v2) hierarchy is preferred, then the v1 memory
+        controller.
+        """
+        memory = ""
+        for line in text.splitlines():
+            hierarchy, _, rest = line.partition(":")
+            controllers, _, path = rest.partition(":")
+            if hierarchy == "0" and not controllers:
+                return path
+            if "memory" in controllers.split(","):
+                memory = path
+        return memory
+
+    def _read_proc(self, pid: int, name: str) -> str:
+        path = os.path.join(self._proc_root, str(pid), name)
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    def _identify(self, pid: int) -> Tuple[str, str]:
+        if self._isolated:
+            # 호스트 pid의 /proc/<pid>는 관계없는 프로세스일 수 있음
+            return ("", "")
+        identity = self._identities.get(pid)
+        if identity is None:
+            try:
+                identity = (
+                    self._read_proc(pid, "comm").strip(),
+                    self.parse_cgroup(self._read_proc(pid, "cgroup")),
+                )
+            except OSError:
+                # 다른 PID 네임스페이스의 프로세스는 보이지 않음
+                identity = ("", "")
+        return identity
+
+    def collect(self, timestamp: float) -> Optional[Dict[str, float]]:
+        """List the device's processes if ``interval`` has elapsed."""
+        if self._handle is None:
+            return None
+        if self._last is not None and timestamp - self._last < self._interval:
+            return None
+        self._last = timestamp
+
+        try:
+            running = self._nvml.nvmlDeviceGetComputeRunningProcesses(
+                self._handle
+            )
+        except Exception as e:
+            logger.error(f"Failed to list GPU processes: {e}")
+            return None
+
+        identities: Dict[int, Tuple[str, str]] = {}
+        processes = []
+        for entry in running:
+            pid = int(entry.pid)
+            memory = entry.usedGpuMemory
+            used = (
+                MemoryConverter.to_mb(memory)
+                if memory is not None
+                else math.nan
+            )
+            identities[pid] = self._identify(pid)
+            processes.append(GPUProcess(pid, used, *identities[pid]))
+        processes.sort(
+            key=lambda p: -math.inf if math.isnan(p.used) else p.used,
+            reverse=True,
+        )
+        self._identities = identities
+        self._processes = tuple(processes)
+
+        own_pid = os.getpid()
+        known = [p for p in processes if not math.isnan(p.used)]
+        total = sum(p.used for p in known)
+        own = sum(p.used for p in known if p.pid == own_pid)
+        if self._isolated:
+            own = math.nan
+        return {
+            "count": float(len(processes)),
+            "used": total,
+            "own": own,
+            "others": total - own,
+            "top": known[0].used if known else 0.0,
+        }
+
+
+def gpu_process_collectors(
+    nvml_instance: Any = None, interval: float = 10.0
+) -> List[BaseCollector]:
+    """Create a process collector for every NVML device."""
+    return [
+        GPUProcessCollector(device, nvml_instance, interval)
+        for device in range(device_count(nvml_instance))
+    ]
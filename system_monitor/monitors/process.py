@@ -0,0 +1,60 @@
+"""Process memory monitoring."""
+
+import os
+from typing import Optional
+from .base import BaseMonitor
+from ..core import MemoryInfo
+from ..logging_config import get_logger
+
+logger = get_logger('system_monitor.monitors.process')
+
+
+class ProcessMonitor(BaseMonitor):
+    """Resident memory (RSS) monitor for a single process using psutil."""
+
+    def __init__(self, pid: Optional[int] = None):
+        super().__init__()
+        self._own = pid is None  # 현재 프로세스를 따라감 (fork 후 포함)
+        self._pid = pid if pid is not None else os.getpid()
+        self._psutil = None
+        self._process = None
+        self._init_psutil()
+
+    def _init_psutil(self):
+        """Initialize psutil."""
+        try:
+            import psutil
+
+            self._psutil = psutil
+            self._process = psutil.Process(self._pid)
+        except ImportError:
+            logger.warning("psutil not available for process monitoring")
+            self._psutil = None
+        except Exception as e:
+            logger.error(f"Failed to attach to process {self._pid}: {e}")
+            self._psutil = None
+
+    @property
+    def pid(self) -> int:
+        """Get the monitored process id."""
+        return self._pid
+
+    def get_memory_info(self) -> Optional[MemoryInfo]:
+        """Get process memory information (RSS against host total)."""
+        if not self._psutil or not self._process:
+            return None
+
+        try:
+            rss = self._process.memory_info().rss
+            total = self._psutil.virtual_memory().total
+            return MemoryInfo.from_bytes(rss, total)
+        except Exception as e:
+            logger.error(f"Failed to get process memory info: {e}")
+            return None
+
+    def after_fork_child(self) -> None:
+        """Follow the child if this monitor tracks the current process."""
+        super().after_fork_child()
+        if self._own:
+            self._pid = os.getpid()
+            self._init_psutil()
@@ -0,0 +1,232 @@
+"""Environment-aware monitor profiles."""
+
+import dataclasses
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .scheduling import AdaptiveInterval
+
+# "host"는 CPU 사용률/스왑/PSI 수집기, "gpu_stats"는 NVML GPU 사용률/온도/
+# 전력 수집기, "gpu_processes"는 프로세스별 GPU 메모리 수집기
+# (메모리 소스가 아님)
+SOURCES = (
+    "cpu", "gpu", "process", "cgroup", "host", "gpu_stats", "gpu_processes"
+)
+
+# 환경 변수로 프로필을 덮어쓸 때 사용하는 이름
+ENV_PREFIX = "SYSTEM_MONITOR_"
+
+
+@dataclass(frozen=True)
+class MonitorProfile:
+    """
+    Declarative monitor configuration.
+
+    A profile selects which sources are read (``cpu`` is always read),
+    how often the background sampler runs and how much history is kept.
+    """
+
+    name: str
+    sources: Tuple[str, ...] = ("cpu", "gpu", "process")
+    interval: Optional[float] = 1.0  # None disables background sampling
+    adaptive: bool = False
+    min_interval: float = 0.1
+    max_interval: float = 5.0
+    history_size: int = 3600
+
+    def validate(self) -> None:
+        """
+        Check the profile for misconfiguration.
+
+        Raises:
+            ValueError: Listing every invalid field
+        """
+        errors = []
+        unknown = [s for s in self.sources if s not in SOURCES]
+        if unknown:
+            errors.append(f"unknown sources {unknown} (valid: {SOURCES})")
+        if "cpu" not in self.sources:
+            errors.append("the 'cpu' source cannot be disabled")
+        # nan/inf는 비교를 통과하지만 샘플러 스레드를 첫 틱에 멈추게 함
+        if self.interval is not None and not (
+            0 < self.interval and math.isfinite(self.interval)
+        ):
+            errors.append("interval must be positive and finite")
+        if not (
+            0 < self.min_interval <= self.max_interval
+            and math.isfinite(self.max_interval)
+        ):
+            errors.append(
+                "require 0 < min_interval <= max_interval (finite)"
+            )
+        if self.history_size <= 0:
+            errors.append("history_size must be positive")
+        if errors:
+            raise ValueError(
+                f"Invalid monitor profile '{self.name}': " + "; ".join(errors)
+            )
+
+    def scheduler(self) -> Optional[AdaptiveInterval]:
+        """Build the sampling scheduler of an adaptive profile."""
+        if not self.adaptive:
+            return None
+        return AdaptiveInterval(
+            min_interval=self.min_interval, max_interval=self.max_interval
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the profile as a dictionary."""
+        return dataclasses.asdict(self)
+
+
+PROFILES: Dict[str, MonitorProfile] = {
+    # 노트북 환경: 커널을 방해하지 않도록 낮은 주기
+    "colab": MonitorProfile(name="colab", interval=5.0, history_size=720),
+    "jupyter": MonitorProfile(name="jupyter", interval=2.0, history_size=1800),
+    # 컨테이너: cgroup 제한 기준 모니터링과 적응형 샘플링
+    "container": MonitorProfile(
+        name="container",
+        sources=("cpu", "gpu", "process", "cgroup"),
+        interval=1.0,
+        adaptive=True,
+        min_interval=0.2,
+        max_interval=5.0,
+    ),
+    "vscode": MonitorProfile(name="vscode", interval=1.0),
+    # 헤드리스 터미널/서버: 높은 주기의 적응형 샘플링
+    "terminal": MonitorProfile(
+        name="terminal",
+        interval=0.5,
+        adaptive=True,
+        min_interval=0.1,
+        max_interval=2.0,
+        history_size=7200,
+    ),
+    # 수동 샘플링 전용
+    "manual": MonitorProfile(name="manual", interval=None),
+}
+
+
+def _profile_name(env_info: Mapping[str, Any]) -> str:
+    if env_info.get("is_colab"):
+        return "colab"
+    if env_info.get("is_jupyter"):
+        return "jupyter"
+    if env_info.get("is_container"):
+        return "container"
+    if env_info.get("is_vscode"):
+        return "vscode"
+    return "terminal"
+
+
+def _parse_bool(name: str, value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ("1", "true", "yes", "on"):
+        return True
+    if lowered in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
+
+def _parse_number(name: str, value: str, kind: type) -> Any:
+    try:
+        number = kind(value)
+    except ValueError:
+        raise ValueError(
+            f"{name} must be {kind.__name__}, got {value!r}"
+        ) from None
+    if not math.isfinite(number):
+        raise ValueError(f"{name} must be finite, got {value!r}")
+    return number
+
+
+def apply_overrides(
+    profile: MonitorProfile, environ: Optional[Mapping[str, str]] = None
+) -> MonitorProfile:
+    """
+    Apply ``SYSTEM_MONITOR_*`` environment variable overrides.
+
+    Supported variables: ``SYSTEM_MONITOR_SOURCES`` (comma separated),
+    ``SYSTEM_MONITOR_INTERVAL`` (seconds, ``none`` disables sampling),
+    ``SYSTEM_MONITOR_ADAPTIVE``, ``SYSTEM_MONITOR_MIN_INTERVAL``,
+    ``SYSTEM_MONITOR_MAX_INTERVAL`` and ``SYSTEM_MONITOR_HISTORY_SIZE``.
+
+    Raises:
+        ValueError: If a variable cannot be parsed
+    """
+    environ = os.environ if environ is None else environ
+    changes: Dict[str, Any] = {}
+
+    def get(key: str) -> Optional[str]:
+        value = environ.get(ENV_PREFIX + key)
+        return value if value not in (None, "") else None
+
+    sources = get("SOURCES")
+    if sources is not None:
+        changes["sources"] = tuple(
+            s.strip() for s in sources.split(",") if s.strip()
+        )
+    interval = get("INTERVAL")
+    if interval is not None:
+        changes["interval"] = (
+            None
+            if interval.strip().lower() == "none"
+            else _parse_number(ENV_PREFIX + "INTERVAL", interval, float)
+        )
+    adaptive = get("ADAPTIVE")
+    if adaptive is not None:
+        changes["adaptive"] = _parse_bool(ENV_PREFIX + "ADAPTIVE", adaptive)
+    for key, kind in (
+        ("MIN_INTERVAL", float),
+        ("MAX_INTERVAL", float),
+        ("HISTORY_SIZE", int),
+    ):
+        value = get(key)
+        if value is not None:
+            changes[key.lower()] = _parse_number(
+                ENV_PREFIX + key, value, kind
+            )
+
+    if not changes:
+        return profile
+    return dataclasses.replace(profile, **changes)
+
+
+def select_profile(
+    env_info: Optional[Mapping[str, Any]] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> MonitorProfile:
+    """
+    Choose and validate the profile for the current environment.
+
+    ``SYSTEM_MONITOR_PROFILE`` forces a profile by name; other
+    ``SYSTEM_MONITOR_*`` variables override individual fields.
+
+    Args:
+        env_info: Result of ``detect_environment()`` (detected if omitted)
+        environ: Environment variables (``os.environ`` if omitted)
+
+    Returns:
+        Validated profile
+
+    Raises:
+        ValueError: If the profile name or an override is invalid
+    """
+    environ = os.environ if environ is None else environ
+    name = environ.get(ENV_PREFIX + "PROFILE")
+    if not name:
+        if env_info is None:
+            from .env_utils import detect_environment
+
+            env_info = detect_environment()
+        name = _profile_name(env_info)
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown monitor profile '{name}' "
+            f"(available: {', '.join(sorted(PROFILES))})"
+        )
+    profile = apply_overrides(PROFILES[name], environ)
+    profile.validate()
+    return profile
@@ -0,0 +1,266 @@
+"""pytest plugin failing tests whose peak memory grew past a baseline.
+
+Installed as a ``pytest11`` entry point; it does nothing unless
+``--memory-baseline`` is given::
+
+    # 기준값 기록
+    pytest --memory-baseline=memory.json --memory-update-baseline
+    # CI: 기준값보다 늘어난 테스트를 실패로 처리
+    pytest --memory-baseline=memory.json
+
+For every test the background sampler runs at ``--memory-interval``
+only while the test function executes, and the peak increase of each
+source over its reading at the start of the test is recorded. A test
+fails when a source's peak increase exceeds its baseline by more than
+``--memory-tolerance`` (relative) plus ``--memory-min-increase`` (MB).
+"""
+
+import json
+import os
+from typing import Any, Dict, Generator, List, Mapping, Optional, Tuple
+
+import pytest
+
+from .core import MemoryInfo, diff_snapshots
+from .monitor import SystemMonitor
+
+# 기록할 소스의 기본값 (cpu는 호스트 전체라 잡음이 큼)
+DEFAULT_SOURCES = "process,gpu"
+
+
+class _PeakTracker:
+    """Sample listener keeping the highest used bytes per source."""
+
+    def __init__(self) -> None:
+        self.peaks: Dict[str, int] = {}
+
+    def __call__(
+        self, timestamp: float, readings: Mapping[str, MemoryInfo]
+    ) -> None:
+        peaks = self.peaks
+        for source, info in readings.items():
+            used = info.used_bytes
+            if source not in peaks or used > peaks[source]:
+                peaks[source] = used
+
+
+class MemoryGate:
+    """Records per-test peak memory and compares it with a baseline."""
+
+    def __init__(
+        self,
+        path: str,
+        update: bool = False,
+        tolerance: float = 0.1,
+        min_increase: float = 1.0,
+        interval: float = 0.001,
+        sources: Tuple[str, ...] = ("process", "gpu"),
+    ):
+        """
+        Initialize memory gate.
+
+        Args:
+            path: Baseline JSON file
+            update: Write the recorded peaks to the baseline instead of
+                comparing
+            tolerance: Allowed relative increase over the baseline
+            min_increase: Allowed absolute increase in MB
+            interval: Sampling interval in seconds while a test runs
+            sources: Sources to record
+        """
+        self.path = path
+        self.update = update
+        self.tolerance = tolerance
+        self.min_increase = min_increase
+        self.interval = interval
+        self.sources = sources
+        self.baseline: Dict[str, Dict[str, float]] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.baseline = json.load(f).get("tests", {})
+        self.results: Dict[str, Dict[str, float]] = {}
+        self.regressions: Dict[str, List[str]] = {}
+        self._monitor: Optional[SystemMonitor] = None
+        self._peaks = _PeakTracker()
+
+    @property
+    def monitor(self) -> SystemMonitor:
+        """Get the monitor sampling during tests (created on first use)."""
+        if self._monitor is None:
+            # 기록이 커지면 측정 대상인 프로세스 메모리도 늘어나므로 작게 유지
+            self._monitor = SystemMonitor(
+                use_gpu="gpu" in self.sources,
+                track_process="process" in self.sources,
+                history_size=16,
+            )
+            self._monitor.add_listener(self._peaks)
+        return self._monitor
+
+    def measure(self, nodeid: str) -> Generator[None, None, None]:
+        """Sample while the wrapped test runs and record its peaks."""
+        monitor = self.monitor
+        self._peaks.peaks = {}
+        before = monitor.snapshot()
+        monitor.start_sampling(self.interval)
+        try:
+            yield
+        finally:
+            monitor.stop_sampling()
+        # 짧은 기록 대신 리스너가 본 최대값으로 피크를 계산
+        diff = diff_snapshots(
+            before, monitor.snapshot(), peaks=self._peaks.peaks
+        )
+        self.results[nodeid] = {
+            source: round(diff[source].peak_increase_mb, 3)
+            for source in self.sources
+            if source in diff
+        }
+        self.regressions[nodeid] = self.check(nodeid)
+
+    def check(self, nodeid: str) -> List[str]:
+        """Describe the sources of a test that exceed the baseline."""
+        if self.update:
+            return []
+        baseline = self.baseline.get(nodeid, {})
+        messages = []
+        for source, peak in self.results.get(nodeid, {}).items():
+            base = baseline.get(source)
+            if base is None:
+                continue
+            limit = base * (1 + self.tolerance) + self.min_increase
+            if peak > limit:
+                messages.append(
+                    f"{source} peak +{peak:.1f} MB exceeds baseline "
+                    f"+{base:.1f} MB (limit +{limit:.1f} MB)"
+                )
+        return messages
+
+    def write_baseline(self) -> None:
+        """Merge the recorded peaks into the baseline file."""
+        tests = dict(self.baseline)
+        tests.update(self.results)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"unit": "MB", "tests": tests}, f, indent=2, sort_keys=True
+            )
+            f.write("\n")
+
+    # pytest 훅
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator:
+        yield from self.measure(item.nodeid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(
+        self, item: pytest.Item, call: Any
+    ) -> Generator:
+        outcome = yield
+        report = outcome.get_result()
+        messages = self.regressions.get(item.nodeid)
+        if report.when == "call" and report.passed and messages:
+            report.outcome = "failed"
+            report.longrepr = "Memory regression: " + "; ".join(messages)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        if self._monitor is not None:
+            self._monitor.stop_sampling()
+        if self.update and self.results:
+            self.write_baseline()
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        if not self.results:
+            return
+        terminalreporter.section("memory")
+        regressed = [n for n, m in self.regressions.items() if m]
+        if self.update:
+            terminalreporter.write_line(
+                f"baseline of {len(self.results)} tests written to "
+                f"{self.path}"
+            )
+        else:
+            terminalreporter.write_line(
+                f"{len(regressed)} memory regressions in "
+                f"{len(self.results)} tests (baseline {self.path})"
+            )
+        top = sorted(
+            self.results.items(),
+            key=lambda item: max(item[1].values(), default=0.0),
+            reverse=True,
+        )[:5]
+        for nodeid, peaks in top:
+            values = ", ".join(
+                f"{source} +{peak:.1f} MB" for source, peak in peaks.items()
+            )
+            terminalreporter.write_line(f"  {nodeid}: {values}")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("memory", "memory regression gate")
+    group.addoption(
+        "--memory-baseline",
+        metavar="PATH",
+        default=None,
+        help="record peak memory per test and compare with this JSON file",
+    )
+    group.addoption(
+        "--memory-update-baseline",
+        action="store_true",
+        default=False,
+        help="write the recorded peaks to the baseline file",
+    )
+    group.addoption(
+        "--memory-tolerance",
+        type=float,
+        default=0.1,
+        help="allowed relative increase over the baseline (default 0.1)",
+    )
+    group.addoption(
+        "--memory-min-increase",
+        type=float,
+        default=1.0,
+        help="allowed absolute increase in MB (default 1.0)",
+    )
+    group.addoption(
+        "--memory-interval",
+        type=float,
+        default=0.001,
+        help="sampling interval in seconds during tests (default 0.001)",
+    )
+    group.addoption(
+        "--memory-sources",
+        default=DEFAULT_SOURCES,
+        help=f"comma-separated sources to record (default {DEFAULT_SOURCES})",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    path = config.getoption("memory_baseline")
+    if path:
+        sources = tuple(
+            source.strip()
+            for source in config.getoption("memory_sources").split(",")
+            if source.strip()
+        )
+        config.pluginmanager.register(
+            MemoryGate(
+                path,
+                update=config.getoption("memory_update_baseline"),
+                tolerance=config.getoption("memory_tolerance"),
+                min_increase=config.getoption("memory_min_increase"),
+                interval=config.getoption("memory_interval"),
+                sources=sources,
+            ),
+            "system_monitor_memory_gate",
+        )
+
+
+@pytest.fixture
+def memory_monitor(request: pytest.FixtureRequest) -> SystemMonitor:
+    """``SystemMonitor`` sampling during the test (new if not gated)."""
+    gate = request.config.pluginmanager.get_plugin(
+        "system_monitor_memory_gate"
+    )
+    if gate is not None:
+        return gate.monitor
+    return SystemMonitor()
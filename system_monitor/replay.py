@@ -0,0 +1,284 @@
+"""Offline replay of recorded memory traces through a SystemMonitor."""
+
+import heapq
+import itertools
+import os
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import Annotation, MemoryHistory, MemoryInfo
+from .core.trace import (
+    PathLike,
+    TraceChunk,
+    iter_annotations,
+    iter_trace,
+    trace_sources,
+)
+from .monitor import SystemMonitor
+from .monitors import BaseMonitor
+
+# (timestamp, source, MemoryInfo)
+_Reading = Tuple[float, str, MemoryInfo]
+# 같은 타임스탬프의 읽기 묶음 = 원래의 sample() 한 번
+Frame = Tuple[float, Dict[str, MemoryInfo]]
+
+TraceInput = Union[MemoryHistory, PathLike, Iterable[TraceChunk]]
+
+
+class ReplayMonitor(BaseMonitor):
+    """Backend returning the reading of one source in the current frame."""
+
+    def __init__(self, replay: "TraceReplay", source: str):
+        super().__init__()
+        self._replay = replay
+        self._source = source
+        self._available = True
+
+    @property
+    def source(self) -> str:
+        """Name of the replayed source."""
+        return self._source
+
+    def get_memory_info(self) -> Optional[MemoryInfo]:
+        """Get the reading of the current frame, if it has one."""
+        return self._replay.current_readings.get(self._source)
+
+
+def _history_readings(
+    history: MemoryHistory, source: str
+) -> Iterator[_Reading]:
+    for sample in history.samples(source):
+        yield sample.timestamp, source, sample.info
+
+
+def _trace_readings(path: PathLike, source: str) -> Iterator[_Reading]:
+    # 소스마다 파일을 따로 읽으므로 소스별로 프레임 하나씩만 메모리에 둠.
+    # 다른 소스의 프레임은 디코딩하지 않고 건너뛰어 디코딩은 파일당 한 번
+    for chunk in iter_trace(path, sources=(source,)):
+        for t, u, tot in zip(chunk.timestamps, chunk.used, chunk.total):
+            yield t, source, MemoryInfo(used=u, total=tot)
+
+
+def _load_chunks(
+    chunks: Iterable[TraceChunk],
+) -> Dict[str, List[_Reading]]:
+    readings: Dict[str, List[_Reading]] = {}
+    for chunk in chunks:
+        series = readings.setdefault(chunk.source, [])
+        for t, u, tot in zip(chunk.timestamps, chunk.used, chunk.total):
+            series.append((t, chunk.source, MemoryInfo(used=u, total=tot)))
+    return readings
+
+
+class TraceReplay:
+    """
+    Feeds a recorded trace through a ``SystemMonitor``.
+
+    The monitor reads :class:`ReplayMonitor` backends instead of the
+    real CPU/GPU monitors and takes its timestamps from the trace, so
+    history, listeners (leak detection, deadband filters, trace writers,
+    panels), the forecaster and exports see the recorded samples exactly
+    as they were captured. Readings that share a timestamp are replayed
+    as one ``sample()``::
+
+        replay = TraceReplay("incident.smt")
+        detector = LeakDetector(window=600)
+        detector.attach(replay.monitor)
+        replay.run()                 # as fast as possible
+        replay.run(speed=60.0)       # one trace minute per second
+
+    Sources of a trace file or history are merged lazily in time order;
+    other chunk iterables are loaded into memory first. Annotations are
+    added to the monitor's annotation log as the replay passes their
+    start times.
+    """
+
+    def __init__(
+        self,
+        trace: TraceInput,
+        sources: Optional[Iterable[str]] = None,
+        history_size: int = 3600,
+        sleep: Callable[[float], None] = time.sleep,
+        annotations: Optional[Iterable[Annotation]] = None,
+    ):
+        """
+        Prepare a replay.
+
+        Args:
+            trace: ``MemoryHistory``, path of a trace file written by
+                ``TraceWriter``, or an iterable of ``TraceChunk``
+            sources: Sources to replay (all recorded sources if omitted)
+            history_size: History capacity of the replay monitor
+            sleep: Function used to wait when pacing the replay
+            annotations: Annotations to replay (those of the trace file
+                if ``trace`` is a path)
+        """
+        self._readers: Callable[[str], Iterator[_Reading]]
+        if isinstance(trace, MemoryHistory):
+            history = trace
+            recorded = history.sources()
+            self._readers = lambda s: _history_readings(history, s)
+        elif isinstance(trace, (str, os.PathLike)):
+            path = trace
+            recorded = trace_sources(path)
+            self._readers = lambda s: _trace_readings(path, s)
+        else:
+            loaded = _load_chunks(trace)
+            recorded = list(loaded)
+            self._readers = lambda s: iter(loaded[s])
+        if sources is not None:
+            wanted = set(sources)
+            recorded = [s for s in recorded if s in wanted]
+        if annotations is None and isinstance(trace, (str, os.PathLike)):
+            annotations = iter_annotations(trace)
+        self._annotations = sorted(
+            annotations or (), key=lambda annotation: annotation.timestamp
+        )
+        self._next_annotation = 0
+        self._sources = recorded
+        self._sleep = sleep
+        self._frames: Optional[Iterator[Frame]] = None
+        self._pending: Optional[Frame] = None  # run(until=...)이 멈춘 프레임
+        self._timestamp: Optional[float] = None
+        self._readings: Dict[str, MemoryInfo] = {}
+        self.frames = 0
+        self._monitor = SystemMonitor(
+            history_size=history_size,
+            backends={
+                source: ReplayMonitor(self, source)
+                for source in self._sources
+            },
+            clock=self.clock,
+        )
+
+    @property
+    def sources(self) -> List[str]:
+        """Names of the replayed sources."""
+        return list(self._sources)
+
+    @property
+    def monitor(self) -> SystemMonitor:
+        """Monitor driven by the replay."""
+        return self._monitor
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """Trace time of the current frame (None before the first)."""
+        return self._timestamp
+
+    @property
+    def current_readings(self) -> Dict[str, MemoryInfo]:
+        """Readings of the current frame."""
+        return self._readings
+
+    def clock(self) -> float:
+        """Trace time of the current frame, used as the monitor clock."""
+        if self._timestamp is None:
+            return time.time()
+        return self._timestamp
+
+    def _iter_frames(self) -> Iterator[Frame]:
+        merged = heapq.merge(
+            *(self._readers(source) for source in self._sources),
+            key=lambda reading: reading[0],
+        )
+        for timestamp, group in itertools.groupby(
+            merged, key=lambda reading: reading[0]
+        ):
+            yield timestamp, {source: info for _, source, info in group}
+
+    def rewind(self) -> None:
+        """Restart the trace from its first frame."""
+        self._frames = None
+        self._pending = None
+        self._timestamp = None
+        self._readings = {}
+        self._next_annotation = 0
+        self.frames = 0
+
+    def _next_frame(self) -> Optional[Frame]:
+        if self._pending is not None:
+            frame, self._pending = self._pending, None
+            return frame
+        if self._frames is None:
+            self._frames = self._iter_frames()
+        return next(self._frames, None)
+
+    def _play(self, frame: Frame) -> Dict[str, MemoryInfo]:
+        self._timestamp, self._readings = frame
+        self.frames += 1
+        log = self._monitor.annotations
+        while (
+            self._next_annotation < len(self._annotations)
+            and self._annotations[self._next_annotation].timestamp
+            <= self._timestamp
+        ):
+            log.append(self._annotations[self._next_annotation])
+            self._next_annotation += 1
+        return self._monitor.sample()
+
+    def step(self) -> Optional[Dict[str, MemoryInfo]]:
+        """
+        Replay the next frame as one ``sample()``.
+
+        Returns:
+            Readings of the sample, or None at the end of the trace
+        """
+        frame = self._next_frame()
+        if frame is None:
+            return None
+        return self._play(frame)
+
+    def run(
+        self,
+        speed: Optional[float] = None,
+        until: Optional[float] = None,
+        max_frames: Optional[int] = None,
+    ) -> int:
+        """
+        Replay frames until the end of the trace or a limit.
+
+        Args:
+            speed: Trace seconds replayed per wall-clock second (1.0 is
+                real time); None replays as fast as possible
+            until: Stop before the first frame later than this trace
+                time
+            max_frames: Stop after this many frames
+
+        Returns:
+            Number of frames replayed by this call
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+        replayed = 0
+        start: Optional[Tuple[float, float]] = None  # (wall, trace)
+        while max_frames is None or replayed < max_frames:
+            frame = self._next_frame()
+            if frame is None:
+                break
+            timestamp = frame[0]
+            if until is not None and timestamp > until:
+                # 멈춘 프레임은 다음 호출에서 다시 재생
+                self._pending = frame
+                break
+            if speed is not None:
+                if start is None:
+                    start = (time.monotonic(), timestamp)
+                delay = (
+                    start[0] + (timestamp - start[1]) / speed
+                    - time.monotonic()
+                )
+                if delay > 0:
+                    self._sleep(delay)
+            self._play(frame)
+            replayed += 1
+        return replayed
@@ -0,0 +1,115 @@
+"""Background sampling for SystemMonitor."""
+
+import math
+import threading
+import time
+from typing import Optional, TYPE_CHECKING
+
+from .instrumentation import SamplerStats
+from .logging_config import get_logger
+from .scheduling import AdaptiveInterval
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .monitor import SystemMonitor
+
+logger = get_logger('system_monitor.sampler')
+
+THREAD_NAME = "system-monitor-sampler"
+
+
+class BackgroundSampler:
+    """Daemon thread that calls ``SystemMonitor.sample()`` periodically."""
+
+    def __init__(
+        self,
+        monitor: "SystemMonitor",
+        interval: float = 1.0,
+        stats: Optional[SamplerStats] = None,
+        scheduler: Optional[AdaptiveInterval] = None,
+    ):
+        """
+        Initialize background sampler.
+
+        Args:
+            monitor: Monitor to sample
+            interval: Seconds between samples (initial value when a
+                scheduler is given)
+            stats: Statistics object to update (created if omitted)
+            scheduler: Policy choosing the interval after each sample
+        """
+        if not (0 < interval and math.isfinite(interval)):
+            raise ValueError("interval must be positive and finite")
+        self._monitor = monitor
+        self._interval = interval
+        self._scheduler = scheduler
+        self._stats = stats if stats is not None else SamplerStats()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def interval(self) -> float:
+        """Get the current sampling interval in seconds."""
+        return self._interval
+
+    @property
+    def scheduler(self) -> Optional[AdaptiveInterval]:
+        """Get the interval policy, if any."""
+        return self._scheduler
+
+    @property
+    def stats(self) -> SamplerStats:
+        """Get loop timing statistics."""
+        return self._stats
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sampler thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the sampler thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the sampler thread and wait for it to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        stats = self._stats
+        cpu_start = time.thread_time()
+        wall_start = time.monotonic()
+        next_tick = wall_start
+        while not self._stop_event.is_set():
+            stats.record_tick(time.monotonic() - next_tick)
+            try:
+                readings = self._monitor.sample()
+                if self._scheduler is not None:
+                    self._interval = self._scheduler.next_interval(
+                        time.monotonic(), readings
+                    )
+            except Exception as e:
+                logger.error(f"Sampling failed: {e}")
+            stats.interval = self._interval
+
+            next_tick += self._interval
+            now = time.monotonic()
+            delay = next_tick - now
+            if delay < 0:
+                # 밀린 틱은 건너뛰고 현재 시점부터 다시 시작
+                stats.record_overrun(-delay, self._interval)
+                next_tick = now
+                delay = 0.0
+            stats.cpu_time += time.thread_time() - cpu_start
+            stats.wall_time += now - wall_start
+            cpu_start = time.thread_time()
+            wall_start = now
+            self._stop_event.wait(delay)
@@ -0,0 +1,122 @@
+"""Adaptive sampling interval policies."""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+from .core import MemoryInfo
+
+
+class AdaptiveInterval:
+    """
+    Sampling interval driven by memory volatility and pressure.
+
+    After every sample the interval is chosen from the readings:
+
+    - usage at or above ``pressure_threshold`` percent, or changing by
+      at least ``volatility_threshold`` percentage points per second,
+      drops the interval straight to ``min_interval``
+    - changes of at least half the volatility threshold halve it
+    - otherwise the interval backs off by ``backoff`` up to
+      ``max_interval``
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.1,
+        max_interval: float = 5.0,
+        volatility_threshold: float = 1.0,
+        pressure_threshold: float = 90.0,
+        backoff: float = 2.0,
+        sources: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize adaptive interval policy.
+
+        Args:
+            min_interval: Shortest interval in seconds
+            max_interval: Longest interval in seconds
+            volatility_threshold: Usage change in percentage points per
+                second treated as volatile
+            pressure_threshold: Usage percent treated as near the limit
+            backoff: Factor applied to the interval while steady
+            sources: Sources to consider (all sources if omitted)
+        """
+        if not (
+            0 < min_interval <= max_interval and math.isfinite(max_interval)
+        ):
+            raise ValueError(
+                "require 0 < min_interval <= max_interval (finite)"
+            )
+        if backoff <= 1:
+            raise ValueError("backoff must be greater than 1")
+        if volatility_threshold <= 0:
+            raise ValueError("volatility_threshold must be positive")
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._volatility_threshold = volatility_threshold
+        self._pressure_threshold = pressure_threshold
+        self._backoff = backoff
+        self._sources = None if sources is None else frozenset(sources)
+        self._interval = min_interval
+        self._previous: Dict[str, Tuple[float, float]] = {}
+
+    @property
+    def min_interval(self) -> float:
+        """Shortest interval in seconds."""
+        return self._min_interval
+
+    @property
+    def max_interval(self) -> float:
+        """Longest interval in seconds."""
+        return self._max_interval
+
+    @property
+    def interval(self) -> float:
+        """Interval chosen after the latest sample."""
+        return self._interval
+
+    def reset(self) -> None:
+        """Forget previous readings and restart at ``min_interval``."""
+        self._interval = self._min_interval
+        self._previous.clear()
+
+    def next_interval(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> float:
+        """
+        Choose the interval until the next sample.
+
+        Args:
+            timestamp: Monotonic time of the sample in seconds
+            readings: Readings returned by ``SystemMonitor.sample()``
+
+        Returns:
+            Seconds to wait before the next sample
+        """
+        pressure = 0.0
+        rate = 0.0
+        for source, info in readings.items():
+            if self._sources is not None and source not in self._sources:
+                continue
+            usage = info.usage_percent
+            pressure = max(pressure, usage)
+            previous = self._previous.get(source)
+            if previous is not None and timestamp > previous[0]:
+                change = abs(usage - previous[1]) / (timestamp - previous[0])
+                rate = max(rate, change)
+            self._previous[source] = (timestamp, usage)
+
+        if (
+            pressure >= self._pressure_threshold
+            or rate >= self._volatility_threshold
+        ):
+            interval = self._min_interval
+        elif rate >= self._volatility_threshold / 2:
+            interval = self._interval / 2
+        else:
+            interval = self._interval * self._backoff
+
+        self._interval = min(
+            max(interval, self._min_interval), self._max_interval
+        )
+        return self._interval
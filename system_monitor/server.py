@@ -0,0 +1,248 @@
+"""Local HTTP/JSON endpoint for time-window queries of a monitor."""
+
+import fnmatch
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .core.rollup import DEFAULT_LEVELS, MemoryRollup
+from .logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .monitor import SystemMonitor
+
+logger = get_logger('system_monitor.server')
+
+
+class _QueryError(Exception):
+    """Invalid query parameters (answered with 400)."""
+
+
+def _number(
+    params: Dict[str, List[str]], name: str, default: Optional[float] = None
+) -> Optional[float]:
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = float(values[-1])
+    except ValueError:
+        raise _QueryError(f"{name} must be a number") from None
+    if not math.isfinite(value):
+        raise _QueryError(f"{name} must be finite")
+    return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        routes = {
+            "/series": self.server.query_server.handle_series,
+            "/query": self.server.query_server.handle_query,
+            "/latest": self.server.query_server.handle_latest,
+        }
+        route = routes.get(url.path.rstrip("/") or "/")
+        if route is None:
+            self._send(404, {"error": f"unknown path {url.path}"})
+            return
+        try:
+            body = route(params)
+        except _QueryError as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            logger.error(f"Query failed: {e}")
+            self._send(500, {"error": str(e)})
+        else:
+            self._send(200, body)
+
+    def _send(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format % args)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: Tuple[str, int], query_server: "QueryServer"
+    ):
+        self.query_server = query_server
+        super().__init__(address, _Handler)
+
+
+class QueryServer:
+    """
+    Serves time-window queries of a monitor's samples over HTTP/JSON.
+
+    The server keeps a ``MemoryRollup`` of the monitor (filled from its
+    history when created, then on every sample), so each query merges
+    a bounded number of precomputed buckets instead of scanning raw
+    samples. Endpoints (``GET``)::
+
+        /series                      series names and rollup levels
+        /latest                      readings of the latest sample (MB)
+        /query?series=gpu*_stats.used&window=600
+                                     min/max/avg per bucket and window
+
+    ``/query`` parameters: ``series`` (name or ``fnmatch`` pattern,
+    repeatable; all series if omitted), ``window`` (seconds before
+    ``end``, default 600) or ``start``, ``end`` (default: latest
+    sample), ``bucket`` (seconds) and ``points`` (maximum buckets per
+    series, default 500).
+
+    It listens on ``127.0.0.1`` by default and has no authentication;
+    bind to other interfaces only on trusted networks.
+    """
+
+    def __init__(
+        self,
+        monitor: "SystemMonitor",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rollup: Optional[MemoryRollup] = None,
+        levels: Sequence[Tuple[float, int]] = DEFAULT_LEVELS,
+    ):
+        """
+        Initialize query server.
+
+        Args:
+            monitor: Monitor whose samples are served
+            host: Interface to listen on
+            port: TCP port (a free port if 0, see ``port``)
+            rollup: Rollup to serve; a new one fed from the monitor's
+                history and attached to the monitor if omitted
+            levels: Rollup resolutions when creating the rollup
+        """
+        self.monitor = monitor
+        self._owns_rollup = rollup is None
+        if rollup is None:
+            rollup = MemoryRollup(levels)
+            rollup.feed(monitor.history, monitor.metrics)
+            rollup.attach(monitor)
+        self.rollup = rollup
+        self._httpd = _Server((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Get the ``(host, port)`` the server listens on."""
+        host, port = self._httpd.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def port(self) -> int:
+        """Get the TCP port the server listens on."""
+        return self.address[1]
+
+    @property
+    def url(self) -> str:
+        """Get the base URL of the server."""
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the server thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "QueryServer":
+        """Serve requests in a background daemon thread."""
+        if self.is_running:
+            return self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name="system-monitor-query",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Serving queries at {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and detach the rollup created by the server."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+        if self._owns_rollup:
+            self.rollup.detach(self.monitor)
+
+    def __enter__(self) -> "QueryServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # 요청 처리 (서버 스레드에서 호출)
+
+    def handle_series(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Answer ``/series``."""
+        return {
+            "series": self.rollup.series(),
+            "levels": [list(level) for level in self.rollup.levels],
+            "latest": self.rollup.latest_timestamp,
+        }
+
+    def handle_latest(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Answer ``/latest``."""
+        state = self.monitor.state
+        return {
+            "timestamp": state.timestamp,
+            "readings": {
+                source: {"used": info.used, "total": info.total}
+                for source, info in state.readings.items()
+            },
+            "metrics": {
+                source: dict(values)
+                for source, values in state.metrics.items()
+            },
+        }
+
+    def handle_query(self, params: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Answer ``/query``."""
+        rollup = self.rollup
+        end = _number(params, "end", rollup.latest_timestamp)
+        if end is None:
+            return {"start": None, "end": None, "series": {}}
+        start = _number(params, "start")
+        if start is None:
+            window = _number(params, "window", 600.0)
+            if window is None or window < 0:
+                raise _QueryError("window must not be negative")
+            start = end - window
+        bucket = _number(params, "bucket")
+        points = _number(params, "points", 500.0)
+        if points is None or points < 1:
+            raise _QueryError("points must be at least 1")
+
+        names = rollup.series()
+        patterns = params.get("series")
+        if patterns:
+            names = [
+                name
+                for name in names
+                if any(fnmatch.fnmatchcase(name, p) for p in patterns)
+            ]
+        series = {}
+        for name in names:
+            try:
+                result = rollup.query(name, start, end, bucket, int(points))
+            except ValueError as e:
+                raise _QueryError(str(e)) from None
+            if result is not None:
+                series[name] = result.to_dict()
+        return {"start": start, "end": end, "series": series}
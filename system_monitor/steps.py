@@ -0,0 +1,188 @@
+"""Per-step memory accounting for training loops."""
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from .core import MemoryInfo
+
+# 선택한 소스만 읽어 {source: MemoryInfo}를 반환하는 함수
+SourceReader = Callable[[Iterable[str]], Dict[str, MemoryInfo]]
+
+_KINDS = ("start", "end", "peak")
+
+
+@dataclass
+class _OpenStep:
+    step: int
+    timestamp: float
+    started: float
+    start: Dict[str, float]
+    peak: Dict[str, float] = field(default_factory=dict)
+
+
+class StepRecorder:
+    """
+    Step-indexed memory recorder with columnar storage.
+
+    Each step stores its index, wall-clock start, duration and, for
+    every tracked source, used memory (MB) at the start and end of the
+    step and the peak seen during it. Peaks include every background
+    sample taken while the step is open, so a running sampler catches
+    spikes between the step boundaries.
+
+    Sources are only read at step boundaries; ``begin`` reads once and
+    uses the result both to close the previous step and open the next.
+    """
+
+    def __init__(
+        self,
+        read: SourceReader,
+        sources: Iterable[str] = ("gpu", "process"),
+        maxlen: int = 100000,
+    ):
+        """
+        Initialize step recorder.
+
+        Args:
+            read: Function reading the given sources
+            sources: Sources recorded per step
+            maxlen: Number of steps kept (oldest are discarded)
+        """
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self._read = read
+        self._sources = tuple(sources)
+        self._maxlen = maxlen
+        self._lock = threading.Lock()
+        self._current: Optional[_OpenStep] = None
+        self._columns: Dict[str, Deque[float]] = {
+            name: deque(maxlen=maxlen) for name in self.column_names()
+        }
+
+    @property
+    def sources(self) -> List[str]:
+        """Sources recorded per step."""
+        return list(self._sources)
+
+    @property
+    def current_step(self) -> Optional[int]:
+        """Index of the open step, if any."""
+        current = self._current
+        return None if current is None else current.step
+
+    def column_names(self) -> List[str]:
+        """Names of the stored columns."""
+        names = ["step", "timestamp", "duration"]
+        for source in self._sources:
+            names.extend(f"{source}_{kind}" for kind in _KINDS)
+        return names
+
+    def _used(self) -> Dict[str, float]:
+        readings = self._read(self._sources)
+        return {source: info.used for source, info in readings.items()}
+
+    def _close(self, ended: float, used: Dict[str, float]) -> None:
+        current = self._current
+        self._current = None
+        columns = self._columns
+        columns["step"].append(current.step)
+        columns["timestamp"].append(current.timestamp)
+        columns["duration"].append(ended - current.started)
+        for source in self._sources:
+            start = current.start.get(source, math.nan)
+            end = used.get(source, math.nan)
+            peak = max(
+                (
+                    value
+                    for value in (start, end, current.peak.get(source))
+                    if value is not None and not math.isnan(value)
+                ),
+                default=math.nan,
+            )
+            columns[f"{source}_start"].append(start)
+            columns[f"{source}_end"].append(end)
+            columns[f"{source}_peak"].append(peak)
+
+    def begin(self, step: int) -> None:
+        """
+        Start a step, closing the open one.
+
+        Args:
+            step: Step index
+        """
+        used = self._used()
+        now = time.perf_counter()
+        with self._lock:
+            if self._current is not None:
+                self._close(now, used)
+            self._current = _OpenStep(step, time.time(), now, used)
+
+    def end(self) -> None:
+        """Close the open step (no-op if none is open)."""
+        if self._current is None:
+            return
+        used = self._used()
+        now = time.perf_counter()
+        with self._lock:
+            if self._current is not None:
+                self._close(now, used)
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Update peaks of the open step from a sample."""
+        if self._current is None:
+            return
+        with self._lock:
+            current = self._current
+            if current is None:
+                return
+            for source in self._sources:
+                info = readings.get(source)
+                if info is None:
+                    continue
+                peak = current.peak.get(source)
+                if peak is None or info.used > peak:
+                    current.peak[source] = info.used
+
+    def columns(self) -> Dict[str, List[float]]:
+        """
+        Get recorded steps as columns.
+
+        Returns:
+            Column name to values; missing readings are ``nan``
+        """
+        with self._lock:
+            return {
+                name: list(values) for name, values in self._columns.items()
+            }
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get recorded steps as dictionaries (missing readings are None)."""
+        columns = self.columns()
+        names = list(columns)
+        return [
+            {
+                name: (
+                    None
+                    if isinstance(value, float) and math.isnan(value)
+                    else value
+                )
+                for name, value in zip(names, row)
+            }
+            for row in zip(*columns.values())
+        ]
+
+    def clear(self) -> None:
+        """Discard recorded steps and the open step."""
+        with self._lock:
+            self._current = None
+            for values in self._columns.values():
+                values.clear()
+
+    def __len__(self) -> int:
+        return len(self._columns["step"])
@@ -0,0 +1,93 @@
+"""Change-only emission of sample streams."""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from .core import MemoryInfo
+from .monitor import SampleListener
+
+
+class DeadbandFilter:
+    """
+    Sample listener that forwards only readings that changed.
+
+    A reading is forwarded when its used memory moved more than
+    ``deadband`` MB from the last forwarded value, when its total
+    changed, or when ``heartbeat`` seconds passed since the source was
+    last forwarded. Samples with no forwarded readings are dropped.
+
+    Register it in place of the downstream listener::
+
+        monitor.add_listener(DeadbandFilter(publish, deadband=1.0))
+    """
+
+    def __init__(
+        self,
+        listener: SampleListener,
+        deadband: float = 1.0,
+        heartbeat: Optional[float] = 60.0,
+        sources: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize change-only filter.
+
+        Args:
+            listener: Downstream callback receiving changed readings
+            deadband: Change in used MB below which readings are dropped
+            heartbeat: Seconds after which a reading is forwarded anyway
+                (``None`` disables heartbeats)
+            sources: Sources to forward (all sources if omitted)
+        """
+        if deadband < 0:
+            raise ValueError("deadband must not be negative")
+        if heartbeat is not None and heartbeat <= 0:
+            raise ValueError("heartbeat must be positive")
+        self._listener = listener
+        self._deadband = deadband
+        self._heartbeat = heartbeat
+        self._sources = None if sources is None else frozenset(sources)
+        self._emitted: Dict[str, Tuple[float, MemoryInfo]] = {}
+        self.received = 0
+        self.forwarded = 0
+
+    def _changed(
+        self, source: str, timestamp: float, info: MemoryInfo
+    ) -> bool:
+        last = self._emitted.get(source)
+        if last is None:
+            return True
+        last_timestamp, last_info = last
+        if info.total != last_info.total:
+            return True
+        if abs(info.used - last_info.used) > self._deadband:
+            return True
+        return (
+            self._heartbeat is not None
+            and timestamp - last_timestamp >= self._heartbeat
+        )
+
+    def __call__(
+        self, timestamp: float, readings: Dict[str, MemoryInfo]
+    ) -> None:
+        """Filter one ``SystemMonitor.sample()`` result."""
+        changed = {}
+        for source, info in readings.items():
+            if self._sources is not None and source not in self._sources:
+                continue
+            self.received += 1
+            if self._changed(source, timestamp, info):
+                changed[source] = info
+                self._emitted[source] = (timestamp, info)
+        if changed:
+            self.forwarded += len(changed)
+            self._listener(timestamp, changed)
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of readings that were not forwarded."""
+        if not self.received:
+            return 0.0
+        return 1 - self.forwarded / self.received
+
+    def reset(self) -> None:
+        """Forget last forwarded values so every source is re-sent."""
+        self._emitted.clear()
@@ -0,0 +1,188 @@
+"""Annotation tests."""
+
+import threading
+import pytest
+from system_monitor import SystemMonitor
+from system_monitor.core import (
+    Annotation,
+    AnnotationLog,
+    MemoryHistory,
+    MemoryInfo,
+    TraceWriter,
+    iter_annotations,
+    iter_trace,
+)
+from system_monitor.core.codec import decode_annotations, encode_annotations
+from system_monitor.replay import TraceReplay
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_monitor(clock):
+    """Create a monitor reading only the CPU with a fake clock."""
+    return SystemMonitor(use_gpu=False, track_process=False, clock=clock)
+
+
+class TestAnnotationLog:
+    """Test the annotation log."""
+
+    def test_range_queries(self):
+        """Test selecting annotations that overlap a range."""
+        log = AnnotationLog()
+        log.append(Annotation(5.0, "late"))
+        log.append(Annotation(1.0, "span", duration=2.0))
+        log.append(Annotation(4.0, "mark"))
+        assert [a.name for a in log.annotations()] == ["span", "mark", "late"]
+        assert [a.name for a in log.annotations(2.5, 4.0)] == ["span", "mark"]
+        assert [a.name for a in log.annotations(start=4.5)] == ["late"]
+        assert log.annotations()[0].end == 3.0
+        assert log.to_records()[0] == {
+            "timestamp": 1.0, "name": "span", "duration": 2.0, "thread": 0
+        }
+
+    def test_bounded_and_subscribers(self):
+        """Test maxlen and subscriber queues."""
+        log = AnnotationLog(maxlen=2)
+        log.append(Annotation(0.0, "before"))
+        queue = log.subscribe()
+        for i in range(3):
+            log.append(Annotation(float(i + 1), f"a{i}"))
+        assert [a.name for a in log.annotations()] == ["a1", "a2"]
+        assert [a.name for a in queue] == ["a1", "a2"]
+
+        log.unsubscribe(queue)
+        log.append(Annotation(9.0, "after"))
+        assert len(queue) == 2
+        log.clear()
+        assert len(log) == 0
+        with pytest.raises(ValueError):
+            AnnotationLog(maxlen=0)
+
+    def test_concurrent_marks(self):
+        """Test that marks from many threads are all recorded."""
+        log = AnnotationLog(maxlen=10000)
+        queue = log.subscribe()
+
+        def mark(index):
+            for i in range(500):
+                log.append(Annotation(float(i), f"t{index}"))
+
+        threads = [
+            threading.Thread(target=mark, args=(i,)) for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(log) == 2000
+        assert len(queue) == 2000
+
+
+class TestMonitorAnnotations:
+    """Test marking events through SystemMonitor."""
+
+    def test_mark_and_span(self):
+        """Test instant marks and spans on the monitor clock."""
+        clock = Clock()
+        monitor = make_monitor(clock)
+        mark = monitor.mark("checkpoint_save")
+        assert mark == Annotation(
+            100.0, "checkpoint_save", 0.0, threading.get_ident()
+        )
+
+        with pytest.raises(RuntimeError):
+            with monitor.span("eval"):
+                clock.now = 102.5
+                raise RuntimeError("boom")
+        span = monitor.annotations.annotations()[-1]
+        assert (span.name, span.timestamp, span.duration) == (
+            "eval", 100.0, 2.5
+        )
+
+        monitor.sample()
+        data = monitor.to_dict()
+        assert [a["name"] for a in data["annotations"]] == [
+            "checkpoint_save", "eval"
+        ]
+        assert data["samples"][0]["timestamp"] == 102.5
+
+
+class TestAnnotationExport:
+    """Test carrying annotations through the trace format."""
+
+    def test_codec_roundtrip(self):
+        """Test encoding keeps names, threads and exact durations."""
+        annotations = [
+            Annotation(1700000000.002, "b", 0.0, 2 ** 40),
+            Annotation(1700000000.001, "한글", 0.000123, 1),
+        ]
+        decoded = decode_annotations(encode_annotations(annotations))
+        assert [a.name for a in decoded] == ["한글", "b"]
+        assert decoded[0].duration == 0.000123
+        assert decoded[0].timestamp == pytest.approx(1700000000.001)
+        assert decoded[1].thread == 2 ** 40
+        assert decode_annotations(encode_annotations([])) == []
+
+    def test_trace_writer_drains_monitor(self, tmp_path):
+        """Test that an attached writer records marks between samples."""
+        clock = Clock()
+        monitor = make_monitor(clock)
+        path = tmp_path / "run.smt"
+        writer = TraceWriter(path, chunk_size=2)
+        monitor.mark("before_attach")
+        writer.attach(monitor)
+        for i in range(3):
+            clock.now = 100.0 + i
+            monitor.mark(f"mark{i}")
+            monitor.sample()
+        monitor.mark("pending")
+        writer.close()
+        monitor.mark("after_close")
+
+        assert writer.annotations == 4
+        assert [a.name for a in iter_annotations(path)] == [
+            "mark0", "mark1", "mark2", "pending"
+        ]
+        assert sum(len(c.timestamps) for c in iter_trace(path)) == 3
+
+    def test_detach_stops_annotations(self, tmp_path):
+        """Test that detaching writes pending marks and unsubscribes."""
+        monitor = make_monitor(Clock())
+        path = tmp_path / "run.smt"
+        with TraceWriter(path) as writer:
+            writer.attach(monitor)
+            monitor.mark("kept")
+            writer.detach(monitor)
+            monitor.mark("dropped")
+        assert [a.name for a in iter_annotations(path)] == ["kept"]
+
+    def test_replay_restores_annotations(self, tmp_path):
+        """Test that replayed monitors see annotations in time order."""
+        path = tmp_path / "run.smt"
+        with TraceWriter(path) as writer:
+            for i in range(5):
+                writer.write("gpu", float(i), MemoryInfo(float(i), 10.0))
+            writer.write_annotation(Annotation(2.5, "save"))
+        replay = TraceReplay(path)
+        replay.run(until=2.0)
+        assert len(replay.monitor.annotations) == 0
+        replay.run()
+        assert replay.monitor.annotations.annotations() == [
+            Annotation(2.5, "save")
+        ]
+
+        history = MemoryHistory()
+        history.append("gpu", 1.0, MemoryInfo(1.0, 10.0))
+        replay = TraceReplay(
+            history, annotations=[Annotation(0.5, "start")]
+        )
+        replay.run()
+        assert len(replay.monitor.annotations) == 1
@@ -0,0 +1,159 @@
+"""Arrow/Parquet export tests."""
+
+import pytest
+from unittest.mock import patch
+from system_monitor.core import (
+    Annotation,
+    AnnotationLog,
+    MemoryHistory,
+    MemoryInfo,
+)
+from system_monitor.core.trace import (
+    TraceChunk,
+    TraceWriter,
+    chunks_to_history,
+)
+from system_monitor.export import arrow
+
+
+def make_history(count=10):
+    """Create a history with gpu and cpu samples."""
+    history = MemoryHistory()
+    for i in range(count):
+        t = 1700000000.0 + i * 0.1
+        history.append("gpu", t, MemoryInfo(100.0 + i, 1000.0))
+        history.append("cpu", t, MemoryInfo(500.0, 2000.0))
+    return history
+
+
+class TestMissingPyarrow:
+    """Test behavior without pyarrow."""
+
+    def test_import_error(self):
+        """Test that exporting without pyarrow names the extra."""
+        with patch.object(arrow, "pa", None):
+            with pytest.raises(ImportError, match="system-monitor\\[arrow\\]"):
+                arrow.to_record_batches(make_history())
+            with pytest.raises(ImportError):
+                arrow.write_parquet(make_history(), "unused.parquet")
+
+
+class TestArrowExport:
+    """Test record batch and Parquet conversion."""
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        """Skip when pyarrow is not installed."""
+        pytest.importorskip("pyarrow")
+
+    def test_schema_and_batches(self):
+        """Test column types and batch splitting."""
+        import pyarrow as pa
+
+        batches = list(arrow.to_record_batches(make_history(), batch_size=8))
+        assert [batch.num_rows for batch in batches] == [8, 8, 4]
+        schema = batches[0].schema
+        assert schema.field("timestamp").type == pa.timestamp("us", "UTC")
+        assert pa.types.is_dictionary(schema.field("source").type)
+        assert schema.field("used").type == pa.float64()
+
+        # 두 번째 배치는 gpu 2개와 cpu 6개를 포함하고 사전을 공유
+        sources = batches[1].column("source")
+        assert sources.dictionary.to_pylist() == ["gpu", "cpu"]
+        assert sources.to_pylist() == ["gpu"] * 2 + ["cpu"] * 6
+
+    def test_table_roundtrip(self):
+        """Test converting batches back into chunks."""
+        history = make_history()
+        table = arrow.to_table(history)
+        assert table.num_rows == 20
+        restored = chunks_to_history(
+            arrow.from_record_batches(table.to_batches())
+        )
+        assert restored.sources() == ["gpu", "cpu"]
+        loaded = restored.samples("gpu")
+        original = history.samples("gpu")
+        assert [s.used for s in loaded] == [s.used for s in original]
+        assert [s.timestamp for s in loaded] == pytest.approx(
+            [s.timestamp for s in original], abs=1e-6
+        )
+
+    def test_plain_columns_accepted(self):
+        """Test importing batches with string sources and float times."""
+        import pyarrow as pa
+
+        batch = pa.RecordBatch.from_pydict(
+            {
+                "timestamp": [1.0, 2.0, 3.0],
+                "source": ["gpu", "cpu", "gpu"],
+                "used": [1.0, 2.0, 3.0],
+                "total": [4.0, 4.0, 4.0],
+            }
+        )
+        chunks = list(arrow.from_record_batches([batch]))
+        assert chunks == [
+            TraceChunk("gpu", [1.0, 3.0], [1.0, 3.0], [4.0, 4.0]),
+            TraceChunk("cpu", [2.0], [2.0], [4.0]),
+        ]
+
+    def test_parquet_roundtrip(self, tmp_path):
+        """Test writing and reading a Parquet file in row groups."""
+        import pyarrow.parquet as pq
+
+        history = make_history(100)
+        path = tmp_path / "trace.parquet"
+        assert arrow.write_parquet(history, path, batch_size=64) == 200
+        assert pq.ParquetFile(path).num_row_groups == 4
+
+        restored = arrow.read_parquet(path, batch_size=50)
+        for source in ("gpu", "cpu"):
+            original = history.samples(source)
+            loaded = restored.samples(source)
+            assert [s.used for s in loaded] == [s.used for s in original]
+            assert [s.timestamp for s in loaded] == pytest.approx(
+                [s.timestamp for s in original], abs=1e-6
+            )
+
+    def test_trace_file_to_parquet(self, tmp_path):
+        """Test exporting an on-disk trace."""
+        trace = tmp_path / "run.smt"
+        with TraceWriter(trace, chunk_size=16) as writer:
+            for i in range(100):
+                writer.write("gpu", float(i), MemoryInfo(float(i), 100.0))
+        path = tmp_path / "trace.parquet"
+        assert arrow.write_parquet(str(trace), path, batch_size=32) == 100
+        chunks = list(arrow.iter_parquet(path, batch_size=32))
+        assert [len(c.timestamps) for c in chunks] == [32, 32, 32, 4]
+        assert chunks[-1].used == [96.0, 97.0, 98.0, 99.0]
+
+    def test_invalid_batch_size(self):
+        """Test batch size validation."""
+        with pytest.raises(ValueError):
+            arrow.to_record_batches(make_history(), batch_size=0)
+        with pytest.raises(ValueError):
+            arrow.annotations_to_record_batches([], batch_size=0)
+
+    def test_annotations_roundtrip(self, tmp_path):
+        """Test exporting annotations from a log and a trace file."""
+        import pyarrow as pa
+
+        log = AnnotationLog()
+        for i in range(5):
+            log.append(Annotation(1700000000.0 + i, f"step{i % 2}", 0.25, 7))
+        batches = list(arrow.annotations_to_record_batches(log, 2))
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        schema = batches[0].schema
+        assert pa.types.is_dictionary(schema.field("name").type)
+        assert schema.field("thread").type == pa.uint64()
+
+        path = tmp_path / "annotations.parquet"
+        assert arrow.write_annotations_parquet(log, path) == 5
+        assert arrow.read_annotations_parquet(path) == log.annotations()
+
+        trace = tmp_path / "run.smt"
+        with TraceWriter(trace) as writer:
+            writer.write_annotation(Annotation(1.5, "save", 0.0, 1))
+        assert arrow.write_annotations_parquet(str(trace), path) == 1
+        assert arrow.read_annotations_parquet(path) == [
+            Annotation(1.5, "save", 0.0, 1)
+        ]
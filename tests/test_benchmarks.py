@@ -0,0 +1,95 @@
+"""Benchmark suite smoke tests."""
+
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.bench_threads import measure_throughput, thread_counts
+from benchmarks.runner import BenchConfig, BenchResult, compare, run
+
+
+class TestBenchmarkRunner:
+    """Test the benchmark runner with quick settings."""
+
+    def test_run_selected(self):
+        """Test that selected benchmarks produce results."""
+        report = run(BenchConfig.quick(), "no-such-benchmark")
+        assert report["results"] == {}
+
+        report = run(BenchConfig.quick(), "backend")
+        assert "backend.gpu.read" in report["results"]
+        assert report["results"]["backend.gpu.read"]["unit"] == "ns/call"
+        assert report["meta"]["version"]
+        assert "gil_enabled" in report["meta"]
+
+    def test_compare(self):
+        """Test regression detection for time and rate units."""
+        baseline = {
+            "results": {
+                "a": {"unit": "ns/call", "median": 100.0},
+                "b": {"unit": "ops/s", "median": 100.0},
+                "c": {"unit": "ms", "median": 0.0},
+            }
+        }
+        current = {
+            "results": {
+                "a": {"unit": "ns/call", "median": 150.0},
+                "b": {"unit": "ops/s", "median": 150.0},
+                "c": {"unit": "ms", "median": 1.0},
+                "d": {"unit": "ms", "median": 1.0},
+            }
+        }
+        rows = {row["name"]: row for row in compare(current, baseline, 0.25)}
+        assert set(rows) == {"a", "b"}
+        assert rows["a"]["regressed"] is True
+        assert rows["b"]["regressed"] is False
+
+    def test_result_stats(self):
+        """Test summary statistics of a result."""
+        result = BenchResult("x", "ms", [1.0, 3.0, 2.0])
+        data = result.to_dict()
+        assert data["median"] == 2.0
+        assert data["min"] == 1.0
+        assert data["max"] == 3.0
+        assert BenchResult("y", "ms", [1.0]).to_dict()["stdev"] == 0.0
+
+    def test_cli_saves_and_compares(self, tmp_path, capsys):
+        """Test the command line entry point."""
+        output = tmp_path / "baseline.json"
+        assert main(["--quick", "-k", "serialize", "-o", str(output)]) == 0
+        saved = json.loads(output.read_text())
+        assert "serialize.memory_info.str" in saved["results"]
+
+        # 기준선을 아주 빠르게 조작하면 회귀로 보고된다
+        for result in saved["results"].values():
+            result["median"] = 1e-9
+        output.write_text(json.dumps(saved))
+        args = ["--quick", "-k", "serialize", "--compare", str(output)]
+        assert main(args) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+
+
+class TestThreadBenchmarks:
+    """Test the multi-threaded throughput helpers."""
+
+    def test_thread_counts(self):
+        """Test powers of two up to the CPU count."""
+        assert thread_counts(1) == [1]
+        assert thread_counts(6) == [1, 2, 4, 6]
+        assert thread_counts(8) == [1, 2, 4, 8]
+        assert thread_counts(64) == [1, 2, 4, 8, 16]
+        assert thread_counts(0) == [1]
+
+    def test_measure_throughput(self):
+        """Test that every thread's operations are counted."""
+        calls = []
+        rate = measure_throughput(lambda: calls.append(1), 3, 0.02)
+        assert rate > 0
+        assert len(calls) % 100 == 0
+
+    def test_run_threads_group(self):
+        """Test the throughput benchmark with quick settings."""
+        report = run(BenchConfig.quick(), "threads")
+        result = report["results"]["threads.state@1"]
+        assert result["unit"] == "ops/s"
+        assert result["speedup"] == 1.0
+        assert result["threads"] == 1
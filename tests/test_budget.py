@@ -0,0 +1,259 @@
+"""GPU memory budget tests."""
+
+import contextlib
+import sys
+import pytest
+from unittest.mock import Mock, patch
+from system_monitor import SystemMonitor
+from system_monitor.budget import GPUBudgetExceeded, GPUBudgetManager
+
+MB = 1024 * 1024
+
+
+class FakeOutOfMemoryError(Exception):
+    """Stand-in for ``cupy.cuda.memory.OutOfMemoryError``."""
+
+
+class FakePool:
+    """
+    Memory pool with a limit, like ``cupy.cuda.MemoryPool``.
+
+    Like CuPy's pool, every call acts on the current device of the fake
+    CuPy module; ``used``, ``held`` and ``limit`` are those of the
+    current device.
+    """
+
+    def __init__(self, cupy):
+        self._cupy = cupy
+        self.devices = {}
+
+    def state(self, device):
+        """Get the pool state of one device."""
+        return self.devices.setdefault(
+            device, {"used": 0, "held": 0, "limit": None}
+        )
+
+    def _current(self):
+        return self.state(self._cupy.current_device)
+
+    used = property(
+        lambda self: self._current()["used"],
+        lambda self, value: self._current().__setitem__("used", value),
+    )
+    held = property(
+        lambda self: self._current()["held"],
+        lambda self, value: self._current().__setitem__("held", value),
+    )
+    limit = property(lambda self: self._current()["limit"])
+
+    def set_limit(self, size):
+        self._current()["limit"] = size
+
+    def used_bytes(self):
+        return self.used
+
+    def total_bytes(self):
+        return self.held
+
+    def free_all_blocks(self):
+        self.held = self.used
+
+    def malloc(self, size):
+        if self.limit is not None and self.used + size > self.limit:
+            raise FakeOutOfMemoryError(size)
+        self.used += size
+        self.held = max(self.held, self.used)
+
+
+class FakeDevice:
+    """``cupy.cuda.Device`` making its id current inside ``with``."""
+
+    def __init__(self, cupy, device, total):
+        self._cupy = cupy
+        self.id = device
+        self.mem_info = (total, total)
+
+    def __enter__(self):
+        self._cupy.device_stack.append(self.id)
+        return self
+
+    def __exit__(self, *exc):
+        self._cupy.device_stack.pop()
+
+
+def make_cupy(device_total=8192 * MB):
+    """Create a fake CuPy module (device 0 current by default)."""
+    cupy = Mock()
+    cupy.device_stack = [0]
+    type(cupy).current_device = property(lambda self: self.device_stack[-1])
+    cupy.cuda.Device.side_effect = lambda device=0: FakeDevice(
+        cupy, device, device_total
+    )
+    cupy.cuda.MemoryPool.side_effect = lambda: FakePool(cupy)
+    cupy.cuda.memory.OutOfMemoryError = FakeOutOfMemoryError
+    cupy.allocator = None
+
+    @contextlib.contextmanager
+    def using_allocator(allocator):
+        previous, cupy.allocator = cupy.allocator, allocator
+        try:
+            yield
+        finally:
+            cupy.allocator = previous
+
+    cupy.cuda.using_allocator = using_allocator
+    return cupy
+
+
+class TestGPUBudgetManager:
+    """Test GPUBudgetManager limits."""
+
+    def test_assign_sets_pool_limit(self):
+        """Test that each tenant gets a capped pool."""
+        manager = GPUBudgetManager(make_cupy())
+        budget = manager.assign("a", hard_limit=1000)
+        manager.assign("b", hard_limit=2000, soft_limit=1500)
+
+        assert budget.soft_limit == pytest.approx(900)
+        assert manager.pool("a").limit == 1000 * MB
+        assert manager.pool("a") is not manager.pool("b")
+        assert manager.budget("b").soft_limit == 1500
+        assert manager.tenants() == ["a", "b"]
+
+    def test_reassign_keeps_pool(self):
+        """Test that changing a budget keeps the tenant's pool."""
+        manager = GPUBudgetManager(make_cupy())
+        manager.assign("a", hard_limit=1000)
+        pool = manager.pool("a")
+        manager.assign("a", hard_limit=500)
+        assert manager.pool("a") is pool
+        assert pool.limit == 500 * MB
+
+    def test_invalid_budgets(self):
+        """Test limit validation and device over-subscription."""
+        manager = GPUBudgetManager(make_cupy(device_total=4096 * MB))
+        with pytest.raises(ValueError):
+            manager.assign("a", hard_limit=0)
+        with pytest.raises(ValueError):
+            manager.assign("a", hard_limit=100, soft_limit=200)
+        manager.assign("a", hard_limit=3000)
+        with pytest.raises(ValueError, match="more than the device"):
+            manager.assign("b", hard_limit=2000)
+        manager.assign("b", hard_limit=2000, device=1)
+        with pytest.raises(ValueError):
+            GPUBudgetManager(make_cupy(), soft_ratio=0)
+
+    def test_unknown_tenant(self):
+        """Test that unknown tenants raise KeyError."""
+        manager = GPUBudgetManager(make_cupy())
+        with pytest.raises(KeyError, match="ghost"):
+            manager.usage("ghost")
+
+    def test_check_raises_early(self):
+        """Test the pre-allocation hard limit check."""
+        manager = GPUBudgetManager(make_cupy())
+        manager.assign("a", hard_limit=100)
+        manager.pool("a").malloc(80 * MB)
+        manager.check("a", 20 * MB)
+
+        with pytest.raises(GPUBudgetExceeded) as excinfo:
+            manager.check("a", 30 * MB)
+        assert isinstance(excinfo.value, MemoryError)
+        assert excinfo.value.tenant == "a"
+        assert "30.00 MB" in str(excinfo.value)
+        assert "hard limit 100.00 MB" in str(excinfo.value)
+
+    def test_activate_routes_allocations(self):
+        """Test allocator routing and out-of-memory translation."""
+        cupy = make_cupy()
+        manager = GPUBudgetManager(cupy)
+        manager.assign("a", hard_limit=100, device=1)
+        with manager.activate("a") as pool:
+            cupy.allocator(60 * MB)
+            assert pool.used == 60 * MB
+        cupy.cuda.Device.assert_called_with(1)
+        assert cupy.allocator is None
+
+        with pytest.raises(GPUBudgetExceeded) as excinfo:
+            with manager.activate("a"):
+                cupy.allocator(60 * MB)
+        assert isinstance(excinfo.value.__cause__, FakeOutOfMemoryError)
+
+        with pytest.raises(ValueError):
+            with manager.activate("a"):
+                raise ValueError("unrelated")
+
+    def test_enforce_soft_limit(self):
+        """Test that cached blocks are freed above the soft limit."""
+        manager = GPUBudgetManager(make_cupy())
+        manager.assign("a", hard_limit=100, soft_limit=50)
+        manager.assign("b", hard_limit=100, soft_limit=50)
+        pool = manager.pool("a")
+        pool.used, pool.held = 10 * MB, 70 * MB
+        manager.pool("b").held = 40 * MB
+
+        assert manager.enforce() == ["a"]
+        assert pool.held == 10 * MB
+        status = manager.status()
+        assert status["a"]["frees"] == 1
+        assert status["a"]["held_mb"] == pytest.approx(10)
+        assert status["b"]["frees"] == 0
+        assert manager.usage("a").usage_percent == pytest.approx(10)
+
+    def test_pool_calls_on_budget_device(self):
+        """Test that limits, usage and frees act on the budget's device."""
+        cupy = make_cupy()
+        manager = GPUBudgetManager(cupy)
+        manager.assign("a", hard_limit=100, soft_limit=50, device=1)
+        pool = manager.pool("a")
+        assert pool.state(1)["limit"] == 100 * MB
+        assert pool.state(0)["limit"] is None
+
+        pool.state(1).update(used=20 * MB, held=80 * MB)
+        pool.state(0).update(used=5 * MB, held=90 * MB)
+        # 샘플러 스레드처럼 현재 디바이스가 0인 상태에서 실행
+        assert manager.enforce() == ["a"]
+        assert pool.state(1)["held"] == 20 * MB
+        assert pool.state(0)["held"] == 90 * MB
+        assert manager.usage("a").used == pytest.approx(20)
+        assert manager.status()["a"]["held_mb"] == pytest.approx(20)
+        with pytest.raises(GPUBudgetExceeded):
+            manager.check("a", 90 * MB)
+
+        pool.state(1)["held"] = 60 * MB
+        manager.release("a")
+        assert pool.state(1)["held"] == 20 * MB
+        assert cupy.device_stack == [0]
+
+    def test_attach_enforces_on_sample(self):
+        """Test enforcement driven by monitor samples."""
+        manager = GPUBudgetManager(make_cupy())
+        manager.assign("a", hard_limit=100, soft_limit=50)
+        manager.pool("a").held = 80 * MB
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        manager.attach(monitor)
+        monitor.sample()
+        assert manager.status()["a"]["frees"] == 1
+
+        manager.detach(monitor)
+        manager.pool("a").held = 80 * MB
+        monitor.sample()
+        assert manager.status()["a"]["frees"] == 1
+
+    def test_release(self):
+        """Test that releasing a tenant frees its cached blocks."""
+        manager = GPUBudgetManager(make_cupy())
+        manager.assign("a", hard_limit=100)
+        pool = manager.pool("a")
+        pool.held = 30 * MB
+        manager.release("a")
+        manager.release("a")
+        assert pool.held == 0
+        assert manager.tenants() == []
+
+    def test_missing_cupy(self):
+        """Test the error when CuPy is not installed."""
+        manager = GPUBudgetManager()
+        with patch.dict(sys.modules, {"cupy": None}):
+            with pytest.raises(RuntimeError, match="CuPy"):
+                manager.assign("a", hard_limit=100)
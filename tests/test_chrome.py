@@ -0,0 +1,169 @@
+"""Chrome Trace Event export tests."""
+
+import gzip
+import json
+import threading
+import pytest
+from system_monitor import SystemMonitor
+from system_monitor.core import (
+    Annotation,
+    MemoryHistory,
+    MemoryInfo,
+    MetricHistory,
+    TraceWriter,
+)
+from system_monitor.export.chrome import ChromeTraceWriter, write_chrome_trace
+from system_monitor.monitors import BaseCollector
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class StaticCollector(BaseCollector):
+    """Collector returning a fixed value."""
+
+    name = "static"
+
+    def collect(self, timestamp):
+        return {"value": 1.0}
+
+
+def load(path):
+    """Parse a written trace, checking that it is valid JSON."""
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return json.load(f)["traceEvents"]
+
+
+def by_phase(events, phase):
+    """Select the events of one phase."""
+    return [event for event in events if event["ph"] == phase]
+
+
+class TestChromeTraceWriter:
+    """Test streaming trace events."""
+
+    def test_counters_and_annotations(self, tmp_path):
+        """Test event shapes and timestamps."""
+        path = tmp_path / "trace.json"
+        with ChromeTraceWriter(path, pid=7, time_origin=100.0) as writer:
+            writer.write_sample("gpu", 100.5, MemoryInfo(300.0, 1000.0))
+            writer.write_metrics(
+                "gpu0_stats", 100.5, {"sm_util": 80.0, "power": float("nan")}
+            )
+            writer.write_annotation(Annotation(100.25, "eval", 0.5, 42))
+            writer.write_annotation(Annotation(100.75, "save", 0.0, 42))
+        assert writer.closed
+        assert writer.events == 6
+
+        events = load(path)
+        assert events[0]["args"] == {"name": "system_monitor"}
+        counters = by_phase(events, "C")
+        assert counters[0] == {
+            "ph": "C",
+            "name": "gpu memory (MB)",
+            "pid": 7,
+            "tid": 0,
+            "ts": 500000.0,
+            "args": {"used": 300.0, "free": 700.0},
+        }
+        assert [c["name"] for c in counters] == [
+            "gpu memory (MB)", "gpu0_stats.sm_util"
+        ]
+        span = by_phase(events, "X")[0]
+        assert (span["ts"], span["dur"]) == (250000.0, 500000.0)
+        assert span["tid"] == 1
+        assert by_phase(events, "i")[0]["tid"] == 1
+        assert by_phase(events, "M")[1]["args"] == {"name": "thread 42"}
+
+        with pytest.raises(ValueError):
+            writer.write_sample("gpu", 1.0, MemoryInfo(1.0, 2.0))
+
+    def test_attached_to_monitor(self, tmp_path):
+        """Test streaming samples, metrics and marks while sampling."""
+        clock = Clock()
+        monitor = SystemMonitor(
+            use_gpu=False,
+            track_process=False,
+            clock=clock,
+            collectors=[StaticCollector()],
+        )
+        path = tmp_path / "live.json.gz"
+        writer = ChromeTraceWriter(path)
+        writer.attach(monitor)
+        for i in range(3):
+            clock.now = 100.0 + i
+            with monitor.span(f"step{i}"):
+                clock.now += 0.5
+            monitor.sample()
+        monitor.mark("done")
+        writer.detach(monitor)
+        monitor.sample()
+        writer.close()
+
+        events = load(path)
+        names = [c["name"] for c in by_phase(events, "C")]
+        assert names.count("cpu memory (MB)") == 3
+        assert names.count("static.value") == 3
+        assert [s["name"] for s in by_phase(events, "X")] == [
+            "step0", "step1", "step2"
+        ]
+        assert by_phase(events, "i")[0]["name"] == "done"
+        thread_name = by_phase(events, "M")[1]["args"]["name"]
+        assert thread_name == threading.current_thread().name
+
+
+class TestWriteChromeTrace:
+    """Test exporting recorded traces."""
+
+    def test_monitor_export(self, tmp_path):
+        """Test exporting a monitor's history, metrics and annotations."""
+        clock = Clock()
+        monitor = SystemMonitor(
+            use_gpu=False,
+            track_process=False,
+            clock=clock,
+            collectors=[StaticCollector()],
+        )
+        monitor.sample()
+        monitor.mark("checkpoint_save")
+        path = tmp_path / "monitor.json"
+        count = write_chrome_trace(monitor, path, pid=1)
+        events = load(path)
+        assert count == len(events)
+        assert [e["ph"] for e in events] == ["M", "C", "C", "M", "i"]
+
+    def test_trace_file_and_history(self, tmp_path):
+        """Test exporting a trace file with its annotations."""
+        trace = tmp_path / "run.smt"
+        with TraceWriter(trace) as writer:
+            for i in range(4):
+                writer.write("gpu", float(i), MemoryInfo(float(i), 10.0))
+            writer.write_annotation(Annotation(1.0, "save"))
+        path = tmp_path / "file.json"
+        write_chrome_trace(str(trace), path)
+        events = load(path)
+        assert len(by_phase(events, "C")) == 4
+        assert by_phase(events, "i")[0]["name"] == "save"
+
+        history = MemoryHistory()
+        history.append("cpu", 1.0, MemoryInfo(1.0, 2.0))
+        metrics = MetricHistory()
+        metrics.append("swap", 1.0, {"percent": 5.0})
+        write_chrome_trace(
+            history,
+            path,
+            annotations=[Annotation(1.0, "extra", 1.0)],
+            metrics=metrics,
+        )
+        events = load(path)
+        assert [e["name"] for e in events if e["ph"] != "M"] == [
+            "cpu memory (MB)", "swap.percent", "extra"
+        ]
@@ -0,0 +1,126 @@
+"""Sample stream encoding tests."""
+
+import json
+import math
+import random
+
+import pytest
+from system_monitor.core import MemoryHistory, MemoryInfo
+from system_monitor.core.codec import (
+    decode_floats,
+    decode_history,
+    decode_series,
+    decode_timestamps,
+    encode_floats,
+    encode_history,
+    encode_series,
+    encode_timestamps,
+    read_varint,
+    write_varint,
+)
+
+
+class TestVarint:
+    """Test varint helpers."""
+
+    @pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 63])
+    def test_roundtrip(self, value):
+        """Test varint round trip."""
+        buffer = bytearray()
+        write_varint(buffer, value)
+        assert read_varint(bytes(buffer), 0) == (value, len(buffer))
+
+    def test_truncated(self):
+        """Test truncated varint detection."""
+        with pytest.raises(ValueError):
+            read_varint(b"\x80", 0)
+
+
+class TestFloatCompression:
+    """Test Gorilla XOR float compression."""
+
+    def test_roundtrip(self):
+        """Test exact round trip of varied floats."""
+        rng = random.Random(0)
+        values = [0.0, -1.5, math.inf, 1e-300, 512.0, 512.0, 512.25]
+        values += [rng.uniform(0, 16384) for _ in range(200)]
+        values += [1024.0] * 20
+        assert decode_floats(encode_floats(values), len(values)) == values
+
+    def test_empty(self):
+        """Test empty input."""
+        assert encode_floats([]) == b""
+        assert decode_floats(b"", 0) == []
+
+    def test_constant_series_is_tiny(self):
+        """Test that repeated values cost one bit each."""
+        data = encode_floats([2048.0] * 1000)
+        assert len(data) == 8 + math.ceil(999 / 8)
+
+    def test_truncated(self):
+        """Test truncated stream detection."""
+        data = encode_floats([1.0, 2.0, 3.0])
+        with pytest.raises(ValueError):
+            decode_floats(data[:-2], 3)
+
+
+class TestTimestampCompression:
+    """Test delta-of-delta timestamp encoding."""
+
+    def test_roundtrip(self):
+        """Test millisecond round trip with irregular gaps."""
+        timestamps = [1700000000.0, 1700000001.0, 1700000002.0, 1700000002.5]
+        timestamps += [1700000010.123, 1699999999.0]
+        decoded = decode_timestamps(encode_timestamps(timestamps), 6)
+        assert decoded == pytest.approx(timestamps, abs=0.0005)
+
+    def test_regular_series_is_tiny(self):
+        """Test that regular sampling costs about one byte per sample."""
+        timestamps = [1700000000.0 + i for i in range(1000)]
+        assert len(encode_timestamps(timestamps)) < 1010
+
+
+class TestSeries:
+    """Test series and history encoding."""
+
+    def test_series_roundtrip(self):
+        """Test multi-column round trip."""
+        data = encode_series([1.0, 2.0], [[1.0, 2.0], [3.0, 3.0]])
+        timestamps, columns, offset = decode_series(data)
+        assert timestamps == [1.0, 2.0]
+        assert columns == [[1.0, 2.0], [3.0, 3.0]]
+        assert offset == len(data)
+
+    def test_series_length_mismatch(self):
+        """Test column length validation."""
+        with pytest.raises(ValueError):
+            encode_series([1.0], [[1.0, 2.0]])
+
+    def test_truncated_block(self):
+        """Test truncated block detection."""
+        data = encode_series([1.0, 2.0], [[1.0, 2.0]])
+        with pytest.raises(ValueError):
+            decode_series(data[:-1])
+
+    def test_history_roundtrip_and_ratio(self):
+        """Test history round trip and compression ratio."""
+        history = MemoryHistory()
+        for i in range(3600):
+            used = 1024.0 + (i // 600)  # 10분마다 1MB씩 증가
+            history.append("gpu", 1700000000.0 + i, MemoryInfo(used, 16384.0))
+            history.append(
+                "cpu", 1700000000.0 + i, MemoryInfo(8000.0, 32000.0)
+            )
+
+        data = encode_history(history)
+        decoded = decode_history(data)
+        assert decoded.sources() == ["gpu", "cpu"]
+        assert decoded.samples("gpu") == history.samples("gpu")
+
+        raw = json.dumps(history.to_records()).encode()
+        assert len(raw) / len(data) > 10
+
+    def test_invalid_magic(self):
+        """Test that foreign data is rejected."""
+        with pytest.raises(ValueError):
+            decode_history(b"nope")
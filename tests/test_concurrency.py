@@ -0,0 +1,232 @@
+"""Concurrency stress tests."""
+
+import logging
+import sys
+import threading
+import time
+import pytest
+from system_monitor import SystemMonitor
+from system_monitor.core import MemoryHistory, MemoryInfo
+from system_monitor.logging_config import reset_logger_config, setup_logger
+from system_monitor.monitors import BaseMonitor
+
+THREADS = 8
+
+
+@pytest.fixture(autouse=True)
+def fast_switching():
+    """Switch threads very often to provoke interleavings."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class CountingMonitor(BaseMonitor):
+    """Monitor whose readings encode a counter (total is twice used)."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def get_memory_info(self):
+        with self._lock:
+            self.calls += 1
+            value = float(self.calls)
+        if self._delay:
+            time.sleep(self._delay)
+        return MemoryInfo(used=value, total=2 * value)
+
+
+def make_monitor(history_size=64):
+    """Create a monitor reading two counting sources."""
+    monitor = SystemMonitor(
+        use_gpu=False, track_process=False, history_size=history_size
+    )
+    monitor._cpu_monitor = CountingMonitor()
+    monitor._process_monitor = CountingMonitor()
+    return monitor
+
+
+def run_threads(target, count=THREADS):
+    """Run ``target(index)`` in threads and re-raise the first error."""
+    errors = []
+
+    def wrapper(index):
+        try:
+            target(index)
+        except BaseException as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=wrapper, args=(i,)) for i in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    if errors:
+        raise errors[0]
+
+
+class TestSnapshotReads:
+    """Test lock-free readers against a single writer."""
+
+    def test_state_is_consistent(self):
+        """Test that readers only see complete, increasing states."""
+        monitor = make_monitor()
+        stop = threading.Event()
+
+        def writer():
+            for _ in range(2000):
+                monitor.sample()
+            stop.set()
+
+        def reader(index):
+            last = 0
+            while not stop.is_set():
+                state = monitor.state
+                assert state.sequence >= last
+                last = state.sequence
+                if state.sequence:
+                    assert set(state.readings) == {"cpu", "process"}
+                    for info in state.readings.values():
+                        assert info.total == 2 * info.used
+                    with pytest.raises(TypeError):
+                        state.readings["cpu"] = None
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        run_threads(reader)
+        thread.join()
+        assert monitor.state.sequence == 2000
+
+    def test_history_reads_are_aligned(self):
+        """Test that history columns never mix two appends."""
+        history = MemoryHistory(maxlen=32)
+        stop = threading.Event()
+
+        def writer():
+            for i in range(20000):
+                value = float(i)
+                history.append("gpu", value, MemoryInfo(value, 2 * value))
+            stop.set()
+
+        def reader(index):
+            while not stop.is_set():
+                samples = history.samples("gpu")
+                for sample in samples:
+                    assert sample.used == sample.timestamp
+                    assert sample.total == 2 * sample.used
+                timestamps = [s.timestamp for s in samples]
+                assert timestamps == sorted(timestamps)
+                latest = history.latest("gpu")
+                if latest is not None:
+                    assert latest.total == 2 * latest.used
+                len(history)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        run_threads(reader)
+        thread.join()
+        assert len(history) == 32
+
+
+class TestSingleWriter:
+    """Test concurrent writers and listener changes."""
+
+    def test_concurrent_samples_are_serialized(self):
+        """Test that samples from many threads are applied one by one."""
+        monitor = make_monitor(history_size=10000)
+        sequences = []
+
+        def listener(timestamp, readings):
+            sequences.append(monitor.state.sequence)
+
+        monitor.add_listener(listener)
+        run_threads(lambda index: [monitor.sample() for _ in range(250)])
+
+        total = THREADS * 250
+        assert sequences == list(range(1, total + 1))
+        assert len(monitor.history) == 2 * total
+        timestamps = [s.timestamp for s in monitor.history.samples("cpu")]
+        assert timestamps == sorted(timestamps)
+
+    def test_listener_changes_while_sampling(self):
+        """Test adding and removing listeners during sampling."""
+        monitor = make_monitor()
+        stop = threading.Event()
+        received = []
+
+        def writer():
+            while not stop.is_set():
+                monitor.sample()
+
+        def churn(index):
+            def listener(timestamp, readings):
+                received.append(index)
+
+            for _ in range(200):
+                monitor.add_listener(listener)
+                monitor.remove_listener(listener)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            run_threads(churn)
+        finally:
+            stop.set()
+            thread.join()
+        assert monitor._listeners == ()
+
+    def test_start_stop_sampling_races(self):
+        """Test that concurrent start/stop leaves at most one sampler."""
+        monitor = make_monitor()
+
+        def toggle(index):
+            for _ in range(20):
+                monitor.start_sampling(interval=0.001)
+                monitor.stop_sampling(timeout=5)
+
+        run_threads(toggle)
+        assert not monitor.is_sampling
+        alive = [
+            t for t in threading.enumerate()
+            if t.name.startswith("system-monitor")
+        ]
+        assert alive == []
+
+
+class TestLazyState:
+    """Test lazily initialized shared state."""
+
+    def test_availability_probed_once(self):
+        """Test that racing is_available checks probe only once."""
+        source = CountingMonitor(delay=0.01)
+        barrier = threading.Barrier(THREADS)
+
+        def check(index):
+            barrier.wait()
+            assert source.is_available
+
+        run_threads(check)
+        assert source.calls == 1
+
+    def test_logger_setup_adds_one_handler(self):
+        """Test that racing setup_logger calls configure once."""
+        reset_logger_config()
+        barrier = threading.Barrier(THREADS)
+        loggers = []
+
+        def setup(index):
+            barrier.wait()
+            loggers.append(setup_logger("system_monitor", logging.INFO))
+
+        try:
+            run_threads(setup)
+            assert len(loggers[0].handlers) == 1
+            assert all(logger is loggers[0] for logger in loggers)
+        finally:
+            reset_logger_config()
@@ -1,5 +1,7 @@
 """Core components tests."""
 
+import dataclasses
+
 import pytest
 from system_monitor.core.info import MemoryInfo
 from system_monitor.core.converter import MemoryConverter
@@ -34,6 +36,58 @@ class TestMemoryInfo:
         assert info.usage_percent == 100.0
         assert info.free == 0.0
 
+    def test_bytes_storage(self):
+        """Test that readings are kept as integer bytes."""
+        info = MemoryInfo.from_bytes(3 * 1024 * 1024 + 1, 8 * 1024 * 1024)
+        assert info.used_bytes == 3 * 1024 * 1024 + 1
+        assert isinstance(info.used_bytes, int)
+        assert info.free_bytes == 5 * 1024 * 1024 - 1
+        assert info.used == (3 * 1024 * 1024 + 1) / (1024 * 1024)
+        assert info.total == 8.0
+
+        # 한 바이트 차이도 정확히 구분됨
+        other = MemoryInfo.from_bytes(3 * 1024 * 1024, 8 * 1024 * 1024)
+        assert info.used_bytes - other.used_bytes == 1
+        assert info != other
+
+    def test_mb_compatibility(self):
+        """Test that values given in MB read back unchanged."""
+        info = MemoryInfo(100.1, 2048.0)
+        assert info.used == 100.1
+        assert info.total_bytes == 2048 * 1024 * 1024
+        assert isinstance(info.total_bytes, int)
+        assert info == MemoryInfo.from_bytes(info.used_bytes, 2 ** 31)
+        assert repr(info) == "MemoryInfo(used=100.1, total=2048.0)"
+
+        info.used = 1.5
+        assert info.used_bytes == 1536 * 1024
+
+    def test_dataclass(self):
+        """Test dataclass helpers on the byte fields."""
+        info = MemoryInfo(1.5, 2.0)
+        assert [f.name for f in dataclasses.fields(info)] == [
+            "used_bytes",
+            "total_bytes",
+        ]
+        assert dataclasses.asdict(info) == {
+            "used_bytes": 1536 * 1024,
+            "total_bytes": 2048 * 1024,
+        }
+        changed = dataclasses.replace(info, used_bytes=1024 * 1024)
+        assert changed == MemoryInfo(used=1.0, total=2.0)
+        assert info.used == 1.5
+        assert MemoryInfo(used_bytes=1, total_bytes=2).free_bytes == 1
+        with pytest.raises(TypeError):
+            MemoryInfo(1.0, 2.0, used_bytes=1)
+        with pytest.raises(TypeError):
+            MemoryInfo(1.0)
+
+    def test_format(self):
+        """Test formatting in other units and precisions."""
+        info = MemoryInfo.from_bytes(1536 * 1024 * 1024, 4 * 1024 ** 3)
+        assert info.format("GB", 1) == "1.5 GB / 4.0 GB"
+        assert info.format("kb", 0) == "1572864 KB / 4194304 KB"
+
 
 class TestMemoryConverter:
     """Test MemoryConverter utility."""
@@ -73,3 +127,13 @@ class TestMemoryConverter:
         assert MemoryConverter.to_mb(0) == 0.0
         assert MemoryConverter.to_gb(0) == 0.0
         assert MemoryConverter.format_memory(0) == "0.00 MB"
+
+    def test_units(self):
+        """Test conversion to and from other units."""
+        assert MemoryConverter.convert(2048, "KB") == 2.0
+        assert MemoryConverter.to_bytes(1.5, "KB") == 1536
+        assert isinstance(MemoryConverter.to_bytes(1.0), int)
+        assert MemoryConverter.to_bytes(0.5, "B") == 0.5
+        assert MemoryConverter.format_memory(1536, "B", 0) == "1536 B"
+        with pytest.raises(ValueError):
+            MemoryConverter.convert(1, "PB")
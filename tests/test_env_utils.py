@@ -0,0 +1,265 @@
+"""Environment probe tests."""
+
+import sys
+import types
+
+import pytest
+from unittest.mock import mock_open, patch
+from system_monitor import env_utils
+from system_monitor.logging_config import is_colab, is_jupyter
+from system_monitor.profiles import MonitorProfile
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Run every test with an empty probe cache."""
+    env_utils.clear_probe_cache()
+    yield
+    env_utils.clear_probe_cache()
+
+
+def _fake_ipython(shell):
+    module = types.ModuleType("IPython")
+    module.get_ipython = lambda: shell
+    return module
+
+
+class TestProbes:
+    """Test memoized environment probes."""
+
+    def test_probe_module_is_cached(self):
+        """Test that find_spec runs once per module."""
+        with patch(
+            "importlib.util.find_spec", return_value=object()
+        ) as find_spec:
+            assert env_utils.probe_module("some_fake_module") is True
+            assert env_utils.probe_module("some_fake_module") is True
+        find_spec.assert_called_once_with("some_fake_module")
+
+    def test_probe_module_missing(self):
+        """Test missing and invalid module names."""
+        assert env_utils.probe_module("no_such_module_xyz") is False
+        assert env_utils.probe_module("no_such_parent_xyz.child") is False
+
+    def test_probe_module_does_not_import(self):
+        """Test that probing leaves the module unimported."""
+        sys.modules.pop("tabnanny", None)
+        assert env_utils.probe_module("tabnanny") is True
+        assert "tabnanny" not in sys.modules
+        assert env_utils.probe_module("sys") is True
+
+    def test_probe_ipython_without_ipython(self):
+        """Test probing when IPython was never imported."""
+        with patch.dict(sys.modules, {"IPython": None}):
+            assert env_utils.probe_ipython() == (None, False)
+
+    def test_probe_ipython_shell(self):
+        """Test probing inside an IPython kernel."""
+
+        class ZMQInteractiveShell:
+            kernel = object()
+
+        fake = _fake_ipython(ZMQInteractiveShell())
+        with patch.dict(sys.modules, {"IPython": fake}):
+            assert env_utils.probe_ipython() == ("ZMQInteractiveShell", True)
+            assert is_jupyter() is True
+
+    def test_probe_ipython_no_shell(self):
+        """Test probing when IPython is imported but no shell runs."""
+        with patch.dict(sys.modules, {"IPython": _fake_ipython(None)}):
+            assert env_utils.probe_ipython() == (None, False)
+
+    def test_backend_versions(self):
+        """Test backend version lookup without importing."""
+        fake_cupy = types.ModuleType("cupy")
+        fake_cupy.__version__ = "13.0.0"
+        with patch.dict(sys.modules, {"cupy": fake_cupy}):
+            versions = env_utils.get_backend_versions()
+        assert versions["cupy"] == "13.0.0"
+
+        env_utils.clear_probe_cache()
+        with patch.object(env_utils, "probe_module", return_value=False):
+            with patch.dict(sys.modules, {"cupy": None, "psutil": None}):
+                versions = env_utils.get_backend_versions()
+        assert versions == {"cupy": None, "psutil": None}
+
+    def test_backend_version_from_metadata(self):
+        """Test that installed but unimported packages use metadata."""
+        with patch.dict(sys.modules, {"cupy": None}):
+            with patch.object(env_utils, "probe_module", return_value=True):
+                with patch.object(
+                    env_utils, "_distribution_version", return_value=None
+                ):
+                    versions = env_utils.get_backend_versions()
+        assert versions["cupy"] == "unknown"
+
+    def test_distribution_version(self):
+        """Test metadata lookup of distributions."""
+        assert env_utils._distribution_version("no-such-dist-xyz") is None
+        assert env_utils._distribution_version("no-such-dist-xyz", "pytest")
+
+    def test_warm_up_probes(self):
+        """Test synchronous and background warm up."""
+        assert env_utils.warm_up_probes(background=False) is None
+        assert "environment" in env_utils._probe_cache
+
+        env_utils.clear_probe_cache()
+        thread = env_utils.warm_up_probes()
+        thread.join(10)
+        assert "backends" in env_utils._probe_cache
+
+
+class TestProbeFreeThreading:
+    """Test free-threaded build detection."""
+
+    def test_gil_build(self, monkeypatch):
+        """Test a regular build without sys._is_gil_enabled."""
+        monkeypatch.delattr(sys, "_is_gil_enabled", raising=False)
+        with patch("sysconfig.get_config_var", return_value=0):
+            info = env_utils.probe_free_threading()
+        assert info == {"free_threaded_build": False, "gil_enabled": True}
+
+    def test_free_threaded_build(self, capsys):
+        """Test a free-threaded build running without the GIL."""
+        with patch("sysconfig.get_config_var", return_value=1):
+            with patch.object(
+                sys, "_is_gil_enabled", lambda: False, create=True
+            ):
+                info = env_utils.detect_environment()
+                env_utils.print_environment_info()
+        assert info["free_threaded_build"] is True
+        assert info["gil_enabled"] is False
+        assert "GIL 꺼짐" in capsys.readouterr().out
+
+
+class TestProbeContainer:
+    """Test container detection."""
+
+    def test_marker_files(self):
+        """Test detection from marker files."""
+        with patch("os.path.exists", side_effect=lambda p: p == "/.dockerenv"):
+            assert env_utils.probe_container() is True
+
+    def test_kubernetes(self):
+        """Test detection from Kubernetes variables."""
+        with patch("os.path.exists", return_value=False):
+            with patch.dict("os.environ", {"KUBERNETES_SERVICE_HOST": "x"}):
+                assert env_utils.probe_container() is True
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [("0::/kubepods/pod1/abc\n", True), ("0::/user.slice\n", False)],
+    )
+    def test_proc_cgroup(self, content, expected):
+        """Test detection from /proc/1/cgroup."""
+        with patch("os.path.exists", return_value=False):
+            with patch.dict("os.environ", clear=True):
+                with patch("builtins.open", mock_open(read_data=content)):
+                    assert env_utils.probe_container() is expected
+
+    def test_unreadable_proc(self):
+        """Test hosts without /proc."""
+        with patch("os.path.exists", return_value=False):
+            with patch.dict("os.environ", clear=True):
+                with patch("builtins.open", side_effect=OSError):
+                    assert env_utils.probe_container() is False
+
+
+class TestDetectEnvironment:
+    """Test detect_environment."""
+
+    def test_terminal(self):
+        """Test plain terminal detection."""
+        with patch.dict("os.environ", {"TERM_PROGRAM": "xterm"}):
+            with patch.object(env_utils, "probe_module", return_value=False):
+                with patch.object(
+                    env_utils, "probe_ipython", return_value=(None, False)
+                ):
+                    info = env_utils.detect_environment()
+        assert info["is_terminal"] is True
+        assert info["is_vscode"] is False
+
+    def test_cached_copy(self):
+        """Test that callers get independent copies of a cached result."""
+        first = env_utils.detect_environment()
+        first["is_colab"] = "modified"
+        assert env_utils.detect_environment()["is_colab"] != "modified"
+
+    def test_jupyter_and_vscode(self):
+        """Test Jupyter and VSCode detection."""
+        with patch.dict("os.environ", {"TERM_PROGRAM": "vscode"}):
+            with patch.object(env_utils, "probe_module", return_value=False):
+                with patch.object(
+                    env_utils,
+                    "probe_ipython",
+                    return_value=("ZMQInteractiveShell", True),
+                ):
+                    info = env_utils.detect_environment()
+        assert info["is_jupyter"] is True
+        assert info["jupyter_type"] == "ZMQInteractiveShell"
+        assert info["is_vscode"] is True
+        assert info["is_terminal"] is False
+
+    def test_colab(self):
+        """Test Colab detection."""
+        with patch.object(env_utils, "probe_module", return_value=True):
+            info = env_utils.detect_environment()
+            assert is_colab() is True
+        assert info["is_colab"] is True
+        assert "jupyter_type" not in info
+
+
+class TestSetupHelpers:
+    """Test printing and setup helpers."""
+
+    def test_print_environment_info_does_not_import_cupy(self, capsys):
+        """Test that printing uses metadata only."""
+        with patch.object(
+            env_utils,
+            "get_backend_versions",
+            return_value={"cupy": "13.0.0", "psutil": None},
+        ):
+            env_utils.print_environment_info()
+        output = capsys.readouterr().out
+        assert "CuPy: 13.0.0" in output
+        assert "psutil: 미설치" in output
+
+    def test_setup_skips_gpu_without_cupy(self, capsys):
+        """Test that the monitor is built without GPU if CuPy is absent."""
+        with patch.object(env_utils, "probe_module", return_value=False):
+            monitor = env_utils.setup_environment_optimized_monitor("manual")
+        assert monitor._gpu_monitor is None
+        assert monitor.is_sampling is False
+        output = capsys.readouterr().out
+        assert "System Monitor" in output
+        assert "manual (수동 샘플링)" in output
+
+    def test_setup_applies_profile(self, capsys):
+        """Test that a profile selects sources and starts sampling."""
+        profile = MonitorProfile(
+            name="custom",
+            sources=("cpu", "cgroup", "host"),
+            interval=60.0,
+            adaptive=True,
+            history_size=10,
+        )
+        monitor = env_utils.setup_environment_optimized_monitor(profile)
+        try:
+            assert monitor.is_sampling is True
+            assert monitor._sampler.scheduler is not None
+            assert monitor._process_monitor is None
+            assert monitor._cgroup_monitor is not None
+            assert len(monitor.collectors) == 3
+            assert monitor.history.maxlen == 10
+        finally:
+            monitor.stop_sampling()
+        assert "custom (샘플링 주기 60.0s)" in capsys.readouterr().out
+
+    def test_setup_rejects_invalid_profile(self):
+        """Test that misconfiguration fails at startup."""
+        with pytest.raises(ValueError):
+            env_utils.setup_environment_optimized_monitor(
+                MonitorProfile(name="bad", history_size=0)
+            )
+        with pytest.raises(ValueError):
+            env_utils.setup_environment_optimized_monitor("no-such-profile")
@@ -0,0 +1,155 @@
+"""Memory forecasting tests."""
+
+import math
+import random
+import pytest
+from unittest.mock import Mock
+from system_monitor import SystemMonitor
+from system_monitor.analysis import MemoryForecaster
+from system_monitor.core import MemoryHistory, MemoryInfo
+
+
+def linear(forecaster, count=300, slope=0.5, noise=0.0, total=1000.0):
+    """Feed a linearly growing trace sampled every second."""
+    rng = random.Random(0)
+    for t in range(count):
+        used = 100.0 + slope * t + rng.gauss(0, noise)
+        forecaster.update("gpu", float(t), used, total)
+
+
+class TestMemoryForecaster:
+    """Test MemoryForecaster projections."""
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        for kwargs in (
+            {"halflife": 0},
+            {"period": -1},
+            {"bins": 0},
+            {"seasonal_rate": 0},
+            {"confidence": 1},
+            {"min_samples": 2},
+        ):
+            with pytest.raises(ValueError):
+                MemoryForecaster(**kwargs)
+        forecaster = MemoryForecaster()
+        linear(forecaster, count=20)
+        with pytest.raises(ValueError):
+            forecaster.forecast(horizon=0)
+
+    def test_too_few_samples(self):
+        """Test that sources are only forecast after min_samples."""
+        forecaster = MemoryForecaster(min_samples=10)
+        linear(forecaster, count=9)
+        assert forecaster.forecast(60.0) == {}
+        assert forecaster.forecast_source("cpu", 60.0) is None
+
+    def test_linear_growth(self):
+        """Test trend projection and time to limit."""
+        forecaster = MemoryForecaster()
+        linear(forecaster)
+        result = forecaster.forecast(horizon=1000.0)["gpu"]
+
+        # 299초에 249.5MB, 0.5MB/s 증가 -> 1000MB까지 1501초
+        assert result.current == pytest.approx(249.5)
+        assert result.expected == pytest.approx(749.5, rel=1e-6)
+        assert result.peak_time == pytest.approx(1299.0)
+        assert result.time_to_limit is None
+        assert not result.will_exceed
+        assert result.probability == pytest.approx(0.0)
+
+        result = forecaster.forecast_source("gpu", horizon=2000.0)
+        assert result.will_exceed
+        assert result.time_to_limit == pytest.approx(1501.0, abs=35)
+        assert result.probability == pytest.approx(1.0)
+
+    def test_confidence_bounds(self):
+        """Test that bounds widen with noise and contain the truth."""
+        forecaster = MemoryForecaster()
+        linear(forecaster, noise=5.0)
+        result = forecaster.forecast_source("gpu", horizon=100.0)
+        truth = 100.0 + 0.5 * 399
+        assert result.lower < truth < result.upper
+        assert result.lower < result.peak < result.upper
+        assert result.probability < 0.01
+
+        quiet = MemoryForecaster()
+        linear(quiet, noise=0.5)
+        narrow = quiet.forecast_source("gpu", horizon=100.0)
+        assert narrow.upper - narrow.lower < result.upper - result.lower
+
+    def test_periodic_peak(self):
+        """Test that the periodic component raises the projected peak."""
+        def feed(forecaster):
+            for t in range(600):
+                used = 500.0 + 100.0 * math.sin(2 * math.pi * t / 100)
+                forecaster.update("gpu", float(t), used, 1000.0)
+
+        trend_only = MemoryForecaster()
+        periodic = MemoryForecaster(period=100.0)
+        feed(trend_only)
+        feed(periodic)
+
+        result = periodic.forecast_source("gpu", horizon=100.0)
+        assert result.peak == pytest.approx(600.0, abs=15)
+        assert (result.peak_time - 25) % 100 == pytest.approx(0, abs=5)
+        assert trend_only.forecast_source("gpu", 100.0).peak < 560
+
+    def test_out_of_order_samples_ignored(self):
+        """Test that samples older than the latest are dropped."""
+        forecaster = MemoryForecaster(min_samples=3)
+        linear(forecaster, count=10)
+        forecaster.update("gpu", 0.0, 999.0, 1000.0)
+        assert forecaster.forecast_source("gpu", 10.0).samples == 10
+
+    def test_listener_and_feed(self):
+        """Test updating from samples and from a history."""
+        forecaster = MemoryForecaster(sources=["gpu"], min_samples=3)
+        history = MemoryHistory()
+        for t in range(5):
+            info = MemoryInfo(used=100.0 + t, total=1000.0)
+            forecaster(float(t), {"gpu": info, "cpu": info})
+            history.append("gpu", float(t), info)
+
+        assert list(forecaster.forecast(10.0)) == ["gpu"]
+        fed = MemoryForecaster(sources=["gpu"], min_samples=3)
+        fed.feed(history)
+        assert fed.forecast(10.0)["gpu"].expected == pytest.approx(
+            forecaster.forecast(10.0)["gpu"].expected
+        )
+
+        forecaster.reset("gpu")
+        assert forecaster.forecast(10.0) == {}
+
+    def test_attach(self):
+        """Test registering as a monitor listener."""
+        monitor = Mock()
+        forecaster = MemoryForecaster()
+        forecaster.attach(monitor)
+        forecaster.detach(monitor)
+        monitor.add_listener.assert_called_once_with(forecaster)
+        monitor.remove_listener.assert_called_once_with(forecaster)
+
+
+class TestSystemMonitorForecast:
+    """Test forecasting through SystemMonitor."""
+
+    def test_forecast_from_samples(self):
+        """Test that samples update the built-in forecaster."""
+        monitor = SystemMonitor(use_gpu=False)
+        for _ in range(12):
+            monitor.sample()
+        forecasts = monitor.forecast(horizon=60.0)
+        assert set(forecasts) == {"cpu", "process"}
+        assert forecasts["cpu"].limit > 0
+
+    def test_configure_forecast_rebuilds_from_history(self):
+        """Test replacing the forecaster with new options."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        for _ in range(12):
+            monitor.sample()
+        forecaster = monitor.configure_forecast(
+            sources=["cpu"], period=30.0
+        )
+        assert monitor.forecaster is forecaster
+        assert monitor.forecast(60.0, sources=["cpu"])["cpu"].samples == 12
@@ -0,0 +1,221 @@
+"""Fork safety and worker relay tests."""
+
+import multiprocessing
+import os
+import time
+
+import pytest
+from system_monitor import SystemMonitor, WorkerRelay
+from system_monitor.core import MemoryInfo
+from system_monitor.monitors import BaseMonitor, GPUMonitor, ProcessMonitor
+
+MB = 1024 * 1024
+
+requires_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method not available",
+)
+
+
+class StaticMonitor(BaseMonitor):
+    """Monitor returning a fixed reading."""
+
+    def __init__(self, used=100 * MB + 1, total=1000 * MB):
+        super().__init__()
+        self.used = used
+        self.total = total
+
+    def get_memory_info(self):
+        return MemoryInfo.from_bytes(self.used, self.total)
+
+
+def wait_for(condition, timeout=10.0):
+    """Poll until a condition holds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def report_forked_state(monitor, process_monitor, results):
+    """Report the state of an inherited monitor in a forked child."""
+    readings = monitor.sample()  # 부모가 잡고 있던 잠금이 풀려 있어야 함
+    results.put(
+        {
+            "pid": os.getpid(),
+            "sampling": monitor.is_sampling,
+            "has_gpu": monitor.has_gpu,
+            "sources": sorted(readings),
+            "process_pid": process_monitor.pid,
+        }
+    )
+
+
+def idle_worker(seconds):
+    """Keep a forked worker alive while its monitor samples."""
+    time.sleep(seconds)
+
+
+def spawned_worker(relay, samples):
+    """Sample a worker's own monitor and publish it to the parent."""
+    monitor = SystemMonitor(backends={"cpu": StaticMonitor(used=42)})
+    relay.connect(monitor)
+    for _ in range(samples):
+        monitor.sample()
+    relay.close()
+
+
+class TestForkSafety:
+    """Test the state of monitors across fork."""
+
+    @requires_fork
+    def test_child_state(self, mock_cupy):
+        """Test that the child gets usable locks, no sampler and no GPU."""
+        process_monitor = ProcessMonitor()
+        monitor = SystemMonitor(
+            backends={
+                "cpu": StaticMonitor(),
+                "gpu": GPUMonitor(mock_cupy),
+                "process": process_monitor,
+            }
+        )
+        monitor.add_listener(lambda timestamp, readings: time.sleep(0.001))
+        monitor.start_sampling(interval=0.001)
+        try:
+            ctx = multiprocessing.get_context("fork")
+            results = ctx.Queue()
+            child = ctx.Process(
+                target=report_forked_state,
+                args=(monitor, process_monitor, results),
+                daemon=True,
+            )
+            child.start()
+            state = results.get(timeout=10.0)
+            child.join(10.0)
+        finally:
+            monitor.stop_sampling()
+        assert child.exitcode == 0
+        assert state["sampling"] is False
+        assert state["has_gpu"] is False
+        assert state["sources"] == ["cpu", "process"]
+        assert state["process_pid"] == state["pid"] == child.pid
+
+        # 부모는 그대로 계속 샘플링
+        assert monitor.has_gpu
+        assert process_monitor.pid == os.getpid()
+
+    @requires_fork
+    def test_sampler_resumes_in_parent(self):
+        """Test that the parent's sampler keeps running after forks."""
+        monitor = SystemMonitor(backends={"cpu": StaticMonitor()})
+        monitor.start_sampling(interval=0.001)
+        try:
+            ctx = multiprocessing.get_context("fork")
+            for _ in range(3):
+                child = ctx.Process(
+                    target=idle_worker, args=(0.0,), daemon=True
+                )
+                child.start()
+                child.join(10.0)
+                assert child.exitcode == 0
+            count = len(monitor.history)
+            assert monitor.is_sampling
+            assert wait_for(lambda: len(monitor.history) > count)
+        finally:
+            monitor.stop_sampling()
+
+
+class TestWorkerRelay:
+    """Test publishing worker samples to the parent."""
+
+    def test_in_process(self):
+        """Test recording published samples and dropping on overflow."""
+        parent = SystemMonitor(backends={"cpu": StaticMonitor()})
+        worker = SystemMonitor(backends={"cpu": StaticMonitor(used=7)})
+        relay = WorkerRelay(maxsize=1)
+        relay.attach(parent)
+        relay.connect(worker)
+        worker.sample()
+        worker.sample()
+        assert relay.dropped == 1
+
+        assert wait_for(lambda: relay.drain() == 1)
+        source = f"worker{os.getpid()}_cpu"
+        assert parent.history.latest(source).info.used_bytes == 7
+        assert list(relay.workers) == [os.getpid()]
+        relay.close()
+        with pytest.raises(ValueError):
+            WorkerRelay(maxsize=0)
+        with pytest.raises(ValueError):
+            WorkerRelay(expire_after=0.0)
+
+    def test_silent_workers_expire(self):
+        """Test removing the series of workers that stopped publishing."""
+        parent = SystemMonitor(backends={"cpu": StaticMonitor()})
+        worker = SystemMonitor(
+            backends={"cpu": StaticMonitor(), "gpu": StaticMonitor()}
+        )
+        relay = WorkerRelay(expire_after=60.0)
+        relay.attach(parent)
+        relay.connect(worker)
+        worker.sample()
+        assert wait_for(lambda: relay.drain(now=1000.0) == 1)
+        sources = {f"worker{os.getpid()}_cpu", f"worker{os.getpid()}_gpu"}
+        assert sources <= set(parent.history.sources())
+
+        relay.drain(now=1060.0)
+        assert list(relay.workers) == [os.getpid()]
+        relay.drain(now=1060.5)
+        assert relay.workers == {}
+        assert parent.history.sources() == []
+        relay.close()
+
+    @requires_fork
+    def test_forked_workers_reconnect(self):
+        """Test that forked copies of the monitor publish their samples."""
+        monitor = SystemMonitor(backends={"cpu": StaticMonitor()})
+        relay = WorkerRelay("fork")
+        relay.attach(monitor)
+        monitor.start_sampling(interval=0.01)
+        try:
+            ctx = multiprocessing.get_context("fork")
+            workers = [
+                ctx.Process(target=idle_worker, args=(0.3,), daemon=True)
+                for _ in range(2)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(10.0)
+                assert worker.exitcode == 0
+            pids = {worker.pid for worker in workers}
+            assert wait_for(lambda: set(relay.workers) == pids)
+        finally:
+            monitor.stop_sampling()
+        for pid in pids:
+            samples = monitor.history.samples(f"worker{pid}_cpu")
+            assert samples
+            assert samples[0].info.used_bytes == 100 * MB + 1
+        relay.close()
+
+    def test_spawned_worker(self):
+        """Test connecting a worker started with the spawn method."""
+        monitor = SystemMonitor(backends={"cpu": StaticMonitor()})
+        relay = WorkerRelay("spawn")
+        relay.attach(monitor)
+        ctx = multiprocessing.get_context("spawn")
+        worker = ctx.Process(
+            target=spawned_worker, args=(relay, 3), daemon=True
+        )
+        worker.start()
+        worker.join(60.0)
+        assert worker.exitcode == 0
+
+        assert wait_for(
+            lambda: monitor.sample() is not None and relay.received == 3
+        )
+        samples = monitor.history.samples(f"worker{worker.pid}_cpu")
+        assert [s.info.used_bytes for s in samples] == [42, 42, 42]
+        relay.close()
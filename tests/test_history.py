@@ -0,0 +1,142 @@
+"""Memory history tests."""
+
+import math
+
+import pytest
+from system_monitor.core import (
+    MemoryHistory,
+    MemoryInfo,
+    MemorySample,
+    MetricHistory,
+)
+
+
+class TestMemoryHistory:
+    """Test MemoryHistory ring buffer."""
+
+    def test_invalid_maxlen(self):
+        """Test that a non-positive maxlen is rejected."""
+        with pytest.raises(ValueError):
+            MemoryHistory(maxlen=0)
+
+    def test_append_and_samples(self):
+        """Test recording and reading samples."""
+        history = MemoryHistory()
+        history.append("cpu", 1.0, MemoryInfo(used=100.0, total=200.0))
+        history.append("cpu", 2.0, MemoryInfo(used=110.0, total=200.0))
+        history.append("gpu", 1.0, MemoryInfo(used=50.0, total=100.0))
+
+        assert history.sources() == ["cpu", "gpu"]
+        assert len(history) == 3
+        assert history.samples("cpu") == [
+            MemorySample(timestamp=1.0, source="cpu", used=100.0, total=200.0),
+            MemorySample(timestamp=2.0, source="cpu", used=110.0, total=200.0),
+        ]
+        assert history.samples("missing") == []
+
+    def test_byte_readings_round_trip(self):
+        """Test that readings in bytes are stored without rounding."""
+        history = MemoryHistory()
+        info = MemoryInfo.from_bytes(123456789, 987654321)
+        history.append("process", 1.0, info)
+        sample = history.latest("process")
+        assert sample.info == info
+        assert sample.info.used_bytes == 123456789
+
+    def test_ring_buffer_eviction(self):
+        """Test that the oldest samples are discarded."""
+        history = MemoryHistory(maxlen=2)
+        for i in range(5):
+            history.append("cpu", float(i), MemoryInfo(used=i, total=10.0))
+
+        assert history.maxlen == 2
+        assert [s.timestamp for s in history.samples("cpu")] == [3.0, 4.0]
+
+    def test_latest(self):
+        """Test latest sample lookup."""
+        history = MemoryHistory()
+        assert history.latest("cpu") is None
+
+        history.append("cpu", 1.0, MemoryInfo(used=1.0, total=2.0))
+        history.append("cpu", 2.0, MemoryInfo(used=1.5, total=2.0))
+        latest = history.latest("cpu")
+        assert latest.timestamp == 2.0
+        assert latest.info == MemoryInfo(used=1.5, total=2.0)
+
+    def test_to_records_and_clear(self):
+        """Test record export and clearing."""
+        history = MemoryHistory()
+        history.append("gpu", 1.0, MemoryInfo(used=5.0, total=10.0))
+
+        assert history.to_records() == [
+            {"timestamp": 1.0, "source": "gpu", "used": 5.0, "total": 10.0}
+        ]
+        history.clear()
+        assert len(history) == 0
+        assert history.sources() == []
+
+    def test_remove(self):
+        """Test discarding one source."""
+        history = MemoryHistory()
+        history.append("gpu", 1.0, MemoryInfo(used=5.0, total=10.0))
+        history.append("cpu", 1.0, MemoryInfo(used=5.0, total=10.0))
+        assert history.remove("gpu")
+        assert not history.remove("gpu")
+        assert history.sources() == ["cpu"]
+        assert history.latest("gpu") is None
+
+
+class TestMetricHistory:
+    """Test MetricHistory."""
+
+    def test_columns_and_latest(self):
+        """Test recording fields and reading them back."""
+        history = MetricHistory(maxlen=3)
+        history.append("host_cpu", 1.0, {"core0": 10.0, "percent": 10.0})
+        history.append("host_cpu", 2.0, {"core0": 30.0, "percent": 30.0})
+
+        assert history.sources() == ["host_cpu"]
+        assert history.fields("host_cpu") == ["core0", "percent"]
+        assert history.columns("host_cpu") == {
+            "timestamp": [1.0, 2.0],
+            "core0": [10.0, 30.0],
+            "percent": [10.0, 30.0],
+        }
+        assert history.latest("host_cpu") == {
+            "timestamp": 2.0, "core0": 30.0, "percent": 30.0
+        }
+        assert history.latest("swap") is None
+        assert history.columns("swap") == {}
+        assert history.fields("swap") == []
+
+    def test_new_and_missing_fields(self):
+        """Test that columns stay aligned when fields change."""
+        history = MetricHistory(maxlen=3)
+        history.append("swap", 1.0, {"used": 1.0})
+        history.append("swap", 2.0, {"used": 2.0, "in_rate": 0.5})
+        history.append("swap", 3.0, {"in_rate": 0.25})
+        history.append("swap", 4.0, {"used": 4.0})
+
+        columns = history.columns("swap")
+        assert columns["timestamp"] == [2.0, 3.0, 4.0]
+        assert columns["used"][0] == 2.0 and math.isnan(columns["used"][1])
+        assert columns["in_rate"][:2] == [0.5, 0.25]
+        assert math.isnan(columns["in_rate"][2])
+        assert len(history) == 3
+
+    def test_records_and_clear(self):
+        """Test exporting records without missing values and clearing."""
+        history = MetricHistory()
+        history.append("swap", 1.0, {"used": 1.0})
+        history.append("swap", 2.0, {"in_rate": 0.5})
+        assert history.to_records() == [
+            {"timestamp": 1.0, "source": "swap", "used": 1.0},
+            {"timestamp": 2.0, "source": "swap", "in_rate": 0.5},
+        ]
+        history.clear()
+        assert len(history) == 0
+
+    def test_invalid_maxlen(self):
+        """Test maxlen validation."""
+        with pytest.raises(ValueError):
+            MetricHistory(maxlen=0)
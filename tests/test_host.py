@@ -0,0 +1,186 @@
+"""Host metric collector tests."""
+
+import pytest
+from collections import namedtuple
+from unittest.mock import Mock
+from system_monitor import SystemMonitor
+from system_monitor.monitors import (
+    BaseCollector,
+    HostCPUCollector,
+    PressureCollector,
+    SwapCollector,
+)
+
+CPUTimes = namedtuple(
+    "CPUTimes", "user nice system idle iowait guest guest_nice"
+)
+Swap = namedtuple("Swap", "total used free percent sin sout")
+
+MB = 1024 * 1024
+
+PSI = """some avg10={avg:.2f} avg60=0.00 avg300=0.00 total={some}
+full avg10=0.00 avg60=0.00 avg300=0.00 total={full}
+"""
+
+
+def write_pressure(root, resource, some, full, avg=0.0):
+    """Write a pressure file in the kernel's format."""
+    (root / resource).write_text(PSI.format(avg=avg, some=some, full=full))
+
+
+class TestHostCPUCollector:
+    """Test per-core CPU utilization."""
+
+    def test_utilization_between_samples(self):
+        """Test busy shares computed from CPU time deltas."""
+        collector = HostCPUCollector()
+        collector._psutil = Mock()
+        collector._psutil.cpu_times.side_effect = [
+            [
+                CPUTimes(10, 0, 0, 90, 0, 0, 0),
+                CPUTimes(0, 0, 0, 100, 0, 0, 0),
+            ],
+            # core0: 30/40 바쁨, core1: iowait는 유휴로 계산, guest는 제외
+            [
+                CPUTimes(40, 0, 0, 100, 0, 5, 0),
+                CPUTimes(0, 0, 0, 110, 10, 0, 0),
+            ],
+        ]
+        assert collector.collect(1.0) == {}
+        values = collector.collect(2.0)
+        assert values["core0"] == pytest.approx(75.0)
+        assert values["core1"] == pytest.approx(0.0)
+        assert values["percent"] == pytest.approx(37.5)
+
+    def test_unavailable(self):
+        """Test missing psutil and read errors."""
+        collector = HostCPUCollector()
+        collector._psutil = None
+        assert collector.collect(1.0) is None
+        collector._psutil = Mock()
+        collector._psutil.cpu_times.side_effect = OSError("boom")
+        assert collector.collect(1.0) is None
+
+
+class TestSwapCollector:
+    """Test swap usage and rates."""
+
+    def test_rates_between_samples(self):
+        """Test swap-in/out rates from cumulative counters."""
+        collector = SwapCollector()
+        collector._psutil = Mock()
+        collector._psutil.swap_memory.side_effect = [
+            Swap(1024 * MB, 256 * MB, 768 * MB, 25.0, 0, 0),
+            Swap(1024 * MB, 512 * MB, 512 * MB, 50.0, 20 * MB, 4 * MB),
+        ]
+        first = collector.collect(10.0)
+        assert first == {"used": 256.0, "total": 1024.0, "percent": 25.0}
+        second = collector.collect(12.0)
+        assert second["in_rate"] == pytest.approx(10.0)
+        assert second["out_rate"] == pytest.approx(2.0)
+
+    def test_unavailable(self):
+        """Test missing psutil."""
+        collector = SwapCollector()
+        collector._psutil = None
+        assert collector.collect(1.0) is None
+
+
+class TestPressureCollector:
+    """Test PSI stall metrics."""
+
+    def test_parse(self):
+        """Test parsing a pressure file."""
+        lines = PressureCollector.parse(PSI.format(avg=1.5, some=10, full=4))
+        assert lines["some"] == {
+            "avg10": 1.5, "avg60": 0.0, "avg300": 0.0, "total": 10.0
+        }
+        assert lines["full"]["total"] == 4.0
+
+    def test_stall_share_between_samples(self, tmp_path):
+        """Test stall percentages from total counter deltas."""
+        write_pressure(tmp_path, "memory", some=1000, full=0, avg=0.5)
+        write_pressure(tmp_path, "cpu", some=0, full=0)
+        collector = PressureCollector(str(tmp_path))
+        assert collector.resources == ["cpu", "memory"]
+
+        first = collector.collect(100.0)
+        assert first["memory_some_avg10"] == 0.5
+        assert "memory_some" not in first
+
+        # 2초 동안 memory some 0.5초(25%), full 0.1초(5%) 정체
+        write_pressure(tmp_path, "memory", some=501000, full=100000)
+        values = collector.collect(102.0)
+        assert values["memory_some"] == pytest.approx(25.0)
+        assert values["memory_full"] == pytest.approx(5.0)
+        assert values["cpu_some"] == 0.0
+
+    def test_unavailable(self, tmp_path):
+        """Test hosts without PSI and unreadable files."""
+        missing = PressureCollector(str(tmp_path / "missing"))
+        assert missing.collect(1.0) is None
+
+        write_pressure(tmp_path, "memory", some=0, full=0)
+        collector = PressureCollector(str(tmp_path), resources=["memory"])
+        (tmp_path / "memory").write_text("some avg10=oops")
+        assert collector.collect(1.0) is None
+
+
+class StaticCollector(BaseCollector):
+    """Collector returning a fixed value."""
+
+    name = "static"
+
+    def collect(self, timestamp):
+        return {"value": 1.0}
+
+
+class FailingCollector(BaseCollector):
+    """Collector that always fails."""
+
+    name = "failing"
+
+    def collect(self, timestamp):
+        raise RuntimeError("boom")
+
+
+class TestSystemMonitorCollectors:
+    """Test collecting metrics through SystemMonitor."""
+
+    def test_metrics_recorded_with_samples(self):
+        """Test that collectors run in the sampling pass."""
+        monitor = SystemMonitor(
+            use_gpu=False,
+            track_process=False,
+            collectors=[StaticCollector(), FailingCollector()],
+        )
+        monitor.sample()
+        timestamp = monitor.state.timestamp
+
+        assert monitor.state.metrics["static"]["value"] == 1.0
+        assert "failing" not in monitor.state.metrics
+        assert monitor.metrics.latest("static") == {
+            "timestamp": timestamp, "value": 1.0
+        }
+        assert monitor.history.latest("cpu").timestamp == timestamp
+        assert "static" in monitor.get_overhead_stats()["reads"]
+        assert monitor.to_dict()["metrics"][0]["source"] == "static"
+
+    def test_add_and_remove_collectors(self):
+        """Test changing collectors and the host collector set."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        assert monitor.collectors == ()
+        collector = StaticCollector()
+        monitor.add_collector(collector)
+        monitor.add_collector(collector)
+        assert monitor.collectors == (collector,)
+        monitor.remove_collector(collector)
+        assert monitor.collectors == ()
+
+        host = SystemMonitor(use_gpu=False, track_host=True)
+        assert [c.name for c in host.collectors] == [
+            "host_cpu", "swap", "pressure"
+        ]
+        host.sample()
+        host.sample()
+        assert "swap" in host.metrics.sources()
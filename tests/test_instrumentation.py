@@ -0,0 +1,83 @@
+"""Self-instrumentation tests."""
+
+import pytest
+from system_monitor.instrumentation import (
+    LatencyHistogram,
+    OverheadTracker,
+    SamplerStats,
+)
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram."""
+
+    def test_empty(self):
+        """Test summary of an empty histogram."""
+        histogram = LatencyHistogram()
+        assert histogram.count == 0
+        assert histogram.mean == 0.0
+        assert histogram.percentile(99) == 0.0
+        assert histogram.to_dict()["buckets"] == {}
+
+    def test_record(self):
+        """Test bucketing and summary statistics."""
+        histogram = LatencyHistogram()
+        for seconds in (0.0000001, 0.000003, 0.000003, 0.001):
+            histogram.record(seconds)
+
+        data = histogram.to_dict()
+        assert histogram.count == 4
+        assert data["buckets"] == {"<2us": 1, "<4us": 2, "<1024us": 1}
+        assert data["min_us"] == pytest.approx(0.1)
+        assert data["max_us"] == pytest.approx(1000.0)
+        assert histogram.percentile(50) == pytest.approx(0.000004)
+        assert histogram.percentile(100) == pytest.approx(0.001)
+
+    def test_huge_values_clamped(self):
+        """Test that very long durations land in the last bucket."""
+        histogram = LatencyHistogram()
+        histogram.record(1e9)
+        assert histogram._buckets[-1] == 1
+        histogram.reset()
+        assert histogram.count == 0
+
+
+class TestSamplerStats:
+    """Test SamplerStats."""
+
+    def test_ticks_and_overruns(self):
+        """Test tick, late and dropped accounting."""
+        stats = SamplerStats()
+        assert stats.cpu_percent == 0.0
+
+        stats.record_tick(0.001)
+        stats.record_tick(-0.001)
+        stats.record_overrun(0.25, 0.1)
+        stats.cpu_time = 0.5
+        stats.wall_time = 10.0
+
+        data = stats.to_dict()
+        assert data["ticks"] == 2
+        assert data["late_ticks"] == 1
+        assert data["dropped_ticks"] == 2
+        assert data["cpu_percent"] == pytest.approx(5.0)
+        assert data["jitter"]["count"] == 2
+
+
+class TestOverheadTracker:
+    """Test OverheadTracker."""
+
+    def test_record_and_reset(self):
+        """Test per-source read histograms."""
+        tracker = OverheadTracker()
+        tracker.record_read("cpu", 0.00001)
+        tracker.record_read("cpu", 0.00002)
+        tracker.record_read("gpu", 0.00001)
+
+        data = tracker.to_dict()
+        assert data["reads"]["cpu"]["count"] == 2
+        assert data["reads"]["gpu"]["count"] == 1
+        assert set(data) == {"reads", "sample", "listeners", "sampler"}
+
+        tracker.reset()
+        assert tracker.to_dict()["reads"] == {}
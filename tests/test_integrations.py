@@ -0,0 +1,85 @@
+"""Training-loop adapter tests."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from system_monitor.integrations import (
+    KerasStepCallback,
+    LightningStepCallback,
+    TransformersStepCallback,
+    track_steps,
+)
+
+
+class TestTrackSteps:
+    """Test the plain-loop wrapper."""
+
+    def test_each_item_is_a_step(self):
+        """Test step boundaries around loop items."""
+        monitor = Mock()
+        items = list(track_steps(monitor, "abc", start=10))
+
+        assert items == ["a", "b", "c"]
+        assert [c[0][0] for c in monitor.step.call_args_list] == [10, 11, 12]
+        monitor.end_step.assert_called_once()
+
+    def test_break_closes_step(self):
+        """Test that leaving the loop early closes the open step."""
+        monitor = Mock()
+        loop = track_steps(monitor, range(100))
+        for item in loop:
+            if item == 2:
+                break
+        loop.close()
+
+        assert monitor.step.call_count == 3
+        monitor.end_step.assert_called_once()
+
+
+class TestCallbacks:
+    """Test framework callback adapters driven by plain loops."""
+
+    def test_keras(self):
+        """Test global step numbering across epochs."""
+        monitor = Mock()
+        callback = KerasStepCallback(monitor)
+        callback.set_model("model")
+        callback.set_params({"epochs": 2})
+        for epoch in range(2):
+            callback.on_epoch_begin(epoch)
+            for batch in range(3):
+                callback.on_train_batch_begin(batch)
+                callback.on_train_batch_end(batch, logs={"loss": 1.0})
+            callback.on_epoch_end(epoch)
+
+        steps = [c[0][0] for c in monitor.step.call_args_list]
+        assert steps == [0, 1, 2, 3, 4, 5]
+        assert monitor.end_step.call_count == 6
+        assert getattr(callback, "_supports_tf_logs", False) is False
+
+    def test_lightning(self):
+        """Test that the trainer's global step is used."""
+        monitor = Mock()
+        callback = LightningStepCallback(monitor)
+        trainer = SimpleNamespace(global_step=0)
+        for batch_idx in range(3):
+            callback.on_train_batch_start(trainer, None, "batch", batch_idx)
+            trainer.global_step += 1
+            callback.on_train_batch_end(
+                trainer, None, {}, "batch", batch_idx
+            )
+
+        steps = [c[0][0] for c in monitor.step.call_args_list]
+        assert steps == [0, 1, 2]
+        assert monitor.end_step.call_count == 3
+
+    def test_transformers(self):
+        """Test step hooks with a trainer state."""
+        monitor = Mock()
+        callback = TransformersStepCallback(monitor)
+        state = SimpleNamespace(global_step=5)
+        callback.on_train_begin(None, state, None)
+        callback.on_step_begin(None, state, None)
+        callback.on_step_end(None, state, None, model=None)
+
+        monitor.step.assert_called_once_with(5)
+        monitor.end_step.assert_called_once()
@@ -0,0 +1,140 @@
+"""Jupyter live panel tests."""
+
+import pytest
+from unittest.mock import Mock, patch
+from system_monitor.core import MemoryHistory, MemoryInfo, MemorySample
+from system_monitor.jupyter import LiveMemoryPanel, sparkline_svg
+
+
+def make_display():
+    """Create a fake IPython.display module."""
+    display = Mock()
+    display.HTML.side_effect = lambda data: ("html", data)
+    display.handle = display.display.return_value
+    return display
+
+
+def make_monitor():
+    """Create a monitor stand-in with a real history."""
+    monitor = Mock()
+    monitor.history = MemoryHistory()
+    for t in range(5):
+        monitor.history.append(
+            "cpu", float(t), MemoryInfo(used=100.0 * t, total=1000.0)
+        )
+    return monitor
+
+
+class TestSparkline:
+    """Test SVG sparkline rendering."""
+
+    def test_points_scaled_to_usage(self):
+        """Test that points span the width and usage maps to height."""
+        samples = [
+            MemorySample(0.0, "cpu", 0.0, 100.0),
+            MemorySample(1.0, "cpu", 100.0, 100.0),
+        ]
+        svg = sparkline_svg(samples, width=100, height=20)
+        assert 'points="0.0,20.0 100.0,0.0"' in svg
+
+    def test_too_few_samples(self):
+        """Test that a single sample renders an empty polyline."""
+        svg = sparkline_svg([MemorySample(0.0, "cpu", 1.0, 2.0)])
+        assert 'points=""' in svg
+
+
+class TestLiveMemoryPanel:
+    """Test LiveMemoryPanel display updates."""
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            LiveMemoryPanel(Mock(), refresh_interval=-1)
+        with pytest.raises(ValueError):
+            LiveMemoryPanel(Mock(), window=1)
+
+    def test_render(self):
+        """Test HTML rendering of recorded and missing sources."""
+        panel = LiveMemoryPanel(
+            make_monitor(), sources=["cpu", "gpu"], display_module=Mock()
+        )
+        html = panel.render()
+        assert "CPU" in html
+        assert "400.00 MB / 1000.00 MB (40.0%)" in html
+        assert "<polyline" in html
+        assert "GPU" in html and "Not available" in html
+        assert panel._repr_html_() == html
+
+    def test_show_registers_listener(self):
+        """Test that show displays once with a display id."""
+        monitor = make_monitor()
+        display = make_display()
+        panel = LiveMemoryPanel(monitor, display_module=display)
+        panel.show()
+        panel.show()
+
+        display.display.assert_called_once()
+        assert display.display.call_args[1] == {"display_id": True}
+        monitor.add_listener.assert_called_once_with(panel)
+        assert panel.is_shown
+
+    def test_updates_are_throttled(self):
+        """Test that samples within the refresh interval are skipped."""
+        display = make_display()
+        panel = LiveMemoryPanel(
+            make_monitor(), refresh_interval=1.0, display_module=display
+        )
+        with patch("system_monitor.jupyter.time.monotonic") as clock:
+            clock.return_value = 0.0
+            panel.show()
+            for t in (0.2, 0.5, 1.1, 1.5, 2.2):
+                clock.return_value = t
+                panel(t, {})
+
+        assert display.handle.update.call_count == 2
+        assert panel.updates == 2
+        assert panel.skipped == 3
+
+    def test_update_error_is_logged(self):
+        """Test that a failing display update does not raise."""
+        display = make_display()
+        display.handle.update.side_effect = RuntimeError("closed")
+        panel = LiveMemoryPanel(
+            make_monitor(), refresh_interval=0, display_module=display
+        )
+        panel.show()
+        assert panel.refresh() is False
+        assert panel.updates == 0
+
+    def test_close(self):
+        """Test that close removes the listener after a final update."""
+        monitor = make_monitor()
+        display = make_display()
+        panel = LiveMemoryPanel(
+            monitor, refresh_interval=60.0, display_module=display
+        )
+        assert panel.refresh() is False
+        panel.show()
+        panel.close()
+        panel.close()
+
+        monitor.remove_listener.assert_called_once_with(panel)
+        display.handle.update.assert_called_once()
+        assert not panel.is_shown
+
+    def test_with_system_monitor(self):
+        """Test the panel fed by real SystemMonitor samples."""
+        from system_monitor import SystemMonitor
+
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        display = make_display()
+        panel = LiveMemoryPanel(
+            monitor, refresh_interval=0, display_module=display
+        )
+        panel.show()
+        monitor.sample()
+        monitor.sample()
+        panel.close()
+
+        assert display.handle.update.call_count == 3
+        assert "CPU" in display.handle.update.call_args[0][0][1]
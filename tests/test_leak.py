@@ -0,0 +1,179 @@
+"""Leak detector tests."""
+
+import random
+
+import pytest
+from unittest.mock import Mock
+from system_monitor.analysis import LeakDetector
+from system_monitor.analysis.leak import _SortedSlopes
+from system_monitor.core import MemoryHistory, MemoryInfo
+from system_monitor.monitor import SystemMonitor
+
+
+def _feed(detector, values, source="process", step=60.0):
+    report = None
+    for i, value in enumerate(values):
+        report = detector.update(source, i * step, value)
+    return report
+
+
+class TestLeakDetector:
+    """Test LeakDetector trend detection."""
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            LeakDetector(window=1)
+        with pytest.raises(ValueError):
+            LeakDetector(window=10, min_samples=20)
+
+    def test_steady_growth_is_leak(self):
+        """Test that monotonic growth is flagged."""
+        detector = LeakDetector(window=40, min_samples=20)
+        # 분당 1MB 증가 = 시간당 60MB
+        report = _feed(detector, [100.0 + i for i in range(60)])
+
+        assert report.is_leak is True
+        assert report.slope == pytest.approx(60.0)
+        assert report.tau == pytest.approx(1.0)
+        assert report.samples == 40
+        assert report.change_point == 0.0
+
+    def test_flat_noise_is_not_leak(self):
+        """Test that noise around a constant level is not flagged."""
+        rng = random.Random(0)
+        detector = LeakDetector(window=40, min_samples=20)
+        values = [100.0 + rng.uniform(-5, 5) for _ in range(80)]
+        report = _feed(detector, values)
+
+        assert report.is_leak is False
+        assert abs(report.tau) < 0.6
+
+    def test_robust_to_outliers(self):
+        """Test that a single spike does not distort the slope."""
+        detector = LeakDetector(window=30, min_samples=10)
+        values = [100.0] * 30
+        values[15] = 5000.0
+        report = _feed(detector, values)
+
+        assert report.slope == 0.0
+        assert report.is_leak is False
+
+    def test_incremental_matches_batch(self):
+        """Test that the sliding window equals a from-scratch estimate."""
+        rng = random.Random(1)
+        detector = LeakDetector(window=15, min_samples=5)
+        values = [rng.uniform(0, 100) for _ in range(50)]
+        report = _feed(detector, values, step=1.0)
+
+        points = list(enumerate(values))[-15:]
+        slopes = sorted(
+            (v2 - v1) / (t2 - t1)
+            for i, (t1, v1) in enumerate(points)
+            for t2, v2 in points[i + 1:]
+        )
+        middle = len(slopes) // 2
+        expected = (
+            slopes[middle]
+            if len(slopes) % 2
+            else (slopes[middle - 1] + slopes[middle]) / 2
+        )
+        assert report.slope == pytest.approx(expected * 3600)
+
+    def test_sorted_slopes_chunks(self, monkeypatch):
+        """Test the chunked multiset against a sorted list."""
+        monkeypatch.setattr(_SortedSlopes, "_LOAD", 4)
+        rng = random.Random(2)
+        slopes = _SortedSlopes()
+        expected = []
+        for _ in range(2000):
+            if expected and rng.random() < 0.45:
+                value = rng.choice(expected)
+                expected.remove(value)
+                slopes.remove(value)
+            else:
+                value = float(rng.randint(-20, 20))  # 중복 값 포함
+                expected.append(value)
+                slopes.add(value)
+            expected.sort()
+            assert len(slopes) == len(expected)
+            if expected:
+                index = rng.randrange(len(expected))
+                assert slopes[index] == expected[index]
+        assert len(slopes._chunks) <= len(expected) // 2 + 1
+
+    def test_large_window_matches_batch(self):
+        """Test a window whose slopes span many chunks."""
+        rng = random.Random(3)
+        detector = LeakDetector(window=80, min_samples=5)
+        values = [round(rng.uniform(0, 10)) for _ in range(200)]
+        report = _feed(detector, values, step=1.0)
+
+        points = list(enumerate(values))[-80:]
+        slopes = sorted(
+            (v2 - v1) / (t2 - t1)
+            for i, (t1, v1) in enumerate(points)
+            for t2, v2 in points[i + 1:]
+        )
+        middle = len(slopes) // 2
+        assert report.slope == pytest.approx(
+            (slopes[middle - 1] + slopes[middle]) / 2 * 3600
+        )
+
+    def test_duplicate_timestamps(self):
+        """Test that equal timestamps do not divide by zero."""
+        detector = LeakDetector(window=3, min_samples=2)
+        for value in (1.0, 2.0, 3.0, 4.0):
+            report = detector.update("gpu", 5.0, value)
+        assert report.slope == 0.0
+
+    def test_on_leak_called_once(self):
+        """Test that the callback fires on transition only."""
+        callback = Mock()
+        detector = LeakDetector(window=20, min_samples=10, on_leak=callback)
+        _feed(detector, [float(i * 10) for i in range(30)])
+
+        callback.assert_called_once()
+        assert callback.call_args[0][0].is_leak is True
+
+    def test_change_point_resets_when_flat(self):
+        """Test that the CUSUM change point clears once growth stops."""
+        detector = LeakDetector(window=20, min_samples=10)
+        report = _feed(detector, [0.0, 20.0, 40.0, 0.0])
+        assert report.change_point is None
+
+    def test_listener_and_feed(self):
+        """Test listener interface and history replay."""
+        detector = LeakDetector(sources=("gpu",), window=10, min_samples=5)
+        detector(1.0, {"gpu": MemoryInfo(used=1.0, total=10.0)})
+        detector(2.0, {"cpu": MemoryInfo(used=1.0, total=10.0)})
+        assert detector.sources == ("gpu",)
+        assert detector.report("gpu").samples == 1
+        assert detector.report("cpu") is None
+
+        history = MemoryHistory()
+        for i in range(3, 10):
+            history.append("gpu", float(i), MemoryInfo(used=i, total=10.0))
+        reports = detector.feed(history)
+        assert reports["gpu"].samples == 8
+
+        detector.reset("gpu")
+        assert detector.reports() == {}
+        detector.update("gpu", 1.0, 1.0)
+        detector.reset()
+        assert detector.reports() == {}
+
+    def test_attach_to_monitor(self):
+        """Test that an attached detector receives monitor samples."""
+        monitor = SystemMonitor(use_gpu=False)
+        monitor._process_monitor.get_memory_info = Mock(
+            return_value=MemoryInfo(used=10.0, total=100.0)
+        )
+        detector = LeakDetector(window=5, min_samples=2)
+        detector.attach(monitor)
+        monitor.sample()
+        assert detector.report("process").samples == 1
+
+        detector.detach(monitor)
+        monitor.sample()
+        assert detector.report("process").samples == 1
@@ -1,5 +1,7 @@
 """Main monitor tests."""
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 from system_monitor.monitor import (
@@ -8,6 +10,7 @@ from system_monitor.monitor import (
     MemoryMonitorManager,
 )
 from system_monitor.core import MemoryInfo
+from system_monitor.scheduling import AdaptiveInterval
 
 
 class TestSystemMonitor:
@@ -185,6 +188,159 @@ class TestSystemMonitor:
         mock_logger.info.assert_any_call("  CPU: Not available")
         mock_logger.info.assert_any_call("  GPU: Not available")
 
+    def test_init_no_process(self):
+        """Test initialization without process tracking."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        assert monitor._process_monitor is None
+        assert monitor.get_process_memory() is None
+
+    def test_cgroup_memory(self):
+        """Test cgroup source selection and sampling."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        assert monitor.get_cgroup_memory() is None
+
+        monitor = SystemMonitor(
+            use_gpu=False, track_process=False, track_cgroup=True
+        )
+        expected_info = MemoryInfo(used=10.0, total=100.0)
+        monitor._cgroup_monitor.get_memory_info = Mock(
+            return_value=expected_info
+        )
+        assert monitor.get_cgroup_memory() is expected_info
+        assert "cgroup" in monitor.sample()
+
+    def test_get_process_memory(self):
+        """Test get_process_memory method."""
+        monitor = SystemMonitor(use_gpu=False)
+        expected_info = MemoryInfo(used=10.0, total=100.0)
+        monitor._process_monitor.get_memory_info = Mock(
+            return_value=expected_info
+        )
+
+        assert monitor.get_process_memory() is expected_info
+
+    def test_sample_records_history(self):
+        """Test that sample() records available sources."""
+        monitor = SystemMonitor(history_size=10)
+        cpu_info = MemoryInfo(used=100.0, total=200.0)
+        monitor._cpu_monitor.get_memory_info = Mock(return_value=cpu_info)
+        monitor._gpu_monitor.get_memory_info = Mock(return_value=None)
+        monitor._process_monitor.get_memory_info = Mock(
+            return_value=MemoryInfo(used=10.0, total=200.0)
+        )
+
+        readings = monitor.sample()
+
+        assert set(readings) == {"cpu", "process"}
+        assert monitor.history.sources() == ["cpu", "process"]
+        assert monitor.history.latest("cpu").info == cpu_info
+        assert monitor.history.maxlen == 10
+
+    def test_sample_listeners(self):
+        """Test listener registration and error isolation."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        monitor._cpu_monitor.get_memory_info = Mock(
+            return_value=MemoryInfo(used=1.0, total=2.0)
+        )
+        failing = Mock(side_effect=RuntimeError("boom"))
+        listener = Mock()
+        monitor.add_listener(failing)
+        monitor.add_listener(listener)
+        monitor.add_listener(listener)
+
+        readings = monitor.sample()
+
+        listener.assert_called_once()
+        timestamp, received = listener.call_args[0]
+        assert received == readings
+        assert timestamp > 0
+
+        monitor.remove_listener(listener)
+        monitor.remove_listener(listener)
+        monitor.sample()
+        listener.assert_called_once()
+
+    def test_background_sampling(self):
+        """Test starting and stopping the background sampler."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        monitor._cpu_monitor.get_memory_info = Mock(
+            return_value=MemoryInfo(used=1.0, total=2.0)
+        )
+        sampled = threading.Event()
+        monitor.add_listener(lambda timestamp, readings: sampled.set())
+
+        monitor.start_sampling(interval=0.01)
+        monitor.start_sampling(interval=0.01)
+        assert monitor.is_sampling is True
+        assert sampled.wait(2.0)
+
+        monitor.stop_sampling()
+        assert monitor.is_sampling is False
+        assert len(monitor.history) > 0
+        monitor.stop_sampling()
+
+    def test_overhead_stats(self):
+        """Test that sample() records its own read latencies."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        monitor._cpu_monitor.get_memory_info = Mock(
+            return_value=MemoryInfo(used=1.0, total=2.0)
+        )
+        monitor.sample()
+        monitor.sample()
+
+        stats = monitor.get_overhead_stats()
+        assert stats["reads"]["cpu"]["count"] == 2
+        assert stats["sample"]["count"] == 2
+        assert stats["listeners"]["count"] == 2
+
+        exported = monitor.to_dict()
+        assert len(exported["samples"]) == 2
+        assert exported["overhead"]["reads"]["cpu"]["count"] == 2
+
+        monitor.reset_overhead_stats()
+        assert monitor.get_overhead_stats()["reads"] == {}
+
+    def test_sampler_overhead_stats(self):
+        """Test that the background sampler reports loop statistics."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        sampled = threading.Semaphore(0)
+        monitor.add_listener(lambda timestamp, readings: sampled.release())
+
+        monitor.start_sampling(interval=0.001)
+        for _ in range(3):
+            assert sampled.acquire(timeout=2.0)
+        monitor.stop_sampling()
+
+        sampler = monitor.get_overhead_stats()["sampler"]
+        assert sampler["ticks"] >= 3
+        assert sampler["wall_time_s"] > 0
+
+    @patch("system_monitor.monitor.logger")
+    def test_print_overhead_stats(self, mock_logger):
+        """Test overhead printing."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        monitor._cpu_monitor.get_memory_info = Mock(return_value=None)
+        monitor.print_overhead_stats("Overhead")
+        mock_logger.info.assert_called_once_with("Overhead")
+
+        monitor.sample()
+        monitor._overhead.sampler.record_tick(0.0)
+        monitor.print_overhead_stats("Overhead")
+        messages = [c[0][0] for c in mock_logger.info.call_args_list]
+        assert any(m.startswith("  cpu read:") for m in messages)
+        assert any(m.startswith("  sampler: 1 ticks") for m in messages)
+
+    def test_adaptive_sampling(self):
+        """Test starting the sampler with an adaptive scheduler."""
+        monitor = SystemMonitor(use_gpu=False, track_process=False)
+        assert monitor.sampling_interval is None
+
+        scheduler = AdaptiveInterval(min_interval=0.5, max_interval=1.0)
+        monitor.start_sampling(interval=0.5, scheduler=scheduler)
+        assert monitor._sampler.scheduler is scheduler
+        assert monitor.sampling_interval in (0.5, 1.0)
+        monitor.stop_sampling()
+
     def test_memory_monitor_manager_alias(self):
         """Test that MemoryMonitorManager is an alias for GPUMemoryMonitor."""
         assert MemoryMonitorManager is GPUMemoryMonitor
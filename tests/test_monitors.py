@@ -5,6 +5,8 @@ from unittest.mock import Mock, patch
 from system_monitor.monitors.base import BaseMonitor
 from system_monitor.monitors.cpu import CPUMonitor
 from system_monitor.monitors.gpu import GPUMonitor
+from system_monitor.monitors.cgroup import CgroupMonitor
+from system_monitor.monitors.process import ProcessMonitor
 from system_monitor.core import MemoryInfo
 
 
@@ -195,3 +197,126 @@ class TestGPUMonitor:
         monitor = GPUMonitor(cupy_instance=mock_cupy)
         monitor._available = None  # Reset cache
         assert monitor.is_available is True
+
+
+class TestProcessMonitor:
+    """Test ProcessMonitor class."""
+
+    def test_default_pid(self):
+        """Test that the current process is monitored by default."""
+        import os
+
+        monitor = ProcessMonitor()
+        assert monitor.pid == os.getpid()
+
+    def test_init_without_psutil(self):
+        """Test initialization when psutil is not available."""
+        with patch("builtins.__import__", side_effect=ImportError):
+            monitor = ProcessMonitor()
+            assert monitor._psutil is None
+            assert monitor.get_memory_info() is None
+
+    def test_init_invalid_pid(self):
+        """Test initialization with a process that cannot be attached."""
+        mock_psutil = Mock()
+        mock_psutil.Process.side_effect = Exception("no such process")
+        with patch.dict("sys.modules", {"psutil": mock_psutil}):
+            monitor = ProcessMonitor(pid=-1)
+        assert monitor._psutil is None
+        assert monitor.is_available is False
+
+    def test_get_memory_info_success(self):
+        """Test successful memory info retrieval."""
+        monitor = ProcessMonitor()
+        mock_psutil = Mock()
+        mock_psutil.virtual_memory.return_value = Mock(
+            total=2048 * 1024 * 1024
+        )
+        monitor._psutil = mock_psutil
+        monitor._process = Mock()
+        monitor._process.memory_info.return_value = Mock(
+            rss=256 * 1024 * 1024
+        )
+
+        info = monitor.get_memory_info()
+        assert info.used == 256.0
+        assert info.total == 2048.0
+
+    def test_get_memory_info_exception(self):
+        """Test memory info when psutil raises exception."""
+        monitor = ProcessMonitor()
+        monitor._psutil = Mock()
+        monitor._process = Mock()
+        monitor._process.memory_info.side_effect = Exception("Test error")
+
+        assert monitor.get_memory_info() is None
+
+
+class TestCgroupMonitor:
+    """Test CgroupMonitor class."""
+
+    MB = 1024 * 1024
+
+    def _write(self, root, files):
+        for name, content in files.items():
+            path = root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def test_cgroup_v2(self, tmp_path):
+        """Test reading a cgroup v2 hierarchy."""
+        self._write(
+            tmp_path,
+            {
+                "memory.current": f"{256 * self.MB}\n",
+                "memory.max": f"{1024 * self.MB}\n",
+            },
+        )
+        monitor = CgroupMonitor(root=str(tmp_path))
+        assert monitor.version == 2
+        info = monitor.get_memory_info()
+        assert info.used == 256.0
+        assert info.total == 1024.0
+
+    def test_cgroup_v1_unlimited(self, tmp_path):
+        """Test an unlimited cgroup v1 hierarchy falls back to host total."""
+        self._write(
+            tmp_path,
+            {
+                "memory/memory.usage_in_bytes": str(128 * self.MB),
+                "memory/memory.limit_in_bytes": "9223372036854771712",
+            },
+        )
+        monitor = CgroupMonitor(root=str(tmp_path))
+        assert monitor.version == 1
+        with patch.object(
+            CgroupMonitor, "_host_total", return_value=2048 * self.MB
+        ):
+            info = monitor.get_memory_info()
+        assert info.total == 2048.0
+
+    def test_unlimited_without_psutil(self, tmp_path):
+        """Test that usage is used as total when nothing else is known."""
+        self._write(
+            tmp_path,
+            {"memory.current": str(64 * self.MB), "memory.max": "max"},
+        )
+        monitor = CgroupMonitor(root=str(tmp_path))
+        with patch.dict("sys.modules", {"psutil": None}):
+            info = monitor.get_memory_info()
+        assert info.used == info.total == 64.0
+
+    def test_no_controller(self, tmp_path):
+        """Test hosts without a cgroup memory controller."""
+        monitor = CgroupMonitor(root=str(tmp_path))
+        assert monitor.version is None
+        assert monitor.get_memory_info() is None
+        assert monitor.is_available is False
+
+    def test_read_error(self, tmp_path):
+        """Test unreadable or malformed files."""
+        self._write(
+            tmp_path, {"memory.current": "garbage", "memory.max": "max"}
+        )
+        monitor = CgroupMonitor(root=str(tmp_path))
+        assert monitor.get_memory_info() is None
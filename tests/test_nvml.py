@@ -0,0 +1,280 @@
+"""NVML GPU statistics collector tests."""
+
+import math
+import os
+import sys
+import pytest
+from unittest.mock import patch
+from benchmarks.fakes import FakeNVML
+from system_monitor import SystemMonitor
+from system_monitor.monitors import (
+    GPUProcess,
+    GPUProcessCollector,
+    GPUStatsCollector,
+    gpu_process_collectors,
+    gpu_stats_collectors,
+    load_nvml,
+)
+from system_monitor.monitors import nvml as nvml_module
+
+
+@pytest.fixture
+def fake_nvml():
+    """Fake NVML binding with two devices."""
+    return FakeNVML(devices=2)
+
+
+class TestGPUStatsCollector:
+    """Test reading device statistics."""
+
+    def test_fields(self, fake_nvml):
+        """Test that values are converted to the documented units."""
+        collector = GPUStatsCollector(1, nvml_instance=fake_nvml)
+        assert collector.name == "gpu1_stats"
+        assert collector.device == 1
+        assert collector.collect(1.0) == {
+            "sm_util": 50.0,
+            "mem_util": 25.0,
+            "temperature": 60.0,
+            "power": 150.0,
+            "power_limit": 300.0,
+            "sm_clock": 1410.0,
+            "mem_clock": 1215.0,
+            "used": 512.0,
+            "total": 1024.0,
+        }
+
+    def test_unsupported_fields_are_skipped(self, fake_nvml):
+        """Test that unsupported queries are not repeated."""
+        fake_nvml.devices[0].unsupported = {"power", "sm_util"}
+        collector = GPUStatsCollector(0, nvml_instance=fake_nvml)
+        values = collector.collect(1.0)
+        # 사용률 조회 하나가 sm_util/mem_util을 함께 반환
+        assert "power" not in values
+        assert "sm_util" not in values
+        assert "mem_util" not in values
+        assert values["temperature"] == 60.0
+
+        calls = fake_nvml.calls
+        collector.collect(2.0)
+        assert fake_nvml.calls - calls == 6
+
+    def test_query_errors_are_logged(self, fake_nvml):
+        """Test that other failures skip the field for one sample."""
+        collector = GPUStatsCollector(0, nvml_instance=fake_nvml)
+        with patch.object(
+            fake_nvml,
+            "nvmlDeviceGetTemperature",
+            side_effect=RuntimeError("boom"),
+        ), patch.object(nvml_module.logger, "error") as error:
+            values = collector.collect(1.0)
+        assert "temperature" not in values
+        error.assert_called_once()
+        assert collector.collect(2.0)["temperature"] == 60.0
+
+    def test_unavailable(self, fake_nvml):
+        """Test missing devices and failed initialization."""
+        assert GPUStatsCollector(5, nvml_instance=fake_nvml).collect(1.0) is (
+            None
+        )
+        with patch.object(
+            fake_nvml, "nvmlInit", side_effect=RuntimeError("no driver")
+        ):
+            assert load_nvml(fake_nvml) is None
+            collector = GPUStatsCollector(0, nvml_instance=fake_nvml)
+        assert collector.collect(1.0) is None
+
+
+def write_process(root, pid, name, cgroup):
+    """Write the procfs files of a process."""
+    (root / str(pid)).mkdir()
+    (root / str(pid) / "comm").write_text(name + "\n")
+    (root / str(pid) / "cgroup").write_text(cgroup)
+
+
+class TestGPUProcessCollector:
+    """Test per-process GPU memory attribution."""
+
+    @pytest.fixture
+    def proc_root(self, tmp_path):
+        """Procfs with this process and a neighbour in another cgroup."""
+        write_process(tmp_path, os.getpid(), "python", "0::/jobs/mine\n")
+        write_process(
+            tmp_path,
+            200,
+            "trainer",
+            "12:cpu,cpuacct:/other\n4:memory:/jobs/noisy\n",
+        )
+        return tmp_path
+
+    def test_processes_joined_with_names_and_cgroups(
+        self, fake_nvml, proc_root
+    ):
+        """Test the process table, cgroup totals and recorded fields."""
+        MB = 1024 * 1024
+        fake_nvml.devices[0].processes = [
+            (os.getpid(), 256 * MB),
+            (200, 512 * MB),
+            (300, None),
+        ]
+        collector = GPUProcessCollector(
+            0, nvml_instance=fake_nvml, proc_root=str(proc_root)
+        )
+        assert collector.name == "gpu0_processes"
+        assert collector.collect(1.0) == {
+            "count": 3.0,
+            "used": 768.0,
+            "own": 256.0,
+            "others": 512.0,
+            "top": 512.0,
+        }
+        processes = collector.processes
+        assert processes[0] == GPUProcess(200, 512.0, "trainer", "/jobs/noisy")
+        assert processes[1] == GPUProcess(
+            os.getpid(), 256.0, "python", "/jobs/mine"
+        )
+        # 다른 컨테이너의 프로세스는 이름/cgroup을 알 수 없음
+        assert processes[2].name == ""
+        assert math.isnan(processes[2].used)
+        assert collector.by_cgroup() == {
+            "/jobs/noisy": 512.0, "/jobs/mine": 256.0
+        }
+
+    def test_lower_rate_than_samples(self, fake_nvml, proc_root):
+        """Test that listings are at least ``interval`` seconds apart."""
+        collector = GPUProcessCollector(
+            0,
+            nvml_instance=fake_nvml,
+            interval=10.0,
+            proc_root=str(proc_root),
+        )
+        results = [collector.collect(t) for t in (0.0, 5.0, 10.0, 19.0)]
+        assert [r is not None for r in results] == [True, False, True, False]
+        assert fake_nvml.calls == 2
+        with pytest.raises(ValueError):
+            GPUProcessCollector(0, nvml_instance=fake_nvml, interval=-1.0)
+
+    def test_identities_cached_per_pid(self, fake_nvml, proc_root):
+        """Test that procfs is read once per process."""
+        fake_nvml.devices[0].processes = [(200, 0)]
+        collector = GPUProcessCollector(
+            0, nvml_instance=fake_nvml, interval=0.0, proc_root=str(proc_root)
+        )
+        collector.collect(1.0)
+        (proc_root / "200" / "comm").write_text("renamed\n")
+        collector.collect(2.0)
+        assert collector.processes[0].name == "trainer"
+
+        # 목록에서 사라진 pid는 캐시에서 제거되어 다시 읽음
+        fake_nvml.devices[0].processes = []
+        collector.collect(3.0)
+        fake_nvml.devices[0].processes = [(200, 0)]
+        collector.collect(4.0)
+        assert collector.processes[0].name == "renamed"
+
+    def test_child_pid_namespace(self, fake_nvml, proc_root):
+        """Test that host pids are not matched inside a container."""
+        (proc_root / "self").mkdir()
+        (proc_root / "self" / "status").write_text(
+            f"Name:\tpython\nNSpid:\t4242\t{os.getpid()}\n"
+        )
+        fake_nvml.devices[0].processes = [(os.getpid(), 1024 * 1024)]
+        collector = GPUProcessCollector(
+            0, nvml_instance=fake_nvml, proc_root=str(proc_root)
+        )
+        assert collector.isolated
+        result = collector.collect(1.0)
+        assert result["used"] == 1.0
+        assert math.isnan(result["own"]) and math.isnan(result["others"])
+        # 같은 번호의 /proc 항목은 다른 프로세스일 수 있으므로 읽지 않음
+        assert collector.processes[0].name == ""
+
+        (proc_root / "self" / "status").write_text("NSpid:\t4242\n")
+        assert not nvml_module._in_child_pid_namespace(str(proc_root))
+
+    def test_parse_cgroup(self):
+        """Test preferring the unified hierarchy."""
+        parse = GPUProcessCollector.parse_cgroup
+        assert parse("4:memory:/v1\n0::/v2\n") == "/v2"
+        assert parse("3:cpu:/a\n4:memory,hugetlb:/b\n") == "/b"
+        assert parse("") == ""
+
+    def test_unavailable(self, fake_nvml):
+        """Test missing devices and failed listings."""
+        missing = GPUProcessCollector(5, nvml_instance=fake_nvml)
+        assert missing.collect(1.0) is None
+
+        collector = GPUProcessCollector(0, nvml_instance=fake_nvml)
+        fake_nvml.devices[0].unsupported = {"processes"}
+        assert collector.collect(1.0) is None
+        assert collector.processes == ()
+
+
+class TestLoadNVML:
+    """Test loading the NVML binding."""
+
+    def test_one_collector_per_device(self, fake_nvml):
+        """Test creating collectors for every device."""
+        collectors = gpu_stats_collectors(fake_nvml)
+        assert [c.name for c in collectors] == ["gpu0_stats", "gpu1_stats"]
+        assert fake_nvml.initialized == 3
+        collectors = gpu_process_collectors(fake_nvml, interval=1.0)
+        assert [c.device for c in collectors] == [0, 1]
+
+    def test_missing_pynvml(self):
+        """Test that a missing binding is cached as unavailable."""
+        with patch.object(nvml_module, "_nvml", None), patch.dict(
+            sys.modules, {"pynvml": None}
+        ):
+            assert load_nvml() is None
+            assert nvml_module._nvml is False
+            assert gpu_stats_collectors() == []
+
+    def test_pynvml_initialized_once(self, fake_nvml):
+        """Test that the imported binding is initialized once."""
+        with patch.object(nvml_module, "_nvml", None), patch.dict(
+            sys.modules, {"pynvml": fake_nvml}
+        ):
+            assert load_nvml() is fake_nvml
+            assert load_nvml() is fake_nvml
+        assert fake_nvml.initialized == 1
+
+
+class TestSystemMonitorGPUStats:
+    """Test recording GPU statistics through SystemMonitor."""
+
+    def test_recorded_with_memory_samples(self, fake_nvml):
+        """Test that statistics share timestamps with memory samples."""
+        with patch.object(nvml_module, "_nvml", fake_nvml):
+            monitor = SystemMonitor(
+                use_gpu=False, track_process=False, track_gpu_stats=True
+            )
+        assert [c.name for c in monitor.collectors] == [
+            "gpu0_stats", "gpu1_stats"
+        ]
+        monitor.sample()
+        fake_nvml.devices[0].temperature = 70
+        monitor.sample()
+
+        columns = monitor.metrics.columns("gpu0_stats")
+        assert columns["temperature"] == [60.0, 70.0]
+        assert columns["timestamp"] == [
+            sample.timestamp for sample in monitor.history.samples("cpu")
+        ]
+        assert monitor.state.metrics["gpu1_stats"]["power"] == 150.0
+
+    def test_process_collectors(self, fake_nvml):
+        """Test enabling per-process GPU memory."""
+        with patch.object(nvml_module, "_nvml", fake_nvml), patch.object(
+            nvml_module, "_in_child_pid_namespace", return_value=False
+        ):
+            monitor = SystemMonitor(
+                use_gpu=False, track_process=False, track_gpu_processes=True
+            )
+        fake_nvml.devices[1].processes = [(os.getpid(), 1024 * 1024)]
+        monitor.sample()
+        monitor.sample()
+        # 기본 간격(10초) 안의 두 번째 샘플은 기록하지 않음
+        assert len(monitor.metrics.columns("gpu1_processes")["own"]) == 1
+        assert monitor.metrics.latest("gpu1_processes")["own"] == 1.0
+        assert "gpu1_processes" not in monitor.state.metrics
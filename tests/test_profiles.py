@@ -0,0 +1,169 @@
+"""Monitor profile tests."""
+
+import dataclasses
+
+import pytest
+from system_monitor.profiles import (
+    PROFILES,
+    MonitorProfile,
+    apply_overrides,
+    select_profile,
+)
+from system_monitor.scheduling import AdaptiveInterval
+
+
+def _env(**flags):
+    info = {
+        "is_colab": False,
+        "is_jupyter": False,
+        "is_vscode": False,
+        "is_container": False,
+    }
+    info.update(flags)
+    return info
+
+
+class TestMonitorProfile:
+    """Test MonitorProfile validation."""
+
+    def test_builtin_profiles_are_valid(self):
+        """Test that every shipped profile validates."""
+        for name, profile in PROFILES.items():
+            assert profile.name == name
+            profile.validate()
+
+    def test_validate_collects_errors(self):
+        """Test that every invalid field is reported at once."""
+        profile = MonitorProfile(
+            name="broken",
+            sources=("gpu", "disk"),
+            interval=0,
+            min_interval=2.0,
+            max_interval=1.0,
+            history_size=0,
+        )
+        with pytest.raises(ValueError) as excinfo:
+            profile.validate()
+        message = str(excinfo.value)
+        assert "'broken'" in message
+        for fragment in ("disk", "'cpu'", "interval", "history_size"):
+            assert fragment in message
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"interval": float("inf")},
+            {"interval": float("nan")},
+            {"min_interval": float("nan")},
+            {"max_interval": float("inf")},
+        ],
+    )
+    def test_validate_rejects_non_finite_intervals(self, fields):
+        """Test that nan/inf intervals fail validation."""
+        with pytest.raises(ValueError, match="finite"):
+            MonitorProfile(name="broken", **fields).validate()
+
+    def test_scheduler(self):
+        """Test scheduler construction."""
+        assert MonitorProfile(name="fixed").scheduler() is None
+        scheduler = MonitorProfile(
+            name="adaptive", adaptive=True, min_interval=0.5, max_interval=3
+        ).scheduler()
+        assert isinstance(scheduler, AdaptiveInterval)
+        assert scheduler.min_interval == 0.5
+        assert scheduler.max_interval == 3
+
+    def test_to_dict(self):
+        """Test dictionary conversion."""
+        data = PROFILES["container"].to_dict()
+        assert data["name"] == "container"
+        assert "cgroup" in data["sources"]
+
+
+class TestSelectProfile:
+    """Test profile selection and overrides."""
+
+    @pytest.mark.parametrize(
+        "flags, expected",
+        [
+            ({"is_colab": True, "is_jupyter": True}, "colab"),
+            ({"is_jupyter": True, "is_container": True}, "jupyter"),
+            ({"is_container": True, "is_vscode": True}, "container"),
+            ({"is_vscode": True}, "vscode"),
+            ({}, "terminal"),
+        ],
+    )
+    def test_environment_selection(self, flags, expected):
+        """Test the profile chosen for each environment."""
+        assert select_profile(_env(**flags), {}).name == expected
+
+    def test_detects_environment_when_omitted(self):
+        """Test that the environment is detected automatically."""
+        assert select_profile(environ={}).name in PROFILES
+
+    def test_forced_profile(self):
+        """Test SYSTEM_MONITOR_PROFILE."""
+        environ = {"SYSTEM_MONITOR_PROFILE": "manual"}
+        assert select_profile(_env(is_colab=True), environ).interval is None
+
+        with pytest.raises(ValueError, match="Unknown monitor profile"):
+            select_profile(_env(), {"SYSTEM_MONITOR_PROFILE": "nope"})
+
+    def test_overrides(self):
+        """Test per-field environment variable overrides."""
+        environ = {
+            "SYSTEM_MONITOR_SOURCES": "cpu, gpu ,",
+            "SYSTEM_MONITOR_INTERVAL": "0.25",
+            "SYSTEM_MONITOR_ADAPTIVE": "yes",
+            "SYSTEM_MONITOR_MIN_INTERVAL": "0.05",
+            "SYSTEM_MONITOR_MAX_INTERVAL": "1",
+            "SYSTEM_MONITOR_HISTORY_SIZE": "100",
+            "SYSTEM_MONITOR_UNRELATED": "x",
+        }
+        profile = apply_overrides(PROFILES["jupyter"], environ)
+        assert profile == dataclasses.replace(
+            PROFILES["jupyter"],
+            sources=("cpu", "gpu"),
+            interval=0.25,
+            adaptive=True,
+            min_interval=0.05,
+            max_interval=1.0,
+            history_size=100,
+        )
+
+    def test_overrides_disable_sampling(self):
+        """Test that an interval of 'none' disables sampling."""
+        environ = {
+            "SYSTEM_MONITOR_INTERVAL": "None",
+            "SYSTEM_MONITOR_ADAPTIVE": "off",
+        }
+        profile = apply_overrides(PROFILES["terminal"], environ)
+        assert profile.interval is None
+        assert profile.adaptive is False
+
+    def test_no_overrides_returns_same_profile(self):
+        """Test that empty variables are ignored."""
+        profile = PROFILES["colab"]
+        environ = {"SYSTEM_MONITOR_INTERVAL": ""}
+        assert apply_overrides(profile, environ) is profile
+
+    @pytest.mark.parametrize(
+        "key, value",
+        [
+            ("SYSTEM_MONITOR_INTERVAL", "fast"),
+            ("SYSTEM_MONITOR_INTERVAL", "inf"),
+            ("SYSTEM_MONITOR_MIN_INTERVAL", "nan"),
+            ("SYSTEM_MONITOR_MAX_INTERVAL", "inf"),
+            ("SYSTEM_MONITOR_HISTORY_SIZE", "1.5"),
+            ("SYSTEM_MONITOR_ADAPTIVE", "maybe"),
+        ],
+    )
+    def test_invalid_overrides(self, key, value):
+        """Test that unparsable variables fail with the variable name."""
+        with pytest.raises(ValueError, match=key):
+            select_profile(_env(), {key: value})
+
+    def test_invalid_override_values_are_validated(self):
+        """Test that parsed but invalid values fail validation."""
+        with pytest.raises(ValueError, match="interval must be positive"):
+            select_profile(_env(), {"SYSTEM_MONITOR_INTERVAL": "-1"})
@@ -0,0 +1,184 @@
+"""Trace replay tests."""
+
+import pytest
+from system_monitor import DeadbandFilter, LeakDetector, SystemMonitor
+from system_monitor.core import MemoryHistory, MemoryInfo, TraceWriter
+from system_monitor.core import trace as trace_module
+from system_monitor.core.trace import TraceChunk
+from system_monitor.monitors import BaseMonitor
+from system_monitor.replay import ReplayMonitor, TraceReplay
+
+
+class FixedMonitor(BaseMonitor):
+    """Monitor returning a fixed reading."""
+
+    def __init__(self, used: float):
+        super().__init__()
+        self.used = used
+
+    def get_memory_info(self):
+        return MemoryInfo(used=self.used, total=100.0)
+
+
+def make_history(count=20):
+    """Create a history with a growing gpu and a flat cpu source."""
+    history = MemoryHistory(maxlen=1000)
+    for i in range(count):
+        t = 1000.0 + i
+        history.append("gpu", t, MemoryInfo(10.0 * i, 1000.0))
+        if i % 2 == 0:
+            history.append("cpu", t, MemoryInfo(500.0, 2000.0))
+    return history
+
+
+class TestMonitorBackends:
+    """Test SystemMonitor backend and clock injection."""
+
+    def test_backends_replace_builtin_monitors(self):
+        """Test that only the given backends are read."""
+        monitor = SystemMonitor(
+            backends={"gpu": FixedMonitor(1.0), "disk": FixedMonitor(2.0)},
+            clock=lambda: 42.0,
+        )
+        readings = monitor.sample()
+        assert set(readings) == {"gpu", "disk"}
+        assert monitor.history.latest("disk").timestamp == 42.0
+        assert monitor.get_cpu_memory() is None
+        assert not monitor.has_cpu
+        assert monitor.get_gpu_memory().used == 1.0
+
+
+class TestTraceReplay:
+    """Test replaying traces through a monitor."""
+
+    def test_replays_history_in_time_order(self):
+        """Test frames, timestamps and the replay monitor's history."""
+        history = make_history()
+        replay = TraceReplay(history)
+        assert replay.sources == ["gpu", "cpu"]
+        seen = []
+        replay.monitor.add_listener(
+            lambda t, readings: seen.append((t, sorted(readings)))
+        )
+
+        assert replay.run() == 20
+        assert seen[0] == (1000.0, ["cpu", "gpu"])
+        assert seen[1] == (1001.0, ["gpu"])
+        assert replay.monitor.history.samples("gpu") == history.samples(
+            "gpu"
+        )
+        assert replay.monitor.state.timestamp == 1019.0
+        assert replay.step() is None
+
+    def test_step_until_and_rewind(self):
+        """Test partial runs resuming where they stopped."""
+        replay = TraceReplay(make_history(), sources=["gpu"])
+        assert replay.step() == {"gpu": MemoryInfo(0.0, 1000.0)}
+        assert replay.run(until=1004.5) == 4
+        assert replay.timestamp == 1004.0
+        assert replay.run(max_frames=3) == 3
+        assert replay.timestamp == 1007.0
+        assert replay.frames == 8
+
+        replay.rewind()
+        assert replay.timestamp is None
+        assert replay.run() == 20
+
+    def test_paused_runs_do_not_wrap_frames(self):
+        """Test that repeated paused runs keep a single frame iterator."""
+        replay = TraceReplay(make_history(), sources=["gpu"])
+        assert replay.run(until=1004.5) == 5
+        frames = replay._frames
+        for _ in range(1000):
+            assert replay.run(until=1004.5) == 0
+        assert replay._frames is frames
+        assert replay.run() == 15
+        assert replay.timestamp == 1019.0
+
+    def test_drives_analysis_pipelines(self):
+        """Test that listeners see replayed readings."""
+        replay = TraceReplay(make_history(200), sources=["gpu"])
+        detector = LeakDetector(sources=["gpu"], window=60, min_samples=30)
+        detector.attach(replay.monitor)
+        forwarded = []
+        replay.monitor.add_listener(
+            DeadbandFilter(
+                lambda t, readings: forwarded.append(t), deadband=50.0
+            )
+        )
+        replay.run()
+
+        assert detector.report("gpu").is_leak
+        assert len(forwarded) == 34  # 10MB/s 증가, 50MB마다 전달
+        forecast = replay.monitor.forecast(horizon=60.0)["gpu"]
+        assert forecast.expected == pytest.approx(2590.0, rel=0.01)
+
+    def test_trace_file_and_chunks(self, tmp_path):
+        """Test replaying a trace file and in-memory chunks."""
+        path = tmp_path / "run.smt"
+        with TraceWriter(path, chunk_size=4) as writer:
+            for i in range(10):
+                writer(float(i), {
+                    "gpu": MemoryInfo(float(i), 10.0),
+                    "cpu": MemoryInfo(1.0, 10.0),
+                })
+        replay = TraceReplay(path)
+        assert sorted(replay.sources) == ["cpu", "gpu"]
+        assert replay.run() == 10
+        assert len(replay.monitor.history) == 20
+
+        chunks = [
+            TraceChunk("gpu", [2.0, 3.0], [2.0, 3.0], [9.0, 9.0]),
+            TraceChunk("cpu", [1.0, 3.0], [1.0, 1.0], [9.0, 9.0]),
+        ]
+        replay = TraceReplay(chunks)
+        times = []
+        replay.monitor.add_listener(lambda t, readings: times.append(t))
+        replay.run()
+        assert times == [1.0, 2.0, 3.0]
+
+    def test_trace_file_decodes_each_frame_once(self, tmp_path, monkeypatch):
+        """Test that per-source readers skip other sources' frames."""
+        path = tmp_path / "run.smt"
+        with TraceWriter(path, chunk_size=4) as writer:
+            for i in range(8):
+                writer(float(i), {
+                    source: MemoryInfo(float(i), 10.0)
+                    for source in ("cpu", "gpu", "process")
+                })
+        decoded = []
+        original = trace_module.decode_series
+
+        def counting(block):
+            decoded.append(block)
+            return original(block)
+
+        monkeypatch.setattr(trace_module, "decode_series", counting)
+        replay = TraceReplay(path)
+        assert replay.sources == ["cpu", "gpu", "process"]
+        assert not decoded  # 소스 이름은 디코딩 없이 읽음
+        assert replay.run() == 8
+        assert len(decoded) == 6  # 소스 3개 x 프레임 2개
+
+    def test_paced_replay(self):
+        """Test waiting between frames at the requested speed."""
+        delays = []
+        replay = TraceReplay(
+            make_history(5), sources=["gpu"], sleep=delays.append
+        )
+        assert replay.run(speed=2.0) == 5
+        # sleep이 실제로 기다리지 않으므로 시작 시점 기준 지연이 누적됨
+        assert delays == pytest.approx([0.5, 1.0, 1.5, 2.0], abs=0.05)
+
+        with pytest.raises(ValueError):
+            replay.run(speed=0)
+
+    def test_replay_monitor(self):
+        """Test the replay backend outside of a frame."""
+        replay = TraceReplay(make_history(), sources=["gpu"])
+        backend = ReplayMonitor(replay, "gpu")
+        assert backend.source == "gpu"
+        assert backend.is_available
+        assert backend.get_memory_info() is None
+        replay.step()
+        assert backend.get_memory_info().used == 0.0
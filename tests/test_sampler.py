@@ -0,0 +1,101 @@
+"""Background sampler tests."""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+from system_monitor.instrumentation import SamplerStats
+from system_monitor.core import MemoryInfo
+from system_monitor.sampler import BackgroundSampler
+from system_monitor.scheduling import AdaptiveInterval
+
+
+class TestBackgroundSampler:
+    """Test BackgroundSampler thread."""
+
+    @pytest.mark.parametrize("interval", [0, float("inf"), float("nan")])
+    def test_invalid_interval(self, interval):
+        """Test that non-positive and non-finite intervals are rejected."""
+        with pytest.raises(ValueError):
+            BackgroundSampler(Mock(), interval=interval)
+
+    def test_samples_until_stopped(self):
+        """Test that the monitor is sampled repeatedly."""
+        monitor = Mock()
+        calls = threading.Semaphore(0)
+        monitor.sample.side_effect = lambda: calls.release()
+
+        sampler = BackgroundSampler(monitor, interval=0.001)
+        assert sampler.interval == 0.001
+        sampler.start()
+        for _ in range(3):
+            assert calls.acquire(timeout=2.0)
+        sampler.stop()
+
+        assert sampler.is_running is False
+        assert monitor.sample.call_count >= 3
+
+    def test_sampling_errors_do_not_stop_thread(self):
+        """Test that exceptions in sample() are logged and ignored."""
+        monitor = Mock()
+        calls = threading.Semaphore(0)
+
+        def failing_sample():
+            calls.release()
+            raise RuntimeError("boom")
+
+        monitor.sample.side_effect = failing_sample
+        sampler = BackgroundSampler(monitor, interval=0.001)
+        sampler.start()
+        sampler.start()
+        assert calls.acquire(timeout=2.0)
+        assert calls.acquire(timeout=2.0)
+        assert sampler.is_running is True
+        sampler.stop()
+
+    def test_overrun_is_recorded(self):
+        """Test that slow samples are counted as late and dropped ticks."""
+        monitor = Mock()
+        calls = threading.Semaphore(0)
+
+        def slow_sample():
+            time.sleep(0.005)
+            calls.release()
+
+        monitor.sample.side_effect = slow_sample
+        stats = SamplerStats()
+        sampler = BackgroundSampler(monitor, interval=0.001, stats=stats)
+        assert sampler.stats is stats
+        sampler.start()
+        assert calls.acquire(timeout=2.0)
+        assert calls.acquire(timeout=2.0)
+        sampler.stop()
+
+        assert stats.late_ticks >= 1
+        assert stats.dropped_ticks >= 1
+        assert stats.cpu_time >= 0
+
+    def test_scheduler_adapts_interval(self):
+        """Test that the scheduler sets the interval after each sample."""
+        monitor = Mock()
+        calls = threading.Semaphore(0)
+
+        def sample():
+            calls.release()
+            return {"gpu": MemoryInfo(used=1.0, total=100.0)}
+
+        monitor.sample.side_effect = sample
+        scheduler = AdaptiveInterval(min_interval=0.001, max_interval=0.004)
+        stats = SamplerStats()
+        sampler = BackgroundSampler(
+            monitor, interval=0.001, stats=stats, scheduler=scheduler
+        )
+        assert sampler.scheduler is scheduler
+        sampler.start()
+        for _ in range(4):
+            assert calls.acquire(timeout=2.0)
+        sampler.stop()
+
+        assert sampler.interval == 0.004
+        assert stats.interval == 0.004
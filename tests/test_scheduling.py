@@ -0,0 +1,75 @@
+"""Adaptive sampling interval tests."""
+
+import pytest
+from system_monitor.core import MemoryInfo
+from system_monitor.scheduling import AdaptiveInterval
+
+
+def _reading(used, total=100.0):
+    return {"gpu": MemoryInfo(used=used, total=total)}
+
+
+class TestAdaptiveInterval:
+    """Test AdaptiveInterval policy."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_interval": 0},
+            {"min_interval": 2.0, "max_interval": 1.0},
+            {"max_interval": float("inf")},
+            {"min_interval": float("nan")},
+            {"backoff": 1.0},
+            {"volatility_threshold": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            AdaptiveInterval(**kwargs)
+
+    def test_backs_off_when_steady(self):
+        """Test exponential back-off bounded by max_interval."""
+        policy = AdaptiveInterval(min_interval=0.1, max_interval=1.0)
+        assert policy.interval == 0.1
+        intervals = [
+            policy.next_interval(float(t), _reading(10.0)) for t in range(6)
+        ]
+        assert intervals == pytest.approx([0.2, 0.4, 0.8, 1.0, 1.0, 1.0])
+        assert policy.min_interval == 0.1
+        assert policy.max_interval == 1.0
+
+    def test_speeds_up_on_volatility(self):
+        """Test that fast changes drop the interval to the minimum."""
+        policy = AdaptiveInterval(min_interval=0.1, max_interval=4.0)
+        for t in range(6):
+            policy.next_interval(float(t), _reading(10.0))
+        assert policy.interval == 4.0
+
+        # 1초 동안 5%p 증가
+        assert policy.next_interval(6.0, _reading(15.0)) == 0.1
+
+    def test_halves_on_moderate_change(self):
+        """Test that moderate changes halve the interval."""
+        policy = AdaptiveInterval(min_interval=0.1, max_interval=4.0)
+        for t in range(6):
+            policy.next_interval(float(t), _reading(10.0))
+        assert policy.next_interval(6.0, _reading(10.6)) == 2.0
+
+    def test_speeds_up_under_pressure(self):
+        """Test that usage near the limit keeps the minimum interval."""
+        policy = AdaptiveInterval(pressure_threshold=90.0)
+        for t in range(5):
+            assert policy.next_interval(float(t), _reading(95.0)) == 0.1
+
+    def test_source_filter_and_reset(self):
+        """Test source filtering and reset."""
+        policy = AdaptiveInterval(sources=("gpu",))
+        readings = {"cpu": MemoryInfo(used=99.0, total=100.0)}
+        assert policy.next_interval(0.0, readings) == 0.2
+
+        policy.reset()
+        assert policy.interval == 0.1
+        # 같은 시각의 읽기는 변화율 계산에서 제외
+        policy.next_interval(1.0, _reading(10.0))
+        assert policy.next_interval(1.0, _reading(50.0)) == 0.4
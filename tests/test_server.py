@@ -0,0 +1,211 @@
+"""Rollup and HTTP query server tests."""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from system_monitor import MemoryRollup, SystemMonitor
+from system_monitor.core import MemoryHistory, MemoryInfo, MetricHistory
+from system_monitor.monitors import BaseMonitor
+from system_monitor.monitors.base import BaseCollector
+from system_monitor.server import QueryServer
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class SettableMonitor(BaseMonitor):
+    """Monitor returning the MB set by the test."""
+
+    def __init__(self, used=100.0):
+        super().__init__()
+        self.used = used
+
+    def get_memory_info(self):
+        return MemoryInfo(self.used, 1000.0)
+
+
+class DeviceCollector(BaseCollector):
+    """Collector reporting a per-device used value."""
+
+    def __init__(self, device):
+        self.name = f"gpu{device}_stats"
+        self.used = 10.0 * (device + 1)
+
+    def collect(self, timestamp):
+        return {"used": self.used}
+
+
+def get_json(url):
+    """Fetch and decode a JSON response."""
+    with urllib.request.urlopen(url, timeout=10.0) as response:
+        return json.loads(response.read())
+
+
+class TestMemoryRollup:
+    """Test multi-resolution rollups."""
+
+    def test_buckets_at_each_level(self):
+        """Test min/max/avg of merged buckets and level selection."""
+        rollup = MemoryRollup(levels=[(1.0, 100), (10.0, 100)])
+        for i in range(30):
+            rollup.update("gpu", 100.0 + i, float(i))
+
+        result = rollup.query("gpu", 100.0, 129.0, bucket=10.0)
+        assert result.resolution == 10.0
+        assert [p.start for p in result.points] == [100.0, 110.0, 120.0]
+        first = result.points[0]
+        assert (first.min, first.max, first.avg, first.count) == (
+            0.0,
+            9.0,
+            4.5,
+            10,
+        )
+        assert (result.min, result.max, result.count) == (0.0, 29.0, 30)
+        assert result.avg == pytest.approx(14.5)
+
+        # 해상도의 배수로 올림
+        fine = rollup.query("gpu", 100.0, 104.0, bucket=1.5)
+        assert (fine.resolution, fine.bucket) == (1.0, 2.0)
+        assert [p.max for p in fine.points] == [1.0, 3.0, 4.0]
+
+        # 점 수 제한이 버킷 폭보다 우선
+        assert len(rollup.query("gpu", 100.0, 129.0, 1.0, 3).points) == 3
+        assert rollup.query("cpu", 0.0, 1.0) is None
+        with pytest.raises(ValueError):
+            rollup.query("gpu", 2.0, 1.0)
+        with pytest.raises(ValueError, match="finite"):
+            rollup.query("gpu", 0.0, float("inf"))
+
+    def test_bounded_and_falls_back_to_coarser_level(self):
+        """Test that old windows are answered from longer-lived levels."""
+        rollup = MemoryRollup(levels=[(1.0, 10), (100.0, 10)])
+        for i in range(1000):
+            rollup.update("gpu", float(i), float(i))
+        assert len(rollup) == 10 + 10
+
+        result = rollup.query("gpu", 0.0, 99.0, bucket=1.0)
+        assert result.resolution == 100.0
+        assert result.max == 99.0
+        assert rollup.query("gpu", 995.0, 999.0).min == 995.0
+
+    def test_window_before_first_sample_keeps_resolution(self):
+        """Test that a window older than all data stays on a fine level."""
+        rollup = MemoryRollup()
+        now = 10000.0
+        for i in range(120):
+            rollup.update("gpu", now - 119 + i, float(i))
+
+        result = rollup.query("gpu", now - 600.0, now)
+        assert (result.resolution, result.bucket) == (1.0, 2.0)
+        assert len(result.points) == 61
+        assert (result.min, result.max, result.count) == (0.0, 119.0, 120)
+
+    def test_late_values_and_nan(self):
+        """Test adding to existing buckets and skipping missing values."""
+        rollup = MemoryRollup(levels=[(1.0, 10)])
+        rollup.update("gpu", 5.0, 1.0)
+        rollup.update("gpu", 6.0, 2.0)
+        rollup.update("gpu", 5.5, 9.0)
+        rollup.update("gpu", 1.0, 9.0)  # 없는 버킷은 만들지 않음
+        rollup.update("gpu", 7.0, float("nan"))
+        points = rollup.query("gpu", 0.0, 10.0).points
+        assert [(p.start, p.max, p.count) for p in points] == [
+            (5.0, 9.0, 2),
+            (6.0, 2.0, 1),
+        ]
+        with pytest.raises(ValueError):
+            MemoryRollup(levels=[(10.0, 10), (1.0, 10)])
+
+    def test_feed_and_attach(self):
+        """Test filling from histories and from monitor samples."""
+        history = MemoryHistory()
+        history.append("gpu", 1.0, MemoryInfo(200.0, 1000.0))
+        metrics = MetricHistory()
+        metrics.append("gpu0_stats", 1.0, {"used": 5.0})
+        rollup = MemoryRollup()
+        rollup.feed(history, metrics)
+        assert rollup.series() == ["gpu", "gpu0_stats.used"]
+
+        clock = Clock()
+        monitor = SystemMonitor(
+            backends={"cpu": SettableMonitor(300.0)},
+            collectors=[DeviceCollector(1)],
+            clock=clock,
+        )
+        rollup.attach(monitor)
+        monitor.sample()
+        rollup.detach(monitor)
+        monitor.sample()
+        assert rollup.query("cpu", 0.0, 2000.0).count == 1
+        assert rollup.query("gpu1_stats.used", 0.0, 2000.0).max == 20.0
+
+
+class TestQueryServer:
+    """Test the HTTP/JSON endpoint."""
+
+    @pytest.fixture
+    def monitor(self):
+        clock = Clock()
+        source = SettableMonitor()
+        monitor = SystemMonitor(
+            backends={"gpu": source},
+            collectors=[DeviceCollector(0), DeviceCollector(1)],
+            clock=clock,
+        )
+        monitor.sample()  # 서버 생성 전 기록 (history에서 채움)
+        for i in range(1, 60):
+            clock.now += 10.0
+            source.used = 100.0 + i
+            monitor.sample()
+        return monitor
+
+    def test_query_endpoints(self, monitor):
+        """Test per-device window queries, series and latest readings."""
+        with QueryServer(monitor) as server:
+            assert server.address[0] == "127.0.0.1"
+            monitor.sample()
+            query = (
+                f"{server.url}/query?series=gpu*_stats.used"
+                "&window=600&bucket=60"
+            )
+            body = get_json(query)
+            assert body["end"] == 1590.0
+            series = body["series"]
+            assert sorted(series) == ["gpu0_stats.used", "gpu1_stats.used"]
+            assert series["gpu1_stats.used"]["max"] == 20.0
+            assert series["gpu1_stats.used"]["resolution"] == 60.0
+
+            gpu = get_json(f"{server.url}/query?series=gpu&start=0")
+            assert gpu["series"]["gpu"]["min"] == 100.0
+            assert gpu["series"]["gpu"]["max"] == 159.0
+            assert gpu["series"]["gpu"]["count"] == 61
+
+            names = get_json(f"{server.url}/series")["series"]
+            assert names == ["gpu", "gpu0_stats.used", "gpu1_stats.used"]
+            latest = get_json(f"{server.url}/latest")
+            assert latest["readings"]["gpu"]["used"] == 159.0
+            assert latest["metrics"]["gpu0_stats"] == {"used": 10.0}
+
+            for path, status in [
+                ("/query?window=abc", 400),
+                ("/query?window=inf", 400),
+                ("/query?bucket=-inf", 400),
+                ("/query?start=nan", 400),
+                ("/query?start=-1e308&end=1e308", 400),  # 구간 폭 overflow
+                ("/query?points=0", 400),
+                ("/missing", 404),
+            ]:
+                with pytest.raises(urllib.error.HTTPError) as info:
+                    urllib.request.urlopen(server.url + path, timeout=10.0)
+                assert info.value.code == status
+        assert not server.is_running
+        assert server.rollup not in monitor._listeners
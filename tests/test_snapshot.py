@@ -0,0 +1,161 @@
+"""Snapshot diffing and pytest memory gate tests."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import system_monitor
+from system_monitor import SystemMonitor
+from system_monitor.core import (
+    MemoryHistory,
+    MemoryInfo,
+    MemorySnapshot,
+    diff_snapshots,
+)
+from system_monitor.monitors import BaseMonitor
+
+pytest_plugins = ["pytester"]
+
+MB = 1024 * 1024
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class SettableMonitor(BaseMonitor):
+    """Monitor returning the bytes set by the test."""
+
+    def __init__(self, used):
+        super().__init__()
+        self.used = used
+
+    def get_memory_info(self):
+        return MemoryInfo.from_bytes(self.used, 1024 * MB)
+
+
+class TestSnapshotDiff:
+    """Test snapshot() and diff()."""
+
+    def test_diff_includes_sampled_peak(self):
+        """Test exact deltas and peaks seen by samples in between."""
+        clock = Clock()
+        source = SettableMonitor(100 * MB)
+        monitor = SystemMonitor(backends={"cpu": source}, clock=clock)
+        before = monitor.snapshot()
+        assert before.readings["cpu"].used_bytes == 100 * MB
+        assert len(monitor.history) == 0  # 스냅샷은 기록하지 않음
+
+        clock.now = 101.0
+        source.used = 300 * MB
+        monitor.sample()
+        clock.now = 102.0
+        source.used = 100 * MB + 1
+
+        diff = monitor.diff(before)
+        cpu = diff["cpu"]
+        assert (diff.start, diff.end) == (100.0, 102.0)
+        assert cpu.delta == 1
+        assert cpu.peak == 300 * MB
+        assert cpu.peak_increase_mb == 200.0
+        assert diff.to_dict()["sources"]["cpu"]["peak"] == 300.0
+        assert "gpu" not in diff
+
+    def test_diff_snapshots(self):
+        """Test peaks from history samples and externally tracked peaks."""
+        before = MemorySnapshot(1.0, {"gpu": MemoryInfo(100.0, 1000.0)})
+        after = MemorySnapshot(3.0, {"gpu": MemoryInfo(50.0, 1000.0)})
+        history = MemoryHistory()
+        history.append("gpu", 0.5, MemoryInfo(900.0, 1000.0))  # 이전 샘플
+        history.append("gpu", 2.0, MemoryInfo(400.0, 1000.0))
+
+        gpu = diff_snapshots(before, after, history)["gpu"]
+        assert gpu.delta_mb == -50.0
+        assert gpu.peak_increase_mb == 300.0
+        assert diff_snapshots(before, after)["gpu"].peak_increase == 0
+        peaks = {"gpu": 600 * MB}
+        assert diff_snapshots(before, after, peaks=peaks)["gpu"].peak == (
+            600 * MB
+        )
+
+
+GATED_TESTS = """
+import time
+
+def test_allocates():
+    data = b"x" * (64 * 1024 * 1024)
+    time.sleep(0.1)
+    del data
+
+def test_small():
+    time.sleep(0.01)
+"""
+
+
+class TestMemoryGate:
+    """Test the pytest plugin."""
+
+    @pytest.fixture(autouse=True)
+    def importable(self, monkeypatch):
+        """Make the package importable in the pytest subprocess."""
+        root = str(Path(system_monitor.__file__).resolve().parents[1])
+        path = os.environ.get("PYTHONPATH")
+        monkeypatch.setenv(
+            "PYTHONPATH", root if not path else root + os.pathsep + path
+        )
+
+    def run(self, pytester, *args):
+        return pytester.runpytest_subprocess(
+            "-p",
+            "system_monitor.pytest_plugin",
+            "--memory-sources=process",
+            *args,
+        )
+
+    def test_records_and_compares_baseline(self, pytester):
+        """Test writing a baseline and failing tests that exceed it."""
+        pytester.makepyfile(test_gated=GATED_TESTS)
+        baseline = pytester.path / "memory.json"
+
+        result = self.run(
+            pytester,
+            f"--memory-baseline={baseline}",
+            "--memory-update-baseline",
+        )
+        result.assert_outcomes(passed=2)
+        recorded = json.loads(baseline.read_text())["tests"]
+        peak = recorded["test_gated.py::test_allocates"]["process"]
+        assert peak >= 60.0
+
+        # 기록한 기준값과 비교하면 통과
+        self.run(pytester, f"--memory-baseline={baseline}").assert_outcomes(
+            passed=2
+        )
+
+        recorded["test_gated.py::test_allocates"]["process"] = 10.0
+        baseline.write_text(json.dumps({"tests": recorded}))
+        result = self.run(pytester, f"--memory-baseline={baseline}")
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines(
+            ["*Memory regression: process peak +*MB exceeds baseline*"]
+        )
+
+    def test_disabled_without_baseline(self, pytester):
+        """Test that tests are not measured unless enabled."""
+        pytester.makepyfile(
+            test_plain="""
+def test_fixture(memory_monitor):
+    snapshot = memory_monitor.snapshot()
+    assert memory_monitor.diff(snapshot).end >= snapshot.timestamp
+"""
+        )
+        result = self.run(pytester)
+        result.assert_outcomes(passed=1)
+        assert "memory regressions" not in result.stdout.str()
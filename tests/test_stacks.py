@@ -0,0 +1,193 @@
+"""Spike stack capture tests."""
+
+import threading
+import pytest
+from system_monitor import SystemMonitor
+from system_monitor.analysis import SpikeStackSampler, StackTable
+from system_monitor.analysis.stacks import TRUNCATED
+from system_monitor.core import MemoryInfo
+from system_monitor.monitors import BaseMonitor
+
+
+class SteppedMonitor(BaseMonitor):
+    """Monitor returning a settable reading."""
+
+    def __init__(self):
+        super().__init__()
+        self.used = 100.0
+
+    def get_memory_info(self):
+        return MemoryInfo(used=self.used, total=1000.0)
+
+
+class Clock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def allocating_worker(started, release):
+    """Block in a recognizable function until released."""
+    started.set()
+    release.wait(5.0)
+
+
+@pytest.fixture
+def worker():
+    """Background thread parked in ``allocating_worker``."""
+    started, release = threading.Event(), threading.Event()
+    thread = threading.Thread(
+        target=allocating_worker,
+        args=(started, release),
+        name="allocator",
+    )
+    thread.start()
+    started.wait(5.0)
+    yield thread
+    release.set()
+    thread.join()
+
+
+class TestStackTable:
+    """Test stack deduplication."""
+
+    def test_intern(self):
+        """Test that equal stacks share an id."""
+        table = StackTable()
+        assert table.intern(("a", "b")) == 0
+        assert table.intern(("a", "c")) == 1
+        assert table.intern(("a", "b")) == 0
+        assert table[1] == ("a", "c")
+        assert len(table) == 2
+
+    def test_release(self):
+        """Test that stacks are removed with their last reference."""
+        table = StackTable()
+        first = table.intern(("a",))
+        table.intern(("a",))
+        second = table.intern(("b",))
+        table.release(first)
+        assert table[first] == ("a",)
+        table.release(first)
+        table.release(second)
+        assert len(table) == 0
+        with pytest.raises(KeyError):
+            table[first]
+        # 지운 id는 다시 쓰지 않음
+        assert table.intern(("a",)) == 2
+
+
+class TestSpikeStackSampler:
+    """Test capturing stacks on spikes."""
+
+    def test_capture_on_spike(self, worker):
+        """Test that a spike captures every thread's stack."""
+        sampler = SpikeStackSampler(threshold=100.0)
+        assert sampler.update("gpu", 0.0, MemoryInfo(100.0, 1000.0)) is None
+        assert sampler.update("gpu", 1.0, MemoryInfo(150.0, 1000.0)) is None
+        capture = sampler.update("gpu", 2.0, MemoryInfo(400.0, 1000.0))
+
+        assert (capture.timestamp, capture.source) == (2.0, "gpu")
+        assert capture.increase == 250.0
+        names = {thread.name: thread for thread in capture.threads}
+        assert set(names) >= {"allocator", threading.current_thread().name}
+        stack = sampler.table[names["allocator"].stack]
+        assert any(f.startswith("allocating_worker (") for f in stack)
+        # 이 패키지의 프레임은 잎에서 잘려 테스트 함수가 가장 안쪽
+        own = sampler.table[names[threading.current_thread().name].stack]
+        assert own[-1].startswith("test_capture_on_spike (")
+        assert sampler.capture_seconds > 0
+
+    def test_rate_limit_and_relative_threshold(self):
+        """Test the minimum interval between captures."""
+        sampler = SpikeStackSampler(
+            threshold=1000.0, relative=0.1, min_interval=10.0, max_captures=2
+        )
+        used = 0.0
+        captured = []
+        for t in range(0, 40, 2):
+            used += 150.0
+            if sampler.update("gpu", float(t), MemoryInfo(used, 1000.0)):
+                captured.append(t)
+        assert captured == [2, 12, 22, 32]
+        assert len(sampler.captures) == 2
+        assert sampler.skipped == 15
+
+        sampler.reset()
+        assert not sampler.captures
+        with pytest.raises(ValueError):
+            SpikeStackSampler(threshold=0.0)
+
+    def test_folded_export(self, worker, tmp_path):
+        """Test aggregating stacks in the folded format."""
+        sampler = SpikeStackSampler(sources=["gpu", "cpu"], min_interval=0.0)
+        for t in range(2):
+            sampler.capture(float(t), "gpu", 512.0)
+        sampler.capture(2.0, "cpu", 512.0)
+        folded = sampler.folded("gpu")
+        lines = [line for line in folded if line.startswith("allocator;")]
+        assert len(lines) == 1
+        assert folded[lines[0]] == 2
+        assert ";allocating_worker (" in lines[0]
+
+        path = tmp_path / "stacks.folded"
+        assert sampler.write_folded(path) == len(sampler.folded())
+        for line in path.read_text().splitlines():
+            assert int(line.rsplit(" ", 1)[1]) >= 1
+
+    def test_table_bounded_by_kept_captures(self):
+        """Test that stacks of dropped captures leave the table."""
+        sampler = SpikeStackSampler(min_interval=0.0, max_captures=2)
+
+        def capture_in(depth, t):
+            # 깊이마다 다른 스택
+            if depth:
+                return capture_in(depth - 1, t)
+            return sampler.capture(t, "gpu", 1.0)
+
+        for t in range(20):
+            capture_in(t, float(t))
+        live = {
+            thread.stack
+            for capture in sampler.captures
+            for thread in capture.threads
+        }
+        assert len(sampler.table) == len(live)
+        for stack_id in live:
+            assert sampler.table[stack_id]
+
+    def test_max_depth(self):
+        """Test truncating deep stacks at the outer end."""
+        sampler = SpikeStackSampler(max_depth=2)
+        capture = sampler.capture(0.0, "gpu", 1.0)
+        current = threading.get_ident()
+        thread = next(t for t in capture.threads if t.thread == current)
+        stack = sampler.table[thread.stack]
+        assert len(stack) == 3
+        assert stack[0] == TRUNCATED
+
+    def test_attached_to_monitor(self):
+        """Test capturing from samples and marking the capture."""
+        clock = Clock()
+        gpu = SteppedMonitor()
+        monitor = SystemMonitor(backends={"gpu": gpu}, clock=clock)
+        captures = []
+        sampler = SpikeStackSampler(on_capture=captures.append)
+        sampler.attach(monitor)
+        monitor.sample()
+        clock.now, gpu.used = 1.0, 900.0
+        monitor.sample()
+        sampler.detach(monitor)
+        clock.now, gpu.used = 10.0, 100.0
+        monitor.sample()
+        clock.now, gpu.used = 20.0, 900.0
+        monitor.sample()
+
+        assert len(captures) == 1
+        assert [a.name for a in monitor.annotations.annotations()] == [
+            "stack_capture gpu"
+        ]
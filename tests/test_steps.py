@@ -0,0 +1,135 @@
+"""Per-step memory recorder tests."""
+
+import math
+import pytest
+from unittest.mock import Mock
+from system_monitor import SystemMonitor
+from system_monitor.core import MemoryInfo
+from system_monitor.steps import StepRecorder
+
+
+def make_reader(values):
+    """Create a reader returning successive used values per source."""
+    readings = iter(values)
+
+    def read(sources):
+        used = next(readings)
+        return {
+            source: MemoryInfo(used=used[source], total=1000.0)
+            for source in sources
+            if source in used
+        }
+
+    return read
+
+
+class TestStepRecorder:
+    """Test StepRecorder columnar storage."""
+
+    def test_invalid_maxlen(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            StepRecorder(Mock(), maxlen=0)
+
+    def test_begin_closes_previous_step(self):
+        """Test that one boundary read ends a step and starts the next."""
+        read = Mock(side_effect=make_reader([
+            {"gpu": 100.0, "process": 50.0},
+            {"gpu": 300.0, "process": 60.0},
+            {"gpu": 120.0, "process": 55.0},
+        ]))
+        recorder = StepRecorder(read)
+        recorder.begin(0)
+        recorder.begin(1)
+        assert recorder.current_step == 1
+        recorder.end()
+
+        assert read.call_count == 3
+        assert len(recorder) == 2
+        columns = recorder.columns()
+        assert columns["step"] == [0, 1]
+        assert columns["gpu_start"] == [100.0, 300.0]
+        assert columns["gpu_end"] == [300.0, 120.0]
+        assert columns["gpu_peak"] == [300.0, 300.0]
+        assert columns["process_end"] == [60.0, 55.0]
+        assert all(d >= 0 for d in columns["duration"])
+        assert recorder.current_step is None
+
+    def test_peak_from_samples(self):
+        """Test that samples during a step raise its peak."""
+        recorder = StepRecorder(make_reader([
+            {"gpu": 100.0}, {"gpu": 110.0},
+        ]), sources=["gpu"])
+        recorder(0.0, {"gpu": MemoryInfo(used=999.0, total=1000.0)})
+        recorder.begin(7)
+        recorder(1.0, {"gpu": MemoryInfo(used=500.0, total=1000.0)})
+        recorder(2.0, {"gpu": MemoryInfo(used=400.0, total=1000.0)})
+        recorder.end()
+
+        assert recorder.columns()["gpu_peak"] == [500.0]
+
+    def test_missing_readings(self):
+        """Test that unavailable sources are stored as nan / None."""
+        recorder = StepRecorder(make_reader([
+            {"process": 50.0}, {"process": 52.0},
+        ]))
+        recorder.begin(0)
+        recorder.end()
+        recorder.end()
+
+        assert math.isnan(recorder.columns()["gpu_peak"][0])
+        record = recorder.to_records()[0]
+        assert record["gpu_start"] is None
+        assert record["process_peak"] == 52.0
+
+    def test_maxlen_and_clear(self):
+        """Test that old steps are discarded and clear empties storage."""
+        recorder = StepRecorder(
+            make_reader([{"gpu": float(i)} for i in range(6)]),
+            sources=["gpu"],
+            maxlen=3,
+        )
+        for step in range(5):
+            recorder.begin(step)
+        recorder.end()
+        assert recorder.columns()["step"] == [2, 3, 4]
+
+        recorder.clear()
+        assert len(recorder) == 0
+        assert recorder.column_names() == [
+            "step", "timestamp", "duration",
+            "gpu_start", "gpu_end", "gpu_peak",
+        ]
+
+
+class TestSystemMonitorSteps:
+    """Test step recording through SystemMonitor."""
+
+    def test_step_scope(self):
+        """Test recording with a context manager and sampling inside."""
+        monitor = SystemMonitor(use_gpu=False)
+        with monitor.step_scope(0):
+            monitor.sample()
+        monitor.step(1)
+        monitor.step(2)
+        monitor.end_step()
+
+        assert monitor.steps.columns()["step"] == [0, 1, 2]
+        assert monitor.steps.columns()["process_peak"][0] > 0
+        assert len(monitor.to_dict()["steps"]) == 3
+
+    def test_step_scope_closes_on_error(self):
+        """Test that a failing step is still recorded."""
+        monitor = SystemMonitor(use_gpu=False)
+        with pytest.raises(RuntimeError):
+            with monitor.step_scope(0):
+                raise RuntimeError("boom")
+        assert len(monitor.steps) == 1
+        assert monitor.steps.current_step is None
+
+    def test_read_does_not_record(self):
+        """Test that read() leaves history untouched."""
+        monitor = SystemMonitor(use_gpu=False)
+        readings = monitor.read(["process", "gpu"])
+        assert list(readings) == ["process"]
+        assert len(monitor.history) == 0
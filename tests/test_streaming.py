@@ -0,0 +1,63 @@
+"""Change-only emission tests."""
+
+import pytest
+from unittest.mock import Mock
+from system_monitor.core import MemoryInfo
+from system_monitor.streaming import DeadbandFilter
+
+
+class TestDeadbandFilter:
+    """Test DeadbandFilter listener."""
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            DeadbandFilter(Mock(), deadband=-1)
+        with pytest.raises(ValueError):
+            DeadbandFilter(Mock(), heartbeat=0)
+
+    def test_forwards_changes_only(self):
+        """Test deadband filtering."""
+        downstream = Mock()
+        change_filter = DeadbandFilter(
+            downstream, deadband=1.0, heartbeat=None
+        )
+        assert change_filter.reduction == 0.0
+
+        change_filter(1.0, {"gpu": MemoryInfo(used=100.0, total=1000.0)})
+        change_filter(2.0, {"gpu": MemoryInfo(used=100.5, total=1000.0)})
+        change_filter(3.0, {"gpu": MemoryInfo(used=101.5, total=1000.0)})
+        change_filter(4.0, {"gpu": MemoryInfo(used=101.5, total=2000.0)})
+
+        timestamps = [c[0][0] for c in downstream.call_args_list]
+        assert timestamps == [1.0, 3.0, 4.0]
+        assert change_filter.reduction == pytest.approx(0.25)
+
+    def test_heartbeat(self):
+        """Test that unchanged readings are re-sent periodically."""
+        downstream = Mock()
+        change_filter = DeadbandFilter(downstream, heartbeat=10.0)
+        for t in range(0, 25, 5):
+            change_filter(float(t), {"cpu": MemoryInfo(used=1.0, total=2.0)})
+        timestamps = [c[0][0] for c in downstream.call_args_list]
+        assert timestamps == [0.0, 10.0, 20.0]
+
+    def test_partial_and_filtered_sources(self):
+        """Test that only changed and selected sources are forwarded."""
+        downstream = Mock()
+        change_filter = DeadbandFilter(downstream, sources=("gpu", "cpu"))
+        readings = {
+            "gpu": MemoryInfo(used=1.0, total=2.0),
+            "cpu": MemoryInfo(used=1.0, total=2.0),
+            "process": MemoryInfo(used=1.0, total=2.0),
+        }
+        change_filter(1.0, readings)
+        readings["gpu"] = MemoryInfo(used=10.0, total=20.0)
+        change_filter(2.0, readings)
+
+        assert set(downstream.call_args_list[0][0][1]) == {"gpu", "cpu"}
+        assert set(downstream.call_args_list[1][0][1]) == {"gpu"}
+
+        change_filter.reset()
+        change_filter(3.0, readings)
+        assert set(downstream.call_args_list[2][0][1]) == {"gpu", "cpu"}
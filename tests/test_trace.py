@@ -0,0 +1,133 @@
+"""On-disk trace tests."""
+
+import pytest
+from unittest.mock import Mock
+from system_monitor.core import MemoryHistory, MemoryInfo
+from system_monitor.core.trace import (
+    TraceChunk,
+    TraceWriter,
+    chunks_to_history,
+    history_chunks,
+    iter_trace,
+    read_trace,
+)
+
+
+def make_history(count=10):
+    """Create a history with interleaved gpu and cpu samples."""
+    history = MemoryHistory()
+    for i in range(count):
+        t = 1700000000.0 + i * 0.1
+        history.append("gpu", t, MemoryInfo(100.0 + i, 1000.0))
+        history.append("cpu", t, MemoryInfo(500.0, 2000.0))
+    return history
+
+
+class TestHistoryChunks:
+    """Test converting between histories and chunks."""
+
+    def test_split_and_collect(self):
+        """Test splitting per source and collecting back."""
+        history = make_history(10)
+        chunks = list(history_chunks(history, chunk_size=4))
+        assert [(c.source, len(c.timestamps)) for c in chunks] == [
+            ("gpu", 4), ("gpu", 4), ("gpu", 2),
+            ("cpu", 4), ("cpu", 4), ("cpu", 2),
+        ]
+        restored = chunks_to_history(chunks)
+        assert restored.samples("gpu") == history.samples("gpu")
+        assert restored.samples("cpu") == history.samples("cpu")
+
+    def test_maxlen_keeps_newest(self):
+        """Test that a smaller history keeps the newest samples."""
+        restored = chunks_to_history(history_chunks(make_history(10)), 3)
+        assert [s.used for s in restored.samples("gpu")] == [
+            107.0, 108.0, 109.0
+        ]
+
+    def test_invalid_chunk_size(self):
+        """Test chunk size validation."""
+        with pytest.raises(ValueError):
+            list(history_chunks(MemoryHistory(), chunk_size=0))
+
+
+class TestTraceWriter:
+    """Test writing and reading trace files."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that a written trace reads back frame by frame."""
+        path = tmp_path / "run.smt"
+        history = make_history(10)
+        with TraceWriter(path, chunk_size=4) as writer:
+            for sample in history.samples("gpu"):
+                writer(sample.timestamp, {
+                    "gpu": sample.info,
+                    "cpu": MemoryInfo(500.0, 2000.0),
+                })
+            assert writer.frames == 4  # 소스별로 4개씩 찬 프레임
+        assert writer.closed
+        assert writer.samples == 20
+
+        chunks = list(iter_trace(path))
+        assert all(isinstance(chunk, TraceChunk) for chunk in chunks)
+        assert sum(len(c.timestamps) for c in chunks) == 20
+        restored = read_trace(path)
+        assert [(s.used, s.total) for s in restored.samples("gpu")] == [
+            (s.used, s.total) for s in history.samples("gpu")
+        ]
+        timestamps = [s.timestamp for s in restored.samples("gpu")]
+        assert timestamps == pytest.approx(
+            [s.timestamp for s in history.samples("gpu")], abs=0.0005
+        )
+
+    def test_write_chunk_and_source_filter(self, tmp_path):
+        """Test appending chunks and recording only some sources."""
+        path = tmp_path / "run.smt"
+        with TraceWriter(path, sources=["gpu"]) as writer:
+            writer(1.0, {
+                "gpu": MemoryInfo(1.0, 2.0),
+                "cpu": MemoryInfo(3.0, 4.0),
+            })
+            writer.write_chunk(
+                TraceChunk("gpu", [2.0, 3.0], [5.0, 6.0], [8.0, 8.0])
+            )
+        restored = read_trace(path)
+        assert restored.sources() == ["gpu"]
+        assert [s.used for s in restored.samples("gpu")] == [1.0, 5.0, 6.0]
+
+    def test_closed_writer(self, tmp_path):
+        """Test that writing after close fails and close is idempotent."""
+        writer = TraceWriter(tmp_path / "run.smt")
+        writer.close()
+        writer.close()
+        with pytest.raises(ValueError):
+            writer.write("gpu", 1.0, MemoryInfo(1.0, 2.0))
+
+    def test_invalid_files(self, tmp_path):
+        """Test foreign and truncated files."""
+        foreign = tmp_path / "foreign"
+        foreign.write_bytes(b"nope")
+        with pytest.raises(ValueError):
+            list(iter_trace(foreign))
+
+        path = tmp_path / "run.smt"
+        with TraceWriter(path) as writer:
+            writer.write("gpu", 1.0, MemoryInfo(1.0, 2.0))
+        truncated = tmp_path / "truncated.smt"
+        truncated.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(ValueError):
+            list(iter_trace(truncated))
+
+    def test_invalid_chunk_size(self, tmp_path):
+        """Test chunk size validation."""
+        with pytest.raises(ValueError):
+            TraceWriter(tmp_path / "run.smt", chunk_size=0)
+
+    def test_attach(self, tmp_path):
+        """Test registering as a monitor listener."""
+        monitor = Mock()
+        with TraceWriter(tmp_path / "run.smt") as writer:
+            writer.attach(monitor)
+            writer.detach(monitor)
+        monitor.add_listener.assert_called_once_with(writer)
+        monitor.remove_listener.assert_called_once_with(writer)